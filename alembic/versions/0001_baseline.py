@@ -0,0 +1,537 @@
+"""baseline: Alembic 도입 전 create_all로 관리하던 스키마
+
+이후 리비전(0001b~)에서 추가하는 컬럼/색인(대표 이미지 컬럼, FULLTEXT, 핫 경로 복합 색인)은 포함하지 않는다.
+create_all로 이미 만들어진 DB는 있는 테이블/색인을 건너뛰므로 그대로 upgrade 할 수 있고,
+오프라인(--sql) 모드에서는 전체 생성문을 출력한다.
+
+Revision ID: 0001_baseline
+Revises:
+Create Date: 2025-09-01 00:00:00
+"""
+
+from alembic import op
+import sqlalchemy as sa
+
+from app.db.migration_helpers import create_index_if_missing, create_table_if_missing
+
+revision = "0001_baseline"
+down_revision = None
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    create_table_if_missing(
+        "notification",
+        sa.Column("id", sa.BigInteger(), autoincrement=True, nullable=False),
+        sa.Column("user_id", sa.BigInteger(), nullable=True),
+        sa.Column("channel", sa.String(length=20), nullable=False),
+        sa.Column("product_id", sa.BigInteger(), nullable=True),
+        sa.Column("template_code", sa.String(length=80), nullable=True),
+        sa.Column("title", sa.String(length=200), nullable=True),
+        sa.Column("body", sa.String(length=1024), nullable=True),
+        sa.Column("metadata_json", sa.JSON(), nullable=True),
+        sa.Column(
+            "sent_at", sa.DateTime(), server_default=sa.func.now(), nullable=False
+        ),
+        sa.Column("status", sa.String(length=20), nullable=False),
+        sa.PrimaryKeyConstraint("id"),
+    )
+    create_table_if_missing(
+        "notification_outbox",
+        sa.Column("id", sa.BigInteger(), autoincrement=True, nullable=False),
+        sa.Column("channel", sa.String(length=20), nullable=False),
+        sa.Column("payload", sa.JSON(), nullable=False),
+        sa.Column("status", sa.String(length=20), nullable=False),
+        sa.Column("attempts", sa.Integer(), nullable=False),
+        sa.Column(
+            "available_at",
+            sa.DateTime(),
+            server_default=sa.func.now(),
+            nullable=False,
+        ),
+        sa.Column("last_error", sa.String(length=1024), nullable=True),
+        sa.Column(
+            "created_at", sa.DateTime(), server_default=sa.func.now(), nullable=False
+        ),
+        sa.Column("sent_at", sa.DateTime(), nullable=True),
+        sa.PrimaryKeyConstraint("id"),
+    )
+    create_index_if_missing(
+        "idx_no_status_available", "notification_outbox", ["status", "available_at"]
+    )
+    create_table_if_missing(
+        "order",
+        sa.Column("id", sa.BigInteger(), autoincrement=True, nullable=False),
+        sa.Column("user_id", sa.BigInteger(), nullable=False),
+        sa.Column("address_id", sa.BigInteger(), nullable=True),
+        sa.Column("status", sa.String(length=20), nullable=False),
+        sa.Column("total_amount", sa.Integer(), nullable=False),
+        sa.Column("shipping_fee", sa.Integer(), nullable=False),
+        sa.Column(
+            "created_at", sa.DateTime(), server_default=sa.func.now(), nullable=False
+        ),
+        sa.Column(
+            "updated_at", sa.DateTime(), server_default=sa.func.now(), nullable=False
+        ),
+        sa.PrimaryKeyConstraint("id"),
+    )
+    create_table_if_missing(
+        "payment",
+        sa.Column("id", sa.BigInteger(), autoincrement=True, nullable=False),
+        sa.Column("order_id", sa.BigInteger(), nullable=True),
+        sa.Column("user_id", sa.BigInteger(), nullable=False),
+        sa.Column("provider", sa.String(length=30), nullable=False),
+        sa.Column("external_tid", sa.String(length=191), nullable=True),
+        sa.Column("amount", sa.DECIMAL(precision=12, scale=2), nullable=False),
+        sa.Column("status", sa.String(length=20), nullable=False),
+        sa.Column(
+            "requested_at",
+            sa.DateTime(),
+            server_default=sa.func.now(),
+            nullable=False,
+        ),
+        sa.Column("paid_at", sa.DateTime(), nullable=True),
+        sa.Column("fail_reason", sa.String(length=255), nullable=True),
+        sa.PrimaryKeyConstraint("id"),
+    )
+    create_table_if_missing(
+        "payment_log",
+        sa.Column("id", sa.BigInteger(), autoincrement=True, nullable=False),
+        sa.Column("payment_id", sa.BigInteger(), nullable=False),
+        sa.Column("provider", sa.String(length=30), nullable=False),
+        sa.Column("external_tid", sa.String(length=191), nullable=True),
+        sa.Column("amount", sa.DECIMAL(precision=12, scale=2), nullable=False),
+        sa.Column("status", sa.String(length=20), nullable=False),
+        sa.Column(
+            "requested_at",
+            sa.DateTime(),
+            server_default=sa.func.now(),
+            nullable=False,
+        ),
+        sa.Column("paid_at", sa.DateTime(), nullable=True),
+        sa.Column("fail_reason", sa.String(length=255), nullable=True),
+        sa.Column("log_type", sa.String(length=10), nullable=False),
+        sa.Column(
+            "created_at", sa.DateTime(), server_default=sa.func.now(), nullable=False
+        ),
+        sa.PrimaryKeyConstraint("id"),
+    )
+    create_table_if_missing(
+        "payment_refund",
+        sa.Column("id", sa.BigInteger(), autoincrement=True, nullable=False),
+        sa.Column("payment_id", sa.BigInteger(), nullable=False),
+        sa.Column("amount", sa.DECIMAL(precision=12, scale=2), nullable=False),
+        sa.Column("reason", sa.String(length=255), nullable=True),
+        sa.Column(
+            "refunded_at",
+            sa.DateTime(),
+            server_default=sa.func.now(),
+            nullable=False,
+        ),
+        sa.PrimaryKeyConstraint("id"),
+    )
+    create_table_if_missing(
+        "phone_verification",
+        sa.Column("id", sa.BigInteger(), autoincrement=True, nullable=False),
+        sa.Column("phone_number", sa.String(length=20), nullable=False),
+        sa.Column("code6", sa.String(length=6), nullable=False),
+        sa.Column("expires_at", sa.DateTime(timezone=True), nullable=False),
+        sa.Column("verified_at", sa.DateTime(timezone=True), nullable=True),
+        sa.Column(
+            "created_at",
+            sa.DateTime(timezone=True),
+            server_default=sa.func.now(),
+            nullable=False,
+        ),
+        sa.PrimaryKeyConstraint("id"),
+    )
+    create_index_if_missing(
+        "ix_phone_verification_expires_at", "phone_verification", ["expires_at"]
+    )
+    create_index_if_missing(
+        "ix_phone_verification_phone_number", "phone_verification", ["phone_number"]
+    )
+    create_table_if_missing(
+        "popup_store",
+        sa.Column("id", sa.BigInteger(), autoincrement=True, nullable=False),
+        sa.Column("name", sa.String(length=120), nullable=False),
+        sa.Column("description", sa.String(length=1024), nullable=True),
+        sa.Column("sales_description", sa.String(length=1024), nullable=True),
+        sa.Column("image_url", sa.String(length=1024), nullable=True),
+        sa.Column("starts_at", sa.DateTime(), nullable=True),
+        sa.Column("ends_at", sa.DateTime(), nullable=True),
+        sa.Column(
+            "created_at", sa.DateTime(), server_default=sa.func.now(), nullable=False
+        ),
+        sa.PrimaryKeyConstraint("id"),
+    )
+    create_table_if_missing(
+        "shipment",
+        sa.Column("id", sa.BigInteger(), autoincrement=True, nullable=False),
+        sa.Column("order_id", sa.BigInteger(), nullable=False),
+        sa.Column("courier_name", sa.String(length=60), nullable=False),
+        sa.Column("tracking_number", sa.String(length=100), nullable=False),
+        sa.Column("status", sa.String(length=20), nullable=False),
+        sa.Column("shipped_at", sa.DateTime(), nullable=True),
+        sa.Column("delivered_at", sa.DateTime(), nullable=True),
+        sa.PrimaryKeyConstraint("id"),
+    )
+    create_table_if_missing(
+        "tag",
+        sa.Column("id", sa.Integer(), autoincrement=True, nullable=False),
+        sa.Column("name", sa.String(length=60), nullable=False),
+        sa.PrimaryKeyConstraint("id"),
+        sa.UniqueConstraint("name"),
+    )
+    create_table_if_missing(
+        "user",
+        sa.Column("id", sa.BigInteger(), autoincrement=True, nullable=False),
+        sa.Column("email", sa.String(length=255), nullable=False),
+        sa.Column("nickname", sa.String(length=60), nullable=True),
+        sa.Column("phone_number", sa.String(length=20), nullable=True),
+        sa.Column("profile_image_url", sa.Text(), nullable=True),
+        sa.Column("is_phone_verified", sa.Boolean(), nullable=False),
+        sa.Column(
+            "created_at",
+            sa.DateTime(timezone=True),
+            server_default=sa.func.now(),
+            nullable=False,
+        ),
+        sa.Column(
+            "updated_at",
+            sa.DateTime(timezone=True),
+            server_default=sa.func.now(),
+            nullable=False,
+        ),
+        sa.PrimaryKeyConstraint("id"),
+    )
+    create_index_if_missing("ix_user_email", "user", ["email"], unique=True)
+    create_index_if_missing("ix_user_id", "user", ["id"])
+    create_index_if_missing(
+        "ix_user_phone_number", "user", ["phone_number"], unique=True
+    )
+    create_table_if_missing(
+        "address",
+        sa.Column("id", sa.BigInteger(), autoincrement=True, nullable=False),
+        sa.Column("user_id", sa.BigInteger(), nullable=False),
+        sa.Column("recipient_name", sa.String(length=60), nullable=False),
+        sa.Column("phone_e164", sa.String(length=20), nullable=False),
+        sa.Column("postcode", sa.String(length=10), nullable=True),
+        sa.Column("address1", sa.String(length=255), nullable=False),
+        sa.Column("address2", sa.String(length=255), nullable=True),
+        sa.Column("is_default", sa.Boolean(), nullable=False),
+        sa.Column(
+            "created_at",
+            sa.DateTime(timezone=True),
+            server_default=sa.func.now(),
+            nullable=False,
+        ),
+        sa.Column(
+            "updated_at",
+            sa.DateTime(timezone=True),
+            server_default=sa.func.now(),
+            nullable=False,
+        ),
+        sa.ForeignKeyConstraint(
+            ["user_id"],
+            ["user.id"],
+        ),
+        sa.PrimaryKeyConstraint("id"),
+    )
+    create_index_if_missing("ix_address_user_id", "address", ["user_id"])
+    create_table_if_missing(
+        "auth_provider",
+        sa.Column("id", sa.BigInteger(), autoincrement=True, nullable=False),
+        sa.Column("user_id", sa.BigInteger(), nullable=False),
+        sa.Column("provider", sa.String(length=10), nullable=False),
+        sa.Column("provider_user_id", sa.String(length=191), nullable=False),
+        sa.Column("email", sa.String(length=255), nullable=True),
+        sa.Column("raw_profile_json", sa.JSON(), nullable=True),
+        sa.Column(
+            "linked_at",
+            sa.DateTime(timezone=True),
+            server_default=sa.func.now(),
+            nullable=False,
+        ),
+        sa.ForeignKeyConstraint(
+            ["user_id"],
+            ["user.id"],
+        ),
+        sa.PrimaryKeyConstraint("id"),
+        sa.UniqueConstraint("provider", "provider_user_id"),
+    )
+    create_index_if_missing("ix_auth_provider_user_id", "auth_provider", ["user_id"])
+    create_table_if_missing(
+        "order_item",
+        sa.Column("id", sa.BigInteger(), autoincrement=True, nullable=False),
+        sa.Column("order_id", sa.BigInteger(), nullable=False),
+        sa.Column("product_id", sa.BigInteger(), nullable=False),
+        sa.Column("quantity", sa.Integer(), nullable=False),
+        sa.Column("unit_price", sa.DECIMAL(precision=12, scale=2), nullable=False),
+        sa.Column("subtotal_amount", sa.DECIMAL(precision=12, scale=2), nullable=False),
+        sa.ForeignKeyConstraint(
+            ["order_id"],
+            ["order.id"],
+        ),
+        sa.PrimaryKeyConstraint("id"),
+    )
+    create_table_if_missing(
+        "payment_method",
+        sa.Column("id", sa.BigInteger(), autoincrement=True, nullable=False),
+        sa.Column("user_id", sa.BigInteger(), nullable=False),
+        sa.Column("provider", sa.String(length=10), nullable=False),
+        sa.Column("external_key", sa.String(length=191), nullable=False),
+        sa.Column("masked_info", sa.String(length=191), nullable=True),
+        sa.Column("is_default", sa.Boolean(), nullable=False),
+        sa.Column(
+            "created_at",
+            sa.DateTime(timezone=True),
+            server_default=sa.func.now(),
+            nullable=False,
+        ),
+        sa.ForeignKeyConstraint(
+            ["user_id"],
+            ["user.id"],
+        ),
+        sa.PrimaryKeyConstraint("id"),
+        sa.UniqueConstraint("user_id", "provider", "external_key"),
+    )
+    create_index_if_missing("ix_payment_method_user_id", "payment_method", ["user_id"])
+    create_table_if_missing(
+        "product",
+        sa.Column("id", sa.BigInteger(), autoincrement=True, nullable=False),
+        sa.Column("popup_store_id", sa.BigInteger(), nullable=False),
+        sa.Column("category", sa.String(length=50), nullable=False),
+        sa.Column("name", sa.String(length=200), nullable=False),
+        sa.Column("summary", sa.String(length=500), nullable=True),
+        sa.Column("description", sa.String(length=1024), nullable=True),
+        sa.Column("material", sa.String(length=120), nullable=True),
+        sa.Column("place_of_use", sa.String(length=120), nullable=True),
+        sa.Column("width_cm", sa.DECIMAL(precision=6, scale=2), nullable=True),
+        sa.Column("height_cm", sa.DECIMAL(precision=6, scale=2), nullable=True),
+        sa.Column("tolerance_cm", sa.DECIMAL(precision=5, scale=2), nullable=True),
+        sa.Column("edition_info", sa.String(length=120), nullable=True),
+        sa.Column("condition_note", sa.String(length=255), nullable=True),
+        sa.Column("price", sa.DECIMAL(precision=12, scale=2), nullable=False),
+        sa.Column("stock", sa.Integer(), nullable=False),
+        sa.Column("shipping_base_fee", sa.Integer(), nullable=False),
+        sa.Column("shipping_free_threshold", sa.Integer(), nullable=True),
+        sa.Column("shipping_extra_note", sa.String(length=1024), nullable=True),
+        sa.Column("courier_name", sa.String(length=60), nullable=True),
+        sa.Column("is_active", sa.Integer(), nullable=False),
+        sa.Column("is_sold", sa.Integer(), nullable=False),
+        sa.Column(
+            "created_at", sa.DateTime(), server_default=sa.func.now(), nullable=False
+        ),
+        sa.Column(
+            "updated_at", sa.DateTime(), server_default=sa.func.now(), nullable=False
+        ),
+        sa.ForeignKeyConstraint(
+            ["popup_store_id"],
+            ["popup_store.id"],
+        ),
+        sa.PrimaryKeyConstraint("id"),
+    )
+    create_table_if_missing(
+        "auction",
+        sa.Column("id", sa.BigInteger(), autoincrement=True, nullable=False),
+        sa.Column("product_id", sa.BigInteger(), nullable=False),
+        sa.Column("start_price", sa.DECIMAL(precision=12, scale=2), nullable=False),
+        sa.Column("min_bid_price", sa.DECIMAL(precision=12, scale=2), nullable=False),
+        sa.Column("buy_now_price", sa.DECIMAL(precision=12, scale=2), nullable=True),
+        sa.Column("deposit_amount", sa.DECIMAL(precision=12, scale=2), nullable=False),
+        sa.Column("starts_at", sa.DateTime(), nullable=False),
+        sa.Column("ends_at", sa.DateTime(), nullable=False),
+        sa.Column("status", sa.String(length=10), nullable=False),
+        sa.Column(
+            "created_at", sa.DateTime(), server_default=sa.func.now(), nullable=False
+        ),
+        sa.Column(
+            "updated_at", sa.DateTime(), server_default=sa.func.now(), nullable=False
+        ),
+        sa.ForeignKeyConstraint(
+            ["product_id"],
+            ["product.id"],
+        ),
+        sa.PrimaryKeyConstraint("id"),
+        sa.UniqueConstraint("product_id"),
+    )
+    create_table_if_missing(
+        "product_image",
+        sa.Column("id", sa.BigInteger(), autoincrement=True, nullable=False),
+        sa.Column("product_id", sa.BigInteger(), nullable=False),
+        sa.Column("image_type", sa.String(length=10), nullable=False),
+        sa.Column("image_url", sa.String(length=1024), nullable=False),
+        sa.Column("sort_order", sa.Integer(), nullable=False),
+        sa.ForeignKeyConstraint(
+            ["product_id"],
+            ["product.id"],
+        ),
+        sa.PrimaryKeyConstraint("id"),
+    )
+    create_table_if_missing(
+        "product_tag",
+        sa.Column("product_id", sa.BigInteger(), nullable=False),
+        sa.Column("tag_id", sa.Integer(), nullable=False),
+        sa.ForeignKeyConstraint(
+            ["product_id"],
+            ["product.id"],
+        ),
+        sa.ForeignKeyConstraint(
+            ["tag_id"],
+            ["tag.id"],
+        ),
+        sa.PrimaryKeyConstraint("product_id", "tag_id"),
+    )
+    create_table_if_missing(
+        "story",
+        sa.Column("id", sa.BigInteger(), autoincrement=True, nullable=False),
+        sa.Column("user_id", sa.BigInteger(), nullable=False),
+        sa.Column("product_id", sa.BigInteger(), nullable=False),
+        sa.Column("title", sa.String(length=200), nullable=False),
+        sa.Column("content", sa.Text(), nullable=False),
+        sa.Column(
+            "created_at", sa.DateTime(), server_default=sa.func.now(), nullable=False
+        ),
+        sa.Column(
+            "updated_at", sa.DateTime(), server_default=sa.func.now(), nullable=False
+        ),
+        sa.ForeignKeyConstraint(
+            ["product_id"],
+            ["product.id"],
+        ),
+        sa.ForeignKeyConstraint(
+            ["user_id"],
+            ["user.id"],
+        ),
+        sa.PrimaryKeyConstraint("id"),
+    )
+    create_table_if_missing(
+        "auction_deposit",
+        sa.Column("id", sa.BigInteger(), autoincrement=True, nullable=False),
+        sa.Column("auction_id", sa.BigInteger(), nullable=False),
+        sa.Column("user_id", sa.BigInteger(), nullable=False),
+        sa.Column("payment_id", sa.BigInteger(), nullable=True),
+        sa.Column("amount", sa.DECIMAL(precision=12, scale=2), nullable=False),
+        sa.Column("status", sa.String(length=10), nullable=False),
+        sa.Column(
+            "created_at", sa.DateTime(), server_default=sa.func.now(), nullable=False
+        ),
+        sa.ForeignKeyConstraint(
+            ["auction_id"],
+            ["auction.id"],
+        ),
+        sa.PrimaryKeyConstraint("id"),
+        sa.UniqueConstraint("auction_id", "user_id", name="uq_deposit_user_auction"),
+    )
+    create_index_if_missing("idx_ad_auction", "auction_deposit", ["auction_id"])
+    create_index_if_missing("idx_ad_user", "auction_deposit", ["user_id"])
+    create_table_if_missing(
+        "auction_stats",
+        sa.Column("auction_id", sa.BigInteger(), nullable=False),
+        sa.Column(
+            "current_highest_bid", sa.DECIMAL(precision=12, scale=2), nullable=True
+        ),
+        sa.Column("bidder_count", sa.Integer(), nullable=False),
+        sa.Column("bid_count", sa.Integer(), nullable=False),
+        sa.Column("last_bid_at", sa.DateTime(), nullable=True),
+        sa.Column(
+            "updated_at", sa.DateTime(), server_default=sa.func.now(), nullable=False
+        ),
+        sa.ForeignKeyConstraint(
+            ["auction_id"],
+            ["auction.id"],
+        ),
+        sa.PrimaryKeyConstraint("auction_id"),
+    )
+    create_index_if_missing("idx_as_bidder_count", "auction_stats", ["bidder_count"])
+    create_index_if_missing(
+        "idx_as_highest_bid", "auction_stats", ["current_highest_bid"]
+    )
+    create_table_if_missing(
+        "bid",
+        sa.Column("id", sa.BigInteger(), autoincrement=True, nullable=False),
+        sa.Column("auction_id", sa.BigInteger(), nullable=False),
+        sa.Column("user_id", sa.BigInteger(), nullable=False),
+        sa.Column("bid_order", sa.Integer(), nullable=False),
+        sa.Column("amount", sa.DECIMAL(precision=12, scale=2), nullable=False),
+        sa.Column(
+            "created_at", sa.DateTime(), server_default=sa.func.now(), nullable=False
+        ),
+        sa.ForeignKeyConstraint(
+            ["auction_id"],
+            ["auction.id"],
+        ),
+        sa.PrimaryKeyConstraint("id"),
+        sa.UniqueConstraint("auction_id", "bid_order", name="uq_bid_auction_order"),
+    )
+    create_table_if_missing(
+        "story_image",
+        sa.Column("id", sa.BigInteger(), autoincrement=True, nullable=False),
+        sa.Column("story_id", sa.BigInteger(), nullable=False),
+        sa.Column("image_url", sa.Text(), nullable=False),
+        sa.Column("sort_order", sa.Integer(), nullable=False),
+        sa.ForeignKeyConstraint(
+            ["story_id"],
+            ["story.id"],
+        ),
+        sa.PrimaryKeyConstraint("id"),
+    )
+    create_table_if_missing(
+        "auction_offer",
+        sa.Column("id", sa.BigInteger(), autoincrement=True, nullable=False),
+        sa.Column("auction_id", sa.BigInteger(), nullable=False),
+        sa.Column("bid_id", sa.BigInteger(), nullable=False),
+        sa.Column("user_id", sa.BigInteger(), nullable=False),
+        sa.Column("rank_order", sa.Integer(), nullable=False),
+        sa.Column("status", sa.String(length=30), nullable=False),
+        sa.Column(
+            "offered_at", sa.DateTime(), server_default=sa.func.now(), nullable=False
+        ),
+        sa.Column("expires_at", sa.DateTime(), nullable=False),
+        sa.Column("order_id", sa.BigInteger(), nullable=True),
+        sa.Column(
+            "created_at", sa.DateTime(), server_default=sa.func.now(), nullable=False
+        ),
+        sa.Column(
+            "updated_at", sa.DateTime(), server_default=sa.func.now(), nullable=False
+        ),
+        sa.ForeignKeyConstraint(
+            ["auction_id"],
+            ["auction.id"],
+        ),
+        sa.ForeignKeyConstraint(
+            ["bid_id"],
+            ["bid.id"],
+        ),
+        sa.PrimaryKeyConstraint("id"),
+    )
+
+
+def downgrade() -> None:
+    op.drop_table("auction_offer")
+    op.drop_table("story_image")
+    op.drop_table("bid")
+    op.drop_table("auction_stats")
+    op.drop_table("auction_deposit")
+    op.drop_table("story")
+    op.drop_table("product_tag")
+    op.drop_table("product_image")
+    op.drop_table("auction")
+    op.drop_table("product")
+    op.drop_table("payment_method")
+    op.drop_table("order_item")
+    op.drop_table("auth_provider")
+    op.drop_table("address")
+    op.drop_table("user")
+    op.drop_table("tag")
+    op.drop_table("shipment")
+    op.drop_table("popup_store")
+    op.drop_table("phone_verification")
+    op.drop_table("payment_refund")
+    op.drop_table("payment_log")
+    op.drop_table("payment")
+    op.drop_table("order")
+    op.drop_table("notification_outbox")
+    op.drop_table("notification")
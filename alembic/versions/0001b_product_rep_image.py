@@ -0,0 +1,42 @@
+"""product: 대표 이미지 비정규화 컬럼 (representative_image_url) + 백필
+
+PRODUCT_REP_IMAGE_FROM_COLUMN을 켜기 전에 적용되어 있어야 한다.
+이후 정합성 복구: python -m app.batch.product_rep_image_backfill
+
+Revision ID: 0001b_product_rep_image
+Revises: 0001_baseline
+Create Date: 2025-09-01 00:00:00
+"""
+
+from alembic import op
+import sqlalchemy as sa
+
+from app.db.migration_helpers import context_is_offline, has_column
+
+revision = "0001b_product_rep_image"
+down_revision = "0001_baseline"
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    if context_is_offline() or not has_column("product", "representative_image_url"):
+        op.add_column("product", sa.Column("representative_image_url", sa.String(1024)))
+    # sort_order가 가장 작은 이미지로 백필 (상품 수정이 아니므로 updated_at 유지)
+    op.execute(
+        """
+        UPDATE product SET
+          representative_image_url = (
+            SELECT pi.image_url FROM product_image pi
+            WHERE pi.product_id = product.id
+            ORDER BY pi.sort_order ASC, pi.id ASC
+            LIMIT 1
+          ),
+          updated_at = updated_at
+        WHERE representative_image_url IS NULL
+        """
+    )
+
+
+def downgrade() -> None:
+    op.drop_column("product", "representative_image_url")
@@ -0,0 +1,39 @@
+"""product: 키워드 검색 ngram FULLTEXT 색인
+
+Revision ID: 0002_product_search
+Revises: 0001b_product_rep_image
+Create Date: 2025-09-01 00:00:00
+"""
+
+from alembic import op
+
+from app.db.migration_helpers import (
+    create_index_if_missing,
+    drop_index_if_exists,
+    is_mysql,
+)
+
+revision = "0002_product_search"
+down_revision = "0001b_product_rep_image"
+branch_labels = None
+depends_on = None
+
+FULLTEXT_INDEXES = [
+    ("ft_product_text", "product", ["name", "summary", "description"]),
+    ("ft_product_name", "product", ["name"]),
+    ("ft_popup_store_name", "popup_store", ["name"]),
+]
+
+
+def upgrade() -> None:
+    if is_mysql():
+        for name, table, columns in FULLTEXT_INDEXES:
+            create_index_if_missing(
+                name, table, columns, mysql_prefix="FULLTEXT", mysql_with_parser="ngram"
+            )
+
+
+def downgrade() -> None:
+    if is_mysql():
+        for name, table, _ in FULLTEXT_INDEXES:
+            drop_index_if_exists(name, table)
@@ -0,0 +1,55 @@
+"""핫 경로 조회 조건 복합 색인
+
+Revision ID: 0003_hot_path_indexes
+Revises: 0002_product_search
+Create Date: 2025-09-01 00:00:00
+"""
+
+from alembic import op
+
+from app.db.migration_helpers import (
+    create_index_if_missing,
+    drop_index_if_exists,
+    is_mysql,
+)
+
+revision = "0003_hot_path_indexes"
+down_revision = "0002_product_search"
+branch_labels = None
+depends_on = None
+
+INDEXES = [
+    ("idx_bid_auction_amount", "bid", ["auction_id", "amount"]),
+    ("idx_bid_auction_user", "bid", ["auction_id", "user_id"]),
+    ("idx_bid_user_created", "bid", ["user_id", "created_at"]),
+    ("idx_auction_status_ends", "auction", ["status", "ends_at"]),
+    ("idx_auction_status_starts", "auction", ["status", "starts_at"]),
+    ("idx_notification_user_sent", "notification", ["user_id", "sent_at"]),
+    ("idx_notification_user_status", "notification", ["user_id", "status"]),
+    ("idx_pi_product_sort", "product_image", ["product_id", "sort_order"]),
+    ("idx_product_store_active", "product", ["popup_store_id", "is_active", "is_sold"]),
+    ("idx_oi_product", "order_item", ["product_id"]),
+    ("idx_payment_order_status", "payment", ["order_id", "status"]),
+    ("idx_shipment_order", "shipment", ["order_id"]),
+]
+
+# MySQL은 FK 컬럼으로 시작하는 색인이 생기면 FK 자동 색인을 지우므로,
+# 되돌릴 때 FK를 받칠 단일 컬럼 색인을 먼저 만든다
+FK_FALLBACK_INDEXES = [
+    ("idx_bid_auction", "bid", ["auction_id"]),
+    ("idx_pi_product", "product_image", ["product_id"]),
+    ("idx_product_store", "product", ["popup_store_id"]),
+]
+
+
+def upgrade() -> None:
+    for name, table, columns in INDEXES:
+        create_index_if_missing(name, table, columns)
+
+
+def downgrade() -> None:
+    if is_mysql():
+        for name, table, columns in FK_FALLBACK_INDEXES:
+            create_index_if_missing(name, table, columns)
+    for name, table, _ in reversed(INDEXES):
+        drop_index_if_exists(name, table)
@@ -0,0 +1,30 @@
+"""popup_store: updated_at 컬럼 (스토어명 변경을 검색 색인 증분 반영에 포함)
+
+Revision ID: 0004_popup_store_updated_at
+Revises: 0003_hot_path_indexes
+Create Date: 2025-09-01 00:00:00
+"""
+
+from alembic import op
+import sqlalchemy as sa
+
+from app.db.migration_helpers import context_is_offline, has_column
+
+revision = "0004_popup_store_updated_at"
+down_revision = "0003_hot_path_indexes"
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    if context_is_offline() or not has_column("popup_store", "updated_at"):
+        op.add_column(
+            "popup_store",
+            sa.Column(
+                "updated_at", sa.DateTime(), server_default=sa.func.now(), nullable=False
+            ),
+        )
+
+
+def downgrade() -> None:
+    op.drop_column("popup_store", "updated_at")
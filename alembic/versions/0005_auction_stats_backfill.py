@@ -0,0 +1,35 @@
+"""auction_stats: 기존 bid로 집계 백필
+
+auction_stats 도입 전부터 입찰이 있던 경매는 집계 행이 없어 최고가/입찰자 수가 비어 있으므로
+bid 원본으로 다시 계산한다 (AuctionStatsRepository.reconcile과 같은 집계, 재실행해도 결과 동일).
+
+Revision ID: 0005_auction_stats_backfill
+Revises: 0004_popup_store_updated_at
+Create Date: 2025-09-01 00:00:00
+"""
+
+from alembic import op
+
+revision = "0005_auction_stats_backfill"
+down_revision = "0004_popup_store_updated_at"
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    # 도입 후 마이그레이션 전에 들어온 입찰이 만든 집계(첫 입찰부터 센 값)도 함께 교정
+    op.execute("DELETE FROM auction_stats")
+    op.execute(
+        """
+        INSERT INTO auction_stats
+          (auction_id, current_highest_bid, bidder_count, bid_count, last_bid_at)
+        SELECT auction_id, MAX(amount), COUNT(DISTINCT user_id), COUNT(id), MAX(created_at)
+        FROM bid
+        GROUP BY auction_id
+        """
+    )
+
+
+def downgrade() -> None:
+    # 데이터 백필이므로 되돌릴 스키마 변경 없음
+    pass
@@ -1,7 +1,6 @@
 from fastapi import APIRouter, Depends, Query, Path
-from sqlalchemy.orm import Session
 from typing import Optional
-from app.core.deps import get_db
+from app.core.deps import get_uow
 from app.core.auth_deps import require_admin
 from app.domains.common.paging import Page
 from app.domains.auctions.admin_dto import (
@@ -12,22 +11,21 @@ from app.domains.auctions.admin_dto import (
     AdminAuctionShipmentInfo,
 )
 from app.domains.auctions.admin_service import AuctionAdminService
-from app.repositories.auction_admin_read import AuctionAdminReadRepository
-from app.repositories.auction_admin_write import AuctionAdminWriteRepository
-from app.repositories.auction_read import AuctionReadRepository
 from app.domains.notifications.service import NotificationService
+from app.infrastructure.db.uow import SqlAlchemyUnitOfWork
 from app.domains.common.error_response import BusinessErrorResponse, ServerErrorResponse
 from app.domains.auctions.buy_now_result import BuyNowResult
 from app.domains.auctions.service import AuctionService as AuctionDomainService
+from app.api.v1.endpoints.auction_actions import get_auction_service
 
 
-def get_admin_service(db: Session = Depends(get_db)) -> AuctionAdminService:
+def get_admin_service(uow: SqlAlchemyUnitOfWork = Depends(get_uow)) -> AuctionAdminService:
     return AuctionAdminService(
-        db,
-        AuctionAdminReadRepository(db),
-        AuctionAdminWriteRepository(db),
-        AuctionReadRepository(db),
-        NotificationService(db),
+        uow.session,
+        uow.auction_admin_read,
+        uow.auction_admin_write,
+        uow.auctions_read,
+        NotificationService(uow.session, uow.notifications),
     )
 
 
@@ -47,7 +45,7 @@ class AdminAuctionsAPI:
                 500: {"model": ServerErrorResponse, "description": "서버 내부 오류"},
             },
         )
-        async def list_auctions(
+        def list_auctions(
             service: AuctionAdminService = Depends(get_admin_service),
             page: int = Query(1, ge=1, description="페이지 번호(1부터)"),
             size: int = Query(20, ge=1, le=100, description="페이지 크기(기본 20, 최대 100)"),
@@ -56,8 +54,8 @@ class AdminAuctionsAPI:
             store_name: Optional[str] = Query(None, description="스토어명 검색"),
             status: Optional[str] = Query(None, description="상태 ALL|SCHEDULED|RUNNING|ENDED|CANCELLED"),
             result: Optional[str] = Query(None, description="WON|LOST|ALL"),
-            payment_status: Optional[str] = Query(None, description="결제 상태(대기/확인/취소)"),
-            shipment_status: Optional[str] = Query(None, description="배송 상태(대기/처리/조회/완료)"),
+            payment_status: Optional[str] = Query(None, description="결제 상태 ALL|대기|확인|취소"),
+            shipment_status: Optional[str] = Query(None, description="배송 상태 ALL|대기|처리|조회|완료"),
             starts_from: Optional[str] = Query(None, description="시작일시 FROM(UTC ISO8601)"),
             starts_to: Optional[str] = Query(None, description="시작일시 TO(UTC ISO8601)"),
             ends_from: Optional[str] = Query(None, description="종료일시 FROM(UTC ISO8601)"),
@@ -93,7 +91,7 @@ class AdminAuctionsAPI:
                 500: {"model": ServerErrorResponse, "description": "서버 내부 오류"},
             },
         )
-        async def get_detail(
+        def get_detail(
             auction_id: int = Path(..., description="경매 ID"),
             service: AuctionAdminService = Depends(get_admin_service),
         ):
@@ -111,7 +109,7 @@ class AdminAuctionsAPI:
                 500: {"model": ServerErrorResponse, "description": "서버 내부 오류"},
             },
         )
-        async def upsert_auction(
+        def upsert_auction(
             req: AdminAuctionUpsertRequest,
             service: AuctionAdminService = Depends(get_admin_service),
         ):
@@ -129,7 +127,7 @@ class AdminAuctionsAPI:
                 500: {"model": ServerErrorResponse, "description": "서버 내부 오류"},
             },
         )
-        async def update_auction(
+        def update_auction(
             auction_id: int = Path(..., description="경매 ID"),
             req: AdminAuctionUpsertRequest = ...,  # 전체 필드 기준 수정 (부분 수정 필요 시 알려주세요)
             service: AuctionAdminService = Depends(get_admin_service),
@@ -152,7 +150,7 @@ class AdminAuctionsAPI:
                 500: {"model": ServerErrorResponse, "description": "서버 내부 오류"},
             },
         )
-        async def update_status(
+        def update_status(
             auction_id: int = Path(..., description="경매 ID"),
             req: AdminAuctionStatusUpdateRequest = ...,
             service: AuctionAdminService = Depends(get_admin_service),
@@ -166,7 +164,7 @@ class AdminAuctionsAPI:
             description="배송 상태는 조회만 가능합니다.",
             response_description="배송 정보",
         )
-        async def get_shipping(
+        def get_shipping(
             auction_id: int = Path(..., description="경매 ID"),
             service: AuctionAdminService = Depends(get_admin_service),
         ):
@@ -184,17 +182,9 @@ class AdminAuctionsAPI:
                 500: {"model": ServerErrorResponse, "description": "서버 내부 오류"},
             },
         )
-        async def finalize(
+        def finalize(
             auction_id: int = Path(..., description="경매 ID"),
-            domain: AuctionDomainService = Depends(lambda db=Depends(get_db): AuctionDomainService(
-                db,
-                AuctionReadRepository(db),
-                __import__('app.repositories.auction_write', fromlist=['AuctionWriteRepository']).AuctionWriteRepository(db),
-                __import__('app.repositories.order_write', fromlist=['OrderWriteRepository']).OrderWriteRepository(db),
-                __import__('app.repositories.payment_write', fromlist=['PaymentWriteRepository']).PaymentWriteRepository(db),
-                __import__('app.repositories.auction_deposit', fromlist=['AuctionDepositRepository']).AuctionDepositRepository(db),
-                __import__('app.domains.notifications.service', fromlist=['NotificationService']).NotificationService(db),
-            )),
+            domain: AuctionDomainService = Depends(get_auction_service),
         ):
             return domain.finalize_winner_and_charge(auction_id=auction_id)
 
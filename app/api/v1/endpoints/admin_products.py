@@ -1,12 +1,12 @@
 from fastapi import APIRouter, Depends, Query
 from sqlalchemy import desc
-from sqlalchemy.orm import Session
 from typing import List, Optional
 from app.core.auth_deps import require_admin
 from app.domains.common.error_response import BusinessErrorResponse, ServerErrorResponse
 from app.domains.common.paging import Page
 
-from app.core.deps import get_db
+from app.core.deps import get_uow
+from app.infrastructure.db.uow import SqlAlchemyUnitOfWork
 from app.domains.products.admin_service import ProductAdminService
 from app.domains.products.enums import ProductCategory
 from app.domains.products.admin_product import (
@@ -16,8 +16,8 @@ from app.domains.products.admin_product import (
 )
 
 
-def get_product_service(db: Session = Depends(get_db)) -> ProductAdminService:
-    return ProductAdminService(db)
+def get_product_service(uow: SqlAlchemyUnitOfWork = Depends(get_uow)) -> ProductAdminService:
+    return ProductAdminService(uow.session, uow.products_admin_read, uow.products_admin_write)
 
 
 class AdminProductsAPI:
@@ -41,7 +41,7 @@ class AdminProductsAPI:
                 },
             },
         )
-        async def get_product_list_page(
+        def get_product_list_page(
             service: ProductAdminService = Depends(get_product_service),
             page: int = Query(1, ge=1, description="페이지 번호(1부터)"),
             size: int = Query(
@@ -97,7 +97,7 @@ class AdminProductsAPI:
                 },
             },
         )
-        async def get_product_detail(
+        def get_product_detail(
             product_id: int,
             service: ProductAdminService = Depends(get_product_service),
         ) -> ProductAdminMeta:
@@ -120,7 +120,7 @@ class AdminProductsAPI:
                 },
             },
         )
-        async def create_product(
+        def create_product(
             product_data: ProductCreateOrUpdate,
             service: ProductAdminService = Depends(get_product_service),
         ) -> ProductAdminMeta:
@@ -1,19 +1,19 @@
 from fastapi import APIRouter, Depends, Query
 from sqlalchemy import desc
-from sqlalchemy.orm import Session
 from typing import List, Optional
 from app.core.auth_deps import require_admin
 from app.domains.common.error_response import BusinessErrorResponse, ServerErrorResponse
 from app.domains.common.paging import Page
 
-from app.core.deps import get_db
+from app.core.deps import get_uow
+from app.infrastructure.db.uow import SqlAlchemyUnitOfWork
 from app.domains.products.admin_service import ProductAdminService
 from app.domains.products.admin_store import StoreCreateOrUpdate, StoreAdminMeta
 from app.domains.products.store_meta import StoreMeta
 
 
-def get_product_service(db: Session = Depends(get_db)) -> ProductAdminService:
-    return ProductAdminService(db)
+def get_product_service(uow: SqlAlchemyUnitOfWork = Depends(get_uow)) -> ProductAdminService:
+    return ProductAdminService(uow.session, uow.products_admin_read, uow.products_admin_write)
 
 
 class AdminStoresAPI:
@@ -37,7 +37,7 @@ class AdminStoresAPI:
                 },
             },
         )
-        async def get_store_list_page(
+        def get_store_list_page(
             service: ProductAdminService = Depends(get_product_service),
             page: int = Query(1, ge=1, description="페이지 번호(1부터)"),
             size: int = Query(
@@ -63,7 +63,7 @@ class AdminStoresAPI:
                 },
             },
         )
-        async def get_store_modal_list(
+        def get_store_modal_list(
             service: ProductAdminService = Depends(get_product_service),
         ) -> List[StoreMeta]:
             return service.store_modal_list()
@@ -85,7 +85,7 @@ class AdminStoresAPI:
                 },
             },
         )
-        async def get_store_detail(
+        def get_store_detail(
             store_id: int,
             service: ProductAdminService = Depends(get_product_service),
         ) -> StoreAdminMeta:
@@ -108,7 +108,7 @@ class AdminStoresAPI:
                 },
             },
         )
-        async def create_or_update_store(
+        def create_or_update_store(
             store_data: StoreCreateOrUpdate,
             service: ProductAdminService = Depends(get_product_service),
         ) -> StoreAdminMeta:
@@ -1,29 +1,27 @@
-from fastapi import APIRouter, Depends
-from sqlalchemy.orm import Session
-from app.core.deps import get_db
+from fastapi import APIRouter, Depends, Request
+from fastapi.responses import StreamingResponse
+from app.core.deps import get_uow
 from app.core.auth_deps import get_current_user_id_verified
 from app.domains.auctions.service import AuctionService
 from app.domains.auctions.bid_result import BidResult
 from app.domains.auctions.buy_now_result import BuyNowResult
-from app.repositories.auction_read import AuctionReadRepository
-from app.repositories.auction_write import AuctionWriteRepository
-from app.repositories.order_write import OrderWriteRepository
-from app.repositories.payment_write import PaymentWriteRepository
 from app.domains.notifications.service import NotificationService
-from app.repositories.auction_deposit import AuctionDepositRepository
+from app.infrastructure.db.uow import SqlAlchemyUnitOfWork
 from app.domains.common.error_response import BusinessErrorResponse, ServerErrorResponse
 from app.domains.auctions.service import AuctionService as AuctionDomainService
+from app.domains.auctions.events import auction_channel, auction_event_hub
+from app.infrastructure.realtime.hub import sse_stream
 
 
-def get_auction_service(db: Session = Depends(get_db)) -> AuctionService:
+def get_auction_service(uow: SqlAlchemyUnitOfWork = Depends(get_uow)) -> AuctionService:
     return AuctionService(
-        db,
-        AuctionReadRepository(db),
-        AuctionWriteRepository(db),
-        OrderWriteRepository(db),
-        PaymentWriteRepository(db),
-        AuctionDepositRepository(db),
-        NotificationService(db),
+        uow.session,
+        uow.auctions_read,
+        uow.auctions_write,
+        uow.orders,
+        uow.payments,
+        uow.auction_deposits,
+        NotificationService(uow.session, uow.notifications),
     )
 
 
@@ -79,7 +77,7 @@ class AuctionAPI:
                 500: {"model": ServerErrorResponse, "description": "서버 내부 오류"},
             },
         )
-        async def bid(
+        def bid(
             auction_id: int,
             amount: float,
             service: AuctionService = Depends(get_auction_service),
@@ -125,13 +123,35 @@ class AuctionAPI:
                 500: {"model": ServerErrorResponse, "description": "서버 내부 오류"},
             },
         )
-        async def buy_now(
+        def buy_now(
             auction_id: int,
             service: AuctionService = Depends(get_auction_service),
             user_id: int = Depends(get_current_user_id_verified),
         ):
             return service.buy_now(auction_id=auction_id, user_id=user_id)
 
+        @self.router.get(
+            "/{auction_id}/events",
+            summary="경매 실시간 이벤트 구독 (SSE)",
+            description=(
+                "경매의 새 최고 입찰(BID), 추월(OVERTAKEN), 즉시구매(BUY_NOW), 시작(STARTED), 종료(ENDED) 이벤트를 "
+                "Server-Sent Events로 전달합니다. 각 메시지의 event는 종류, data는 JSON입니다. "
+                "이벤트가 없을 때는 주기적으로 ': ping' 주석을 보냅니다."
+            ),
+            response_class=StreamingResponse,
+            responses={200: {"content": {"text/event-stream": {}}}},
+        )
+        async def auction_events(auction_id: int, request: Request):
+            return StreamingResponse(
+                sse_stream(
+                    auction_event_hub,
+                    auction_channel(auction_id),
+                    is_disconnected=request.is_disconnected,
+                ),
+                media_type="text/event-stream",
+                headers={"Cache-Control": "no-cache", "X-Accel-Buffering": "no"},
+            )
+
         # finalize endpoint moved to admin router
 
 
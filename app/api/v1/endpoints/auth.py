@@ -1,8 +1,8 @@
 from fastapi import APIRouter, Depends, HTTPException, Query, Request, Response, status
 from fastapi.responses import RedirectResponse
-from sqlalchemy.orm import Session
+from starlette.concurrency import run_in_threadpool
 from app.core.config import settings
-from app.core.deps import get_db
+from app.core.deps import get_uow
 from app.core.security import (
     create_access_token,
     get_google_id_token,
@@ -11,12 +11,11 @@ from app.core.security import (
 from app.domains.auth.enum import PROVIDER_TYPE
 from app.domains.auth.models import Login_url, Token
 from app.domains.users.service import UserService
-from app.repositories.user_read import UserReadRepository
-from app.repositories.user_write import UserWriteRepository
+from app.infrastructure.db.uow import SqlAlchemyUnitOfWork
 
 
-def get_user_service(db: Session = Depends(get_db)) -> UserService:
-    return UserService(db, UserReadRepository(db), UserWriteRepository(db))
+def get_user_service(uow: SqlAlchemyUnitOfWork = Depends(get_uow)) -> UserService:
+    return UserService(uow.session, uow.users_read, uow.users_write)
 
 
 class AuthAPI:
@@ -69,7 +68,9 @@ class AuthAPI:
                 raise HTTPException(status_code=400, detail="Invalid Google ID token")
 
             try:
-                user = service.signup_user_with_oauth(
+                # 동기 DB 호출은 스레드풀에서 실행 (이벤트 루프 블로킹 방지)
+                user = await run_in_threadpool(
+                    service.signup_user_with_oauth,
                     email=id_info.get("email"),
                     nickname=id_info.get("name"),
                     provider=PROVIDER_TYPE.GOOGLE,
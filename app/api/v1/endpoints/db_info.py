@@ -13,7 +13,7 @@ router = APIRouter()
 
 
 @router.get("/metadata", response_model=DBInfo, summary="Get MySQL database info")
-async def get_db_info(db: Session = Depends(get_db)) -> DBInfo:
+def get_db_info(db: Session = Depends(get_db)) -> DBInfo:
     version = fetch_database_version(db)
     database = fetch_current_database(db)
     tables = fetch_tables(db)
@@ -1,5 +1,20 @@
 from fastapi import APIRouter
 
+from app.batch.scheduler import auction_scheduler
+from app.db.pool_metrics import pool_status
+from app.db.session import async_engine, async_read_engine, engine, read_engine
+from app.domains.auctions.hot_state import hot_auctions
+from app.domains.products.search import product_search
+from app.domains.system.models import (
+    CacheStats,
+    HotAuctionStats,
+    PoolHealth,
+    PoolStats,
+    SchedulerStats,
+    SearchStats,
+)
+from app.infrastructure.cache.app_cache import app_cache
+
 
 class HealthAPI:
     def __init__(self):
@@ -9,5 +24,64 @@ class HealthAPI:
         async def health() -> dict:
             return {"status": "ok"}
 
+        @self.router.get(
+            "/pool",
+            response_model=PoolHealth,
+            response_model_by_alias=True,
+            summary="DB 커넥션 풀 상태",
+            description="엔진별(primary/replica, sync/async) 풀 크기/사용 중/overflow 현황과 checkout 대기 시간, QueuePool timeout 누적 횟수를 조회합니다.",
+        )
+        async def pool() -> PoolHealth:
+            return PoolHealth(
+                sync=PoolStats(**pool_status(engine)),
+                async_=(
+                    PoolStats(**pool_status(async_engine.sync_engine))
+                    if async_engine is not None
+                    else None
+                ),
+                read=PoolStats(**pool_status(read_engine)) if read_engine is not engine else None,
+                async_read=(
+                    PoolStats(**pool_status(async_read_engine.sync_engine))
+                    if async_read_engine is not None and async_read_engine is not async_engine
+                    else None
+                ),
+            )
+
+        @self.router.get(
+            "/cache",
+            response_model=CacheStats,
+            summary="캐시 통계",
+            description="네임스페이스별 hit/miss/무효화 횟수를 조회합니다 (TTL 튜닝용). 카운터는 워커 프로세스 단위입니다.",
+        )
+        async def cache() -> CacheStats:
+            return CacheStats(**app_cache.stats())
+
+        @self.router.get(
+            "/hot-auctions",
+            response_model=HotAuctionStats,
+            summary="핫 경매 상태 통계",
+            description="메모리에서 추적 중인 경매 수와 조회 hit/miss, 사전 거절 수, 재적재 횟수를 조회합니다. 카운터는 워커 프로세스 단위입니다.",
+        )
+        async def hot_auction_stats() -> HotAuctionStats:
+            return HotAuctionStats(**hot_auctions.stats())
+
+        @self.router.get(
+            "/search",
+            response_model=SearchStats,
+            summary="상품 검색 색인 통계",
+            description="검색 백엔드와 (memory일 때) 색인 문서/term/posting 수, 무효 문서 비율, 검색/재적재 횟수를 조회합니다. 워커 프로세스 단위입니다.",
+        )
+        async def search_stats() -> SearchStats:
+            return SearchStats(**product_search.stats())
+
+        @self.router.get(
+            "/scheduler",
+            response_model=SchedulerStats,
+            summary="경매 스케줄러 상태",
+            description="리더 여부, 대기 중인 시작/종료 예정 수, 다음 예정까지 남은 시간, 예정 시각 대비 배치 완료 지연(p50/p99/max, 최근 1000건)을 조회합니다. SCHEDULER_ENABLED=true로 앱에서 실행 중인 워커 기준입니다.",
+        )
+        async def scheduler_stats() -> SchedulerStats:
+            return SchedulerStats(**auction_scheduler.stats())
+
 
 api = HealthAPI().router
@@ -1,7 +1,11 @@
+from typing import Optional
 from fastapi import APIRouter, Depends, Query
 from sqlalchemy.orm import Session
-from app.core.deps import get_db
-from app.core.auth_deps import get_current_user_id_verified
+from app.core.deps import get_read_db, get_uow
+from app.core.auth_deps import (
+    get_current_user_id_verified,
+    get_current_user_id_verified_read,
+)
 from app.domains.notifications.service import NotificationService
 from app.domains.notifications.dto import (
     NotificationListResult,
@@ -9,10 +13,17 @@ from app.domains.notifications.dto import (
     MarkReadResult,
     UnreadCountResult,
 )
-from app.domains.common.error_response import ServerErrorResponse
+from app.infrastructure.db.uow import SqlAlchemyUnitOfWork
+from app.domains.common.error_response import BusinessErrorResponse, ServerErrorResponse
+
+
+def get_notification_service(uow: SqlAlchemyUnitOfWork = Depends(get_uow)) -> NotificationService:
+    return NotificationService(uow.session, uow.notifications)
 
 
-def get_notification_service(db: Session = Depends(get_db)) -> NotificationService:
+def get_notification_read_service(
+    db: Session = Depends(get_read_db),
+) -> NotificationService:
     return NotificationService(db)
 
 
@@ -26,14 +37,20 @@ class NotificationsAPI:
             summary="내 알림 목록",
             description="최신순으로 정렬된 내 알림을 조회합니다.",
             response_description="알림 리스트",
-            responses={500: {"model": ServerErrorResponse, "description": "서버 내부 오류"}},
+            responses={
+                400: {"model": BusinessErrorResponse, "description": "비즈니스 에러(유효하지 않은 커서)"},
+                500: {"model": ServerErrorResponse, "description": "서버 내부 오류"},
+            },
         )
-        async def list_notifications(
+        def list_notifications(
             limit: int = Query(50, ge=1, le=200),
-            service: NotificationService = Depends(get_notification_service),
-            user_id: int = Depends(get_current_user_id_verified),
+            cursor: Optional[str] = Query(None, description="다음 페이지 커서(응답의 next_cursor)"),
+            service: NotificationService = Depends(get_notification_read_service),
+            user_id: int = Depends(get_current_user_id_verified_read),
         ):
-            return service.list_my_notifications(user_id=user_id, limit=limit)
+            return service.list_my_notifications(
+                user_id=user_id, limit=limit, cursor=cursor
+            )
 
         @self.router.post(
             "/read",
@@ -43,7 +60,7 @@ class NotificationsAPI:
             response_description="처리 결과",
             responses={500: {"model": ServerErrorResponse, "description": "서버 내부 오류"}},
         )
-        async def mark_read(
+        def mark_read(
             req: MarkReadRequest,
             service: NotificationService = Depends(get_notification_service),
             user_id: int = Depends(get_current_user_id_verified),
@@ -59,7 +76,7 @@ class NotificationsAPI:
             response_description="카운트",
             responses={500: {"model": ServerErrorResponse, "description": "서버 내부 오류"}},
         )
-        async def unread_count(
+        def unread_count(
             service: NotificationService = Depends(get_notification_service),
             user_id: int = Depends(get_current_user_id_verified),
         ):
@@ -1,6 +1,5 @@
 from fastapi import APIRouter, Depends
-from sqlalchemy.orm import Session
-from app.core.deps import get_db
+from app.core.deps import get_uow
 from app.core.auth_deps import get_current_user_id_verified
 from app.domains.payments.service import PaymentService
 from app.domains.payments.dto import (
@@ -9,12 +8,12 @@ from app.domains.payments.dto import (
     RefundRequest,
     RefundResult,
 )
-from app.repositories.payment_write import PaymentWriteRepository
+from app.infrastructure.db.uow import SqlAlchemyUnitOfWork
 from app.domains.common.error_response import BusinessErrorResponse, ServerErrorResponse
 
 
-def get_payment_service(db: Session = Depends(get_db)) -> PaymentService:
-    return PaymentService(db, PaymentWriteRepository(db))
+def get_payment_service(uow: SqlAlchemyUnitOfWork = Depends(get_uow)) -> PaymentService:
+    return PaymentService(uow.session, uow.payments)
 
 
 class PaymentsAPI:
@@ -32,7 +31,7 @@ class PaymentsAPI:
                 500: {"model": ServerErrorResponse, "description": "서버 내부 오류"},
             },
         )
-        async def charge(
+        def charge(
             req: ChargeRequest,
             service: PaymentService = Depends(get_payment_service),
             user_id: int = Depends(get_current_user_id_verified),
@@ -51,7 +50,7 @@ class PaymentsAPI:
                 500: {"model": ServerErrorResponse, "description": "서버 내부 오류"},
             },
         )
-        async def refund(
+        def refund(
             req: RefundRequest,
             service: PaymentService = Depends(get_payment_service),
         ):
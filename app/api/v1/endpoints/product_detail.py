@@ -3,7 +3,7 @@ from sqlalchemy.orm import Session
 from typing import List, Optional
 from app.domains.common.paging import Page
 
-from app.core.deps import get_db
+from app.core.deps import get_read_db
 from app.domains.products.product_list_item import ProductListItem
 from app.domains.products.store_meta import StoreMeta
 from app.domains.auctions.auction_info import AuctionInfo
@@ -14,7 +14,7 @@ from app.domains.common.error_response import BusinessErrorResponse, ServerError
 from app.domains.products.enums import SortOption, StatusFilter, BiddersFilter, PriceBucket, ProductCategory
 
 
-def get_product_service(db: Session = Depends(get_db)) -> ProductService:
+def get_product_service(db: Session = Depends(get_read_db)) -> ProductService:
     return ProductService(db)
 
 
@@ -33,7 +33,7 @@ class CatalogAPI:
                 500: {"model": ServerErrorResponse, "description": "서버 내부 오류"},
             },
         )
-        async def get_store_meta(
+        def get_store_meta(
             store_id: int, service: ProductService = Depends(get_product_service)
         ):
             return service.store_meta(store_id=store_id)
@@ -49,14 +49,14 @@ class CatalogAPI:
                 500: {"model": ServerErrorResponse, "description": "서버 내부 오류"},
             },
         )
-        async def list_products_by_store(
+        def list_products_by_store(
             store_id: int,
             service: ProductService = Depends(get_product_service),
             page: int = Query(1, ge=1, description="페이지 번호(1부터)"),
             size: int = Query(
                 30, ge=1, le=100, description="페이지 크기(기본 30, 최대 100)"
             ),
-            sort: SortOption = Query(SortOption.latest, description="정렬: recommended|popular|latest|ending"),
+            sort: SortOption = Query(SortOption.latest, description="정렬: recommended|popular|latest|ending|relevance(q 필요)"),
             status: StatusFilter = Query(StatusFilter.RUNNING, description="상태 ALL|RUNNING|ENDED"),
             bidders: BiddersFilter = Query(BiddersFilter.ALL, description="입찰자수 ALL|LE_10|BT_10_20|GE_20"),
             price_bucket: PriceBucket = Query(PriceBucket.ALL, description="가격 ALL|LT_10000|BT_10000_30000|BT_30000_50000|BT_50000_150000|BT_150000_300000|BT_300000_500000|CUSTOM"),
@@ -64,6 +64,8 @@ class CatalogAPI:
             price_max: Optional[float] = Query(None, description="CUSTOM 최대 가격"),
             category: ProductCategory = Query(ProductCategory.ALL, description="카테고리 코드(ALL 포함)"),
             q: Optional[str] = Query(None, description="키워드 포함 검색"),
+            with_total: bool = Query(True, description="전체 개수 포함 여부 (false면 total 없이 has_next만 반환)"),
+            cursor: Optional[str] = Query(None, description="다음 페이지 커서(응답의 next_cursor). 지정 시 page/total 없이 이어서 조회"),
         ):
             return service.products_by_store(
                 store_id=store_id,
@@ -77,6 +79,8 @@ class CatalogAPI:
                 price_max=price_max,
                 category=category.value if isinstance(category, ProductCategory) else category,
                 q=q,
+                with_total=with_total,
+                cursor=cursor,
             )
 
         @self.router.get(
@@ -90,7 +94,7 @@ class CatalogAPI:
                 500: {"model": ServerErrorResponse, "description": "서버 내부 오류"},
             },
         )
-        async def product_meta(
+        def product_meta(
             product_id: int, service: ProductService = Depends(get_product_service)
         ):
             return service.product_meta(product_id=product_id)
@@ -106,10 +110,16 @@ class CatalogAPI:
                 500: {"model": ServerErrorResponse, "description": "서버 내부 오류"},
             },
         )
-        async def product_auction_info(
-            product_id: int, service: ProductService = Depends(get_product_service)
+        def product_auction_info(
+            product_id: int,
+            with_steps: bool = Query(
+                True, description="입찰 스텝 목록 포함 여부 (false면 bid_steps는 빈 배열)"
+            ),
+            service: ProductService = Depends(get_product_service),
         ):
-            return service.product_auction_info(product_id=product_id)
+            return service.product_auction_info(
+                product_id=product_id, with_steps=with_steps
+            )
 
         @self.router.get(
             "/products/{product_id}/bids",
@@ -122,13 +132,16 @@ class CatalogAPI:
                 500: {"model": ServerErrorResponse, "description": "서버 내부 오류"},
             },
         )
-        async def product_bids(
+        def product_bids(
             product_id: int,
             service: ProductService = Depends(get_product_service),
             page: int = Query(1, ge=1, description="페이지 번호(1부터)"),
             size: int = Query(3, ge=1, le=100, description="페이지 크기(기본 3)"),
+            cursor: Optional[str] = Query(None, description="다음 페이지 커서(응답의 next_cursor). 지정 시 page/total 없이 이어서 조회"),
         ):
-            return service.product_bids(product_id=product_id, page=page, size=size)
+            return service.product_bids(
+                product_id=product_id, page=page, size=size, cursor=cursor
+            )
 
         @self.router.get(
             "/products/{product_id}/similar",
@@ -137,12 +150,12 @@ class CatalogAPI:
             description="동일 스토어 기준 유사 상품을 조회합니다.",
             response_description="상품 리스트",
         )
-        async def product_similar(
+        def product_similar(
             product_id: int,
             service: ProductService = Depends(get_product_service),
             page: int = Query(1, ge=1, description="페이지 번호(1부터)"),
             size: int = Query(4, ge=1, le=100, description="페이지 크기(기본 4)"),
-            sort: SortOption = Query(SortOption.latest, description="정렬 recommended|popular|latest|ending"),
+            sort: SortOption = Query(SortOption.latest, description="정렬 recommended|popular|latest|ending|relevance(q 필요)"),
             status: StatusFilter = Query(StatusFilter.ALL, description="상태 ALL|RUNNING|ENDED"),
             bidders: BiddersFilter = Query(BiddersFilter.ALL, description="입찰자수 ALL|LE_10|BT_10_20|GE_20"),
             price_bucket: PriceBucket = Query(PriceBucket.ALL, description="가격 ALL|LT_10000|BT_10000_30000|BT_30000_50000|BT_50000_150000|BT_150000_300000|BT_300000_500000|CUSTOM"),
@@ -150,6 +163,8 @@ class CatalogAPI:
             price_max: Optional[float] = Query(None, description="CUSTOM 최대 가격"),
             category: str = Query("ALL", description="카테고리 ALL|가구/리빙|키친/테이블웨어|디지털/가전|패션/잡화|아트/컬렉터블|조명/소품|오피스/비즈니스"),
             q: Optional[str] = Query(None, description="키워드 포함 검색"),
+            with_total: bool = Query(True, description="전체 개수 포함 여부 (false면 total 없이 has_next만 반환)"),
+            cursor: Optional[str] = Query(None, description="다음 페이지 커서(응답의 next_cursor). 지정 시 page/total 없이 이어서 조회"),
         ):
             return service.product_similar(
                 product_id=product_id,
@@ -163,6 +178,8 @@ class CatalogAPI:
                 price_max=price_max,
                 category=category,
                 q=q,
+                with_total=with_total,
+                cursor=cursor,
             )
 
 
@@ -1,9 +1,9 @@
 from fastapi import APIRouter, Depends, Query
-from sqlalchemy.orm import Session
 from typing import List, Optional
 from app.domains.common.paging import Page
 
-from app.core.deps import get_db
+from app.core.deps import get_async_read_uow
+from app.infrastructure.db.uow import AsyncSqlAlchemyUnitOfWork
 from app.domains.products.product_list_item import ProductListItem
 from app.domains.products.store_with_products import StoreWithProducts
 from app.domains.products.store_meta import StoreMeta
@@ -12,10 +12,6 @@ from app.domains.common.error_response import BusinessErrorResponse, ServerError
 from app.domains.products.enums import SortOption, StatusFilter, BiddersFilter, PriceBucket, ProductCategory
 
 
-def get_product_service(db: Session = Depends(get_db)) -> ProductService:
-    return ProductService(db)
-
-
 class ProductsAPI:
     def __init__(self):
         self.router = APIRouter()
@@ -50,10 +46,10 @@ class ProductsAPI:
             },
         )
         async def get_ending_soon_products(
-            service: ProductService = Depends(get_product_service),
+            uow: AsyncSqlAlchemyUnitOfWork = Depends(get_async_read_uow),
             page: int = Query(1, ge=1, description="페이지 번호(1부터)"),
             size: int = Query(4, ge=1, le=100, description="페이지 크기(기본 4, 최대 100)"),
-            sort: SortOption = Query(SortOption.ending, description="정렬 recommended|popular|latest|ending"),
+            sort: SortOption = Query(SortOption.ending, description="정렬 recommended|popular|latest|ending|relevance(q 필요)"),
             status: StatusFilter = Query(StatusFilter.RUNNING, description="상태 ALL|RUNNING|ENDED"),
             bidders: BiddersFilter = Query(BiddersFilter.ALL, description="입찰자수 ALL|LE_10|BT_10_20|GE_20"),
             price_bucket: PriceBucket = Query(PriceBucket.ALL, description="가격 ALL|LT_10000|BT_10000_30000|BT_30000_50000|BT_50000_150000|BT_150000_300000|BT_300000_500000|CUSTOM"),
@@ -61,18 +57,24 @@ class ProductsAPI:
             price_max: Optional[float] = Query(None, description="CUSTOM 최대 가격"),
             category: ProductCategory = Query(ProductCategory.ALL, description="카테고리 코드(ALL 포함)"),
             q: Optional[str] = Query(None, description="키워드 포함 검색"),
+            with_total: bool = Query(True, description="전체 개수 포함 여부 (false면 total 없이 has_next만 반환)"),
+            cursor: Optional[str] = Query(None, description="다음 페이지 커서(응답의 next_cursor). 지정 시 page/total 없이 이어서 조회"),
         ):
-            return service.ending_soon(
-                page=page,
-                size=size,
-                sort=sort,
-                status=status,
-                bidders=bidders,
-                price_bucket=price_bucket,
-                price_min=price_min,
-                price_max=price_max,
-                category=category.value if isinstance(category, ProductCategory) else category,
-                q=q,
+            return await uow.run_cached(
+                lambda db: ProductService(db).ending_soon(
+                    page=page,
+                    size=size,
+                    sort=sort,
+                    status=status,
+                    bidders=bidders,
+                    price_bucket=price_bucket,
+                    price_min=price_min,
+                    price_max=price_max,
+                    category=category.value if isinstance(category, ProductCategory) else category,
+                    q=q,
+                    with_total=with_total,
+                    cursor=cursor,
+                )
             )
 
         @self.router.get(
@@ -90,10 +92,10 @@ class ProductsAPI:
             },
         )
         async def get_recommended_products(
-            service: ProductService = Depends(get_product_service),
+            uow: AsyncSqlAlchemyUnitOfWork = Depends(get_async_read_uow),
             page: int = Query(1, ge=1, description="페이지 번호(1부터)"),
             size: int = Query(4, ge=1, le=100, description="페이지 크기(기본 4, 최대 100)"),
-            sort: SortOption = Query(SortOption.recommended, description="정렬 recommended|popular|latest|ending"),
+            sort: SortOption = Query(SortOption.recommended, description="정렬 recommended|popular|latest|ending|relevance(q 필요)"),
             status: StatusFilter = Query(StatusFilter.RUNNING, description="상태 ALL|RUNNING|ENDED"),
             bidders: BiddersFilter = Query(BiddersFilter.ALL, description="입찰자수 ALL|LE_10|BT_10_20|GE_20"),
             price_bucket: PriceBucket = Query(PriceBucket.ALL, description="가격 ALL|LT_10000|BT_10000_30000|BT_30000_50000|BT_50000_150000|BT_150000_300000|BT_300000_500000|CUSTOM"),
@@ -101,18 +103,24 @@ class ProductsAPI:
             price_max: Optional[float] = Query(None, description="CUSTOM 최대 가격"),
             q: Optional[str] = Query(None, description="키워드 포함 검색"),
             category: ProductCategory = Query(ProductCategory.ALL, description="카테고리 코드(ALL 포함)"),
+            with_total: bool = Query(True, description="전체 개수 포함 여부 (false면 total 없이 has_next만 반환)"),
+            cursor: Optional[str] = Query(None, description="다음 페이지 커서(응답의 next_cursor). 지정 시 page/total 없이 이어서 조회"),
         ):
-            return service.recommended(
-                page=page,
-                size=size,
-                sort=sort,
-                status=status,
-                bidders=bidders,
-                price_bucket=price_bucket,
-                price_min=price_min,
-                price_max=price_max,
-                category=category.value if isinstance(category, ProductCategory) else category,
-                q=q,
+            return await uow.run_cached(
+                lambda db: ProductService(db).recommended(
+                    page=page,
+                    size=size,
+                    sort=sort,
+                    status=status,
+                    bidders=bidders,
+                    price_bucket=price_bucket,
+                    price_min=price_min,
+                    price_max=price_max,
+                    category=category.value if isinstance(category, ProductCategory) else category,
+                    q=q,
+                    with_total=with_total,
+                    cursor=cursor,
+                )
             )
 
         @self.router.get(
@@ -130,10 +138,10 @@ class ProductsAPI:
             },
         )
         async def get_new_products(
-            service: ProductService = Depends(get_product_service),
+            uow: AsyncSqlAlchemyUnitOfWork = Depends(get_async_read_uow),
             page: int = Query(1, ge=1, description="페이지 번호(1부터)"),
             size: int = Query(4, ge=1, le=100, description="페이지 크기(기본 4, 최대 100)"),
-            sort: SortOption = Query(SortOption.latest, description="정렬 recommended|popular|latest|ending"),
+            sort: SortOption = Query(SortOption.latest, description="정렬 recommended|popular|latest|ending|relevance(q 필요)"),
             status: StatusFilter = Query(StatusFilter.RUNNING, description="상태 ALL|RUNNING|ENDED"),
             bidders: BiddersFilter = Query(BiddersFilter.ALL, description="입찰자수 ALL|LE_10|BT_10_20|GE_20"),
             price_bucket: PriceBucket = Query(PriceBucket.ALL, description="가격 ALL|LT_10000|BT_10000_30000|BT_30000_50000|BT_50000_150000|BT_150000_300000|BT_300000_500000|CUSTOM"),
@@ -141,18 +149,24 @@ class ProductsAPI:
             price_max: Optional[float] = Query(None, description="CUSTOM 최대 가격"),
             category: ProductCategory = Query(ProductCategory.ALL, description="카테고리 코드(ALL 포함)"),
             q: Optional[str] = Query(None, description="키워드 포함 검색"),
+            with_total: bool = Query(True, description="전체 개수 포함 여부 (false면 total 없이 has_next만 반환)"),
+            cursor: Optional[str] = Query(None, description="다음 페이지 커서(응답의 next_cursor). 지정 시 page/total 없이 이어서 조회"),
         ):
-            return service.newest(
-                page=page,
-                size=size,
-                sort=sort,
-                status=status,
-                bidders=bidders,
-                price_bucket=price_bucket,
-                price_min=price_min,
-                price_max=price_max,
-                category=category.value if isinstance(category, ProductCategory) else category,
-                q=q,
+            return await uow.run_cached(
+                lambda db: ProductService(db).newest(
+                    page=page,
+                    size=size,
+                    sort=sort,
+                    status=status,
+                    bidders=bidders,
+                    price_bucket=price_bucket,
+                    price_min=price_min,
+                    price_max=price_max,
+                    category=category.value if isinstance(category, ProductCategory) else category,
+                    q=q,
+                    with_total=with_total,
+                    cursor=cursor,
+                )
             )
 
         @self.router.get(
@@ -170,7 +184,7 @@ class ProductsAPI:
             },
         )
         async def get_recent_stores_with_products(
-            service: ProductService = Depends(get_product_service),
+            uow: AsyncSqlAlchemyUnitOfWork = Depends(get_async_read_uow),
             page: int = Query(1, ge=1, description="스토어 페이지 번호(1부터)"),
             stores: int = Query(10, ge=1, le=50, description="한 페이지에 조회할 스토어 수(최대 50)"),
             size: int = Query(4, ge=1, le=100, description="각 스토어별 포함할 최신 상품 수"),
@@ -182,17 +196,19 @@ class ProductsAPI:
             price_max: Optional[float] = Query(None, description="CUSTOM 최대 가격"),
             category: ProductCategory = Query(ProductCategory.ALL, description="카테고리 코드(ALL 포함)"),
         ):
-            return service.stores_recent(
-                page=page,
-                stores=stores,
-                size=size,
-                sort=sort,
-                status=status,
-                bidders=bidders,
-                price_bucket=price_bucket,
-                price_min=price_min,
-                price_max=price_max,
-                category=category.value if isinstance(category, ProductCategory) else category,
+            return await uow.run_cached(
+                lambda db: ProductService(db).stores_recent(
+                    page=page,
+                    stores=stores,
+                    size=size,
+                    sort=sort,
+                    status=status,
+                    bidders=bidders,
+                    price_bucket=price_bucket,
+                    price_min=price_min,
+                    price_max=price_max,
+                    category=category.value if isinstance(category, ProductCategory) else category,
+                )
             )
 
         @self.router.get(
@@ -210,11 +226,13 @@ class ProductsAPI:
             },
         )
         async def get_store_list(
-            service: ProductService = Depends(get_product_service),
+            uow: AsyncSqlAlchemyUnitOfWork = Depends(get_async_read_uow),
             page: int = Query(1, ge=1, description="페이지 번호(1부터)"),
             size: int = Query(20, ge=1, le=100, description="페이지 크기(기본 20, 최대 100)"),
         ):
-            return service.store_list(page=page, size=size)
+            return await uow.run(
+                lambda db: ProductService(db).store_list(page=page, size=size)
+            )
 
         @self.router.get(
             "/upcoming",
@@ -228,10 +246,10 @@ class ProductsAPI:
             },
         )
         async def get_upcoming_products(
-            service: ProductService = Depends(get_product_service),
+            uow: AsyncSqlAlchemyUnitOfWork = Depends(get_async_read_uow),
             page: int = Query(1, ge=1, description="페이지 번호(1부터)"),
             size: int = Query(4, ge=1, le=100, description="페이지 크기(기본 4, 최대 100)"),
-            sort: SortOption = Query(SortOption.ending, description="정렬 recommended|popular|latest|ending"),
+            sort: SortOption = Query(SortOption.ending, description="정렬 recommended|popular|latest|ending|relevance(q 필요)"),
             status: StatusFilter = Query(StatusFilter.SCHEDULED, description="상태 SCHEDULED 고정 또는 ALL"),
             bidders: BiddersFilter = Query(BiddersFilter.ALL, description="입찰자수 ALL|LE_10|BT_10_20|GE_20"),
             price_bucket: PriceBucket = Query(PriceBucket.ALL, description="가격 ALL|LT_10000|BT_10000_30000|BT_30000_50000|BT_50000_150000|BT_150000_300000|BT_300000_500000|CUSTOM"),
@@ -239,18 +257,24 @@ class ProductsAPI:
             price_max: Optional[float] = Query(None, description="CUSTOM 최대 가격"),
             category: ProductCategory = Query(ProductCategory.ALL, description="카테고리 코드(ALL 포함)"),
             q: Optional[str] = Query(None, description="키워드 포함 검색"),
+            with_total: bool = Query(True, description="전체 개수 포함 여부 (false면 total 없이 has_next만 반환)"),
+            cursor: Optional[str] = Query(None, description="다음 페이지 커서(응답의 next_cursor). 지정 시 page/total 없이 이어서 조회"),
         ):
-            return service.upcoming(
-                page=page,
-                size=size,
-                sort=sort,
-                status=status,
-                bidders=bidders,
-                price_bucket=price_bucket,
-                price_min=price_min,
-                price_max=price_max,
-                category=category.value if isinstance(category, ProductCategory) else category,
-                q=q,
+            return await uow.run_cached(
+                lambda db: ProductService(db).upcoming(
+                    page=page,
+                    size=size,
+                    sort=sort,
+                    status=status,
+                    bidders=bidders,
+                    price_bucket=price_bucket,
+                    price_min=price_min,
+                    price_max=price_max,
+                    category=category.value if isinstance(category, ProductCategory) else category,
+                    q=q,
+                    with_total=with_total,
+                    cursor=cursor,
+                )
             )
 
 
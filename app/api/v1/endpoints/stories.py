@@ -2,7 +2,7 @@ from fastapi import APIRouter, Depends, Query
 from sqlalchemy.orm import Session
 from typing import List
 
-from app.core.deps import get_db
+from app.core.deps import get_read_db
 from app.domains.common.error_response import BusinessErrorResponse, ServerErrorResponse
 from app.domains.common.paging import Page
 from app.domains.stories.service import StoryService
@@ -10,7 +10,7 @@ from app.domains.stories.story_list_item import StoryListItem
 from app.domains.stories.story_meta import StoryMeta
 
 
-def get_story_service(db: Session = Depends(get_db)) -> StoryService:
+def get_story_service(db: Session = Depends(get_read_db)) -> StoryService:
     return StoryService(db)
 
 
@@ -53,8 +53,11 @@ class StoryAPI:
             size: int = Query(
                 9, ge=1, le=100, description="페이지 크기(기본 9, 최대 100)"
             ),
+            with_total: bool = Query(
+                True, description="전체 개수 포함 여부 (false면 total 없이 has_next만 반환)"
+            ),
         ):
-            return service.get_stories(page=page, size=size)
+            return service.get_stories(page=page, size=size, with_total=with_total)
 
         @self.router.get(
             "/{story_id}",
@@ -67,7 +70,7 @@ class StoryAPI:
                 500: {"model": ServerErrorResponse, "description": "서버 내부 오류"},
             },
         )
-        async def get_story_meta(
+        def get_story_meta(
             story_id: int, service: StoryService = Depends(get_story_service)
         ) -> StoryMeta:
             return service.get_story_meta(story_id=story_id)
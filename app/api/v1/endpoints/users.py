@@ -1,13 +1,11 @@
 from fastapi import APIRouter, Depends, HTTPException, Header, status, Query
-from sqlalchemy.orm import Session
 
-from app.core.deps import get_db
+from app.core.deps import get_uow
 from app.core.errors import BusinessError
 from app.core.security import require_auth
 from app.domains.common.paging import Page
 from app.domains.auctions.user_dto import UserAuctionDashboard, UserRelatedAuctionItem
 from app.domains.auctions.user_service import UserAuctionService
-from app.repositories.user_auction_read import UserAuctionReadRepository
 from app.domains.common.error_response import BusinessErrorResponse, ServerErrorResponse
 from app.domains.users.models import (
     PhoneVerificationResult,
@@ -16,16 +14,15 @@ from app.domains.users.models import (
     UserUpdate,
 )
 from app.domains.users.service import UserService
-from app.repositories.user_read import UserReadRepository
-from app.repositories.user_write import UserWriteRepository
+from app.infrastructure.db.uow import SqlAlchemyUnitOfWork
 
 
-def get_user_service(db: Session = Depends(get_db)) -> UserService:
-    return UserService(db, UserReadRepository(db), UserWriteRepository(db))
+def get_user_service(uow: SqlAlchemyUnitOfWork = Depends(get_uow)) -> UserService:
+    return UserService(uow.session, uow.users_read, uow.users_write)
 
 
-def get_user_auction_service(db: Session = Depends(get_db)) -> UserAuctionService:
-    return UserAuctionService(db, UserAuctionReadRepository(db))
+def get_user_auction_service(uow: SqlAlchemyUnitOfWork = Depends(get_uow)) -> UserAuctionService:
+    return UserAuctionService(uow.session, uow.user_auctions_read)
 
 
 class UsersAPI:
@@ -39,7 +36,7 @@ class UsersAPI:
             summary="[required auth] Get current user",
             description="현재 로그인 한 사용자의 정보를 반환합니다.",
         )
-        async def get_current_user(
+        def get_current_user(
             user_id: int = Depends(require_auth),
             service: UserService = Depends(get_user_service),
         ) -> UserRead:
@@ -63,7 +60,7 @@ class UsersAPI:
                 500: {"model": ServerErrorResponse, "description": "서버 내부 오류"},
             },
         )
-        async def update_current_user(
+        def update_current_user(
             user_data: UserUpdate,
             user_id: int = Depends(require_auth),
             service: UserService = Depends(get_user_service),
@@ -83,7 +80,7 @@ class UsersAPI:
                 500: {"model": ServerErrorResponse, "description": "서버 내부 오류"},
             },
         )
-        async def request_phone_verification_sms(
+        def request_phone_verification_sms(
             phone_number: str,
             user_id: int = Depends(require_auth),
             service: UserService = Depends(get_user_service),
@@ -102,7 +99,7 @@ class UsersAPI:
                 500: {"model": ServerErrorResponse, "description": "서버 내부 오류"},
             },
         )
-        async def verify_phone_verification_sms(
+        def verify_phone_verification_sms(
             phone_number: str,
             code6: str,
             user_id: int = Depends(require_auth),
@@ -120,7 +117,7 @@ class UsersAPI:
             summary="마이페이지 경매 대시보드 카운트",
             description="로그인 사용자의 경매 참여 현황 카운트를 반환합니다.",
         )
-        async def my_auction_dashboard(
+        def my_auction_dashboard(
             user_id: int = Depends(require_auth),
             service: UserAuctionService = Depends(get_user_auction_service),
         ) -> UserAuctionDashboard:
@@ -132,7 +129,7 @@ class UsersAPI:
             summary="마이페이지 관련 상품 조회",
             description="로그인 사용자의 관련 상품(입찰/낙찰 등)을 페이징 조회합니다.",
         )
-        async def my_related_auctions(
+        def my_related_auctions(
             user_id: int = Depends(require_auth),
             service: UserAuctionService = Depends(get_user_auction_service),
             page: int = Query(1, ge=1),
@@ -0,0 +1,8 @@
+import logging
+
+from app.batch.scheduler import auction_scheduler
+
+if __name__ == "__main__":
+    # 경매 시작/정산 스케줄러 실행: python -m app.batch (여러 노드에서 띄워도 GET_LOCK으로 하나만 동작)
+    logging.basicConfig(level=logging.INFO)
+    auction_scheduler.run_forever()
@@ -1,22 +1,76 @@
-from datetime import datetime, timezone
-from sqlalchemy import select
+import logging
+from datetime import datetime
+from typing import Callable, Optional
 from app.infrastructure.db.uow import SqlAlchemyUnitOfWork
-from app.domains.auctions.enums import AuctionStatus
-from app.schemas.auctions import Auction
+from app.domains.auctions.enums import AuctionEventType, AuctionStatus
+from app.domains.auctions.events import AuctionEvent, publish_auction_event_after_commit
+from app.infrastructure.cache.app_cache import (
+    AUCTION_INFO,
+    LISTING,
+    invalidate_after_commit,
+)
+
+logger = logging.getLogger(__name__)
 
 
 class AuctionScheduleBatch:
-    def run_once(self):
-        with SqlAlchemyUnitOfWork() as uow:
-            now = datetime.now(timezone.utc)
-            stmt = select(Auction).where(
-                Auction.status == AuctionStatus.SCHEDULED.value,
-                Auction.starts_at <= now,
-            )
-            for row in uow.session.execute(stmt):
-                auction: Auction = row[0]
-                if auction.ends_at > now:
-                    auction.status = AuctionStatus.RUNNING.value
-            uow.session.flush()
+    def __init__(
+        self,
+        uow_factory: Callable[[], SqlAlchemyUnitOfWork] = SqlAlchemyUnitOfWork,
+        *,
+        chunk_size: int = 1000,
+    ):
+        """경매 시작 배치
+
+        - 시작 시각이 된 SCHEDULED 경매를 청크 단위로 선점(SKIP LOCKED)해 UPDATE 한 번으로 RUNNING 전환
+        - 시작 전에 종료 시각까지 지난 경매는 입찰 없이 ENDED(유찰)로 정리
+        - chunk_size: 한 트랜잭션에서 처리할 경매 수 (캠페인 오픈으로 같은 분에 수천 건이 시작되는 경우)
+        """
+        self.uow_factory = uow_factory
+        self.chunk_size = chunk_size
+
+    def run_once(self, now: Optional[datetime] = None) -> int:
+        """시작 시각이 된 SCHEDULED 경매를 모두 전환 (now: 기준 시각(UTC), 기본 현재)
 
+        :return: RUNNING으로 전환한 경매 수
+        """
+        started = 0
+        while True:
+            with self.uow_factory() as uow:
+                claimed, count = self._start_chunk(uow, now or datetime.utcnow())
+            started += count
+            if claimed < self.chunk_size:
+                return started
 
+    def _start_chunk(self, uow: SqlAlchemyUnitOfWork, now: datetime) -> tuple[int, int]:
+        auctions = uow.auctions_write.claim_due_to_start(now=now, limit=self.chunk_size)
+        if not auctions:
+            return 0, 0
+        starting = [a for a in auctions if a.ends_at > now]
+        expired = [a for a in auctions if a.ends_at <= now]
+        uow.auctions_write.transition_status(
+            [a.id for a in starting],
+            from_status=AuctionStatus.SCHEDULED,
+            to_status=AuctionStatus.RUNNING,
+        )
+        uow.auctions_write.transition_status(
+            [a.id for a in expired], from_status=AuctionStatus.SCHEDULED, to_status=AuctionStatus.ENDED
+        )
+
+        # 실시간 구독자 알림 (커밋 후, 워커 간 전달은 REALTIME_BROKER=redis 필요)
+        for a in starting:
+            publish_auction_event_after_commit(
+                uow.session,
+                AuctionEvent(
+                    type=AuctionEventType.STARTED, auction_id=a.id, product_id=a.product_id
+                ),
+            )
+        for a in expired:
+            publish_auction_event_after_commit(
+                uow.session,
+                AuctionEvent(type=AuctionEventType.ENDED, auction_id=a.id, product_id=a.product_id),
+            )
+        invalidate_after_commit(uow.session, LISTING, AUCTION_INFO)
+        if expired:
+            logger.info("scheduled auctions expired before start: %d", len(expired))
+        return len(auctions), len(starting)
@@ -1,14 +1,22 @@
-from typing import Callable
-from sqlalchemy import select
+import logging
+from typing import Callable, Dict, Optional
 from datetime import datetime, timezone
-from sqlalchemy.orm import Session
-from app.schemas.auctions import Auction, Bid
-from app.domains.auctions.enums import AuctionStatus
+from app.core.config import settings
+from app.domains.auctions.enums import AuctionEventType, AuctionStatus
+from app.domains.auctions.events import AuctionEvent, publish_auction_event_after_commit
+from app.domains.auctions.hot_state import hot_auctions
 from app.domains.payments.service import PaymentService
 from app.domains.payments.dto import RefundRequest
 from app.domains.notifications.service import NotificationService
-from app.domains.notifications.dto import NotifyRequest
+from app.domains.notifications.dto import NotifyManyRequest
 from app.infrastructure.db.uow import SqlAlchemyUnitOfWork
+from app.infrastructure.cache.app_cache import (
+    AUCTION_INFO,
+    LISTING,
+    invalidate_after_commit,
+)
+
+logger = logging.getLogger(__name__)
 
 
 class AuctionSettlementBatch:
@@ -21,13 +29,16 @@ class AuctionSettlementBatch:
         notification_service_factory: (
             Callable[[SqlAlchemyUnitOfWork], NotificationService] | None
         ) = None,
+        *,
+        chunk_size: int | None = None,
     ):
         """경매 정산 배치
 
         DI 정책:
-        - uow_factory: UoW 스코프 세션/레포 제공
+        - uow_factory: UoW 스코프 세션/레포 제공 (청크마다 새 UoW = 새 트랜잭션)
         - payment_service_factory: UoW 바운드 PaymentService 생성 팩토리
         - notification_service_factory: UoW 바운드 NotificationService 생성 팩토리
+        - chunk_size: 한 트랜잭션에서 정산할 경매 수 (기본 SETTLEMENT_CHUNK_SIZE)
         """
         self.uow_factory = uow_factory
         # 기본 팩토리: UoW에 바인딩된 세션/레포로 서비스 생성
@@ -37,51 +48,81 @@ class AuctionSettlementBatch:
         self.notification_service_factory = notification_service_factory or (
             lambda uow: NotificationService(uow.session, uow.notifications)
         )
+        self.chunk_size = chunk_size or settings.SETTLEMENT_CHUNK_SIZE
+
+    def run_once(self, now: Optional[datetime] = None) -> int:
+        """종료 시각이 지난 RUNNING 경매를 모두 정산
+
+        - 청크 단위로 선점(SKIP LOCKED) → 정산 → 커밋. 실패 시 해당 청크만 롤백되고
+          이미 커밋된 청크는 유지되므로 재실행해도 남은 경매만 처리한다 (멱등)
+        - 여러 워커가 동시에 실행해도 같은 경매를 두 번 정산하지 않는다
+        :param now: 기준 시각(UTC, 기본 현재)
+        :return: 정산한 경매 수
+        """
+        settled = 0
+        while True:
+            with self.uow_factory() as uow:
+                count = self._settle_chunk(uow, now or datetime.now(timezone.utc))
+            settled += count
+            if count < self.chunk_size:
+                return settled
+
+    def _settle_chunk(self, uow: SqlAlchemyUnitOfWork, now: datetime) -> int:
+        # 청크 전체를 같은 UoW 세션에서 처리해 하나의 커밋으로 묶음
+        auctions = uow.auctions_write.claim_due_for_settlement(now=now, limit=self.chunk_size)
+        if not auctions:
+            return 0
+        auction_ids = [a.id for a in auctions]
+        winners = uow.auctions_write.winning_bids(auction_ids)
 
-    def run_once(self):
-        # 전체 배치 처리 한 사이클 = 하나의 트랜잭션 경계로 묶음
-        with self.uow_factory() as uow:
-            stmt = select(Auction).where(
-                Auction.status == AuctionStatus.RUNNING.value,
-                Auction.ends_at <= datetime.now(timezone.utc),
-            )
-            for row in uow.session.execute(stmt):
-                auction = row[0]
-                self._settle_auction(uow, auction)
+        # 환불 처리: 낙찰자가 있는 경매의 낙찰자 외 보증금 환불
+        refunds = [
+            dep
+            for dep in uow.auction_deposits.list_refundable_by_auctions(list(winners))
+            if dep.user_id != winners[dep.auction_id].user_id
+        ]
+        self.payment_service_factory(uow).refund_many(
+            [RefundRequest(payment_id=dep.payment_id, amount=float(dep.amount)) for dep in refunds]
+        )
+        uow.auction_deposits.mark_refunded_many([dep.id for dep in refunds])
 
-    def _settle_auction(self, uow: SqlAlchemyUnitOfWork, auction: Auction):
-        # 개별 경매 정산은 동일 UoW 세션 내에서 진행되어 하나의 커밋으로 묶임
-        winner_row = uow.session.execute(
-            select(Bid)
-            .where(Bid.auction_id == auction.id)
-            .order_by(Bid.amount.desc(), Bid.created_at.desc())
-            .limit(1)
-        ).first()
-        if not winner_row:
-            auction.status = AuctionStatus.ENDED.value
-            uow.session.flush()
-            return
-        winner: Bid = winner_row[0]
-        # 환불 처리: 낙찰자 외 보증금 환불
-        payment_service = self.payment_service_factory(uow)
-        for dep in uow.auction_deposits.list_by_auction(auction.id):
-            if (
-                dep.user_id != winner.user_id
-                and dep.status != "REFUNDED"
-                and dep.payment_id
-            ):
-                payment_service.refund(
-                    RefundRequest(payment_id=dep.payment_id, amount=float(dep.amount))
+        # 알림은 아웃박스에 적재 (정산 트랜잭션과 함께 커밋, 디스패처가 전달)
+        self.notification_service_factory(uow).publish_many(
+            [
+                NotifyManyRequest(
+                    user_ids=[winners[a.id].user_id],
+                    title=f"{a.product_name}",
+                    body="낙찰되었습니다. 결제를 진행해 주세요.",
+                    product_id=a.product_id,
                 )
-                uow.auction_deposits.mark_refunded(dep.id)
-        # 알림 전송
-        self.notification_service_factory(uow).send(
-            NotifyRequest(
-                user_id=winner.user_id,
-                title=f"{auction.product.name}",
-                body="낙찰되었습니다. 결제를 진행해 주세요.",
-                product_id=auction.product_id,
-            )
+                for a in auctions
+                if a.id in winners
+            ]
+        )
+        uow.auctions_write.transition_status(
+            auction_ids, from_status=AuctionStatus.RUNNING, to_status=AuctionStatus.ENDED
+        )
+
+        for a in auctions:
+            self._publish_ended(uow, a.id, a.product_id, winners)
+            hot_auctions.evict_after_commit(uow.session, a.id)
+        invalidate_after_commit(uow.session, LISTING, AUCTION_INFO)
+        logger.info("auctions settled: %d (refunds %d)", len(auctions), len(refunds))
+        return len(auctions)
+
+    @staticmethod
+    def _publish_ended(
+        uow: SqlAlchemyUnitOfWork, auction_id: int, product_id: int, winners: Dict[int, object]
+    ):
+        # 실시간 구독자 알림 (정산 커밋 후, 워커 간 전달은 REALTIME_BROKER=redis 필요)
+        winner = winners.get(auction_id)
+        publish_auction_event_after_commit(
+            uow.session,
+            AuctionEvent(
+                type=AuctionEventType.ENDED,
+                auction_id=auction_id,
+                product_id=product_id,
+                amount=float(winner.amount) if winner else None,
+                user_id=winner.user_id if winner else None,
+            ),
         )
-        auction.status = AuctionStatus.ENDED.value
-        uow.session.flush()
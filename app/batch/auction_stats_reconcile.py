@@ -0,0 +1,31 @@
+import logging
+from typing import Callable, Iterable, Optional
+from app.infrastructure.db.uow import SqlAlchemyUnitOfWork
+
+logger = logging.getLogger(__name__)
+
+
+class AuctionStatsReconcileBatch:
+    def __init__(
+        self,
+        uow_factory: Callable[[], SqlAlchemyUnitOfWork] = SqlAlchemyUnitOfWork,
+    ):
+        """auction_stats 백필/정합성 복구 배치
+
+        - 최초 도입 시 기존 bid 데이터로 집계를 채우는 백필 용도 (alembic 0005가 같은 집계로 백필)
+        - 이후 주기 실행으로 집계 드리프트를 bid 원본 기준으로 교정
+        """
+        self.uow_factory = uow_factory
+
+    def run_once(self, auction_ids: Optional[Iterable[int]] = None) -> int:
+        with self.uow_factory() as uow:
+            return uow.auction_stats.reconcile(auction_ids)
+
+
+if __name__ == "__main__":
+    # 실행: python -m app.batch.auction_stats_reconcile [auction_id ...]
+    import sys
+
+    logging.basicConfig(level=logging.INFO)
+    ids = [int(a) for a in sys.argv[1:]] or None
+    logger.info("auction stats reconciled: %d", AuctionStatsReconcileBatch().run_once(ids))
@@ -0,0 +1,155 @@
+import logging
+import time
+from typing import Callable, Dict, Optional
+
+from sqlalchemy.orm import Session
+from tenacity import (
+    Retrying,
+    retry_if_not_exception_type,
+    stop_after_attempt,
+    wait_exponential,
+)
+
+from app.core.config import settings
+from app.infrastructure.db.uow import SqlAlchemyUnitOfWork
+from app.infrastructure.notifications.channels import (
+    NotificationChannel,
+    PartialDeliveryError,
+    default_channels,
+)
+from app.repositories.notification_outbox import NotificationOutboxRepository
+from app.schemas.notifications import NotificationOutbox
+
+logger = logging.getLogger(__name__)
+
+MAX_BACKOFF_SECONDS = 3600.0
+
+
+class NotificationOutboxDispatcher:
+    def __init__(
+        self,
+        uow_factory: Callable[[], SqlAlchemyUnitOfWork] = SqlAlchemyUnitOfWork,
+        channels: Optional[Dict[str, NotificationChannel]] = None,
+        *,
+        batch_size: Optional[int] = None,
+        max_attempts: Optional[int] = None,
+        backoff_seconds: Optional[float] = None,
+        lease_seconds: Optional[float] = None,
+    ):
+        """알림 아웃박스 디스패처
+
+        - 전달 가능한 메시지를 batch_size 단위로 SKIP LOCKED 선점해 IN_FLIGHT로 임대하고 바로 커밋
+          (외부 발송 동안 행 잠금을 잡지 않음)
+        - 메시지마다 전달 + 결과(SENT/재시도) 기록을 별도 트랜잭션으로 커밋 → 커밋 실패 시 재발송은 그 메시지뿐
+        - 일시 오류는 tenacity로 즉시 재시도(3회), 그래도 실패하면 지수 백오프로 available_at을 미뤄 다음 사이클에 재시도
+        - 일부 수신자만 전달되면(PartialDeliveryError) 실패 수신자로 payload를 좁혀 재시도, 식별 불가면 FAILED
+        - max_attempts 초과 시 FAILED로 남겨 수동 확인
+        - 결과 기록 없이 임대(lease_seconds)가 끝난 메시지는 다음 선점 대상 (워커 중단 복구)
+        """
+        self.uow_factory = uow_factory
+        self.channels = channels if channels is not None else default_channels()
+        self.batch_size = batch_size or settings.NOTIFICATION_OUTBOX_BATCH_SIZE
+        self.max_attempts = max_attempts or settings.NOTIFICATION_OUTBOX_MAX_ATTEMPTS
+        self.backoff_seconds = (
+            backoff_seconds
+            if backoff_seconds is not None
+            else settings.NOTIFICATION_OUTBOX_BACKOFF_SECONDS
+        )
+        self.lease_seconds = (
+            lease_seconds
+            if lease_seconds is not None
+            else settings.NOTIFICATION_OUTBOX_LEASE_SECONDS
+        )
+
+    def run_once(self) -> int:
+        """한 배치 전달 (선점 트랜잭션 1개 + 메시지별 트랜잭션). 전달 성공 건수 반환"""
+        with self.uow_factory() as uow:
+            outbox_ids = NotificationOutboxRepository(uow.session).claim_batch(
+                limit=self.batch_size, lease_seconds=self.lease_seconds
+            )
+        sent = 0
+        for outbox_id in outbox_ids:
+            try:
+                sent += self._dispatch(outbox_id)
+            except Exception:
+                # 결과 커밋 실패: 임대가 끝나면 다시 선점된다
+                logger.exception("outbox result commit failed: id=%s", outbox_id)
+        return sent
+
+    def _dispatch(self, outbox_id: int) -> int:
+        """메시지 하나 전달 후 결과를 같은 트랜잭션으로 커밋 (성공 1, 실패 0)"""
+        with self.uow_factory() as uow:
+            outbox = NotificationOutboxRepository(uow.session)
+            row = outbox.get_in_flight(outbox_id)
+            if row is None:
+                return 0
+            try:
+                self._deliver(uow.session, row)
+            except PartialDeliveryError as exc:
+                logger.warning(
+                    "outbox partial delivery: id=%s channel=%s failed=%s",
+                    row.id, row.channel, exc.failed_user_ids,
+                )
+                outbox.mark_partial(
+                    row,
+                    error=repr(exc),
+                    failed_user_ids=exc.failed_user_ids,
+                    delay_seconds=self._backoff(row.attempts + 1),
+                    max_attempts=self.max_attempts,
+                )
+                return 0
+            except Exception as exc:
+                logger.warning(
+                    "outbox delivery failed: id=%s channel=%s", row.id, row.channel,
+                    exc_info=True,
+                )
+                outbox.mark_retry(
+                    row,
+                    error=repr(exc),
+                    delay_seconds=self._backoff(row.attempts + 1),
+                    max_attempts=self.max_attempts,
+                )
+                return 0
+            outbox.mark_sent([row.id])
+            return 1
+
+    def run_forever(self, poll_seconds: Optional[float] = None) -> None:
+        interval = (
+            poll_seconds
+            if poll_seconds is not None
+            else settings.NOTIFICATION_OUTBOX_POLL_SECONDS
+        )
+        while True:
+            try:
+                delivered = self.run_once()
+            except Exception:
+                logger.exception("outbox dispatch cycle failed")
+                delivered = 0
+            # 배치가 꽉 찼으면 밀린 메시지가 있으므로 바로 다음 배치
+            if delivered < self.batch_size:
+                time.sleep(interval)
+
+    def _deliver(self, session: Session, row: NotificationOutbox) -> None:
+        channel = self.channels.get(row.channel)
+        if channel is None:
+            raise LookupError(f"unknown notification channel: {row.channel}")
+        for attempt in Retrying(
+            # 부분 전달은 같은 payload로 재시도하면 중복 발송 → 실패 수신자만 다음 사이클에
+            retry=retry_if_not_exception_type(PartialDeliveryError),
+            stop=stop_after_attempt(3),
+            wait=wait_exponential(multiplier=0.2, max=2),
+            reraise=True,
+        ):
+            with attempt:
+                # 시도 단위 savepoint: 실패한 시도의 부분 기록만 되돌리고 결과(재시도) 기록은 유지
+                with session.begin_nested():
+                    channel.deliver(session, row.payload)
+
+    def _backoff(self, attempts: int) -> float:
+        return min(self.backoff_seconds * (2 ** max(attempts - 1, 0)), MAX_BACKOFF_SECONDS)
+
+
+if __name__ == "__main__":
+    # 워커 실행: python -m app.batch.notification_dispatch
+    logging.basicConfig(level=logging.INFO)
+    NotificationOutboxDispatcher().run_forever()
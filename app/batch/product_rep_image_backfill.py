@@ -0,0 +1,28 @@
+import logging
+from typing import Callable, Iterable, Optional
+from app.infrastructure.db.uow import SqlAlchemyUnitOfWork
+
+logger = logging.getLogger(__name__)
+
+
+class ProductRepImageBackfillBatch:
+    def __init__(
+        self,
+        uow_factory: Callable[[], SqlAlchemyUnitOfWork] = SqlAlchemyUnitOfWork,
+    ):
+        """product.representative_image_url 백필/정합성 복구 배치
+
+        - PRODUCT_REP_IMAGE_FROM_COLUMN을 켜기 전에 기존 상품의 대표 이미지를 채우는 용도
+        - 이후 관리자 상품 저장(sync_product_images)이 컬럼을 유지
+        """
+        self.uow_factory = uow_factory
+
+    def run_once(self, product_ids: Optional[Iterable[int]] = None) -> int:
+        with self.uow_factory() as uow:
+            return uow.product_images.refresh_representative_images(product_ids)
+
+
+if __name__ == "__main__":
+    # 실행: python -m app.batch.product_rep_image_backfill
+    logging.basicConfig(level=logging.INFO)
+    logger.info("representative images refreshed: %d", ProductRepImageBackfillBatch().run_once())
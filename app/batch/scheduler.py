@@ -0,0 +1,187 @@
+import heapq
+import logging
+import threading
+import time
+from collections import deque
+from datetime import datetime, timedelta
+from typing import Callable, Dict, List, Optional, Tuple
+
+from sqlalchemy.orm import Session
+
+from app.batch.auction_schedule import AuctionScheduleBatch
+from app.batch.auction_settlement import AuctionSettlementBatch
+from app.core.config import settings
+from app.db.session import SessionLocal, engine
+from app.domains.auctions.enums import AuctionStatus
+from app.infrastructure.db.advisory_lock import AdvisoryLock
+from app.repositories.auction_read import AuctionReadRepository
+
+logger = logging.getLogger(__name__)
+
+# 힙 항목: (예정 시각(UTC), 현재 상태, 경매 ID) — SCHEDULED면 시작, RUNNING이면 종료 예정
+Entry = Tuple[datetime, str, int]
+
+
+def _percentile(samples, pct: float) -> float:
+    ordered = sorted(samples)
+    if not ordered:
+        return 0.0
+    idx = min(len(ordered) - 1, max(0, int(round(pct / 100 * len(ordered))) - 1))
+    return ordered[idx]
+
+
+class AuctionScheduler:
+    """경매 시작/종료 시각에 맞춰 상태 전이 배치(시작/정산)를 실행
+
+    - 폴링 대신 lookahead 안에 시작/종료하는 경매를 (status, 시각) 색인 조회로 시간순 힙에 적재하고,
+      가장 이른 예정 시각까지 잠들었다가 깨어나 해당 배치를 실행한다 (종료 정밀도 ≈ 배치 실행 시간)
+    - reload 주기마다 힙을 다시 적재해 새로 등록/수정된 경매를 반영 (그 사이 DB 조회 없음)
+    - GET_LOCK으로 노드 중 하나(리더)만 실행, 나머지는 대기하다 리더가 죽으면 이어받음
+    - 지연(lag) = 배치 완료 시각 - 예정 시각, stats()로 노출
+    """
+
+    def __init__(
+        self,
+        session_factory: Callable[[], Session] = SessionLocal,
+        *,
+        schedule_batch: Optional[AuctionScheduleBatch] = None,
+        settlement_batch: Optional[AuctionSettlementBatch] = None,
+        lock: Optional[AdvisoryLock] = None,
+        lookahead_seconds: float = 300.0,
+        reload_seconds: float = 10.0,
+        max_entries: int = 5000,
+        retry_seconds: float = 1.0,
+    ):
+        self.session_factory = session_factory
+        self.schedule_batch = schedule_batch or AuctionScheduleBatch()
+        self.settlement_batch = settlement_batch or AuctionSettlementBatch()
+        self.lock = lock
+        self.lookahead = timedelta(seconds=lookahead_seconds)
+        self.reload_seconds = reload_seconds
+        self.max_entries = max_entries
+        self.retry_seconds = retry_seconds
+        self._heap: List[Entry] = []
+        self._reload_at = 0.0  # monotonic
+        self._lags_ms: deque = deque(maxlen=1000)
+        self._stats: Dict[str, int] = {"reloads": 0, "runs": 0, "started": 0, "settled": 0, "errors": 0}
+        self._stop = threading.Event()
+        self._wake = threading.Event()
+
+    @property
+    def leader(self) -> bool:
+        return self.lock is None or self.lock.held
+
+    def reload(self, now: Optional[datetime] = None) -> int:
+        """lookahead 안의 시작/종료 예정(이미 지난 것 포함)으로 힙을 다시 만든다
+
+        :return: 힙 항목 수
+        """
+        now = now or datetime.utcnow()
+        db = self.session_factory()
+        try:
+            entries = AuctionReadRepository(db).list_pending_transitions(
+                until=now + self.lookahead, limit=self.max_entries
+            )
+        finally:
+            db.close()
+        heapq.heapify(entries)
+        self._heap = entries
+        self._reload_at = time.monotonic() + self.reload_seconds
+        self._stats["reloads"] += 1
+        return len(entries)
+
+    def run_due(self, now: Optional[datetime] = None) -> int:
+        """예정 시각이 지난 항목을 꺼내 필요한 배치 실행
+
+        :return: 꺼낸 항목 수
+        """
+        now = now or datetime.utcnow()
+        due: List[Entry] = []
+        while self._heap and self._heap[0][0] <= now:
+            due.append(heapq.heappop(self._heap))
+        if not due:
+            return 0
+        statuses = {status for _, status, _ in due}
+        if AuctionStatus.SCHEDULED.value in statuses:
+            self._stats["started"] += self.schedule_batch.run_once(now)
+            # 시작한 경매의 종료 예정을 힙에 넣도록 다음 tick에서 재적재
+            self._reload_at = 0.0
+        if AuctionStatus.RUNNING.value in statuses:
+            self._stats["settled"] += self.settlement_batch.run_once(now)
+        finished = datetime.utcnow()
+        self._lags_ms.extend((finished - due_at).total_seconds() * 1000 for due_at, _, _ in due)
+        self._stats["runs"] += 1
+        return len(due)
+
+    def next_wait(self) -> float:
+        """다음 예정 시각 또는 재적재 시각까지 남은 초"""
+        wait = self._reload_at - time.monotonic()
+        if self._heap:
+            wait = min(wait, (self._heap[0][0] - datetime.utcnow()).total_seconds())
+        return max(wait, 0.0)
+
+    def tick(self) -> float:
+        """리더 확인 → (주기가 되면) 재적재 → 예정 배치 실행. 다음 대기 초 반환"""
+        if self.lock is not None and not self.lock.acquire():
+            return self.retry_seconds
+        if time.monotonic() >= self._reload_at:
+            if self.lock is not None and not self.lock.check():
+                logger.warning("auction scheduler lost leadership")
+                self._heap = []
+                return self.retry_seconds
+            self.reload()
+        self.run_due()
+        return self.next_wait()
+
+    def run_forever(self) -> None:
+        logger.info("auction scheduler started")
+        while not self._stop.is_set():
+            try:
+                wait = self.tick()
+            except Exception:
+                logger.exception("auction scheduler cycle failed")
+                self._stats["errors"] += 1
+                # 실패한 항목은 다음 재적재에서 DB 기준으로 다시 잡힌다
+                self._reload_at = time.monotonic() + self.retry_seconds
+                wait = self.retry_seconds
+            self._wake.wait(wait)
+            self._wake.clear()
+        if self.lock is not None:
+            self.lock.release()
+
+    def wake(self) -> None:
+        """즉시 재적재 (경매 등록/수정 직후 lookahead 안의 변경을 바로 반영할 때)"""
+        self._reload_at = 0.0
+        self._wake.set()
+
+    def start(self) -> None:
+        """앱 lifespan에서 백그라운드 스레드로 실행 (노드/워커 중 GET_LOCK을 잡은 하나만 동작)"""
+        self._stop.clear()
+        threading.Thread(target=self.run_forever, name="auction-scheduler", daemon=True).start()
+
+    def stop(self) -> None:
+        self._stop.set()
+        self._wake.set()
+
+    def stats(self) -> dict:
+        lags = list(self._lags_ms)
+        next_due = self._heap[0][0] if self._heap else None
+        return {
+            "leader": self.leader,
+            "pending": len(self._heap),
+            "next_due_in_seconds": (
+                (next_due - datetime.utcnow()).total_seconds() if next_due else None
+            ),
+            "lag_p50_ms": _percentile(lags, 50),
+            "lag_p99_ms": _percentile(lags, 99),
+            "lag_max_ms": max(lags, default=0.0),
+            **self._stats,
+        }
+
+
+auction_scheduler = AuctionScheduler(
+    lock=AdvisoryLock(engine, settings.SCHEDULER_LOCK_NAME),
+    lookahead_seconds=settings.SCHEDULER_LOOKAHEAD_SECONDS,
+    reload_seconds=settings.SCHEDULER_RELOAD_SECONDS,
+    max_entries=settings.SCHEDULER_MAX_ENTRIES,
+)
@@ -1,8 +1,9 @@
 from fastapi import Header, HTTPException, status, Depends
 from typing import Optional
-from sqlalchemy.orm import Session
 from app.core.security import decode_access_token
-from app.core.deps import get_db
+from sqlalchemy.orm import Session
+from app.core.deps import get_read_db, get_uow
+from app.infrastructure.db.uow import SqlAlchemyUnitOfWork
 from app.repositories.user_read import UserReadRepository
 from app.core.config import settings
 
@@ -32,15 +33,32 @@ def get_current_user_id(authorization: Optional[str] = Header(None)) -> int:
 
 def get_current_user_id_verified(
     authorization: Optional[str] = Header(None),
-    db: Session = Depends(get_db),
+    uow: SqlAlchemyUnitOfWork = Depends(get_uow),
 ) -> int:
     """Resolve the current user id from the Authorization header and ensure the user exists.
 
     Returns 401 if the token is missing/invalid or if the user does not exist.
+    Shares the request unit of work (one session/connection per request).
+    """
+    return _ensure_user_exists(get_current_user_id(authorization), uow.users_read)
+
+
+def get_current_user_id_verified_read(
+    authorization: Optional[str] = Header(None),
+    db: Session = Depends(get_read_db),
+) -> int:
+    """Read-endpoint variant of get_current_user_id_verified.
+
+    Looks the user up on the routed read session (get_read_db) so read APIs
+    keep a single replica connection instead of opening a primary UoW.
     """
-    user_id = get_current_user_id(authorization)
-    user = UserReadRepository(db).get_user_by_id(user_id)
-    if user is None:
+    return _ensure_user_exists(
+        get_current_user_id(authorization), UserReadRepository(db)
+    )
+
+
+def _ensure_user_exists(user_id: int, users_read: UserReadRepository) -> int:
+    if users_read.get_user_by_id(user_id) is None:
         raise HTTPException(
             status_code=status.HTTP_401_UNAUTHORIZED, detail="User not found"
         )
@@ -1,4 +1,4 @@
-from typing import List
+from typing import List, Optional
 from pydantic_settings import BaseSettings, SettingsConfigDict
 from pydantic import field_validator
 import json
@@ -12,6 +12,13 @@ class Settings(BaseSettings):
 
     # Required
     DATABASE_URL: str  # must be provided via env/.env
+    # Optional async driver URL (e.g. mysql+aiomysql://...). 설정 시 AsyncSession 경로 사용
+    DATABASE_ASYNC_URL: Optional[str] = None
+    # Read replica (optional). 미설정 시 읽기도 primary 사용
+    DATABASE_READ_URL: Optional[str] = None
+    DATABASE_ASYNC_READ_URL: Optional[str] = None
+    # 쓰기 직후 해당 사용자의 읽기를 primary로 고정하는 시간(초, replica lag 대비)
+    READ_YOUR_WRITES_SECONDS: int = 5
     CORS_ORIGINS: List[str] = ["http://localhost:3000"]
 
     # Optional flags
@@ -19,6 +26,70 @@ class Settings(BaseSettings):
     LOG_LEVEL: str = "INFO"
     # SQLAlchemy
     SQL_ECHO: bool = False
+    # 요청별 SQL 문 수/DB 시간 집계 → Server-Timing 헤더 + 로그 (app.db.query_stats)
+    QUERY_STATS_ENABLED: bool = True
+    QUERY_STATS_WARN_COUNT: int = 50  # 요청당 문장 수가 이 값을 넘으면 WARNING 로그
+    QUERY_STATS_SLOW_MS: float = 200.0  # 가장 느린 문장이 이 시간(ms)을 넘으면 WARNING 로그
+    # Connection pool (엔진당 최대 커넥션 = DB_POOL_SIZE + DB_MAX_OVERFLOW, SQLAlchemy 기본값 유지)
+    # primary/replica/async 엔진마다 따로 잡히고 워커 수만큼 곱해지므로 MySQL max_connections 안에서 조정
+    DB_POOL_SIZE: int = 5
+    DB_MAX_OVERFLOW: int = 10
+    DB_POOL_TIMEOUT: float = 30.0  # 풀 대기 최대 시간(초), 초과 시 QueuePool limit 에러
+    DB_POOL_RECYCLE: int = 1800  # 초. MySQL wait_timeout 보다 짧게
+    # True: checkout마다 ping(비관적), False: recycle + 끊김 감지 후 재시도(낙관적)
+    DB_POOL_PRE_PING: bool = True
+    # 시작 시 없는 테이블 생성(create_all). 스키마 변경(컬럼/색인)은 alembic upgrade head로 반영
+    DB_CREATE_ALL: bool = True
+
+    # Cache (memory | redis). redis는 워커 간 공유 + 무효화 전파
+    CACHE_BACKEND: str = "memory"
+    REDIS_URL: str = "redis://localhost:6379/0"
+    CACHE_SERIALIZER: str = "msgpack"  # msgpack | orjson
+    CACHE_KEY_PREFIX: str = "nafal"
+    CACHE_MEMORY_MAXSIZE: int = 4096
+    CACHE_TTL_SECONDS: float = 30.0  # 상품 메타/스토리/경매 정보 (0이면 비활성)
+    LISTING_CACHE_TTL_SECONDS: float = 5.0  # 상품 목록 (0이면 비활성)
+
+    # 상품 대표 이미지를 product.representative_image_url(비정규화)에서 읽을지 여부.
+    # 켜기 전에 ProductRepImageBackfillBatch로 기존 상품을 백필해야 함
+    PRODUCT_REP_IMAGE_FROM_COLUMN: bool = False
+
+    # 상품 키워드 검색 (like | fulltext | memory)
+    # - fulltext: MySQL FULLTEXT(ngram) 색인 필요 (ft_product_text, ft_product_name, ft_popup_store_name)
+    # - memory: 워커별 bigram 역색인 (상품 수 × 약 수백 바이트 메모리, 시작 시 적재)
+    SEARCH_BACKEND: str = "like"
+    SEARCH_MAX_RESULTS: int = 1000  # memory: 관련도 상위 N개 상품만 후보로 사용
+    SEARCH_REFRESH_SECONDS: float = 60.0  # memory: updated_at 기준 증분 반영 주기
+
+    # Hot auction state (off | memory | redis). memory는 프로세스 로컬이므로 워커가 여럿이면 redis 사용
+    HOT_AUCTION_BACKEND: str = "off"
+    HOT_AUCTION_WINDOW_MINUTES: int = 30  # 종료까지 이 시간 이내인 RUNNING 경매만 추적
+    HOT_AUCTION_MAX: int = 200
+    HOT_AUCTION_REFRESH_SECONDS: float = 30.0  # DB 기준 재적재 주기
+
+    # Realtime auction events (SSE). memory는 같은 워커의 구독자에게만 전달 → 워커/배치가 여럿이면 redis
+    REALTIME_BROKER: str = "memory"  # memory | redis
+    SSE_HEARTBEAT_SECONDS: float = 15.0
+    SSE_QUEUE_SIZE: int = 64  # 구독자별 미전송 이벤트 상한 (초과 시 오래된 것부터 버림)
+
+    # Notification outbox dispatcher
+    NOTIFICATION_OUTBOX_BATCH_SIZE: int = 100
+    NOTIFICATION_OUTBOX_POLL_SECONDS: float = 1.0
+    NOTIFICATION_OUTBOX_MAX_ATTEMPTS: int = 8
+    NOTIFICATION_OUTBOX_BACKOFF_SECONDS: float = 5.0  # 재시도 간격 = base * 2^(attempts-1), 최대 1시간
+    # 선점한 메시지의 임대 시간(초). 결과 기록 없이 지나면(워커 중단) 다른 디스패처가 다시 선점
+    NOTIFICATION_OUTBOX_LEASE_SECONDS: float = 300.0
+
+    # Auction settlement batch: 청크(트랜잭션)당 정산 경매 수
+    SETTLEMENT_CHUNK_SIZE: int = 200
+
+    # Auction scheduler: 경매 시작/정산 배치를 예정 시각에 실행 (python -m app.batch)
+    # SCHEDULER_ENABLED=true면 앱 lifespan에서도 실행 — 노드/워커 중 GET_LOCK을 잡은 하나만 동작
+    SCHEDULER_ENABLED: bool = False
+    SCHEDULER_LOCK_NAME: str = "nafal:auction-scheduler"
+    SCHEDULER_LOOKAHEAD_SECONDS: float = 300.0  # 이 시간 안에 시작/종료하는 경매를 힙에 적재
+    SCHEDULER_RELOAD_SECONDS: float = 10.0  # 힙 재적재 주기 (새로 등록/수정된 경매 반영)
+    SCHEDULER_MAX_ENTRIES: int = 5000
 
     # JWT
     SECRET_KEY: str = "change-me"  # set in .env for prod
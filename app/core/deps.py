@@ -1,5 +1,9 @@
-from typing import Generator
+from typing import AsyncGenerator, Generator, Optional
+from fastapi import Header
+from app.core.security import peek_user_id
 from app.db.session import SessionLocal
+from app.db.routing import async_read_session_factory, read_session_factory
+from app.infrastructure.db.uow import AsyncSqlAlchemyUnitOfWork, SqlAlchemyUnitOfWork
 
 
 def get_db() -> Generator:
@@ -8,3 +12,37 @@ def get_db() -> Generator:
         yield db
     finally:
         db.close()
+
+
+def get_uow() -> Generator[SqlAlchemyUnitOfWork, None, None]:
+    """요청 단위 UoW (쓰기 API용): 세션/트랜잭션 1개, 응답 전에 한 번 커밋 (예외 시 롤백)
+
+    같은 요청의 여러 서비스 의존성은 FastAPI 캐시로 같은 UoW를 공유한다.
+    """
+    with SqlAlchemyUnitOfWork() as uow:
+        yield uow
+
+
+def get_read_db(authorization: Optional[str] = Header(None)) -> Generator:
+    """읽기 전용 세션 (replica). 최근 쓰기 사용자는 primary로 라우팅"""
+    db = read_session_factory(peek_user_id(authorization))()
+    try:
+        yield db
+    finally:
+        db.close()
+
+
+async def get_async_uow() -> AsyncGenerator[AsyncSqlAlchemyUnitOfWork, None]:
+    async with AsyncSqlAlchemyUnitOfWork() as uow:
+        yield uow
+
+
+async def get_async_read_uow(
+    authorization: Optional[str] = Header(None),
+) -> AsyncGenerator[AsyncSqlAlchemyUnitOfWork, None]:
+    user_id = peek_user_id(authorization)
+    async with AsyncSqlAlchemyUnitOfWork(
+        session_factory=async_read_session_factory(user_id),
+        sync_session_factory=read_session_factory(user_id),
+    ) as uow:
+        yield uow
@@ -16,3 +16,5 @@ class ErrorCode(str, Enum):
     PRODUCT_ALREADY_HAS_AUCTION = "PRODUCT_ALREADY_HAS_AUCTION"
     WINNER_NOT_FOUND = "WINNER_NOT_FOUND"
     AUTO_CHARGE_FAILED = "AUTO_CHARGE_FAILED"
+    INVALID_CURSOR = "INVALID_CURSOR"
+    INVALID_STATUS_FILTER = "INVALID_STATUS_FILTER"
@@ -40,6 +40,25 @@ def decode_access_token(token: str) -> dict:
         raise ValueError("Invalid token") from e
 
 
+def peek_user_id(authorization: Optional[str]) -> Optional[int]:
+    """Authorization 헤더에서 사용자 ID를 추출 (검증 실패 시 None, 예외 없음)
+
+    인증이 필요 없는 조회 API에서 라우팅 힌트(read-your-writes) 용도로만 사용한다.
+    """
+    if not authorization or not authorization.lower().startswith("bearer "):
+        return None
+    token = authorization.split(" ", 1)[1].strip()
+    try:
+        sub = decode_access_token(token).get("sub")
+        return int(sub) if sub is not None else None
+    except (ValueError, TypeError):
+        pass
+    try:
+        return int(token)
+    except ValueError:
+        return None
+
+
 async def require_auth(
     auth: Optional[HTTPAuthorizationCredentials] = Depends(http_bearer),
 ) -> int:
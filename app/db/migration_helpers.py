@@ -0,0 +1,48 @@
+from typing import Sequence
+
+import sqlalchemy as sa
+from alembic import op
+
+
+def _inspector():
+    return sa.inspect(op.get_bind())
+
+
+def has_column(table: str, column: str) -> bool:
+    return any(c["name"] == column for c in _inspector().get_columns(table))
+
+
+def has_table(table: str) -> bool:
+    return _inspector().has_table(table)
+
+
+def has_index(table: str, name: str) -> bool:
+    return any(i["name"] == name for i in _inspector().get_indexes(table))
+
+
+def create_index_if_missing(name: str, table: str, columns: Sequence[str], **kw) -> None:
+    """create_all로 먼저 만들어진 DB(신규 테이블/신규 설치)도 있으므로 없는 색인만 추가
+
+    오프라인(--sql) 모드에서는 조회할 수 없으므로 항상 생성문을 출력한다.
+    """
+    if context_is_offline() or not has_index(table, name):
+        op.create_index(name, table, list(columns), **kw)
+
+
+def create_table_if_missing(name: str, *columns, **kw) -> None:
+    """create_all로 이미 테이블이 만들어진 DB도 있으므로 없는 테이블만 생성 (오프라인은 항상 출력)"""
+    if context_is_offline() or not has_table(name):
+        op.create_table(name, *columns, **kw)
+
+
+def drop_index_if_exists(name: str, table: str) -> None:
+    if context_is_offline() or has_index(table, name):
+        op.drop_index(name, table_name=table)
+
+
+def context_is_offline() -> bool:
+    return op.get_context().as_sql
+
+
+def is_mysql() -> bool:
+    return op.get_context().dialect.name == "mysql"
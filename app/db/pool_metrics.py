@@ -0,0 +1,147 @@
+import threading
+import time
+from contextvars import ContextVar
+from typing import Any, Dict
+
+from sqlalchemy import event, exc
+from sqlalchemy.engine import Engine
+from sqlalchemy.pool import AsyncAdaptedQueuePool, QueuePool
+
+
+class PoolMetrics:
+    """커넥션 풀 이벤트 기반 통계 (프로세스 단위, thread-safe)"""
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self.reset()
+
+    def reset(self) -> None:
+        with self._lock:
+            self.connects = 0
+            self.checkouts = 0
+            self.checkins = 0
+            self.invalidations = 0
+            self.timeouts = 0
+            self.wait_count = 0
+            self.wait_total_ms = 0.0
+            self.wait_max_ms = 0.0
+            self.last_timeout_at: float | None = None
+
+    def record_wait(self, elapsed_ms: float) -> None:
+        with self._lock:
+            self.wait_count += 1
+            self.wait_total_ms += elapsed_ms
+            if elapsed_ms > self.wait_max_ms:
+                self.wait_max_ms = elapsed_ms
+
+    def record_timeout(self) -> None:
+        with self._lock:
+            self.timeouts += 1
+            self.last_timeout_at = time.time()
+
+    def incr(self, name: str) -> None:
+        with self._lock:
+            setattr(self, name, getattr(self, name) + 1)
+
+    def snapshot(self) -> Dict[str, Any]:
+        with self._lock:
+            avg = self.wait_total_ms / self.wait_count if self.wait_count else 0.0
+            return {
+                "connects": self.connects,
+                "checkouts": self.checkouts,
+                "checkins": self.checkins,
+                "invalidations": self.invalidations,
+                "timeouts": self.timeouts,
+                "last_timeout_at": self.last_timeout_at,
+                "wait_count": self.wait_count,
+                "wait_avg_ms": round(avg, 3),
+                "wait_max_ms": round(self.wait_max_ms, 3),
+            }
+
+
+# _do_get 재귀 여부 (스레드별 + async는 코루틴(태스크)별로 분리 — threading.local이면
+# 이벤트 루프 스레드의 대기 중인 코루틴들이 깊이를 공유해 측정이 누락됨)
+_do_get_depth: ContextVar[int] = ContextVar("pool_do_get_depth", default=0)
+
+
+class _WaitTimingMixin:
+    """_do_get(풀에서 커넥션 대기/생성) 소요 시간과 QueuePool timeout을 기록
+
+    _do_get은 overflow 경합 시 재귀 호출되므로 가장 바깥 호출만 측정한다.
+    """
+
+    metrics: PoolMetrics
+
+    def _do_get(self):
+        if _do_get_depth.get():
+            return super()._do_get()
+        token = _do_get_depth.set(1)
+        started = time.perf_counter()
+        try:
+            return super()._do_get()
+        except exc.TimeoutError:
+            self.metrics.record_timeout()
+            raise
+        finally:
+            _do_get_depth.reset(token)
+            self.metrics.record_wait((time.perf_counter() - started) * 1000)
+
+
+class InstrumentedQueuePool(_WaitTimingMixin, QueuePool):
+    def __init__(self, *args, **kwargs):
+        self.metrics = PoolMetrics()
+        super().__init__(*args, **kwargs)
+
+    def recreate(self):
+        pool = super().recreate()
+        pool.metrics = self.metrics
+        return pool
+
+
+class InstrumentedAsyncQueuePool(_WaitTimingMixin, AsyncAdaptedQueuePool):
+    def __init__(self, *args, **kwargs):
+        self.metrics = PoolMetrics()
+        super().__init__(*args, **kwargs)
+
+    def recreate(self):
+        pool = super().recreate()
+        pool.metrics = self.metrics
+        return pool
+
+
+def attach_pool_events(engine: Engine, metrics: PoolMetrics) -> None:
+    """checkout/checkin/connect/invalidate 이벤트를 metrics에 연결"""
+
+    @event.listens_for(engine, "connect")
+    def _on_connect(dbapi_conn, conn_record):
+        metrics.incr("connects")
+
+    @event.listens_for(engine, "checkout")
+    def _on_checkout(dbapi_conn, conn_record, conn_proxy):
+        metrics.incr("checkouts")
+
+    @event.listens_for(engine, "checkin")
+    def _on_checkin(dbapi_conn, conn_record):
+        metrics.incr("checkins")
+
+    @event.listens_for(engine, "invalidate")
+    def _on_invalidate(dbapi_conn, conn_record, exception):
+        metrics.incr("invalidations")
+
+
+def pool_status(engine: Engine) -> Dict[str, Any]:
+    """현재 풀 상태 + 누적 이벤트 통계"""
+    pool = engine.pool
+    status: Dict[str, Any] = {
+        "pool_class": type(pool).__name__,
+        "size": pool.size() if hasattr(pool, "size") else None,
+        "checked_in": pool.checkedin() if hasattr(pool, "checkedin") else None,
+        "checked_out": pool.checkedout() if hasattr(pool, "checkedout") else None,
+        "overflow": pool.overflow() if hasattr(pool, "overflow") else None,
+        "max_overflow": getattr(pool, "_max_overflow", None),
+        "timeout": getattr(pool, "_timeout", None),
+    }
+    metrics = getattr(pool, "metrics", None)
+    if metrics is not None:
+        status.update(metrics.snapshot())
+    return status
@@ -0,0 +1,157 @@
+import logging
+import time
+from contextlib import contextmanager
+from contextvars import ContextVar
+from typing import Iterator, List, Optional
+
+from sqlalchemy import event
+from sqlalchemy.engine import Engine
+
+logger = logging.getLogger(__name__)
+
+# 로그/헤더에 남길 가장 느린 문장 최대 길이
+_STATEMENT_PREVIEW = 200
+
+
+class QueryStats:
+    """요청 하나가 실행한 SQL 문 수 / DB 시간 / 가장 느린 문장"""
+
+    __slots__ = ("count", "total_ms", "slowest_ms", "slowest_statement")
+
+    def __init__(self):
+        self.count = 0
+        self.total_ms = 0.0
+        self.slowest_ms = 0.0
+        self.slowest_statement: Optional[str] = None
+
+    def record(self, statement: str, elapsed_ms: float) -> None:
+        self.count += 1
+        self.total_ms += elapsed_ms
+        if elapsed_ms > self.slowest_ms:
+            self.slowest_ms = elapsed_ms
+            self.slowest_statement = statement
+
+    def as_dict(self) -> dict:
+        return {
+            "queries": self.count,
+            "db_ms": round(self.total_ms, 3),
+            "slowest_ms": round(self.slowest_ms, 3),
+            "slowest_sql": (
+                " ".join(self.slowest_statement.split())[:_STATEMENT_PREVIEW]
+                if self.slowest_statement
+                else None
+            ),
+        }
+
+
+# 현재 요청의 집계 (스레드풀에서 도는 sync 엔드포인트/의존성도 복사된 컨텍스트로 같은 객체를 본다)
+_current: ContextVar[Optional[QueryStats]] = ContextVar("query_stats", default=None)
+# capture() 활성 동안 끝난 요청의 집계를 모으는 목록 (테스트용)
+_captures: List[List[QueryStats]] = []
+
+
+def current_query_stats() -> Optional[QueryStats]:
+    return _current.get()
+
+
+@contextmanager
+def track_queries() -> Iterator[QueryStats]:
+    """블록 안에서 (현재 컨텍스트로) 실행된 SQL 문을 새 QueryStats에 집계"""
+    stats = QueryStats()
+    token = _current.set(stats)
+    try:
+        yield stats
+    finally:
+        _current.reset(token)
+        for captured in _captures:
+            captured.append(stats)
+
+
+@contextmanager
+def capture() -> Iterator[List[QueryStats]]:
+    """블록 동안 끝난 track_queries 집계를 순서대로 수집 (요청별 쿼리 수 검증용)"""
+    captured: List[QueryStats] = []
+    _captures.append(captured)
+    try:
+        yield captured
+    finally:
+        _captures.remove(captured)
+
+
+def attach_query_events(engine: Engine) -> None:
+    """before/after_cursor_execute로 문장별 소요 시간을 현재 요청 집계에 기록"""
+
+    @event.listens_for(engine, "before_cursor_execute")
+    def _before(conn, cursor, statement, parameters, context, executemany):
+        if context is not None and _current.get() is not None:
+            context._query_started_at = time.perf_counter()
+
+    @event.listens_for(engine, "after_cursor_execute")
+    def _after(conn, cursor, statement, parameters, context, executemany):
+        stats = _current.get()
+        started = getattr(context, "_query_started_at", None)
+        if stats is not None and started is not None:
+            stats.record(statement, (time.perf_counter() - started) * 1000)
+
+
+def server_timing(stats: QueryStats, app_ms: float) -> str:
+    """Server-Timing 헤더 값 (브라우저 개발자 도구 Timing 탭에 표시)"""
+    return (
+        f'db;dur={stats.total_ms:.1f};desc="{stats.count} queries", '
+        f"db-slowest;dur={stats.slowest_ms:.1f}, "
+        f"app;dur={app_ms:.1f}"
+    )
+
+
+class QueryStatsMiddleware:
+    """요청별 SQL 문 수/DB 시간 집계 → Server-Timing 헤더 + 로그
+
+    - 응답 시작 시점까지의 집계를 헤더로 보내고, 요청 종료 후(응답 후 커밋 포함) 로그를 남긴다
+    - 문장 수/가장 느린 문장이 임계값을 넘으면 WARNING, 아니면 DEBUG
+    """
+
+    def __init__(self, app, *, warn_count: int = 50, slow_ms: float = 200.0):
+        self.app = app
+        self.warn_count = warn_count
+        self.slow_ms = slow_ms
+
+    async def __call__(self, scope, receive, send):
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+        started = time.perf_counter()
+        with track_queries() as stats:
+
+            async def send_with_timing(message):
+                if message["type"] == "http.response.start":
+                    elapsed = (time.perf_counter() - started) * 1000
+                    headers = list(message.get("headers", []))
+                    headers.append(
+                        (b"server-timing", server_timing(stats, elapsed).encode("latin-1"))
+                    )
+                    message = {**message, "headers": headers}
+                await send(message)
+
+            try:
+                await self.app(scope, receive, send_with_timing)
+            finally:
+                self._log(scope, stats, (time.perf_counter() - started) * 1000)
+
+    def _log(self, scope, stats: QueryStats, app_ms: float) -> None:
+        slow = stats.count > self.warn_count or stats.slowest_ms > self.slow_ms
+        level = logging.WARNING if slow else logging.DEBUG
+        if not logger.isEnabledFor(level):
+            return
+        fields = {"method": scope["method"], "path": scope["path"], "app_ms": round(app_ms, 3)}
+        fields.update(stats.as_dict())
+        logger.log(
+            level,
+            "db %s %s queries=%d db_ms=%.1f slowest_ms=%.1f slowest_sql=%s",
+            fields["method"],
+            fields["path"],
+            fields["queries"],
+            fields["db_ms"],
+            fields["slowest_ms"],
+            fields["slowest_sql"],
+            extra={"query_stats": fields},
+        )
@@ -0,0 +1,100 @@
+import threading
+import time
+from typing import Callable, Optional
+
+from cachetools import TTLCache
+from sqlalchemy.orm import Session
+from sqlalchemy.ext.asyncio import async_sessionmaker
+
+from app.core.config import settings
+from app.db.session import (
+    AsyncReadSessionLocal,
+    AsyncSessionLocal,
+    ReadSessionLocal,
+    SessionLocal,
+    async_engine,
+    async_read_engine,
+    engine,
+    read_engine,
+)
+
+
+class RecentWriters:
+    """최근 쓰기를 수행한 사용자 레지스트리 (read-your-writes)
+
+    입찰/즉시구매 직후 일정 시간 동안 해당 사용자의 읽기를 primary로 보내
+    replica 복제 지연으로 방금 쓴 데이터가 안 보이는 문제를 막는다.
+    프로세스 로컬 저장소이므로 워커 간에는 공유되지 않는다.
+    """
+
+    def __init__(
+        self,
+        ttl_seconds: int,
+        maxsize: int = 100_000,
+        timer: Callable[[], float] = time.monotonic,
+    ):
+        self._lock = threading.Lock()
+        self._users: TTLCache = TTLCache(
+            maxsize=maxsize, ttl=max(ttl_seconds, 1), timer=timer
+        )
+        self.enabled = ttl_seconds > 0
+
+    def mark(self, user_id: Optional[int]) -> None:
+        if not self.enabled or user_id is None:
+            return
+        with self._lock:
+            self._users[int(user_id)] = True
+
+    def is_recent(self, user_id: Optional[int]) -> bool:
+        if not self.enabled or user_id is None:
+            return False
+        with self._lock:
+            return int(user_id) in self._users
+
+    def clear(self) -> None:
+        with self._lock:
+            self._users.clear()
+
+
+recent_writers = RecentWriters(settings.READ_YOUR_WRITES_SECONDS)
+
+
+def read_session_factory(user_id: Optional[int] = None) -> Callable[[], Session]:
+    """읽기 전용 세션 팩토리 선택: 최근 쓰기 사용자는 primary, 그 외 replica"""
+    if recent_writers.is_recent(user_id):
+        return SessionLocal
+    return ReadSessionLocal
+
+
+def async_read_session_factory(
+    user_id: Optional[int] = None,
+) -> Optional[async_sessionmaker]:
+    if recent_writers.is_recent(user_id):
+        return AsyncSessionLocal
+    return AsyncReadSessionLocal
+
+
+# replica가 따로 있는 primary 엔진 (이 엔진으로 읽는 세션 = read-your-writes로 primary에 고정된 읽기)
+_PINNABLE_ENGINES = tuple(
+    primary
+    for primary, replica in (
+        (engine, read_engine),
+        (
+            async_engine.sync_engine if async_engine is not None else None,
+            async_read_engine.sync_engine if async_read_engine is not None else None,
+        ),
+    )
+    if primary is not None and replica is not primary
+)
+
+
+def has_replica() -> bool:
+    return bool(_PINNABLE_ENGINES)
+
+
+def is_primary_pinned(session: Session) -> bool:
+    """replica가 설정된 상태에서 primary로 읽는 세션인지 (최근 쓰기 사용자 / 쓰기 UoW)"""
+    if not _PINNABLE_ENGINES:
+        return False
+    bind = session.get_bind()
+    return any(bind is e for e in _PINNABLE_ENGINES)
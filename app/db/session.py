@@ -1,16 +1,100 @@
 from sqlalchemy import create_engine
+from sqlalchemy.ext.asyncio import async_sessionmaker, create_async_engine
 from sqlalchemy.orm import DeclarativeBase, sessionmaker
 from app.core.config import settings
+from app.db.pool_metrics import (
+    InstrumentedAsyncQueuePool,
+    InstrumentedQueuePool,
+    attach_pool_events,
+)
+from app.db.query_stats import attach_query_events
 
 
 class Base(DeclarativeBase):
     pass
 
 
+def _pool_options() -> dict:
+    return dict(
+        pool_size=settings.DB_POOL_SIZE,
+        max_overflow=settings.DB_MAX_OVERFLOW,
+        pool_timeout=settings.DB_POOL_TIMEOUT,
+        pool_recycle=settings.DB_POOL_RECYCLE,
+        pool_pre_ping=settings.DB_POOL_PRE_PING,
+    )
+
+
 engine = create_engine(
     settings.DATABASE_URL,
-    pool_pre_ping=True,
+    poolclass=InstrumentedQueuePool,
     echo=settings.SQL_ECHO,
     echo_pool=settings.SQL_ECHO,
+    **_pool_options(),
 )
+attach_pool_events(engine, engine.pool.metrics)
+attach_query_events(engine)
 SessionLocal = sessionmaker(autocommit=False, autoflush=False, bind=engine)
+
+# Read replica (optional): 미설정 시 primary 엔진을 그대로 사용
+read_engine = (
+    create_engine(
+        settings.DATABASE_READ_URL,
+        poolclass=InstrumentedQueuePool,
+        echo=settings.SQL_ECHO,
+        echo_pool=settings.SQL_ECHO,
+        **_pool_options(),
+    )
+    if settings.DATABASE_READ_URL
+    else engine
+)
+if read_engine is not engine:
+    attach_pool_events(read_engine, read_engine.pool.metrics)
+    attach_query_events(read_engine)
+ReadSessionLocal = sessionmaker(autocommit=False, autoflush=False, bind=read_engine)
+
+# Async engine (optional): DATABASE_ASYNC_URL 설정 시에만 생성
+async_engine = (
+    create_async_engine(
+        settings.DATABASE_ASYNC_URL,
+        poolclass=InstrumentedAsyncQueuePool,
+        echo=settings.SQL_ECHO,
+        echo_pool=settings.SQL_ECHO,
+        **_pool_options(),
+    )
+    if settings.DATABASE_ASYNC_URL
+    else None
+)
+if async_engine is not None:
+    attach_pool_events(async_engine.sync_engine, async_engine.sync_engine.pool.metrics)
+    attach_query_events(async_engine.sync_engine)
+AsyncSessionLocal = (
+    async_sessionmaker(
+        bind=async_engine, autoflush=False, expire_on_commit=False
+    )
+    if async_engine is not None
+    else None
+)
+
+async_read_engine = (
+    create_async_engine(
+        settings.DATABASE_ASYNC_READ_URL,
+        poolclass=InstrumentedAsyncQueuePool,
+        echo=settings.SQL_ECHO,
+        echo_pool=settings.SQL_ECHO,
+        **_pool_options(),
+    )
+    if settings.DATABASE_ASYNC_READ_URL
+    else async_engine
+)
+if async_read_engine is not None and async_read_engine is not async_engine:
+    attach_pool_events(
+        async_read_engine.sync_engine, async_read_engine.sync_engine.pool.metrics
+    )
+    attach_query_events(async_read_engine.sync_engine)
+AsyncReadSessionLocal = (
+    async_sessionmaker(
+        bind=async_read_engine, autoflush=False, expire_on_commit=False
+    )
+    if async_read_engine is not None
+    else None
+)
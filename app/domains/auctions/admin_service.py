@@ -13,13 +13,19 @@ from app.domains.auctions.admin_dto import (
     AdminAuctionShipmentInfo,
 )
 from app.domains.common.tx import transactional
+from app.infrastructure.cache.app_cache import (
+    AUCTION_INFO,
+    LISTING,
+    invalidate_after_commit,
+)
 from app.repositories.auction_admin_read import AuctionAdminReadRepository
 from app.repositories.auction_admin_write import AuctionAdminWriteRepository
 from app.repositories.auction_read import AuctionReadRepository
-from app.domains.auctions.enums import AuctionStatus
+from app.domains.auctions.enums import AuctionStatus, PaymentStatusKo, ShipmentStatusKo
+from app.domains.auctions.hot_state import hot_auctions
 from app.schemas.auctions import Auction
 from app.domains.notifications.service import NotificationService
-from app.domains.notifications.dto import NotifyRequest
+from app.domains.notifications.dto import NotifyManyRequest
 
 
 class AuctionAdminService:
@@ -55,6 +61,12 @@ class AuctionAdminService:
         ends_to: Optional[str] = None,
         sort: str = "latest",
     ) -> Page[AdminAuctionListItem]:
+        for value, allowed in (
+            (payment_status, PaymentStatusKo),
+            (shipment_status, ShipmentStatusKo),
+        ):
+            if value and value != "ALL" and value not in {s.value for s in allowed}:
+                raise BusinessError(ErrorCode.INVALID_STATUS_FILTER, f"알 수 없는 상태 필터입니다: {value}")
         items, total = self.read_admin.list_auctions(
             page=page,
             size=size,
@@ -115,6 +127,7 @@ class AuctionAdminService:
                     "수정은 시작일시 이전이면서 SCHEDULED 상태에서만 가능합니다.",
                 )
         with transactional(self.session):
+            invalidate_after_commit(self.session, LISTING, AUCTION_INFO)
             a = self.write_admin.upsert(
                 id=req.id,
                 product_id=req.product_id,
@@ -157,6 +170,8 @@ class AuctionAdminService:
         else:
             raise BusinessError(ErrorCode.INVALID_AUCTION_STATUS, "허용되지 않는 상태입니다.")
         with transactional(self.session):
+            invalidate_after_commit(self.session, LISTING, AUCTION_INFO)
+            hot_auctions.evict_after_commit(self.session, auction_id)
             self.write_admin.update_status(auction_id, req.status)
             # Notifications for pause/resume
             try:
@@ -168,15 +183,14 @@ class AuctionAdminService:
                     message = f"‘{title}’ 경매가 재개됐어요."
                 if message:
                     # send to all distinct bidders so far
-                    for uid in self.read.list_distinct_bidder_user_ids(auction_id):
-                        self.notifications.send(
-                            NotifyRequest(
-                                user_id=uid,
-                                title=message,
-                                body="5일",
-                                product_id=a.product_id,
-                            )
+                    self.notifications.send_many(
+                        NotifyManyRequest(
+                            user_ids=self.read.list_distinct_bidder_user_ids(auction_id),
+                            title=message,
+                            body="5일",
+                            product_id=a.product_id,
                         )
+                    )
             except Exception:
                 # do not break main flow on notification failures
                 pass
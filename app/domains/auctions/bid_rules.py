@@ -1,39 +1,102 @@
-from typing import List, Optional
+from bisect import bisect_right
+from decimal import ROUND_CEILING, Decimal
+from itertools import islice
+from typing import Iterator, List, Optional
+
+# 호가 단위 구간표: 금액이 _TIER_FLOORS[i] 이상이면 _TIER_INCREMENTS[i] 단위
+_TIER_FLOORS = (0, 10_000, 30_000, 50_000, 150_000, 300_000, 500_000, 1_000_000)
+_TIER_INCREMENTS = (500, 1_000, 2_000, 5_000, 10_000, 20_000, 30_000, 50_000)
+
+# 입찰 금액은 DECIMAL(12,2) 로 저장되므로 원 단위 아래 2자리까지만 비교
+_CENTS = Decimal("0.01")
+
+# 현재가 기준 최대 몇 스텝 위까지 입찰을 허용하는지 (점프 입찰 상한)
+MAX_BID_STEPS = 100
+
+
+def to_amount(value) -> Decimal:
+    """float/Decimal/int 금액을 DECIMAL(12,2) 기준 Decimal로 정규화"""
+    if isinstance(value, Decimal):
+        return value.quantize(_CENTS)
+    return Decimal(str(value)).quantize(_CENTS)
 
 
 class BidRules:
     @staticmethod
-    def calculate_bid_increment(amount: float) -> int:
-        if amount < 10_000:
-            return 500
-        elif amount < 30_000:
-            return 1_000
-        elif amount < 50_000:
-            return 2_000
-        elif amount < 150_000:
-            return 5_000
-        elif amount < 300_000:
-            return 10_000
-        elif amount < 500_000:
-            return 20_000
-        elif amount < 1_000_000:
-            return 30_000
-        else:
-            return 50_000
+    def _tier(amount) -> int:
+        return max(bisect_right(_TIER_FLOORS, amount) - 1, 0)
+
+    @classmethod
+    def calculate_bid_increment(cls, amount: float) -> int:
+        return _TIER_INCREMENTS[cls._tier(amount)]
+
+    @classmethod
+    def iter_bid_steps(
+        cls, current: float | Decimal, buy_now: float | Decimal | None
+    ) -> Iterator[Decimal]:
+        """현재가 다음부터의 입찰 스텝을 필요한 만큼만 생성 (즉시구매가 미만까지)
+
+        첫 두 스텝은 현재가 구간의 단위로, 이후는 직전 스텝 금액의 구간 단위로 증가한다.
+        """
+        cur = to_amount(current)
+        if cur <= 0:
+            return
+        limit = to_amount(buy_now) if buy_now is not None else None
+        inc = cls.calculate_bid_increment(cur)
+        next_amt = cur + inc
+        while limit is None or next_amt < limit:
+            yield next_amt
+            next_amt += inc
+            inc = cls.calculate_bid_increment(next_amt)
 
     @classmethod
     def make_bid_steps(
         cls, current: float, buy_now: Optional[float], count: int = 99
     ) -> List[float]:
-        if current <= 0:
-            return []
-        inc = cls.calculate_bid_increment(current)
-        steps: List[float] = []
-        next_amt = current + inc
-        for _ in range(count):
-            if buy_now is not None and next_amt >= buy_now:
-                break
-            steps.append(float(next_amt))
-            next_amt += inc
-            inc = cls.calculate_bid_increment(next_amt)
-        return steps
+        return [float(s) for s in islice(cls.iter_bid_steps(current, buy_now), count)]
+
+    @classmethod
+    def step_index(
+        cls, current: float | Decimal, amount: float | Decimal, buy_now: float | Decimal | None
+    ) -> Optional[int]:
+        """amount가 현재가 기준 몇 번째 스텝인지(1부터) 계산, 스텝이 아니면 None
+
+        스텝 목록을 만들지 않고 구간표를 따라 구간별 등차수열로 판정한다 (구간 수만큼의 연산).
+        """
+        cur = to_amount(current)
+        amt = to_amount(amount)
+        if cur <= 0 or amt <= cur:
+            return None
+        if buy_now is not None and amt >= to_amount(buy_now):
+            return None
+
+        first_inc = cls.calculate_bid_increment(cur)
+        first = cur + first_inc
+        if amt == first:
+            return 1
+        # 두 번째 스텝까지는 현재가 구간 단위, 이후는 스텝 금액의 구간 단위로 증가
+        start, index = first + first_inc, 2
+        while amt >= start:
+            tier = cls._tier(start)
+            inc = _TIER_INCREMENTS[tier]
+            upper = _TIER_FLOORS[tier + 1] if tier + 1 < len(_TIER_FLOORS) else None
+            if upper is None or amt < upper:
+                n, rem = divmod(amt - start, inc)
+                return index + int(n) if rem == 0 else None
+            # 다음 구간에 처음 들어가는 스텝으로 이동
+            n = ((upper - start) / inc).to_integral_value(rounding=ROUND_CEILING)
+            start += n * inc
+            index += int(n)
+        return None
+
+    @classmethod
+    def is_valid_step(
+        cls,
+        current: float | Decimal,
+        amount: float | Decimal,
+        buy_now: float | Decimal | None,
+        *,
+        max_steps: int = MAX_BID_STEPS,
+    ) -> bool:
+        index = cls.step_index(current, amount, buy_now)
+        return index is not None and index <= max_steps
@@ -9,6 +9,14 @@ class AuctionStatus(str, Enum):
     CANCELLED = "CANCELLED"
 
 
+class AuctionEventType(str, Enum):
+    BID = "BID"  # 새 최고 입찰
+    OVERTAKEN = "OVERTAKEN"  # 직전 최고 입찰자가 추월당함
+    BUY_NOW = "BUY_NOW"  # 즉시구매로 종료
+    STARTED = "STARTED"  # 시작 시각 도래로 입찰 시작
+    ENDED = "ENDED"  # 종료 시각 도래로 정산 완료
+
+
 class PaymentStatusKo(str, Enum):
     PENDING = "대기"
     CONFIRMED = "확인"
@@ -0,0 +1,64 @@
+from datetime import datetime, timezone
+from typing import Optional
+
+from pydantic import BaseModel, Field
+from sqlalchemy.orm import Session
+
+from app.core.config import settings
+from app.domains.auctions.enums import AuctionEventType
+from app.domains.common.tx import after_commit
+from app.infrastructure.realtime.brokers import (
+    EventBroker,
+    InProcessBroker,
+    RedisEventBroker,
+)
+from app.infrastructure.realtime.hub import EventHub
+
+
+class AuctionEvent(BaseModel):
+    type: AuctionEventType = Field(..., description="이벤트 종류: BID|OVERTAKEN|BUY_NOW|STARTED|ENDED")
+    auction_id: int = Field(..., description="경매 ID")
+    product_id: int = Field(..., description="상품 ID")
+    amount: Optional[float] = Field(
+        None, description="BID/OVERTAKEN: 새 최고가, BUY_NOW: 즉시구매가, ENDED: 낙찰가(유찰 시 null)"
+    )
+    user_id: Optional[int] = Field(
+        None,
+        description="BID: 입찰자, OVERTAKEN: 추월당한 사용자, BUY_NOW: 구매자, ENDED: 낙찰자",
+    )
+    bidder_count: Optional[int] = Field(None, description="BID: 입찰 후 입찰자 수")
+    occurred_at: str = Field(
+        default_factory=lambda: datetime.now(timezone.utc).isoformat(),
+        description="발생 시각(ISO8601, UTC)",
+    )
+
+    def to_sse(self) -> bytes:
+        """SSE 프레임 (event: 종류, data: JSON)"""
+        return (
+            f"event: {self.type.value}\ndata: {self.model_dump_json()}\n\n"
+        ).encode()
+
+
+def auction_channel(auction_id: int) -> str:
+    return f"auction:{auction_id}"
+
+
+def _build_broker() -> EventBroker:
+    if settings.REALTIME_BROKER == "redis":
+        return RedisEventBroker.from_url(settings.REDIS_URL, prefix=settings.CACHE_KEY_PREFIX)
+    return InProcessBroker()
+
+
+auction_event_hub = EventHub(
+    _build_broker(),
+    queue_size=settings.SSE_QUEUE_SIZE,
+    heartbeat_seconds=settings.SSE_HEARTBEAT_SECONDS,
+)
+
+
+def publish_auction_event_after_commit(session: Session, event: AuctionEvent) -> None:
+    """커밋된 뒤에만 구독자에게 발행 (롤백된 입찰/종료는 전파하지 않음)"""
+    data = event.to_sse()
+    after_commit(
+        session, lambda: auction_event_hub.publish(auction_channel(event.auction_id), data)
+    )
@@ -0,0 +1,221 @@
+import logging
+import threading
+from datetime import datetime, timedelta
+from typing import Callable, Dict, Optional
+
+from sqlalchemy.orm import Session
+
+from app.core.config import settings
+from app.core.error_codes import ErrorCode
+from app.core.errors import BusinessError
+from app.domains.auctions.auction_info import AuctionInfo
+from app.domains.auctions.bid_rules import BidRules
+from app.domains.auctions.mappers import row_to_auction_info
+from app.domains.common.tx import after_commit
+from app.infrastructure.auctions.hot_state_store import (
+    HotAuctionSnapshot,
+    HotAuctionStore,
+    InMemoryHotAuctionStore,
+    RedisHotAuctionStore,
+)
+from app.repositories.auction_read import AuctionReadRepository
+
+logger = logging.getLogger(__name__)
+
+
+class HotAuctionStateManager:
+    """종료 임박 RUNNING 경매의 최고가/입찰자 집합/스텝을 메모리에 유지
+
+    - 조회: 경매 정보를 DB 대신 스냅샷에서 반환
+    - 입찰: 스냅샷 기준으로 금액/중복 입찰을 먼저 검증해 거절될 입찰은 DB 락 없이 즉시 거절
+      (통과한 입찰은 기존 경로로 DB에 기록되고, 커밋 후 스냅샷에 반영 = write-through)
+    - 적재: 시작 시와 refresh 주기마다 DB 기준으로 다시 적재 (다른 프로세스의 상태 변경 반영)
+    DB가 항상 기준이며, 스냅샷이 없거나 만료되면 호출자는 기존 DB 경로를 사용한다.
+    """
+
+    def __init__(
+        self,
+        store: Optional[HotAuctionStore],
+        *,
+        window_minutes: int = 30,
+        max_auctions: int = 200,
+    ):
+        self.store = store
+        self.window = timedelta(minutes=window_minutes)
+        self.max_auctions = max_auctions
+        self._stats: Dict[str, int] = {"hits": 0, "misses": 0, "rejects": 0, "refreshes": 0}
+        self._stop = threading.Event()
+
+    @property
+    def enabled(self) -> bool:
+        return self.store is not None
+
+    def _live(self, auction_id: Optional[int]) -> Optional[HotAuctionSnapshot]:
+        if auction_id is None:
+            return None
+        snapshot = self.store.get(auction_id)
+        if snapshot is not None and datetime.utcnow() >= snapshot.ends_at_utc:
+            # 종료 시각이 지난 경매는 정산 배치가 상태를 바꾸므로 DB 경로로 넘김
+            self.store.delete(auction_id)
+            return None
+        return snapshot
+
+    def get(self, auction_id: int) -> Optional[HotAuctionSnapshot]:
+        if not self.enabled:
+            return None
+        try:
+            return self._live(auction_id)
+        except Exception:
+            logger.warning("hot auction get failed: %s", auction_id, exc_info=True)
+            return None
+
+    def auction_info(self, product_id: int, *, with_steps: bool = True) -> Optional[AuctionInfo]:
+        """상품의 경매 정보를 스냅샷에서 조회 (추적 중이 아니면 None)"""
+        if not self.enabled:
+            return None
+        try:
+            snapshot = self._live(self.store.auction_id_for_product(product_id))
+        except Exception:
+            logger.warning("hot auction read failed: %s", product_id, exc_info=True)
+            snapshot = None
+        if snapshot is None:
+            self._stats["misses"] += 1
+            return None
+        self._stats["hits"] += 1
+        return snapshot.info.model_copy(
+            update={"bid_steps": list(snapshot.bid_steps) if with_steps else []}
+        )
+
+    def precheck_bid(self, *, auction_id: int, amount: float, user_id: int) -> bool:
+        """스냅샷 기준 입찰 사전 검증 (DB 검증과 같은 순서/에러)
+
+        :return: 스냅샷으로 검증했으면 True, 추적 중이 아니면 False
+        """
+        snapshot = self.get(auction_id)
+        if snapshot is None:
+            return False
+        if not BidRules.is_valid_step(
+            snapshot.current_price, amount, snapshot.info.buy_now_price
+        ):
+            self._stats["rejects"] += 1
+            raise BusinessError(ErrorCode.BID_NOT_ALLOWED, "입찰 가능한 금액이 아닙니다.")
+        if self.store.has_bidder(auction_id, user_id):
+            self._stats["rejects"] += 1
+            raise BusinessError(ErrorCode.BID_ALREADY_EXISTS, "이미 참여한 경매입니다.")
+        return True
+
+    def record_bid_after_commit(
+        self, session: Session, *, auction_id: int, user_id: int, amount: float
+    ) -> None:
+        """입찰이 커밋된 뒤 스냅샷에 반영 (롤백 시 무시)"""
+        if self.enabled:
+            after_commit(session, lambda: self._apply_bid(auction_id, user_id, amount))
+
+    def _apply_bid(self, auction_id: int, user_id: int, amount: float) -> None:
+        try:
+            self.store.apply_bid(auction_id, user_id, float(amount))
+        except Exception:
+            logger.warning("hot auction apply failed: %s", auction_id, exc_info=True)
+            self.evict(auction_id)
+
+    def evict(self, auction_id: int) -> None:
+        """스냅샷 제거 — 다음 refresh 전까지 해당 경매는 DB 경로 사용"""
+        if not self.enabled:
+            return
+        try:
+            self.store.delete(auction_id)
+        except Exception:
+            logger.warning("hot auction evict failed: %s", auction_id, exc_info=True)
+
+    def evict_after_commit(self, session: Session, auction_id: int) -> None:
+        """상태 변경(즉시구매/일시중단/수정) 커밋 후 스냅샷 제거"""
+        if self.enabled:
+            after_commit(session, lambda: self.evict(auction_id))
+
+    def rebuild(self, db: Session) -> int:
+        """DB 기준으로 추적 대상(종료 임박 RUNNING 경매)을 다시 적재
+
+        :return: 추적 중인 경매 수
+        """
+        if not self.enabled:
+            return 0
+        read = AuctionReadRepository(db)
+        now = datetime.utcnow()
+        rows = read.list_hot_auction_rows(
+            ends_after=now, ends_before=now + self.window, limit=self.max_auctions
+        )
+        bidders = read.list_bidder_ids_by_auctions([int(r.id) for r in rows])
+        db.rollback()  # 읽기 트랜잭션 종료 (스냅샷 적재 중 커넥션 점유 방지)
+
+        loaded = set()
+        for row in rows:
+            info = row_to_auction_info(row)
+            snapshot = HotAuctionSnapshot(
+                product_id=int(row.product_id),
+                ends_at_utc=row.ends_at_utc,
+                bid_count=int(row.bid_count),
+                info=info,
+            )
+            self.store.put(snapshot, bidders[info.auction_id])
+            loaded.add(info.auction_id)
+        for auction_id in self.store.auction_ids() - loaded:
+            self.store.delete(auction_id)
+        self._stats["refreshes"] += 1
+        return len(loaded)
+
+    def run_refresh_loop(self, session_factory: Callable[[], Session], interval_seconds: float) -> None:
+        """interval마다 rebuild (stop() 호출 시 종료)"""
+        while not self._stop.is_set():
+            db = session_factory()
+            try:
+                self.rebuild(db)
+            except Exception:
+                logger.exception("hot auction refresh failed")
+            finally:
+                db.close()
+            self._stop.wait(interval_seconds)
+
+    def start(self, session_factory: Callable[[], Session], interval_seconds: float) -> None:
+        """백그라운드 refresh 스레드 시작 (첫 적재 포함)"""
+        if not self.enabled:
+            return
+        self._stop.clear()
+        threading.Thread(
+            target=self.run_refresh_loop,
+            args=(session_factory, interval_seconds),
+            name="hot-auction-refresh",
+            daemon=True,
+        ).start()
+
+    def stop(self) -> None:
+        self._stop.set()
+
+    def stats(self) -> dict:
+        tracked = 0
+        if self.enabled:
+            try:
+                tracked = len(self.store.auction_ids())
+            except Exception:
+                logger.warning("hot auction stats failed", exc_info=True)
+        return {
+            "backend": type(self.store).__name__ if self.enabled else "off",
+            "tracked": tracked,
+            **self._stats,
+        }
+
+
+def _build_store() -> Optional[HotAuctionStore]:
+    if settings.HOT_AUCTION_BACKEND == "redis":
+        return RedisHotAuctionStore.from_url(
+            settings.REDIS_URL, prefix=settings.CACHE_KEY_PREFIX
+        )
+    if settings.HOT_AUCTION_BACKEND == "memory":
+        return InMemoryHotAuctionStore()
+    return None
+
+
+hot_auctions = HotAuctionStateManager(
+    _build_store(),
+    window_minutes=settings.HOT_AUCTION_WINDOW_MINUTES,
+    max_auctions=settings.HOT_AUCTION_MAX,
+)
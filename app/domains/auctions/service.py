@@ -5,15 +5,24 @@ from app.domains.auctions.verification import BidVerificator
 from app.domains.auctions.enums import AuctionStatus
 from app.domains.auctions.bid_result import BidResult
 from app.domains.auctions.buy_now_result import BuyNowResult
-from app.domains.common.tx import transactional
+from app.domains.auctions.enums import AuctionEventType
+from app.domains.auctions.events import AuctionEvent, publish_auction_event_after_commit
+from app.domains.auctions.hot_state import hot_auctions
+from app.domains.common.tx import run_in_transaction, transactional
+from app.infrastructure.cache.app_cache import (
+    LISTING,
+    invalidate_after_commit,
+    invalidate_auction_info_after_commit,
+)
+from app.db.routing import recent_writers
 from app.schemas.auctions import Auction
 from app.repositories.auction_read import AuctionReadRepository
-from app.repositories.auction_write import AuctionWriteRepository
+from app.repositories.auction_write import AuctionWriteRepository, PlacedBid
 from app.repositories.order_write import OrderWriteRepository
 from app.repositories.payment_write import PaymentWriteRepository
 from app.repositories.auction_deposit import AuctionDepositRepository
 from app.domains.notifications.service import NotificationService
-from app.domains.notifications.dto import NotifyRequest
+from app.domains.notifications.dto import NotifyManyRequest
 from app.domains.orders.service import OrderService
 from app.schemas.auctions import AuctionOffer
 from app.schemas.auctions.bid import Bid
@@ -41,60 +50,131 @@ class AuctionService:
     def place_bid(self, *, auction_id: int, amount: float, user_id: int) -> BidResult:
         """입찰 처리
 
-        - 경매 상태/금액 검증 후 입찰 생성
+        - 경매 행을 잠근(SELECT ... FOR UPDATE) 뒤 상태/금액 검증 후 입찰 생성
+          → 같은 경매의 동시 입찰은 직렬화되어 최고가/입찰 순번이 어긋나지 않음
         - 필요 시 보증금(Deposit) 결제 생성
+        - 데드락/락 대기 타임아웃은 트랜잭션 전체 재시도
+        - 핫 경매는 메모리 스냅샷으로 먼저 검증해 거절될 입찰은 DB 락 없이 거절
         :return: BidResult(bid_id, amount)
         """
-        verifier = BidVerificator(self.session)
-        with transactional(self.session):
-            print("검증")
-            auction = verifier.ensure_auction_exists_and_running(auction_id)
-            deposit_amount = verifier.ensure_amount_allowed(
-                auction_product_id=auction.product_id, amount=amount
+        prechecked = hot_auctions.precheck_bid(
+            auction_id=auction_id, amount=amount, user_id=user_id
+        )
+        try:
+            result = run_in_transaction(
+                self.session,
+                lambda: self._place_bid_locked(
+                    auction_id=auction_id, amount=amount, user_id=user_id
+                ),
             )
-            verifier.ensure_not_already_bid(auction_id, user_id)
-            print("검증완료")
-            if deposit_amount > 0:
-                payment = self.payments.create_payment(
-                    user_id=user_id,
-                    amount=float(deposit_amount),
-                    provider="dummy",
-                    status="PAID",
-                )
-                self.payments.create_payment_log(
-                    payment_id=payment.id,
-                    provider="dummy",
-                    amount=float(deposit_amount),
-                    status="PAID",
-                    log_type="REQUEST",
-                )
-                self.deposits.create(
-                    auction_id=auction_id,
-                    user_id=user_id,
-                    payment_id=payment.id,
-                    amount=float(deposit_amount),
-                    status="PAID",
-                )
-                self.send_bid_notification(auction, user_id, amount)
-            bid = self.auctions_write.place_bid(auction_id, user_id, amount)
+        except BusinessError:
+            if prechecked:
+                # 스냅샷은 통과했지만 DB 검증에서 거절 → 스냅샷이 낡음, 다음 refresh까지 DB 경로
+                hot_auctions.evict(auction_id)
+            raise
+        # 입찰 직후 본인 조회는 primary로 (replica 지연 시에도 내 입찰이 보이도록)
+        recent_writers.mark(user_id)
+        return result
 
-            return BidResult(bid_id=bid.id, amount=float(bid.amount))
+    def _place_bid_locked(
+        self, *, auction_id: int, amount: float, user_id: int
+    ) -> BidResult:
+        verifier = BidVerificator(self.session, self.auctions_read, self.auctions_write)
+        print("검증")
+        auction = verifier.ensure_auction_exists_and_running(
+            auction_id, for_update=True
+        )
+        deposit_amount = verifier.ensure_amount_allowed(
+            auction_product_id=auction.product_id, amount=amount, for_update=True
+        )
+        verifier.ensure_not_already_bid(auction_id, user_id)
+        print("검증완료")
+        if deposit_amount > 0:
+            payment = self.payments.create_payment(
+                user_id=user_id,
+                amount=float(deposit_amount),
+                provider="dummy",
+                status="PAID",
+            )
+            self.payments.create_payment_log(
+                payment_id=payment.id,
+                provider="dummy",
+                amount=float(deposit_amount),
+                status="PAID",
+                log_type="REQUEST",
+            )
+            self.deposits.create(
+                auction_id=auction_id,
+                user_id=user_id,
+                payment_id=payment.id,
+                amount=float(deposit_amount),
+                status="PAID",
+            )
+            self.send_bid_notification(auction, user_id, amount)
+        previous = self.auctions_write.get_last_bid(auction_id)
+        # ensure_not_already_bid 통과 = 이 경매의 첫 입찰
+        bid = self.auctions_write.place_bid(
+            auction_id,
+            user_id,
+            amount,
+            last_order=previous.bid_order if previous else 0,
+            is_new_bidder=True,
+        )
+        hot_auctions.record_bid_after_commit(
+            self.session, auction_id=auction_id, user_id=user_id, amount=bid.amount
+        )
+        self._publish_bid_events(
+            auction, bid, user_id=user_id, previous_user_id=previous.user_id if previous else None
+        )
+        return BidResult(bid_id=bid.id, amount=bid.amount)
 
-    def send_bid_notification(self, auction: Auction, user_id: int, amount: float):
-        print("알림 발송")
-        # Notifications
+    def _publish_bid_events(
+        self, auction: Auction, bid: PlacedBid, *, user_id: int, previous_user_id: int | None
+    ) -> None:
+        """실시간 구독자에게 새 최고가/추월 이벤트 발행 (커밋 후)"""
+        # 입찰자 수는 place_bid가 갱신한 집계 값 그대로 사용 (재조회 없음)
+        amount = bid.amount
+        publish_auction_event_after_commit(
+            self.session,
+            AuctionEvent(
+                type=AuctionEventType.BID,
+                auction_id=auction.id,
+                product_id=auction.product_id,
+                amount=amount,
+                user_id=user_id,
+                bidder_count=bid.bidder_count,
+            ),
+        )
+        if previous_user_id is not None and previous_user_id != user_id:
+            publish_auction_event_after_commit(
+                self.session,
+                AuctionEvent(
+                    type=AuctionEventType.OVERTAKEN,
+                    auction_id=auction.id,
+                    product_id=auction.product_id,
+                    amount=amount,
+                    user_id=previous_user_id,
+                ),
+            )
+
+    @staticmethod
+    def _notification_title(auction: Auction) -> str:
         store_name = (
             auction.product.store.name
             if auction.product and auction.product.store
             else ""
         )
         product_name = auction.product.name if auction.product else ""
-        title = f"{store_name} 팝업스토어 {product_name}"
+        return f"{store_name} 팝업스토어 {product_name}"
+
+    def send_bid_notification(self, auction: Auction, user_id: int, amount: float):
+        print("알림 발송")
+        title = self._notification_title(auction)
 
         # 1) 현재 최고 입찰자 알림 (본인)
-        self.notifications.send(
-            NotifyRequest(
-                user_id=user_id,
+        self.notifications.publish(
+            NotifyManyRequest(
+                user_ids=[user_id],
                 title=f"{title} 현재 최고 입찰자입니다.",
                 body="",
                 product_id=auction.product_id,
@@ -106,29 +186,38 @@ class AuctionService:
             auction.id, exclude_user_id=user_id
         )
         formatted_amount = f"{int(round(float(amount))):,}원"
-        for previous_user_id in previous_bidder_ids:
-            self.notifications.send(
-                NotifyRequest(
-                    user_id=previous_user_id,
-                    title=f"{title} 다른 사용자가 {formatted_amount}으로 추월했어요.",
-                    body="",
-                    product_id=auction.product_id,
-                )
+        self.notifications.publish(
+            NotifyManyRequest(
+                user_ids=previous_bidder_ids,
+                title=f"{title} 다른 사용자가 {formatted_amount}으로 추월했어요.",
+                body="",
+                product_id=auction.product_id,
             )
+        )
 
     def buy_now(self, *, auction_id: int, user_id: int) -> BuyNowResult:
         """즉시구매 처리
 
-        - OrderService로 주문+결제를 한 번에 처리
-        - 이후 경매 종료/상품 판매 플래그/알림 기록
+        - 입찰과 같이 경매 행을 잠근(SELECT ... FOR UPDATE) 뒤 상태를 다시 검증
+          → 동시 즉시구매/입찰과 직렬화되어 주문이 두 번 생기거나 커밋된 입찰을 덮어쓰지 않음
+        - OrderService로 주문+결제 후 경매 종료/상품 판매 플래그/알림 기록 (한 트랜잭션)
+        - 데드락/락 대기 타임아웃은 트랜잭션 전체 재시도
         :return: BuyNowResult(status, payment_id)
         """
-        verifier = BidVerificator(self.session)
-        auction = self.auctions_write.get_auction_by_id(auction_id)
+        result = run_in_transaction(
+            self.session,
+            lambda: self._buy_now_locked(auction_id=auction_id, user_id=user_id),
+        )
+        recent_writers.mark(user_id)
+        return result
+
+    def _buy_now_locked(self, *, auction_id: int, user_id: int) -> BuyNowResult:
+        verifier = BidVerificator(self.session, self.auctions_read, self.auctions_write)
+        auction = self.auctions_write.lock_auction(auction_id)
         if not auction:
             raise BusinessError(ErrorCode.AUCTION_NOT_FOUND, "경매를 찾을 수 없습니다.")
         verifier.verify_buy_now(auction)
-        # Order + Payment in one transaction
+        # Order + Payment (바깥 트랜잭션에 합류, 잠금 유지)
         order_service = OrderService(self.session, self.orders, self.payments)
         order_result = order_service.checkout_buy_now(
             user_id=user_id,
@@ -136,42 +225,47 @@ class AuctionService:
             unit_price=float(auction.buy_now_price),
             provider="dummy",
         )
-        # Update auction status and notify in a separate small transaction
-        with transactional(self.session):
-            auction.status = AuctionStatus.ENDED.value
-            auction.product.is_sold = 1
-            # TODO: 이전 입찰자들 환불 처리
-            store_name = (
-                auction.product.store.name
-                if auction.product and auction.product.store
-                else ""
-            )
-            product_name = auction.product.name if auction.product else ""
-            title = f"{store_name} 팝업스토어 {product_name}"
+        # Update auction status and notify
+        auction.status = AuctionStatus.ENDED.value
+        auction.product.is_sold = 1
+        invalidate_after_commit(self.session, LISTING)
+        invalidate_auction_info_after_commit(self.session, auction.product_id)
+        hot_auctions.evict_after_commit(self.session, auction_id)
+        publish_auction_event_after_commit(
+            self.session,
+            AuctionEvent(
+                type=AuctionEventType.BUY_NOW,
+                auction_id=auction_id,
+                product_id=auction.product_id,
+                amount=float(auction.buy_now_price),
+                user_id=user_id,
+            ),
+        )
+        # TODO: 이전 입찰자들 환불 처리
+        title = self._notification_title(auction)
 
-            # 3) 즉시구매로 종료: 이전 입찰자 전체 알림
-            previous_bidder_ids = self.auctions_read.list_distinct_bidder_user_ids(
-                auction_id, exclude_user_id=user_id
+        # 3) 즉시구매로 종료: 이전 입찰자 전체 알림
+        previous_bidder_ids = self.auctions_read.list_distinct_bidder_user_ids(
+            auction_id, exclude_user_id=user_id
+        )
+        self.notifications.publish(
+            NotifyManyRequest(
+                user_ids=previous_bidder_ids,
+                title=f"{title} 경매가 즉시구매로 종료됐어요.",
+                body="",
+                product_id=auction.product_id,
             )
-            for previous_user_id in previous_bidder_ids:
-                self.notifications.send(
-                    NotifyRequest(
-                        user_id=previous_user_id,
-                        title=f"{title} 경매가 즉시구매로 종료됐어요.",
-                        body="",
-                        product_id=auction.product_id,
-                    )
-                )
+        )
 
-            # 4) 즉시구매자에게 주문 접수 알림
-            self.notifications.send(
-                NotifyRequest(
-                    user_id=user_id,
-                    title=f"{title} 주문이 접수됐어요.",
-                    body="",
-                    product_id=auction.product_id,
-                )
+        # 4) 즉시구매자에게 주문 접수 알림
+        self.notifications.publish(
+            NotifyManyRequest(
+                user_ids=[user_id],
+                title=f"{title} 주문이 접수됐어요.",
+                body="",
+                product_id=auction.product_id,
             )
+        )
         return BuyNowResult(status="ORDER_PLACED", payment_id=order_result.payment_id)
 
     def finalize_winner_and_charge(self, *, auction_id: int) -> BuyNowResult:
@@ -229,9 +323,9 @@ class AuctionService:
             self.session.add(offer)
             # 알림
             title = f"{auction.product.store.name if auction.product and auction.product.store else ''} {auction.product.name if auction.product else ''}"
-            self.notifications.send(
-                NotifyRequest(
-                    user_id=winner_bid.user_id,
+            self.notifications.publish(
+                NotifyManyRequest(
+                    user_ids=[winner_bid.user_id],
                     title=f"{title} 낙찰되었습니다.",
                     body="",
                     product_id=auction.product_id,
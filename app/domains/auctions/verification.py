@@ -9,10 +9,15 @@ from app.schemas.auctions import Auction
 
 
 class BidVerificator:
-    def __init__(self, db: Session):
+    def __init__(
+        self,
+        db: Session,
+        read: AuctionReadRepository | None = None,
+        write: AuctionWriteRepository | None = None,
+    ):
         self.db = db
-        self.read = AuctionReadRepository(db)
-        self.write = AuctionWriteRepository(db)
+        self.read = read or AuctionReadRepository(db)
+        self.write = write or AuctionWriteRepository(db)
 
     # 경매가 활성 상태인지 확인
     def ensure_auction_running(self, auction_id: int):
@@ -30,8 +35,14 @@ class BidVerificator:
         if bid:
             raise BusinessError(ErrorCode.BID_ALREADY_EXISTS, "이미 참여한 경매입니다.")
 
-    def ensure_auction_exists_and_running(self, auction_id: int) -> Auction:
-        auction = self.write.get_auction_by_id(auction_id)
+    def ensure_auction_exists_and_running(
+        self, auction_id: int, *, for_update: bool = False
+    ) -> Auction:
+        auction = (
+            self.write.lock_auction(auction_id)
+            if for_update
+            else self.write.get_auction_by_id(auction_id)
+        )
 
         if not auction:
             raise BusinessError(ErrorCode.AUCTION_NOT_FOUND, "경매를 찾을 수 없습니다.")
@@ -41,21 +52,24 @@ class BidVerificator:
             )
         return auction
 
-    def ensure_amount_allowed(self, *, auction_product_id: int, amount: float):
-        info = self.read.get_auction_info_by_product(auction_product_id)
+    def ensure_amount_allowed(
+        self, *, auction_product_id: int, amount: float, for_update: bool = False
+    ):
+        """입찰 금액 검증 (허용 스텝 = 현재 최고가보다 큰 값만 → 금액 단조 증가 보장)"""
+        info = self.read.load_auction_info_by_product(
+            auction_product_id, for_update=for_update
+        )
         if not info:
             raise BusinessError(
                 ErrorCode.AUCTION_NOT_FOUND, "경매 정보를 찾을 수 없습니다."
             )
         current = (
-            float(info.current_highest_bid)
+            info.current_highest_bid
             if info.current_highest_bid is not None
-            else float(info.min_bid_price)
+            else info.min_bid_price
         )
-        buy_now = float(info.buy_now_price) if info.buy_now_price is not None else None
-        steps = BidRules.make_bid_steps(current, buy_now, count=100)
-        # allow equality tolerance due to float -> DECIMAL conversions
-        if all(abs(float(amount) - float(s)) > 0.1 for s in steps):
+        # 스텝 목록을 만들지 않고 구간표 기반 산술로 판정 (DECIMAL(12,2) 기준 정확 비교)
+        if not BidRules.is_valid_step(current, amount, info.buy_now_price):
             raise BusinessError(
                 ErrorCode.BID_NOT_ALLOWED, "입찰 가능한 금액이 아닙니다."
             )
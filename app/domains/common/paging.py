@@ -1,5 +1,14 @@
+import base64
+import binascii
+from datetime import datetime
+from decimal import Decimal, InvalidOperation
+from typing import Any, Generic, List, Optional, Sequence, TypeVar
+
+import orjson
 from pydantic import BaseModel
-from typing import Generic, TypeVar, List
+
+from app.core.error_codes import ErrorCode
+from app.core.errors import BusinessError
 
 T = TypeVar("T")
 
@@ -8,8 +17,78 @@ class Page(BaseModel, Generic[T]):
     items: List[T]
     page: int
     size: int
-    total: int
+    # with_total=false(무한 스크롤) 또는 cursor 조회 시 None
+    total: Optional[int] = None
+    has_next: bool = False
+    # 다음 페이지 조회용 커서 (마지막 페이지면 None)
+    next_cursor: Optional[str] = None
+
+
+def paginate(
+    items: List[T],
+    page: int,
+    size: int,
+    total: Optional[int],
+    has_next: Optional[bool] = None,
+    next_cursor: Optional[str] = None,
+) -> Page[T]:
+    if has_next is None:
+        has_next = total is not None and page * size < total
+    return Page(
+        items=items,
+        page=page,
+        size=size,
+        total=total,
+        has_next=has_next,
+        next_cursor=next_cursor,
+    )
+
+
+# --- keyset cursor ---
+# 커서 = (정렬 키 값들 + id)를 scope(목록/정렬 이름)와 함께 직렬화한 불투명 문자열.
+# base32 소문자를 사용해 대소문자 정규화(캐시 키 등)에도 값이 바뀌지 않도록 한다.
+
+
+def _pack(value: Any) -> Any:
+    if isinstance(value, datetime):
+        return {"dt": value.isoformat()}
+    if isinstance(value, Decimal):
+        return {"dec": str(value)}
+    return value
+
+
+def _unpack(value: Any) -> Any:
+    if isinstance(value, dict):
+        if "dt" in value:
+            return datetime.fromisoformat(value["dt"])
+        if "dec" in value:
+            return Decimal(value["dec"])
+        raise ValueError("unknown cursor value")
+    return value
+
+
+def _invalid_cursor() -> BusinessError:
+    return BusinessError(ErrorCode.INVALID_CURSOR, "유효하지 않은 커서입니다.")
+
+
+def encode_cursor(scope: str, values: Sequence[Any]) -> str:
+    """정렬 키 값들을 불투명 커서 문자열로 인코딩"""
+    raw = orjson.dumps({"s": scope, "v": [_pack(v) for v in values]})
+    return base64.b32encode(raw).decode("ascii").rstrip("=").lower()
+
 
+def decode_cursor(cursor: str, *, scope: str, size: int) -> List[Any]:
+    """커서를 정렬 키 값 리스트로 디코딩
 
-def paginate(items: List[T], page: int, size: int, total: int) -> Page[T]:
-    return Page(items=items, page=page, size=size, total=total)
+    다른 목록/정렬에서 발급된 커서이거나 형식이 깨진 경우 INVALID_CURSOR
+    """
+    try:
+        text = cursor.strip().upper()
+        raw = base64.b32decode(text + "=" * (-len(text) % 8))
+        payload = orjson.loads(raw)
+        values = [_unpack(v) for v in payload["v"]]
+    except (binascii.Error, orjson.JSONDecodeError, KeyError, TypeError, ValueError, InvalidOperation):
+        raise _invalid_cursor()
+    if payload.get("s") != scope or len(values) != size:
+        raise _invalid_cursor()
+    return values
@@ -1,12 +1,104 @@
+from collections import Counter
 from contextlib import contextmanager
+from typing import Callable, List, TypeVar
+from sqlalchemy import event
+from sqlalchemy.exc import OperationalError
 from sqlalchemy.orm import Session
+from tenacity import (
+    Retrying,
+    retry_if_exception,
+    stop_after_attempt,
+    wait_random_exponential,
+)
+
+_AFTER_COMMIT_KEY = "after_commit_hooks"
+# 세션 트랜잭션을 UoW가 소유(요청/배치 단위로 한 번 커밋)하는지 표시
+_UOW_OWNED_KEY = "uow_owned"
+# 중첩된 transactional 블록 깊이 (가장 바깥 블록만 커밋)
+_DEPTH_KEY = "tx_depth"
+# MySQL: 1205 = lock wait timeout, 1213 = deadlock
+_LOCK_CONFLICT_ERRNOS = (1205, 1213)
+
+T = TypeVar("T")
+
+# 락 충돌 재시도 횟수 (벤치마크/모니터링용)
+lock_retry_stats: Counter = Counter()
+
+
+def own_transaction(session: Session) -> None:
+    """세션의 커밋을 UoW에 맡긴다 — 이후 transactional 블록은 커밋 대신 flush"""
+    session.info[_UOW_OWNED_KEY] = True
 
 
 @contextmanager
 def transactional(session: Session):
+    """서비스 쓰기 블록. 예외 시 롤백
+
+    UoW가 소유한 세션이면 커밋하지 않고 flush만 해 UoW 종료 시 한 번에 커밋한다
+    (요청 하나의 여러 블록이 한 트랜잭션이 됨). 아니면 가장 바깥 블록에서만 커밋
+    — 안쪽 블록이 커밋해 바깥 블록이 잡은 행 잠금(FOR UPDATE)을 풀지 않도록.
+    """
+    depth = session.info.get(_DEPTH_KEY, 0)
+    session.info[_DEPTH_KEY] = depth + 1
     try:
         yield
-        session.commit()
+        if depth or session.info.get(_UOW_OWNED_KEY):
+            session.flush()
+        else:
+            session.commit()
     except Exception:
         session.rollback()
         raise
+    finally:
+        session.info[_DEPTH_KEY] = depth
+
+
+def after_commit(session: Session, hook: Callable[[], None]) -> None:
+    """현재 트랜잭션이 커밋된 뒤 1회 실행할 훅 등록 (롤백 시 폐기)
+
+    캐시 무효화처럼 커밋된 데이터 기준으로만 수행해야 하는 후처리에 사용.
+    동일 훅은 트랜잭션당 한 번만 실행된다.
+    """
+    hooks: List[Callable[[], None]] = session.info.setdefault(_AFTER_COMMIT_KEY, [])
+    if hook not in hooks:
+        hooks.append(hook)
+
+
+@event.listens_for(Session, "after_commit")
+def _run_after_commit_hooks(session: Session) -> None:
+    hooks = session.info.pop(_AFTER_COMMIT_KEY, None) or []
+    for hook in hooks:
+        hook()
+
+
+@event.listens_for(Session, "after_rollback")
+def _discard_after_commit_hooks(session: Session) -> None:
+    session.info.pop(_AFTER_COMMIT_KEY, None)
+
+
+def is_lock_conflict(exc: BaseException) -> bool:
+    """데드락/락 대기 타임아웃 여부 (트랜잭션 전체 재시도로 해소 가능한 오류)"""
+    if not isinstance(exc, OperationalError):
+        return False
+    args = getattr(exc.orig, "args", None) or ()
+    return bool(args) and args[0] in _LOCK_CONFLICT_ERRNOS
+
+
+def _count_retry(retry_state) -> None:
+    lock_retry_stats["retries"] += 1
+
+
+def run_in_transaction(
+    session: Session, fn: Callable[[], T], *, attempts: int = 3
+) -> T:
+    """transactional 블록으로 fn 실행, 락 충돌 시 롤백 후 트랜잭션 전체를 재시도"""
+    for attempt in Retrying(
+        retry=retry_if_exception(is_lock_conflict),
+        stop=stop_after_attempt(attempts),
+        wait=wait_random_exponential(multiplier=0.01, max=0.2),
+        before_sleep=_count_retry,
+        reraise=True,
+    ):
+        with attempt:
+            with transactional(session):
+                return fn()
@@ -12,6 +12,16 @@ class NotifyRequest(BaseModel):
     product_id: int | None = None
 
 
+class NotifyManyRequest(BaseModel):
+    """동일 내용 알림을 여러 수신자에게 발송 (템플릿은 호출자가 1회 계산)"""
+
+    user_ids: List[int]
+    title: str
+    body: str
+    channel: str = "PUSH"
+    product_id: int | None = None
+
+
 class NotifyResult(BaseModel):
     ok: bool = True
 
@@ -27,6 +37,8 @@ class NotificationItem(BaseResponseModel):
 
 class NotificationListResult(BaseModel):
     items: List[NotificationItem]
+    # 다음 페이지 커서 (마지막 페이지면 None)
+    next_cursor: Optional[str] = None
 
 
 class MarkReadRequest(BaseModel):
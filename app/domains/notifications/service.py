@@ -1,9 +1,13 @@
-from sqlalchemy import select
+from typing import Sequence
 from sqlalchemy.orm import Session
 from app.repositories.notification_write import NotificationWriteRepository
 from app.repositories.notification_read import NotificationReadRepository
+from app.repositories.notification_outbox import NotificationOutboxRepository
+from app.repositories.product_images import rep_images_by_product
+from app.domains.common.tx import transactional
 from app.domains.notifications.dto import (
     NotifyRequest,
+    NotifyManyRequest,
     NotifyResult,
     NotificationListResult,
     NotificationItem,
@@ -11,7 +15,6 @@ from app.domains.notifications.dto import (
     MarkReadResult,
     UnreadCountResult,
 )
-from app.schemas.products import ProductImage
 
 
 class NotificationService:
@@ -19,6 +22,7 @@ class NotificationService:
         self.db = db
         self.repo = repo or NotificationWriteRepository(db)
         self.read = NotificationReadRepository(db)
+        self.outbox = NotificationOutboxRepository(db)
 
     def send(self, req: NotifyRequest) -> NotifyResult:
         """알림 기록 생성 (MVP)
@@ -35,22 +39,59 @@ class NotificationService:
         )
         return NotifyResult(ok=True)
 
+    def send_many(self, req: NotifyManyRequest) -> NotifyResult:
+        """여러 수신자에게 같은 알림을 일괄 기록 (호출자 트랜잭션 내 단일 INSERT)
+
+        :param req: 수신자 목록 + 알림 내용 DTO (중복 수신자는 1건만 기록)
+        :return: NotifyResult(ok)
+        """
+        self.repo.create_many(
+            user_ids=dict.fromkeys(req.user_ids),
+            title=req.title,
+            body=req.body,
+            channel=req.channel,
+            product_id=req.product_id,
+        )
+        return NotifyResult(ok=True)
+
+    def publish(
+        self, req: NotifyManyRequest, *, channels: Sequence[str] = ("INBOX",)
+    ) -> NotifyResult:
+        """알림을 아웃박스에 적재 (호출자 트랜잭션과 함께 커밋, 전달은 디스패처가 비동기 수행)
+
+        :param req: 수신자 목록 + 알림 내용 DTO
+        :param channels: 전달 채널 INBOX | SMS | PUSH
+        :return: NotifyResult(ok)
+        """
+        if not req.user_ids:
+            return NotifyResult(ok=True)
+        payload = req.model_dump()
+        for channel in channels:
+            self.outbox.enqueue(channel=channel, payload=payload)
+        return NotifyResult(ok=True)
+
+    def publish_many(
+        self, reqs: Sequence[NotifyManyRequest], *, channels: Sequence[str] = ("INBOX",)
+    ) -> NotifyResult:
+        """내용이 서로 다른 여러 알림을 채널별 일괄 INSERT로 아웃박스에 적재 (정산 배치용)"""
+        payloads = [req.model_dump() for req in reqs if req.user_ids]
+        for channel in channels:
+            self.outbox.enqueue_many(channel=channel, payloads=payloads)
+        return NotifyResult(ok=True)
+
     def list_my_notifications(
-        self, *, user_id: int, limit: int = 50
+        self, *, user_id: int, limit: int = 50, cursor: str | None = None
     ) -> NotificationListResult:
-        notifications = self.read.list_by_user(user_id=user_id, limit=limit)
+        notifications, next_cursor = self.read.list_by_user(
+            user_id=user_id, limit=limit, cursor=cursor
+        )
+        # 페이지 내 상품 대표 이미지는 한 번에 조회
+        images = rep_images_by_product(
+            self.db, (n.product_id for n in notifications if n.product_id)
+        )
         items = []
         for n in notifications:
-            image_url = None
-            if n.product_id:
-                row = self.db.execute(
-                    select(ProductImage.image_url)
-                    .where(ProductImage.product_id == n.product_id)
-                    .order_by(ProductImage.sort_order.asc())
-                    .limit(1)
-                ).first()
-                if row:
-                    image_url = row[0]
+            image_url = images.get(n.product_id) if n.product_id else None
             items.append(
                 NotificationItem(
                     id=int(n.id),
@@ -61,7 +102,7 @@ class NotificationService:
                     image_url=image_url,
                 )
             )
-        return NotificationListResult(items=items)
+        return NotificationListResult(items=items, next_cursor=next_cursor)
 
     def mark_read(self, req: MarkReadRequest) -> MarkReadResult:
         # 단순 업데이트: 상태를 READ로 변경
@@ -75,8 +116,8 @@ class NotificationService:
             .where(Notification.id.in_(req.notification_ids))
             .values(status="READ")
         )
-        self.db.execute(stmt)
-        self.db.commit()
+        with transactional(self.db):
+            self.db.execute(stmt)
         return MarkReadResult(ok=True)
 
     def unread_count(self, *, user_id: int) -> UnreadCountResult:
@@ -1,3 +1,4 @@
+from typing import List
 from sqlalchemy.orm import Session
 from app.domains.payments.dto import (
     ChargeRequest,
@@ -36,6 +37,36 @@ class PaymentService:
             )
             return ChargeResult(payment_id=p.id, status="PAID")
 
+    def refund_many(self, reqs: List[RefundRequest]) -> int:
+        """여러 결제를 일괄 환불 (정산 배치용)
+
+        - refund와 같은 기록(환불/로그/결제 상태)을 건별이 아닌 일괄 INSERT/UPDATE로 남긴다
+        - 커밋하지 않음: 호출자 트랜잭션(정산 청크)과 함께 커밋/롤백
+        :return: 환불 건수
+        """
+        if not reqs:
+            return 0
+        self.payments.create_refunds(
+            [
+                {"payment_id": r.payment_id, "amount": r.amount, "reason": r.reason or ""}
+                for r in reqs
+            ]
+        )
+        self.payments.create_payment_logs(
+            [
+                {
+                    "payment_id": r.payment_id,
+                    "provider": "dummy",
+                    "amount": r.amount,
+                    "status": "REFUNDED",
+                    "log_type": "REFUND",
+                }
+                for r in reqs
+            ]
+        )
+        self.payments.update_payment_statuses([r.payment_id for r in reqs], status="REFUNDED")
+        return len(reqs)
+
     def refund(self, req: RefundRequest) -> RefundResult:
         """환불 처리
 
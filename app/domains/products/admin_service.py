@@ -6,6 +6,14 @@ from sqlalchemy.orm import Session
 
 from app.domains.common.str_to_datetime import str_to_datetime
 from app.domains.common.tx import transactional
+from app.infrastructure.cache.app_cache import (
+    AUCTION_INFO,
+    LISTING,
+    PRODUCT_META,
+    STORY,
+    invalidate_after_commit,
+)
+from app.domains.products.search import product_search
 from app.domains.products.admin_store import (
     StoreCreateOrUpdate,
     StoreAdminMeta,
@@ -26,10 +34,15 @@ from app.schemas.products import Product as ProductModel
 
 
 class ProductAdminService:
-    def __init__(self, db: Session):
+    def __init__(
+        self,
+        db: Session,
+        products_admin_read: ProductAdminReadRepository | None = None,
+        products_admin_write: ProductAdminWriteRepository | None = None,
+    ):
         self.db = db
-        self.products_admin_read = ProductAdminReadRepository(db)
-        self.products_admin_write = ProductAdminWriteRepository(db)
+        self.products_admin_read = products_admin_read or ProductAdminReadRepository(db)
+        self.products_admin_write = products_admin_write or ProductAdminWriteRepository(db)
 
     def store_list(self, *, page: int, size: int) -> Page[StoreMeta]:
         """스토어 목록 조회 (페이지네이션)"""
@@ -58,6 +71,7 @@ class ProductAdminService:
                 code=400, message="스토어 시작일시는 종료일시보다 이전이어야 합니다."
             )
         with transactional(self.db):
+            invalidate_after_commit(self.db, LISTING)
             store = self.products_admin_write.create_store(
                 name=store_data.name,
                 image_url=store_data.image_url,
@@ -80,6 +94,7 @@ class ProductAdminService:
                 code=400, message="스토어 시작일시는 종료일시보다 이전이어야 합니다."
             )
         with transactional(self.db):
+            invalidate_after_commit(self.db, LISTING, PRODUCT_META)
             updated_store = self.products_admin_write.update_store(
                 store=store,
                 name=store_data.name,
@@ -89,6 +104,8 @@ class ProductAdminService:
                 starts_at=starts_at,
                 ends_at=ends_at,
             )
+            # 스토어명은 상품 검색 대상이므로 소속 상품 전체 재색인
+            product_search.reindex_after_commit(self.db, store_id=updated_store.id)
             return StoreAdminMeta.from_orm(updated_store)
 
     def product_admin_list(
@@ -126,6 +143,7 @@ class ProductAdminService:
             raise BusinessError(code=404, message="스토어를 찾을 수 없습니다.")
 
         with transactional(self.db):
+            invalidate_after_commit(self.db, LISTING)
             product = self.products_admin_write.create_product(
                 name=data.name,
                 summary=data.summary,
@@ -142,6 +160,7 @@ class ProductAdminService:
                 shipping_extra_note=data.shipping_extra_note,
                 courier_name=data.courier_name,
             )
+            product_search.reindex_after_commit(self.db, product_ids=[product.id])
             return self.products_admin_read.product_admin_meta(product.id)
 
     def update_product_admin(self, data: ProductCreateOrUpdate) -> ProductAdminMeta:
@@ -156,6 +175,9 @@ class ProductAdminService:
             raise BusinessError(code=404, message="상품을 찾을 수 없습니다.")
 
         with transactional(self.db):
+            invalidate_after_commit(
+                self.db, LISTING, PRODUCT_META, STORY, AUCTION_INFO
+            )
             updated = self.products_admin_write.update_product(
                 product=product,
                 name=data.name,
@@ -173,4 +195,5 @@ class ProductAdminService:
                 shipping_extra_note=data.shipping_extra_note,
                 courier_name=data.courier_name,
             )
+            product_search.reindex_after_commit(self.db, product_ids=[updated.id])
             return self.products_admin_read.product_admin_meta(updated.id)
@@ -6,6 +6,7 @@ class SortOption(str, Enum):
     popular = "popular"
     latest = "latest"
     ending = "ending"
+    relevance = "relevance"  # 검색 관련도 (q가 있을 때만, 없으면 latest)
 
 
 class StatusFilter(str, Enum):
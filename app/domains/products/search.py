@@ -0,0 +1,191 @@
+import logging
+import threading
+from datetime import datetime
+from typing import Callable, Dict, Iterable, Optional, Sequence
+
+from sqlalchemy.orm import Session
+
+from app.core.config import settings
+from app.domains.common.tx import after_commit
+from app.infrastructure.search.backends import (
+    FullTextSearchBackend,
+    InMemorySearchBackend,
+    LikeSearchBackend,
+    SearchBackend,
+    SearchField,
+    SearchMatch,
+)
+from app.repositories.product_search import ProductSearchRepository
+
+logger = logging.getLogger(__name__)
+
+# 호출부별 검색 대상 필드
+PRODUCT_TEXT_FIELDS = (SearchField.NAME, SearchField.SUMMARY, SearchField.DESCRIPTION)
+FEED_SEARCH_FIELDS = PRODUCT_TEXT_FIELDS + (SearchField.STORE,)
+
+
+def _texts(row) -> Dict[str, Optional[str]]:
+    return {
+        SearchField.NAME.value: row.name,
+        SearchField.SUMMARY.value: row.summary,
+        SearchField.DESCRIPTION.value: row.description,
+        SearchField.STORE.value: row.store_name,
+    }
+
+
+class ProductSearch:
+    """상품 키워드 검색 진입점 — 리포지토리는 match()가 돌려준 조건/관련도 식을 select에 붙인다
+
+    memory 백엔드일 때만 색인을 관리한다:
+    - 시작 시 전체 적재, 이후 refresh 주기마다 상품/스토어 updated_at 기준 증분 반영
+      (다른 워커의 관리자 수정도 반영), 무효 문서 비율이 커지면 전체 재적재
+    - 관리자 상품/스토어 저장은 커밋 후 해당 문서를 즉시 재색인
+    """
+
+    def __init__(
+        self,
+        backend: SearchBackend,
+        *,
+        chunk_size: int = 5000,
+        compact_ratio: float = 0.25,
+    ):
+        self.backend = backend
+        self.chunk_size = chunk_size
+        self.compact_ratio = compact_ratio
+        self._watermark: Optional[datetime] = None
+        self._session_factory: Optional[Callable[[], Session]] = None
+        self._stats: Dict[str, int] = {"queries": 0, "rebuilds": 0, "reindexed": 0}
+        self._stop = threading.Event()
+
+    @property
+    def indexed(self) -> bool:
+        return isinstance(self.backend, InMemorySearchBackend)
+
+    def match(self, q: str, fields: Sequence[SearchField]) -> SearchMatch:
+        self._stats["queries"] += 1
+        return self.backend.match(q.strip(), fields)
+
+    def _add(self, index, rows) -> int:
+        changed = 0
+        for row in rows:
+            changed += index.add(int(row.id), _texts(row))
+            for updated_at in (row.updated_at, row.store_updated_at):
+                if updated_at is not None and (
+                    self._watermark is None or updated_at > self._watermark
+                ):
+                    self._watermark = updated_at
+        return changed
+
+    def rebuild(self, db: Session) -> int:
+        """전체 상품으로 새 색인을 만들어 교체
+
+        :return: 색인된 상품 수
+        """
+        if not self.indexed:
+            return 0
+        index = self.backend.new_index()
+        self._watermark = None
+        for rows in ProductSearchRepository(db).iter_document_chunks(chunk_size=self.chunk_size):
+            self._add(index, rows)
+        db.rollback()
+        self.backend.index = index
+        self._stats["rebuilds"] += 1
+        return len(index)
+
+    def refresh(self, db: Session) -> int:
+        """마지막 적재 이후 수정된 상품을 반영 (색인이 없거나 무효 문서가 많으면 전체 재적재)
+
+        :return: 바뀐 문서 수
+        """
+        if not self.indexed:
+            return 0
+        index = self.backend.index
+        if index is None or index.dead_ratio > self.compact_ratio:
+            return self.rebuild(db)
+        rows = ProductSearchRepository(db).documents_updated_since(self._watermark)
+        db.rollback()
+        return self._add(index, rows)
+
+    def reindex(
+        self, db: Session, *, product_ids: Iterable[int] = (), store_id: Optional[int] = None
+    ) -> int:
+        """지정 상품(또는 스토어의 전 상품) 문서를 다시 색인"""
+        index = self.backend.index if self.indexed else None
+        if index is None:
+            return 0
+        repo = ProductSearchRepository(db)
+        rows = repo.documents_by_ids(list(product_ids))
+        if store_id is not None:
+            rows += repo.documents_by_store(store_id)
+        db.rollback()
+        changed = self._add(index, rows)
+        self._stats["reindexed"] += changed
+        return changed
+
+    def reindex_after_commit(
+        self, session: Session, *, product_ids: Iterable[int] = (), store_id: Optional[int] = None
+    ) -> None:
+        """관리자 상품/스토어 저장 커밋 후 재색인 (색인이 없거나 시작 전이면 다음 refresh가 반영)"""
+        if not self.indexed or self._session_factory is None:
+            return
+        product_ids = list(product_ids)
+        factory = self._session_factory
+
+        def run() -> None:
+            db = factory()
+            try:
+                self.reindex(db, product_ids=product_ids, store_id=store_id)
+            except Exception:
+                logger.warning("product search reindex failed", exc_info=True)
+            finally:
+                db.close()
+
+        after_commit(session, run)
+
+    def run_refresh_loop(self, session_factory: Callable[[], Session], interval_seconds: float) -> None:
+        """interval마다 refresh (stop() 호출 시 종료)"""
+        while not self._stop.is_set():
+            db = session_factory()
+            try:
+                self.refresh(db)
+            except Exception:
+                logger.exception("product search refresh failed")
+            finally:
+                db.close()
+            self._stop.wait(interval_seconds)
+
+    def start(self, session_factory: Callable[[], Session], interval_seconds: float) -> None:
+        """백그라운드 적재/refresh 스레드 시작 (첫 적재가 끝날 때까지는 LIKE로 검색)"""
+        if not self.indexed:
+            return
+        self._session_factory = session_factory
+        self._stop.clear()
+        threading.Thread(
+            target=self.run_refresh_loop,
+            args=(session_factory, interval_seconds),
+            name="product-search-refresh",
+            daemon=True,
+        ).start()
+
+    def stop(self) -> None:
+        self._stop.set()
+
+    def stats(self) -> dict:
+        index = self.backend.index if self.indexed else None
+        return {
+            "backend": self.backend.name,
+            "ready": index is not None or not self.indexed,
+            **(index.stats() if index is not None else {}),
+            **self._stats,
+        }
+
+
+def _build_backend() -> SearchBackend:
+    if settings.SEARCH_BACKEND == "fulltext":
+        return FullTextSearchBackend()
+    if settings.SEARCH_BACKEND == "memory":
+        return InMemorySearchBackend(max_results=settings.SEARCH_MAX_RESULTS)
+    return LikeSearchBackend()
+
+
+product_search = ProductSearch(_build_backend())
@@ -14,6 +14,7 @@ from sqlalchemy.orm import Session
 
 from app.domains.common.str_to_datetime import str_to_datetime
 from app.domains.common.tx import transactional
+from app.infrastructure.cache.app_cache import LISTING, cached
 from app.repositories.product_read import ProductReadRepository
 from app.repositories.auction_read import AuctionReadRepository
 
@@ -22,6 +23,7 @@ from app.domains.products.store_meta import StoreMeta
 from app.domains.products.store_with_products import StoreWithProducts
 from app.domains.auctions.auction_info import AuctionInfo
 from app.domains.auctions.bid_rules import BidRules
+from app.domains.auctions.hot_state import hot_auctions
 from app.domains.products.product_meta import ProductMeta
 
 from app.domains.products.mappers import rows_to_product_items
@@ -35,6 +37,7 @@ class ProductService:
         self.products = ProductReadRepository(db)
         self.auctions = AuctionReadRepository(db)
 
+    @cached(LISTING, "ending_soon")
     def ending_soon(
         self,
         *,
@@ -48,6 +51,8 @@ class ProductService:
         sort: SortOption = SortOption.ending,
         category: str | None = None,
         q: str | None = None,
+        with_total: bool = True,
+        cursor: str | None = None,
     ) -> Page[ProductListItem]:
         """마감임박 상품 조회 (페이지네이션)
 
@@ -55,7 +60,7 @@ class ProductService:
         :return: ProductListItem 리스트
         """
         offset = (page - 1) * size
-        items, total = self.products.ending_soon_products(
+        items, total, has_next, next_cursor = self.products.ending_soon_products(
             limit=size,
             offset=offset,
             status=status.value if isinstance(status, StatusFilter) else status,
@@ -70,9 +75,12 @@ class ProductService:
             sort=sort.value if isinstance(sort, SortOption) else sort,
             category=category,
             q=q,
+            with_total=with_total,
+            cursor=cursor,
         )
-        return paginate(items, page, size, total)
+        return paginate(items, page, size, total, has_next, next_cursor)
 
+    @cached(LISTING, "recommended")
     def recommended(
         self,
         *,
@@ -86,10 +94,12 @@ class ProductService:
         sort: SortOption = SortOption.recommended,
         category: str | None = None,
         q: str | None = None,
+        with_total: bool = True,
+        cursor: str | None = None,
     ) -> Page[ProductListItem]:
         """MD 추천 상품 조회 (페이지네이션)"""
         offset = (page - 1) * size
-        items, total = self.products.recommended_products(
+        items, total, has_next, next_cursor = self.products.recommended_products(
             limit=size,
             offset=offset,
             status=status.value if isinstance(status, StatusFilter) else status,
@@ -104,9 +114,12 @@ class ProductService:
             sort=sort.value if isinstance(sort, SortOption) else sort,
             category=category,
             q=q,
+            with_total=with_total,
+            cursor=cursor,
         )
-        return paginate(items, page, size, total)
+        return paginate(items, page, size, total, has_next, next_cursor)
 
+    @cached(LISTING, "newest")
     def newest(
         self,
         *,
@@ -120,10 +133,12 @@ class ProductService:
         sort: SortOption = SortOption.latest,
         category: str | None = None,
         q: str | None = None,
+        with_total: bool = True,
+        cursor: str | None = None,
     ) -> Page[ProductListItem]:
         """신규 상품 조회 (페이지네이션)"""
         offset = (page - 1) * size
-        items, total = self.products.new_products(
+        items, total, has_next, next_cursor = self.products.new_products(
             limit=size,
             offset=offset,
             status=status.value if isinstance(status, StatusFilter) else status,
@@ -138,9 +153,12 @@ class ProductService:
             sort=sort.value if isinstance(sort, SortOption) else sort,
             category=category,
             q=q,
+            with_total=with_total,
+            cursor=cursor,
         )
-        return paginate(items, page, size, total)
+        return paginate(items, page, size, total, has_next, next_cursor)
 
+    @cached(LISTING, "stores_recent")
     def stores_recent(
         self,
         *,
@@ -216,9 +234,11 @@ class ProductService:
         price_max: float | None = None,
         category: str | None = None,
         q: str | None = None,
+        with_total: bool = True,
+        cursor: str | None = None,
     ) -> Page[ProductListItem]:
         """특정 스토어 내 상품 목록 조회 (정렬/페이징)"""
-        items, total = self.products.products_by_store(
+        items, total, has_next, next_cursor = self.products.products_by_store(
             store_id=store_id,
             sort=sort.value if isinstance(sort, SortOption) else sort,
             page=page,
@@ -234,9 +254,12 @@ class ProductService:
             price_max=price_max,
             category=category,
             q=q,
+            with_total=with_total,
+            cursor=cursor,
         )
-        return paginate(items, page, size, total)
+        return paginate(items, page, size, total, has_next, next_cursor)
 
+    @cached(LISTING, "upcoming")
     def upcoming(
         self,
         *,
@@ -250,10 +273,12 @@ class ProductService:
         sort: SortOption = SortOption.ending,
         category: str | None = None,
         q: str | None = None,
+        with_total: bool = True,
+        cursor: str | None = None,
     ) -> Page[ProductListItem]:
         """오픈예정 상품 조회 (페이지네이션)"""
         offset = (page - 1) * size
-        items, total = self.products.upcoming_products(
+        items, total, has_next, next_cursor = self.products.upcoming_products(
             limit=size,
             offset=offset,
             status=status.value if isinstance(status, StatusFilter) else status,
@@ -268,15 +293,25 @@ class ProductService:
             sort=sort.value if isinstance(sort, SortOption) else sort,
             category=category,
             q=q,
+            with_total=with_total,
+            cursor=cursor,
         )
-        return paginate(items, page, size, total)
+        return paginate(items, page, size, total, has_next, next_cursor)
 
     def product_meta(self, *, product_id: int) -> ProductMeta:
         """상품 메타데이터 상세 조회"""
         return self.products.product_meta(product_id)
 
-    def product_auction_info(self, *, product_id: int) -> AuctionInfo:
-        """상품의 경매 핵심 정보 조회 및 입찰 스텝 계산"""
+    def product_auction_info(
+        self, *, product_id: int, with_steps: bool = True
+    ) -> AuctionInfo:
+        """상품의 경매 핵심 정보 조회 및 입찰 스텝 계산 (with_steps=False면 스텝 생략)
+
+        종료 임박 경매는 핫 상태 스냅샷에서 바로 반환한다.
+        """
+        hot = hot_auctions.auction_info(product_id, with_steps=with_steps)
+        if hot is not None:
+            return hot
         info = self.auctions.get_auction_info_by_product(product_id)
         if not info:
             return AuctionInfo(
@@ -292,25 +327,26 @@ class ProductService:
                 bidder_count=0,
                 status="CANCELLED",
             )
+        if not with_steps:
+            info.bid_steps = []
+            return info
         current = (
-            float(info.current_highest_bid)
+            info.current_highest_bid
             if info.current_highest_bid is not None
-            else float(info.min_bid_price)
-        )
-        steps = BidRules.make_bid_steps(
-            current,
-            float(info.buy_now_price) if info.buy_now_price is not None else None,
+            else info.min_bid_price
         )
-        info.bid_steps = steps
+        info.bid_steps = BidRules.make_bid_steps(current, info.buy_now_price)
         return info
 
-    def product_bids(self, *, product_id: int, page: int, size: int) -> Page:
-        """상품의 입찰 내역 조회 (페이지네이션)"""
+    def product_bids(
+        self, *, product_id: int, page: int, size: int, cursor: str | None = None
+    ) -> Page:
+        """상품의 입찰 내역 조회 (페이지네이션, cursor 지정 시 keyset 조회)"""
         offset = (page - 1) * size
-        items, total = self.auctions.list_bids_by_product(
-            product_id, limit=size, offset=offset
+        items, total, has_next, next_cursor = self.auctions.list_bids_by_product(
+            product_id, limit=size, offset=offset, cursor=cursor
         )
-        return paginate(items, page, size, total)
+        return paginate(items, page, size, total, has_next, next_cursor)
 
     def product_similar(
         self,
@@ -326,10 +362,12 @@ class ProductService:
         sort: SortOption = SortOption.latest,
         category: str | None = None,
         q: str | None = None,
+        with_total: bool = True,
+        cursor: str | None = None,
     ) -> Page[ProductListItem]:
         """같은 스토어 내 유사 상품 조회 (페이지네이션)"""
         offset = (page - 1) * size
-        items, total = self.auctions.similar_products_in_same_store(
+        items, total, has_next, next_cursor = self.auctions.similar_products_in_same_store(
             product_id,
             limit=size,
             offset=offset,
@@ -345,5 +383,7 @@ class ProductService:
             sort=sort.value if isinstance(sort, SortOption) else sort,
             # category filter not applied for similar scope
             q=q,
+            with_total=with_total,
+            cursor=cursor,
         )
-        return paginate(items, page, size, total)
+        return paginate(items, page, size, total, has_next, next_cursor)
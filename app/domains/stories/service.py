@@ -13,13 +13,17 @@ class StoryService:
         self.db = db
         self.story_read = StoryReadRepository(db)
 
-    def get_stories(self, *, page: int, size: int) -> Page[StoryListItem]:
+    def get_stories(
+        self, *, page: int, size: int, with_total: bool = True
+    ) -> Page[StoryListItem]:
         """스토리 목록 조회 (페이지네이션)"""
         offset = (page - 1) * size
-        stories, total = self.story_read.recent_story_items_with_product_brief(
-            limit=size, offset=offset
+        stories, total, has_next = (
+            self.story_read.recent_story_items_with_product_brief(
+                limit=size, offset=offset, with_total=with_total
+            )
         )
-        return paginate(stories, page, size, total)
+        return paginate(stories, page, size, total, has_next)
 
     def get_story_meta(self, story_id: int) -> StoryMeta | None:
         """스토리 상세 조회"""
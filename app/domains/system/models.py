@@ -1,8 +1,87 @@
-from typing import List, Optional
-from pydantic import BaseModel
+from typing import Dict, List, Optional
+from pydantic import BaseModel, ConfigDict, Field
 
 
 class DBInfo(BaseModel):
     version: str
     database: Optional[str]
     tables: List[str] = []
+
+
+class PoolStats(BaseModel):
+    pool_class: str
+    size: Optional[int] = None
+    checked_in: Optional[int] = None
+    checked_out: Optional[int] = None
+    overflow: Optional[int] = None
+    max_overflow: Optional[int] = None
+    timeout: Optional[float] = None
+    connects: int = 0
+    checkouts: int = 0
+    checkins: int = 0
+    invalidations: int = 0
+    timeouts: int = 0
+    last_timeout_at: Optional[float] = None
+    wait_count: int = 0
+    wait_avg_ms: float = 0.0
+    wait_max_ms: float = 0.0
+
+
+class PoolHealth(BaseModel):
+    sync: PoolStats
+    async_: Optional[PoolStats] = Field(default=None, alias="async")
+    # replica 엔진 (DATABASE_READ_URL / DATABASE_ASYNC_READ_URL 설정 시에만)
+    read: Optional[PoolStats] = None
+    async_read: Optional[PoolStats] = None
+
+    model_config = ConfigDict(populate_by_name=True)
+
+
+class CacheNamespaceStats(BaseModel):
+    hits: int
+    misses: int
+    hit_ratio: float
+    errors: int
+    invalidations: int
+    ttl_seconds: float
+
+
+class CacheStats(BaseModel):
+    backend: str
+    serializer: str
+    namespaces: Dict[str, CacheNamespaceStats] = {}
+
+
+class HotAuctionStats(BaseModel):
+    backend: str
+    tracked: int
+    hits: int
+    misses: int
+    rejects: int
+    refreshes: int
+
+
+class SchedulerStats(BaseModel):
+    leader: bool
+    pending: int
+    next_due_in_seconds: Optional[float] = None
+    lag_p50_ms: float
+    lag_p99_ms: float
+    lag_max_ms: float
+    reloads: int
+    runs: int
+    started: int
+    settled: int
+    errors: int
+
+
+class SearchStats(BaseModel):
+    backend: str
+    ready: bool
+    documents: int = 0
+    dead_ratio: float = 0.0
+    terms: int = 0
+    postings: int = 0
+    queries: int
+    rebuilds: int
+    reindexed: int
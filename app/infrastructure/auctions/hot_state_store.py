@@ -0,0 +1,228 @@
+import threading
+from dataclasses import dataclass, replace
+from datetime import datetime
+from functools import cached_property
+from typing import Dict, Iterable, List, Optional, Protocol, Set
+
+import orjson
+
+from app.domains.auctions.auction_info import AuctionInfo
+from app.domains.auctions.bid_rules import BidRules
+
+
+@dataclass(frozen=True)
+class HotAuctionSnapshot:
+    """진행 중 경매의 메모리 상태 (입찰자 집합은 저장소에서 별도 관리)
+
+    - info: 응답용 경매 정보 (bid_steps 제외, 시각은 KST ISO 문자열)
+    - ends_at_utc: 만료 판단용 종료 시각 (DB와 같은 naive UTC)
+    - bid_count: 반영된 입찰 수 (재적재 시 더 오래된 스냅샷이 덮어쓰지 않도록 비교)
+    """
+
+    product_id: int
+    ends_at_utc: datetime
+    bid_count: int
+    info: AuctionInfo
+
+    @property
+    def auction_id(self) -> int:
+        return self.info.auction_id
+
+    @property
+    def current_price(self) -> float:
+        info = self.info
+        return (
+            info.current_highest_bid
+            if info.current_highest_bid is not None
+            else info.min_bid_price
+        )
+
+    @cached_property
+    def bid_steps(self) -> List[float]:
+        # 스냅샷은 최고가가 바뀔 때마다 새로 만들어지므로 스냅샷당 한 번만 계산
+        return BidRules.make_bid_steps(self.current_price, self.info.buy_now_price)
+
+    def with_bid(self, amount: float, *, new_bidder: bool) -> "HotAuctionSnapshot":
+        info = self.info
+        highest = info.current_highest_bid
+        return replace(
+            self,
+            bid_count=self.bid_count + 1,
+            info=info.model_copy(
+                update={
+                    "current_highest_bid": (
+                        amount if highest is None else max(highest, amount)
+                    ),
+                    "bidder_count": info.bidder_count + (1 if new_bidder else 0),
+                }
+            ),
+        )
+
+    def dumps(self) -> bytes:
+        return orjson.dumps(
+            {
+                "product_id": self.product_id,
+                "ends_at_utc": self.ends_at_utc,
+                "bid_count": self.bid_count,
+                "info": self.info.model_dump(mode="json"),
+            }
+        )
+
+    @classmethod
+    def loads(cls, raw: bytes) -> "HotAuctionSnapshot":
+        data = orjson.loads(raw)
+        return cls(
+            product_id=int(data["product_id"]),
+            ends_at_utc=datetime.fromisoformat(data["ends_at_utc"]),
+            bid_count=int(data["bid_count"]),
+            info=AuctionInfo.model_validate(data["info"]),
+        )
+
+
+class HotAuctionStore(Protocol):
+    """핫 경매 상태 저장소 (프로세스 로컬 / Redis 공유)"""
+
+    def get(self, auction_id: int) -> Optional[HotAuctionSnapshot]: ...
+
+    def auction_id_for_product(self, product_id: int) -> Optional[int]: ...
+
+    def has_bidder(self, auction_id: int, user_id: int) -> bool: ...
+
+    def put(self, snapshot: HotAuctionSnapshot, bidder_ids: Iterable[int]) -> None: ...
+
+    def apply_bid(self, auction_id: int, user_id: int, amount: float) -> None: ...
+
+    def delete(self, auction_id: int) -> None: ...
+
+    def auction_ids(self) -> Set[int]: ...
+
+
+class InMemoryHotAuctionStore:
+    """프로세스 로컬 저장소 — 워커가 하나이거나 경매별 고정 라우팅일 때 사용"""
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._snapshots: Dict[int, HotAuctionSnapshot] = {}
+        self._bidders: Dict[int, Set[int]] = {}
+        self._by_product: Dict[int, int] = {}
+
+    def get(self, auction_id: int) -> Optional[HotAuctionSnapshot]:
+        return self._snapshots.get(auction_id)
+
+    def auction_id_for_product(self, product_id: int) -> Optional[int]:
+        return self._by_product.get(product_id)
+
+    def has_bidder(self, auction_id: int, user_id: int) -> bool:
+        with self._lock:
+            return user_id in self._bidders.get(auction_id, ())
+
+    def put(self, snapshot: HotAuctionSnapshot, bidder_ids: Iterable[int]) -> None:
+        auction_id = snapshot.auction_id
+        with self._lock:
+            current = self._snapshots.get(auction_id)
+            self._bidders.setdefault(auction_id, set()).update(bidder_ids)
+            if current is None or current.bid_count <= snapshot.bid_count:
+                self._snapshots[auction_id] = snapshot
+            self._by_product[snapshot.product_id] = auction_id
+
+    def apply_bid(self, auction_id: int, user_id: int, amount: float) -> None:
+        with self._lock:
+            current = self._snapshots.get(auction_id)
+            if current is None:
+                return
+            bidders = self._bidders.setdefault(auction_id, set())
+            new_bidder = user_id not in bidders
+            bidders.add(user_id)
+            self._snapshots[auction_id] = current.with_bid(amount, new_bidder=new_bidder)
+
+    def delete(self, auction_id: int) -> None:
+        with self._lock:
+            snapshot = self._snapshots.pop(auction_id, None)
+            self._bidders.pop(auction_id, None)
+            if snapshot is not None:
+                self._by_product.pop(snapshot.product_id, None)
+
+    def auction_ids(self) -> Set[int]:
+        with self._lock:
+            return set(self._snapshots)
+
+
+class RedisHotAuctionStore:
+    """Redis 공유 저장소 — 모든 워커가 같은 상태를 보고 입찰 반영도 즉시 공유된다
+
+    - {prefix}:hot:a:{auction_id}  스냅샷 (orjson)
+    - {prefix}:hot:b:{auction_id}  입찰자 ID 집합
+    - {prefix}:hot:p:{product_id}  상품 → 경매 ID
+    - {prefix}:hot:ids             추적 중인 경매 ID 집합
+    """
+
+    def __init__(self, client, *, prefix: str = "hot"):
+        self._client = client
+        self._prefix = prefix
+
+    @classmethod
+    def from_url(cls, url: str, *, prefix: str) -> "RedisHotAuctionStore":
+        import redis  # optional dependency: HOT_AUCTION_BACKEND=redis 일 때만 필요
+
+        return cls(redis.Redis.from_url(url, socket_timeout=0.5), prefix=f"{prefix}:hot")
+
+    def _key(self, kind: str, ident: int) -> str:
+        return f"{self._prefix}:{kind}:{ident}"
+
+    def get(self, auction_id: int) -> Optional[HotAuctionSnapshot]:
+        raw = self._client.get(self._key("a", auction_id))
+        return HotAuctionSnapshot.loads(raw) if raw is not None else None
+
+    def auction_id_for_product(self, product_id: int) -> Optional[int]:
+        raw = self._client.get(self._key("p", product_id))
+        return int(raw) if raw is not None else None
+
+    def has_bidder(self, auction_id: int, user_id: int) -> bool:
+        return bool(self._client.sismember(self._key("b", auction_id), user_id))
+
+    def put(self, snapshot: HotAuctionSnapshot, bidder_ids: Iterable[int]) -> None:
+        auction_id = snapshot.auction_id
+        state_key = self._key("a", auction_id)
+        bidders = list(bidder_ids)
+
+        def _put(pipe) -> None:
+            raw = pipe.get(state_key)
+            current = HotAuctionSnapshot.loads(raw) if raw is not None else None
+            pipe.multi()
+            if current is None or current.bid_count <= snapshot.bid_count:
+                pipe.set(state_key, snapshot.dumps())
+            if bidders:
+                pipe.sadd(self._key("b", auction_id), *bidders)
+            pipe.set(self._key("p", snapshot.product_id), auction_id)
+            pipe.sadd(f"{self._prefix}:ids", auction_id)
+
+        self._client.transaction(_put, state_key)
+
+    def apply_bid(self, auction_id: int, user_id: int, amount: float) -> None:
+        state_key = self._key("a", auction_id)
+        bidders_key = self._key("b", auction_id)
+
+        def _apply(pipe) -> None:
+            raw = pipe.get(state_key)
+            if raw is None:
+                return
+            new_bidder = not pipe.sismember(bidders_key, user_id)
+            snapshot = HotAuctionSnapshot.loads(raw).with_bid(amount, new_bidder=new_bidder)
+            pipe.multi()
+            pipe.set(state_key, snapshot.dumps())
+            pipe.sadd(bidders_key, user_id)
+
+        # 다른 워커의 동시 반영과 겹치면 WATCH 충돌 → 최신 값 기준으로 재시도
+        self._client.transaction(_apply, state_key, bidders_key)
+
+    def delete(self, auction_id: int) -> None:
+        snapshot = self.get(auction_id)
+        pipe = self._client.pipeline()
+        pipe.delete(self._key("a", auction_id), self._key("b", auction_id))
+        if snapshot is not None:
+            pipe.delete(self._key("p", snapshot.product_id))
+        pipe.srem(f"{self._prefix}:ids", auction_id)
+        pipe.execute()
+
+    def auction_ids(self) -> Set[int]:
+        return {int(v) for v in self._client.smembers(f"{self._prefix}:ids")}
@@ -0,0 +1,345 @@
+import functools
+import inspect
+import logging
+import threading
+import time
+from enum import Enum
+from typing import Any, Callable, Dict, Hashable, Optional, Tuple, TypeVar, get_type_hints
+
+import xxhash
+from pydantic import TypeAdapter
+from sqlalchemy.orm import Session
+
+from app.core.config import settings
+from app.db.routing import has_replica, is_primary_pinned
+from app.domains.common.tx import after_commit
+from app.infrastructure.cache.backends import (
+    CacheBackend,
+    InMemoryCacheBackend,
+    RedisCacheBackend,
+)
+from app.infrastructure.cache.serializers import SERIALIZERS, Serializer
+
+logger = logging.getLogger(__name__)
+
+T = TypeVar("T")
+
+# Namespaces (무효화 단위)
+LISTING = "listing"
+PRODUCT_META = "product_meta"
+STORY = "story"
+AUCTION_INFO = "auction_info"
+
+
+def _norm(value: Any) -> Hashable:
+    if isinstance(value, Enum):
+        return value.value
+    if isinstance(value, str):
+        v = value.strip()
+        return v.lower() if v else None
+    if isinstance(value, float) and value.is_integer():
+        return int(value)
+    return value
+
+
+def cache_key(name: str, **params: Any) -> Tuple:
+    """인자 조합을 정규화한 캐시 키 (enum→값, 공백/대소문자 정리, 인자 순서 무관)"""
+    return (name,) + tuple(sorted((k, _norm(v)) for k, v in params.items()))
+
+
+class _NamespaceStats:
+    __slots__ = ("hits", "misses", "errors", "invalidations")
+
+    def __init__(self):
+        self.hits = 0
+        self.misses = 0
+        self.errors = 0
+        self.invalidations = 0
+
+
+class AppCache:
+    """네임스페이스 단위 캐시 (백엔드/직렬화 교체 가능)
+
+    - 실제 키: {prefix}:{namespace}:g{generation}:{hash(key)}
+    - invalidate(namespace)는 generation 카운터를 증가시켜 해당 네임스페이스 전체를
+      무효화한다. 카운터가 백엔드(Redis)에 있으므로 모든 워커에 즉시 반영된다.
+    - 백엔드 장애 시 캐시를 건너뛰고 loader로 조회한다 (요청은 실패시키지 않음)
+    - refresh=True면 캐시를 읽지 않고 loader 결과로 덮어쓴다 (primary 읽기로 최신값 보장)
+    """
+
+    def __init__(
+        self,
+        backend: CacheBackend,
+        serializer: Serializer,
+        *,
+        prefix: str = "cache",
+        ttl_seconds: Optional[Dict[str, float]] = None,
+        default_ttl_seconds: float = 30.0,
+    ):
+        self.backend = backend
+        self.serializer = serializer
+        self.prefix = prefix
+        self.ttl_seconds = dict(ttl_seconds or {})
+        self.default_ttl_seconds = default_ttl_seconds
+        self._lock = threading.Lock()
+        self._stats: Dict[str, _NamespaceStats] = {}
+
+    def _ns_stats(self, namespace: str) -> _NamespaceStats:
+        with self._lock:
+            stats = self._stats.get(namespace)
+            if stats is None:
+                stats = self._stats[namespace] = _NamespaceStats()
+            return stats
+
+    def _ttl(self, namespace: str) -> float:
+        return self.ttl_seconds.get(namespace, self.default_ttl_seconds)
+
+    def _generation(self, namespace: str) -> int:
+        raw = self.backend.get(f"{self.prefix}:gen:{namespace}")
+        return int(raw) if raw is not None else 0
+
+    def _storage_key(self, namespace: str, key: Tuple) -> str:
+        digest = xxhash.xxh3_64_hexdigest(repr(key))
+        return f"{self.prefix}:{namespace}:g{self._generation(namespace)}:{digest}"
+
+    def get_or_load(
+        self,
+        namespace: str,
+        key: Tuple,
+        loader: Callable[[], T],
+        adapter: TypeAdapter,
+        *,
+        refresh: bool = False,
+    ) -> T:
+        ttl = self._ttl(namespace)
+        if ttl <= 0:
+            return loader()
+        stats = self._ns_stats(namespace)
+        try:
+            storage_key = self._storage_key(namespace, key)
+            raw = None if refresh else self.backend.get(storage_key)
+        except Exception:
+            logger.warning("cache get failed: %s", namespace, exc_info=True)
+            stats.errors += 1
+            return loader()
+        if raw is not None:
+            try:
+                value = self.serializer.loads(adapter, raw)
+                stats.hits += 1
+                return value
+            except Exception:
+                logger.warning("cache decode failed: %s", namespace, exc_info=True)
+                stats.errors += 1
+        stats.misses += 1
+        value = loader()
+        try:
+            self.backend.set(storage_key, self.serializer.dumps(adapter, value), ttl)
+        except Exception:
+            logger.warning("cache set failed: %s", namespace, exc_info=True)
+            stats.errors += 1
+        return value
+
+    def invalidate(self, *namespaces: str) -> None:
+        for namespace in namespaces:
+            try:
+                self.backend.incr(f"{self.prefix}:gen:{namespace}")
+                self._ns_stats(namespace).invalidations += 1
+            except Exception:
+                logger.warning("cache invalidate failed: %s", namespace, exc_info=True)
+                self._ns_stats(namespace).errors += 1
+
+    def invalidate_key(self, namespace: str, key: Tuple) -> None:
+        try:
+            self.backend.delete(self._storage_key(namespace, key))
+            self._ns_stats(namespace).invalidations += 1
+        except Exception:
+            logger.warning("cache delete failed: %s", namespace, exc_info=True)
+            self._ns_stats(namespace).errors += 1
+
+    @property
+    def blocking(self) -> bool:
+        """백엔드 호출이 네트워크 I/O로 블로킹되는지 (이벤트 루프에서 직접 호출 금지)"""
+        return getattr(self.backend, "blocking", False)
+
+    def stats(self) -> Dict[str, Any]:
+        with self._lock:
+            namespaces = {
+                name: {
+                    "hits": s.hits,
+                    "misses": s.misses,
+                    "hit_ratio": (
+                        round(s.hits / (s.hits + s.misses), 4)
+                        if s.hits + s.misses
+                        else 0.0
+                    ),
+                    "errors": s.errors,
+                    "invalidations": s.invalidations,
+                    "ttl_seconds": self._ttl(name),
+                }
+                for name, s in self._stats.items()
+            }
+        return {
+            "backend": type(self.backend).__name__,
+            "serializer": type(self.serializer).__name__,
+            "namespaces": namespaces,
+        }
+
+
+class DelayedInvalidator:
+    """커밋 후 무효화를 replica 지연 시간 뒤 한 번 더 실행
+
+    커밋 직후 무효화와 replica 반영 사이에 replica 읽기가 변경 전 값을 다시 채울 수 있으므로,
+    READ_YOUR_WRITES_SECONDS가 지난 뒤 같은 대상을 다시 무효화한다.
+    대상(네임스페이스 / 네임스페이스+키)별로 마지막 예약만 남기고 스레드 하나로 처리한다.
+    """
+
+    def __init__(self, cache: AppCache, delay_seconds: float):
+        self.cache = cache
+        self.delay_seconds = delay_seconds
+        self._cond = threading.Condition()
+        self._due: Dict[Tuple, float] = {}
+        self._thread: Optional[threading.Thread] = None
+
+    def schedule(self, namespace: str, key: Optional[Tuple] = None) -> None:
+        if self.delay_seconds <= 0:
+            return
+        with self._cond:
+            self._due[(namespace, key)] = time.monotonic() + self.delay_seconds
+            if self._thread is None:
+                self._thread = threading.Thread(
+                    target=self._run, name="cache-delayed-invalidation", daemon=True
+                )
+                self._thread.start()
+            self._cond.notify()
+
+    def pending(self) -> int:
+        with self._cond:
+            return len(self._due)
+
+    def run_due(self, now: Optional[float] = None) -> int:
+        """예정 시각이 지난 대상을 무효화
+
+        :return: 무효화한 대상 수
+        """
+        now = time.monotonic() if now is None else now
+        with self._cond:
+            ready = [target for target, due in self._due.items() if due <= now]
+            for target in ready:
+                del self._due[target]
+        for namespace, key in ready:
+            if key is None:
+                self.cache.invalidate(namespace)
+            else:
+                self.cache.invalidate_key(namespace, key)
+        return len(ready)
+
+    def _run(self) -> None:
+        while True:
+            with self._cond:
+                while not self._due:
+                    self._cond.wait()
+                wait = min(self._due.values()) - time.monotonic()
+                if wait > 0:
+                    self._cond.wait(wait)
+                    continue
+            self.run_due()
+
+
+def _build_backend() -> CacheBackend:
+    if settings.CACHE_BACKEND == "redis":
+        return RedisCacheBackend.from_url(settings.REDIS_URL)
+    return InMemoryCacheBackend(maxsize=settings.CACHE_MEMORY_MAXSIZE)
+
+
+app_cache = AppCache(
+    _build_backend(),
+    SERIALIZERS[settings.CACHE_SERIALIZER](),
+    prefix=settings.CACHE_KEY_PREFIX,
+    ttl_seconds={LISTING: settings.LISTING_CACHE_TTL_SECONDS},
+    default_ttl_seconds=settings.CACHE_TTL_SECONDS,
+)
+# replica가 없으면 다시 채워질 지연 값이 없으므로 재무효화하지 않음
+delayed_invalidations = DelayedInvalidator(
+    app_cache, settings.READ_YOUR_WRITES_SECONDS if has_replica() else 0
+)
+
+
+def cached(namespace: str, name: Optional[str] = None):
+    """메서드 결과를 app_cache에 저장하는 데코레이터
+
+    - 캐시 키: (name, self를 제외한 바인딩 인자)
+    - 직렬화 타입: 메서드의 return 타입 힌트 (pydantic TypeAdapter)
+    - self.db가 primary에 고정된 읽기(replica 설정 + 최근 쓰기 사용자)면 캐시를 읽지 않고
+      최신값으로 갱신 → 다른 사용자의 replica 읽기가 채운 지연 값을 보지 않음
+    """
+
+    def decorator(fn):
+        signature = inspect.signature(fn)
+        key_name = name or fn.__qualname__
+        adapter_holder: Dict[str, TypeAdapter] = {}
+
+        def _adapter() -> TypeAdapter:
+            adapter = adapter_holder.get("adapter")
+            if adapter is None:
+                adapter = adapter_holder["adapter"] = TypeAdapter(
+                    get_type_hints(fn)["return"]
+                )
+            return adapter
+
+        @functools.wraps(fn)
+        def wrapper(self, *args, **kwargs):
+            bound = signature.bind(self, *args, **kwargs)
+            bound.apply_defaults()
+            params = dict(bound.arguments)
+            params.pop("self", None)
+            db = getattr(self, "db", None)
+            return app_cache.get_or_load(
+                namespace,
+                cache_key(key_name, **params),
+                lambda: fn(self, *args, **kwargs),
+                _adapter(),
+                refresh=db is not None and is_primary_pinned(db),
+            )
+
+        return wrapper
+
+    return decorator
+
+
+_invalidators: Dict[str, Callable[[], None]] = {}
+
+
+def _invalidate_namespace(namespace: str) -> None:
+    app_cache.invalidate(namespace)
+    delayed_invalidations.schedule(namespace)
+
+
+def _invalidate_key(namespace: str, key: Tuple) -> None:
+    app_cache.invalidate_key(namespace, key)
+    delayed_invalidations.schedule(namespace, key)
+
+
+def _invalidator(namespace: str) -> Callable[[], None]:
+    # 트랜잭션 내 중복 등록 제거를 위해 네임스페이스별 동일 callable 재사용
+    fn = _invalidators.get(namespace)
+    if fn is None:
+        fn = _invalidators[namespace] = functools.partial(_invalidate_namespace, namespace)
+    return fn
+
+
+def invalidate_after_commit(session: Session, *namespaces: str) -> None:
+    """커밋 성공 후 네임스페이스 무효화 (롤백 시 무시, replica 설정 시 지연 후 한 번 더)"""
+    for namespace in namespaces:
+        after_commit(session, _invalidator(namespace))
+
+
+def auction_info_key(product_id: int) -> Tuple:
+    return cache_key("auction_info", product_id=product_id)
+
+
+def invalidate_auction_info_after_commit(session: Session, product_id: int) -> None:
+    """입찰/즉시구매 후 해당 상품의 경매 정보 캐시만 제거"""
+    after_commit(
+        session,
+        functools.partial(_invalidate_key, AUCTION_INFO, auction_info_key(product_id)),
+    )
@@ -0,0 +1,86 @@
+import threading
+import time
+from typing import Optional, Protocol
+
+from cachetools import TLRUCache
+
+
+class CacheBackend(Protocol):
+    """바이트 단위 key/value 캐시 백엔드 (in-memory / Redis 프로토콜)"""
+
+    # 호출이 네트워크 I/O로 블로킹되면 True (이벤트 루프 스레드에서 호출하지 않음)
+    blocking: bool
+
+    def get(self, key: str) -> Optional[bytes]: ...
+
+    def set(self, key: str, value: bytes, ttl_seconds: Optional[float] = None) -> None: ...
+
+    def delete(self, key: str) -> None: ...
+
+    def incr(self, key: str) -> int: ...
+
+
+class InMemoryCacheBackend:
+    """프로세스 로컬 백엔드 (키별 TTL + LRU 상한)"""
+
+    blocking = False
+
+    def __init__(self, maxsize: int = 4096):
+        self._lock = threading.Lock()
+        self._data: TLRUCache = TLRUCache(
+            maxsize=maxsize,
+            ttu=lambda _key, entry, now: entry[1],
+            timer=time.monotonic,
+        )
+
+    def get(self, key: str) -> Optional[bytes]:
+        with self._lock:
+            entry = self._data.get(key)
+        return entry[0] if entry is not None else None
+
+    def set(self, key: str, value: bytes, ttl_seconds: Optional[float] = None) -> None:
+        expires = time.monotonic() + ttl_seconds if ttl_seconds else float("inf")
+        with self._lock:
+            self._data[key] = (value, expires)
+
+    def delete(self, key: str) -> None:
+        with self._lock:
+            self._data.pop(key, None)
+
+    def incr(self, key: str) -> int:
+        with self._lock:
+            entry = self._data.get(key)
+            value = int(entry[0]) + 1 if entry is not None else 1
+            self._data[key] = (str(value).encode(), float("inf"))
+            return value
+
+
+class RedisCacheBackend:
+    """Redis 프로토콜 백엔드 (redis-py 호환 클라이언트, 테스트 시 fakeredis 주입 가능)"""
+
+    # 동기 클라이언트: async 경로에서는 스레드풀에서 호출해야 함 (AsyncSqlAlchemyUnitOfWork.run_cached)
+    blocking = True
+
+    def __init__(self, client):
+        self._client = client
+
+    @classmethod
+    def from_url(cls, url: str) -> "RedisCacheBackend":
+        import redis  # optional dependency: CACHE_BACKEND=redis 일 때만 필요
+
+        return cls(redis.Redis.from_url(url, socket_timeout=0.5))
+
+    def get(self, key: str) -> Optional[bytes]:
+        return self._client.get(key)
+
+    def set(self, key: str, value: bytes, ttl_seconds: Optional[float] = None) -> None:
+        if ttl_seconds:
+            self._client.set(key, value, px=int(ttl_seconds * 1000))
+        else:
+            self._client.set(key, value)
+
+    def delete(self, key: str) -> None:
+        self._client.delete(key)
+
+    def incr(self, key: str) -> int:
+        return int(self._client.incr(key))
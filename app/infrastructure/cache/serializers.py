@@ -0,0 +1,37 @@
+from typing import Any, Protocol
+
+import orjson
+import ormsgpack
+from pydantic import TypeAdapter
+
+
+class Serializer(Protocol):
+    def dumps(self, adapter: TypeAdapter, value: Any) -> bytes: ...
+
+    def loads(self, adapter: TypeAdapter, data: bytes) -> Any: ...
+
+
+class OrjsonSerializer:
+    """pydantic DTO → JSON 호환 dict → orjson 바이트"""
+
+    def dumps(self, adapter: TypeAdapter, value: Any) -> bytes:
+        return orjson.dumps(adapter.dump_python(value, mode="json"))
+
+    def loads(self, adapter: TypeAdapter, data: bytes) -> Any:
+        return adapter.validate_python(orjson.loads(data))
+
+
+class MsgpackSerializer:
+    """pydantic DTO → JSON 호환 dict → msgpack 바이트 (orjson 대비 크기 작음)"""
+
+    def dumps(self, adapter: TypeAdapter, value: Any) -> bytes:
+        return ormsgpack.packb(adapter.dump_python(value, mode="json"))
+
+    def loads(self, adapter: TypeAdapter, data: bytes) -> Any:
+        return adapter.validate_python(ormsgpack.unpackb(data))
+
+
+SERIALIZERS = {
+    "orjson": OrjsonSerializer,
+    "msgpack": MsgpackSerializer,
+}
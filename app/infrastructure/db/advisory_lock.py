@@ -0,0 +1,88 @@
+import logging
+from typing import Optional
+
+from sqlalchemy import text
+from sqlalchemy.engine import Connection, Engine
+
+logger = logging.getLogger(__name__)
+
+
+class AdvisoryLock:
+    """MySQL GET_LOCK 기반 노드 간 단일 실행 잠금 (리더 선출)
+
+    - 잠금은 전용 커넥션(풀에서 1개 점유, autocommit)에 묶여 있어 프로세스가 죽거나
+      커넥션이 끊기면 DB가 자동으로 해제 → 다른 노드가 이어받는다
+    - check()로 주기적으로 보유 여부를 확인 (커넥션 유휴 타임아웃 방지 겸용)
+    - MySQL이 아니면(로컬 SQLite 등) 단일 노드로 보고 항상 획득
+    """
+
+    def __init__(self, engine: Engine, name: str):
+        self.engine = engine
+        self.name = name
+        self._conn: Optional[Connection] = None
+        self._local = False
+
+    @property
+    def supported(self) -> bool:
+        return self.engine.dialect.name == "mysql"
+
+    @property
+    def held(self) -> bool:
+        return self._local or self._conn is not None
+
+    def acquire(self, timeout_seconds: int = 0) -> bool:
+        """잠금 획득 시도 (이미 보유 중이면 True)"""
+        if self.held:
+            return True
+        if not self.supported:
+            self._local = True
+            return True
+        conn = self.engine.connect().execution_options(isolation_level="AUTOCOMMIT")
+        try:
+            acquired = conn.execute(
+                text("SELECT GET_LOCK(:name, :timeout)"),
+                {"name": self.name, "timeout": timeout_seconds},
+            ).scalar()
+        except Exception:
+            conn.close()
+            raise
+        if acquired != 1:
+            conn.close()
+            return False
+        self._conn = conn
+        logger.info("advisory lock acquired: %s", self.name)
+        return True
+
+    def check(self) -> bool:
+        """아직 잠금을 보유 중인지 확인 (커넥션이 끊겼으면 보유 해제 처리)"""
+        if self._local:
+            return True
+        if self._conn is None:
+            return False
+        try:
+            owned = self._conn.execute(
+                text("SELECT IS_USED_LOCK(:name) = CONNECTION_ID()"), {"name": self.name}
+            ).scalar()
+        except Exception:
+            logger.warning("advisory lock connection lost: %s", self.name, exc_info=True)
+            owned = False
+        if not owned:
+            self._discard()
+        return bool(owned)
+
+    def release(self) -> None:
+        if self._conn is not None:
+            try:
+                self._conn.execute(text("SELECT RELEASE_LOCK(:name)"), {"name": self.name})
+            except Exception:
+                logger.warning("advisory lock release failed: %s", self.name, exc_info=True)
+            self._discard()
+        self._local = False
+
+    def _discard(self) -> None:
+        conn, self._conn = self._conn, None
+        if conn is not None:
+            try:
+                conn.close()
+            except Exception:
+                pass
@@ -1,6 +1,8 @@
-from typing import Callable
+from typing import Callable, Optional, TypeVar
 from sqlalchemy.orm import Session
-from app.db.session import SessionLocal
+from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker
+from starlette.concurrency import run_in_threadpool
+from app.db.session import SessionLocal, AsyncSessionLocal
 from app.repositories.product_read import ProductReadRepository
 from app.repositories.auction_read import AuctionReadRepository
 from app.repositories.auction_write import AuctionWriteRepository
@@ -8,25 +10,74 @@ from app.repositories.order_write import OrderWriteRepository
 from app.repositories.payment_write import PaymentWriteRepository
 from app.repositories.notification_write import NotificationWriteRepository
 from app.repositories.auction_deposit import AuctionDepositRepository
+from app.repositories.auction_stats import AuctionStatsRepository
+from app.repositories.product_images import ProductImageRepository
+from app.repositories.auction_admin_read import AuctionAdminReadRepository
+from app.repositories.auction_admin_write import AuctionAdminWriteRepository
+from app.repositories.product_admin_read import ProductAdminReadRepository
+from app.repositories.product_admin_write import ProductAdminWriteRepository
+from app.repositories.user_read import UserReadRepository
+from app.repositories.user_write import UserWriteRepository
+from app.repositories.user_auction_read import UserAuctionReadRepository
+from app.domains.common.tx import own_transaction
+from app.infrastructure.cache.app_cache import app_cache
+
+T = TypeVar("T")
+
+
+class _Repository:
+    """UoW 세션에 바인딩된 리포지토리를 처음 접근할 때 생성 (요청에서 쓰는 것만 만든다)"""
+
+    def __init__(self, factory: Callable[[Session], object]):
+        self.factory = factory
+
+    def __set_name__(self, owner, name: str) -> None:
+        self.name = name
+
+    def __get__(self, uow, owner=None):
+        if uow is None:
+            return self
+        repo = self.factory(uow.session)
+        uow.__dict__[self.name] = repo  # 이후 접근은 인스턴스 속성 (디스크립터 우회)
+        return repo
 
 
 class SqlAlchemyUnitOfWork:
-    """Unit of Work: manages a session and exposes repos bound to that session."""
+    """Unit of Work: 세션 1개 + 트랜잭션 1개를 소유하고 그 세션에 바인딩된 리포지토리를 제공
+
+    - 리포지토리는 처음 접근할 때 생성
+    - 서비스의 transactional 블록은 커밋 대신 flush → 정상 종료 시 한 번만 커밋, 예외 시 롤백
+    - 요청 단위로는 app.core.deps.get_uow 의존성으로 주입
+    """
+
+    products = _Repository(ProductReadRepository)
+    auctions_read = _Repository(AuctionReadRepository)
+    auctions_write = _Repository(AuctionWriteRepository)
+    auction_admin_read = _Repository(AuctionAdminReadRepository)
+    auction_admin_write = _Repository(AuctionAdminWriteRepository)
+    orders = _Repository(OrderWriteRepository)
+    payments = _Repository(PaymentWriteRepository)
+    notifications = _Repository(NotificationWriteRepository)
+    auction_deposits = _Repository(AuctionDepositRepository)
+    auction_stats = _Repository(AuctionStatsRepository)
+    product_images = _Repository(ProductImageRepository)
+    products_admin_read = _Repository(ProductAdminReadRepository)
+    products_admin_write = _Repository(ProductAdminWriteRepository)
+    users_read = _Repository(UserReadRepository)
+    users_write = _Repository(UserWriteRepository)
+    user_auctions_read = _Repository(UserAuctionReadRepository)
 
     def __init__(self, session_factory: Callable[[], Session] = SessionLocal):
         self._session_factory = session_factory
         self.session: Session | None = None
 
     def __enter__(self) -> "SqlAlchemyUnitOfWork":
+        # 이전 스코프에서 만든 리포지토리는 버림
+        for name, attr in vars(type(self)).items():
+            if isinstance(attr, _Repository):
+                self.__dict__.pop(name, None)
         self.session = self._session_factory()
-        # bind repositories
-        self.products = ProductReadRepository(self.session)
-        self.auctions_read = AuctionReadRepository(self.session)
-        self.auctions_write = AuctionWriteRepository(self.session)
-        self.orders = OrderWriteRepository(self.session)
-        self.payments = PaymentWriteRepository(self.session)
-        self.notifications = NotificationWriteRepository(self.session)
-        self.auction_deposits = AuctionDepositRepository(self.session)
+        own_transaction(self.session)
         return self
 
     def __exit__(self, exc_type, exc, tb):
@@ -44,3 +95,77 @@ class SqlAlchemyUnitOfWork:
 
     def rollback(self):
         self.session.rollback()
+
+
+class AsyncSqlAlchemyUnitOfWork:
+    """Async Unit of Work: 이벤트 루프를 막지 않고 리포지토리를 실행
+
+    - AsyncSession이 설정된 경우(DATABASE_ASYNC_URL): run_sync로 동기 리포지토리를
+      그대로 재사용하되 I/O는 async 드라이버로 처리
+    - 미설정 시: 동기 Session을 스레드풀에서 실행 (fallback)
+
+    - @cached 메서드 호출은 run_cached: 캐시 백엔드가 블로킹(redis)이면 run_sync가 도는
+      이벤트 루프 스레드 대신 스레드풀의 동기 세션에서 실행
+
+    사용 예)
+        async with AsyncSqlAlchemyUnitOfWork() as uow:
+            items = await uow.run_cached(lambda db: ProductService(db).ending_soon(...))
+    """
+
+    def __init__(
+        self,
+        session_factory: Optional[async_sessionmaker] = AsyncSessionLocal,
+        sync_session_factory: Callable[[], Session] = SessionLocal,
+    ):
+        self._session_factory = session_factory
+        self._sync_session_factory = sync_session_factory
+        self.session: AsyncSession | None = None
+        self.sync_session: Session | None = None
+
+    async def __aenter__(self) -> "AsyncSqlAlchemyUnitOfWork":
+        if self._session_factory is not None:
+            self.session = self._session_factory()
+        else:
+            self.sync_session = self._sync_session_factory()
+        return self
+
+    async def __aexit__(self, exc_type, exc, tb):
+        try:
+            if exc:
+                await self.rollback()
+            else:
+                await self.commit()
+        finally:
+            await self.close()
+
+    async def run(self, fn: Callable[[Session], T]) -> T:
+        """동기 Session을 받는 함수(리포지토리/서비스 호출)를 비동기로 실행"""
+        if self.session is not None:
+            return await self.session.run_sync(fn)
+        return await run_in_threadpool(fn, self.sync_session)
+
+    async def run_cached(self, fn: Callable[[Session], T]) -> T:
+        """캐시(app_cache)를 거치는 호출 실행 (캐시 I/O가 블로킹이면 스레드풀 + 동기 세션)"""
+        if self.session is not None and app_cache.blocking:
+            if self.sync_session is None:
+                self.sync_session = self._sync_session_factory()
+            return await run_in_threadpool(fn, self.sync_session)
+        return await self.run(fn)
+
+    async def commit(self):
+        if self.session is not None:
+            await self.session.commit()
+        if self.sync_session is not None:
+            await run_in_threadpool(self.sync_session.commit)
+
+    async def rollback(self):
+        if self.session is not None:
+            await self.session.rollback()
+        if self.sync_session is not None:
+            await run_in_threadpool(self.sync_session.rollback)
+
+    async def close(self):
+        if self.session is not None:
+            await self.session.close()
+        if self.sync_session is not None:
+            await run_in_threadpool(self.sync_session.close)
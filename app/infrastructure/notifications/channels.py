@@ -0,0 +1,115 @@
+import logging
+from typing import Any, Dict, List, Optional, Protocol
+
+from sqlalchemy import select
+from sqlalchemy.orm import Session
+
+from app.core.config import settings
+from app.repositories.notification_write import NotificationWriteRepository
+from app.schemas.users import User
+
+logger = logging.getLogger(__name__)
+
+INBOX = "INBOX"
+SMS = "SMS"
+PUSH = "PUSH"
+
+
+def _digits(phone: Optional[str]) -> str:
+    return "".join(ch for ch in phone or "" if ch.isdigit())
+
+
+class PartialDeliveryError(Exception):
+    """일부 수신자에게만 전달됨 — 같은 payload로 재시도하면 이미 받은 수신자에게 중복 발송
+
+    :param failed_user_ids: 전달 실패 수신자 (None이면 식별 불가 → 재시도하지 않음)
+    """
+
+    def __init__(self, message: str, failed_user_ids: Optional[List[int]] = None):
+        super().__init__(message)
+        self.failed_user_ids = failed_user_ids
+
+
+class NotificationChannel(Protocol):
+    """아웃박스 메시지 전달 채널 (실패 시 예외 → 디스패처가 재시도)"""
+
+    def deliver(self, session: Session, payload: Dict[str, Any]) -> None: ...
+
+
+class InboxChannel:
+    """앱 내 알림함(notification 테이블)에 수신자별 행 일괄 기록"""
+
+    def deliver(self, session: Session, payload: Dict[str, Any]) -> None:
+        NotificationWriteRepository(session).create_many(
+            user_ids=dict.fromkeys(payload["user_ids"]),
+            title=payload["title"],
+            body=payload.get("body") or "",
+            channel=payload.get("channel") or "PUSH",
+            product_id=payload.get("product_id"),
+        )
+
+
+class SmsChannel:
+    """solapi 문자 발송 (SMS_API_KEY 미설정 환경에서는 발송 생략)"""
+
+    def __init__(self, message_service=None):
+        self._message_service = message_service
+
+    def _service(self):
+        if self._message_service is None:
+            from solapi import SolapiMessageService
+
+            self._message_service = SolapiMessageService(
+                api_key=settings.SMS_API_KEY, api_secret=settings.SMS_API_SECRET
+            )
+        return self._message_service
+
+    def deliver(self, session: Session, payload: Dict[str, Any]) -> None:
+        if not settings.SMS_API_KEY and self._message_service is None:
+            return
+        recipients = session.execute(
+            select(User.id, User.phone_number).where(
+                User.id.in_(payload["user_ids"]),
+                User.phone_number.isnot(None),
+            )
+        ).all()
+        if not recipients:
+            return
+        from solapi.model import RequestMessage
+
+        text = payload["title"] if not payload.get("body") else f"{payload['title']}\n{payload['body']}"
+        messages = [
+            RequestMessage(from_=settings.SENDER_NUMBER, to=phone, text=text)
+            for _, phone in recipients
+        ]
+        # 전체 실패는 SDK가 예외 → 아무도 받지 않았으므로 디스패처가 그대로 재시도
+        response = self._service().send(messages)
+        failed_count = response.group_info.count.registered_failed
+        if failed_count > 0:
+            raise PartialDeliveryError(
+                f"SMS 발송 실패 {failed_count}건",
+                self._failed_user_ids(recipients, response.failed_message_list),
+            )
+
+    @staticmethod
+    def _failed_user_ids(recipients, failed_messages) -> Optional[List[int]]:
+        """실패 메시지의 수신 번호 → 수신자 ID (번호는 숫자만 비교)"""
+        if not failed_messages:
+            return None
+        failed_phones = {_digits(m.to) for m in failed_messages}
+        return [user_id for user_id, phone in recipients if _digits(phone) in failed_phones]
+
+
+class PushChannel:
+    """모바일 푸시 (스텁: 연동 전까지 로그만 남김)"""
+
+    def deliver(self, session: Session, payload: Dict[str, Any]) -> None:
+        logger.info(
+            "push notification: %d recipients, title=%s",
+            len(payload["user_ids"]),
+            payload["title"],
+        )
+
+
+def default_channels() -> Dict[str, NotificationChannel]:
+    return {INBOX: InboxChannel(), SMS: SmsChannel(), PUSH: PushChannel()}
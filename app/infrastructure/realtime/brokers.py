@@ -0,0 +1,100 @@
+import logging
+import threading
+from typing import Callable, Optional, Protocol
+
+logger = logging.getLogger(__name__)
+
+# 브로커가 수신한 메시지를 로컬 구독자에게 넘기는 콜백 (channel, data)
+Dispatch = Callable[[str, bytes], None]
+
+
+class EventBroker(Protocol):
+    """채널 단위 pub/sub 브로커 (프로세스 내 / Redis 프로토콜)"""
+
+    def attach(self, dispatch: Dispatch) -> None: ...
+
+    def publish(self, channel: str, data: bytes) -> None: ...
+
+    def start(self) -> None: ...
+
+    def stop(self) -> None: ...
+
+
+class InProcessBroker:
+    """같은 프로세스의 구독자에게만 전달 (워커가 하나이거나 테스트용)"""
+
+    def __init__(self):
+        self._dispatch: Optional[Dispatch] = None
+
+    def attach(self, dispatch: Dispatch) -> None:
+        self._dispatch = dispatch
+
+    def publish(self, channel: str, data: bytes) -> None:
+        if self._dispatch is not None:
+            self._dispatch(channel, data)
+
+    def start(self) -> None:
+        pass
+
+    def stop(self) -> None:
+        pass
+
+
+class RedisEventBroker:
+    """Redis pub/sub 브로커 — 모든 워커/배치 프로세스의 발행이 각 워커의 구독자에게 전달된다
+
+    구독(listener 스레드)은 첫 구독자가 생길 때 시작하므로 발행만 하는 배치 프로세스는
+    pub/sub 연결을 열지 않는다.
+    """
+
+    def __init__(self, client, *, prefix: str = "events"):
+        self._client = client
+        self._prefix = prefix
+        self._dispatch: Optional[Dispatch] = None
+        self._lock = threading.Lock()
+        self._pubsub = None
+        self._thread: Optional[threading.Thread] = None
+
+    @classmethod
+    def from_url(cls, url: str, *, prefix: str) -> "RedisEventBroker":
+        import redis  # optional dependency: REALTIME_BROKER=redis 일 때만 필요
+
+        return cls(redis.Redis.from_url(url, socket_timeout=0.5), prefix=f"{prefix}:events")
+
+    def attach(self, dispatch: Dispatch) -> None:
+        self._dispatch = dispatch
+
+    def publish(self, channel: str, data: bytes) -> None:
+        self._client.publish(f"{self._prefix}:{channel}", data)
+
+    def _on_message(self, message) -> None:
+        if self._dispatch is None:
+            return
+        name = message["channel"]
+        if isinstance(name, bytes):
+            name = name.decode()
+        self._dispatch(name[len(self._prefix) + 1 :], message["data"])
+
+    def start(self) -> None:
+        with self._lock:
+            if self._thread is not None:
+                return
+            self._pubsub = self._client.pubsub(ignore_subscribe_messages=True)
+            self._pubsub.psubscribe(**{f"{self._prefix}:*": self._on_message})
+            self._thread = self._pubsub.run_in_thread(
+                sleep_time=1.0, daemon=True, exception_handler=self._on_error
+            )
+
+    @staticmethod
+    def _on_error(exc, pubsub, thread) -> None:
+        # 연결 끊김 등: 로그만 남기고 redis-py가 다음 get_message에서 재연결
+        logger.warning("event broker listener error: %s", exc)
+
+    def stop(self) -> None:
+        with self._lock:
+            if self._thread is not None:
+                self._thread.stop()
+                self._thread = None
+            if self._pubsub is not None:
+                self._pubsub.close()
+                self._pubsub = None
@@ -0,0 +1,154 @@
+import asyncio
+import logging
+import threading
+from contextlib import asynccontextmanager
+from typing import AsyncIterator, Awaitable, Callable, Dict, List, Set
+
+from app.infrastructure.realtime.brokers import EventBroker
+
+logger = logging.getLogger(__name__)
+
+# SSE 주석 프레임 — 유휴 연결 유지/끊김 감지용
+HEARTBEAT = b": ping\n\n"
+
+
+class Subscription:
+    """구독자 1명의 수신 큐 (이벤트 루프 스레드에서만 접근)
+
+    느린 구독자는 큐가 가득 차면 가장 오래된 메시지를 버린다 (발행 측은 막히지 않음).
+    """
+
+    __slots__ = ("channel", "loop", "queue", "dropped")
+
+    def __init__(self, channel: str, loop: asyncio.AbstractEventLoop, maxsize: int):
+        self.channel = channel
+        self.loop = loop
+        self.queue: asyncio.Queue = asyncio.Queue(maxsize)
+        self.dropped = 0
+
+    def offer(self, data: bytes) -> None:
+        if self.queue.full():
+            self.queue.get_nowait()
+            self.dropped += 1
+        self.queue.put_nowait(data)
+
+    async def get(self) -> bytes:
+        return await self.queue.get()
+
+
+def _deliver(subscriptions: List[Subscription], data: bytes) -> None:
+    for sub in subscriptions:
+        sub.offer(data)
+
+
+class EventHub:
+    """채널별 로컬 구독자 관리 + 브로커 연결
+
+    - publish: 브로커로 발행 (동기 코드/다른 스레드에서 호출 가능)
+    - 브로커가 전달한 메시지는 구독자의 이벤트 루프별로 한 번만 call_soon_threadsafe 하여
+      루프 안에서 모든 구독자 큐에 넣는다 (구독자 수와 무관하게 스레드 간 호출은 루프당 1회)
+    - 메시지는 발행 시 한 번 인코딩된 bytes를 모든 구독자가 공유한다
+    - heartbeat는 루프별 타이머 하나가 유휴 구독자 큐에 HEARTBEAT를 넣는다
+      (구독자마다 타임아웃을 걸지 않으므로 유휴 구독자 비용은 큐 하나뿐)
+    """
+
+    def __init__(
+        self,
+        broker: EventBroker,
+        *,
+        queue_size: int = 64,
+        heartbeat_seconds: float = 15.0,
+    ):
+        self.broker = broker
+        self.queue_size = queue_size
+        self.heartbeat_seconds = heartbeat_seconds
+        self._lock = threading.Lock()
+        self._subscribers: Dict[str, Set[Subscription]] = {}
+        self._heartbeats: Dict[asyncio.AbstractEventLoop, asyncio.Task] = {}
+        self._published = 0
+        broker.attach(self.dispatch)
+
+    def publish(self, channel: str, data: bytes) -> None:
+        try:
+            self.broker.publish(channel, data)
+            self._published += 1
+        except Exception:
+            logger.warning("event publish failed: %s", channel, exc_info=True)
+
+    def dispatch(self, channel: str, data: bytes) -> None:
+        with self._lock:
+            subs = self._subscribers.get(channel)
+            if not subs:
+                return
+            by_loop: Dict[asyncio.AbstractEventLoop, List[Subscription]] = {}
+            for sub in subs:
+                by_loop.setdefault(sub.loop, []).append(sub)
+        for loop, group in by_loop.items():
+            try:
+                loop.call_soon_threadsafe(_deliver, group, data)
+            except RuntimeError:
+                # 종료된 루프의 구독자 (서버 종료 중)
+                pass
+
+    def _loop_subscriptions(self, loop: asyncio.AbstractEventLoop) -> List[Subscription]:
+        with self._lock:
+            return [s for subs in self._subscribers.values() for s in subs if s.loop is loop]
+
+    async def _heartbeat(self, loop: asyncio.AbstractEventLoop) -> None:
+        while True:
+            await asyncio.sleep(self.heartbeat_seconds)
+            subs = self._loop_subscriptions(loop)
+            if not subs:
+                self._heartbeats.pop(loop, None)
+                return
+            for sub in subs:
+                if sub.queue.empty():
+                    sub.queue.put_nowait(HEARTBEAT)
+
+    @asynccontextmanager
+    async def subscribe(self, channel: str) -> AsyncIterator[Subscription]:
+        loop = asyncio.get_running_loop()
+        sub = Subscription(channel, loop, self.queue_size)
+        with self._lock:
+            self._subscribers.setdefault(channel, set()).add(sub)
+        if loop not in self._heartbeats:
+            self._heartbeats[loop] = loop.create_task(self._heartbeat(loop))
+        self.broker.start()
+        try:
+            yield sub
+        finally:
+            with self._lock:
+                subs = self._subscribers.get(channel)
+                if subs is not None:
+                    subs.discard(sub)
+                    if not subs:
+                        del self._subscribers[channel]
+
+    def stats(self) -> dict:
+        with self._lock:
+            return {
+                "broker": type(self.broker).__name__,
+                "channels": len(self._subscribers),
+                "subscribers": sum(len(s) for s in self._subscribers.values()),
+                "published": self._published,
+            }
+
+
+async def sse_stream(
+    hub: EventHub,
+    channel: str,
+    *,
+    is_disconnected: Callable[[], Awaitable[bool]],
+    retry_ms: int = 3000,
+) -> AsyncIterator[bytes]:
+    """채널 구독을 Server-Sent Events 바이트 스트림으로 변환
+
+    이벤트가 없으면 hub의 heartbeat 주석(": ping")을 보내 프록시 유휴 타임아웃과 끊긴 연결을 감지한다.
+    """
+    async with hub.subscribe(channel) as sub:
+        yield f"retry: {retry_ms}\n\n".encode()
+        while True:
+            data = await sub.get()
+            if data is HEARTBEAT and await is_disconnected():
+                return
+            yield data
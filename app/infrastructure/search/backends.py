@@ -0,0 +1,144 @@
+from enum import Enum
+from typing import List, NamedTuple, Optional, Protocol, Sequence, Tuple
+
+from sqlalchemy import case, false, or_
+from sqlalchemy.dialects.mysql import match as mysql_match
+
+from app.infrastructure.search.ngram_index import NGRAM_SIZE, NgramIndex, normalize_words
+from app.schemas.products import Product
+from app.schemas.stores import PopupStore
+
+
+class SearchField(str, Enum):
+    NAME = "name"
+    SUMMARY = "summary"
+    DESCRIPTION = "description"
+    STORE = "store"  # 스토어명 — select에 PopupStore join 필요
+
+
+# 관련도 가중치 (메모리 색인 점수용)
+FIELD_WEIGHTS = {
+    SearchField.NAME: 3.0,
+    SearchField.STORE: 2.0,
+    SearchField.SUMMARY: 1.5,
+    SearchField.DESCRIPTION: 1.0,
+}
+
+
+def _column(field: SearchField):
+    return {
+        SearchField.NAME: Product.name,
+        SearchField.SUMMARY: Product.summary,
+        SearchField.DESCRIPTION: Product.description,
+        SearchField.STORE: PopupStore.name,
+    }[field]
+
+
+class SearchMatch(NamedTuple):
+    """select에 붙일 검색 조건과 관련도 식 (관련도 정렬을 지원하지 않으면 relevance=None)"""
+
+    where: object
+    relevance: Optional[object] = None
+
+
+class SearchBackend(Protocol):
+    """상품 키워드 검색 (like / fulltext / memory)"""
+
+    name: str
+
+    def match(self, q: str, fields: Sequence[SearchField]) -> SearchMatch: ...
+
+
+class LikeSearchBackend:
+    """LIKE '%q%' — 색인을 쓰지 못하므로 전체 스캔 (기본값/폴백)"""
+
+    name = "like"
+
+    def match(self, q: str, fields: Sequence[SearchField]) -> SearchMatch:
+        like = f"%{q}%"
+        return SearchMatch(or_(*(_column(f).like(like) for f in fields)))
+
+
+_like = LikeSearchBackend()
+
+
+class FullTextSearchBackend:
+    """MySQL FULLTEXT(ngram parser) 색인 검색
+
+    MATCH의 컬럼 목록은 FULLTEXT 색인과 정확히 같아야 하므로 색인이 있는 조합만 사용한다:
+      product(name, summary, description) / product(name) / popup_store(name)
+    다른 조합이거나 bigram보다 짧은 단어가 있으면 LIKE로 폴백.
+    """
+
+    name = "fulltext"
+
+    _PRODUCT_GROUPS = (
+        (SearchField.NAME, SearchField.SUMMARY, SearchField.DESCRIPTION),
+        (SearchField.NAME,),
+    )
+
+    @staticmethod
+    def boolean_query(q: str) -> Optional[str]:
+        """단어별 필수 구문('+"단어"') — 짧은 단어가 있으면 None"""
+        words = normalize_words(q)
+        if not words or any(len(w) < NGRAM_SIZE for w in words):
+            return None
+        return " ".join(f'+"{w}"' for w in words)
+
+    def match(self, q: str, fields: Sequence[SearchField]) -> SearchMatch:
+        against = self.boolean_query(q)
+        product_fields = tuple(f for f in FIELD_WEIGHTS if f in fields and f != SearchField.STORE)
+        if against is None or (product_fields and product_fields not in self._PRODUCT_GROUPS):
+            return _like.match(q, fields)
+        exprs = []
+        if product_fields:
+            exprs.append(
+                mysql_match(*(_column(f) for f in product_fields), against=against).in_boolean_mode()
+            )
+        if SearchField.STORE in fields:
+            exprs.append(mysql_match(PopupStore.name, against=against).in_boolean_mode())
+        relevance = exprs[0]
+        for expr in exprs[1:]:
+            relevance = relevance + expr
+        return SearchMatch(or_(*exprs), relevance)
+
+
+class InMemorySearchBackend:
+    """프로세스 로컬 bigram 역색인 — 관련도 상위 max_results개 상품 ID로 조건을 만든다
+
+    색인이 준비되기 전에는 LIKE로 폴백. 색인 적재/갱신은 ProductSearch가 담당.
+    """
+
+    name = "memory"
+
+    def __init__(self, *, max_results: int = 1000):
+        self.max_results = max_results
+        self.index: Optional[NgramIndex] = None
+        self._last = None
+
+    @staticmethod
+    def new_index() -> NgramIndex:
+        return NgramIndex({f.value: w for f, w in FIELD_WEIGHTS.items()})
+
+    def search(self, q: str, fields: Sequence[SearchField]) -> List[Tuple[int, float]]:
+        # 같은 요청에서 필터/관련도 정렬이 같은 검색을 반복하므로 색인이 바뀌기 전까지 결과 재사용
+        index = self.index
+        key = (id(index), index.version, q, tuple(fields))
+        cached = self._last
+        if cached is not None and cached[0] == key:
+            return cached[1]
+        hits = index.search(q, [f.value for f in fields], limit=self.max_results)
+        self._last = (key, hits)
+        return hits
+
+    def match(self, q: str, fields: Sequence[SearchField]) -> SearchMatch:
+        if self.index is None:
+            return _like.match(q, fields)
+        hits = self.search(q, fields)
+        if not hits:
+            return SearchMatch(false())
+        scores = dict(hits)
+        return SearchMatch(
+            Product.id.in_(list(scores)),
+            case(scores, value=Product.id, else_=0.0),
+        )
@@ -0,0 +1,181 @@
+import heapq
+import math
+import re
+import threading
+import unicodedata
+from array import array
+from bisect import bisect_left
+from typing import Dict, Iterable, List, Mapping, Optional, Sequence, Set, Tuple
+
+# MySQL ngram parser 기본값(ngram_token_size=2)과 같은 bigram
+NGRAM_SIZE = 2
+_SPLIT = re.compile(r"[\W_]+")
+
+
+def normalize_words(text: Optional[str]) -> List[str]:
+    """NFKC + 소문자화 후 단어 단위로 분리 (공백/구두점 기준)"""
+    if not text:
+        return []
+    return [w for w in _SPLIT.split(unicodedata.normalize("NFKC", text).lower()) if w]
+
+
+def word_terms(word: str) -> List[str]:
+    """단어의 색인 term — bigram, bigram보다 짧은 단어는 단어 자체"""
+    if len(word) < NGRAM_SIZE:
+        return [word]
+    return [word[i : i + NGRAM_SIZE] for i in range(len(word) - NGRAM_SIZE + 1)]
+
+
+def _intersect(postings: List[Sequence[int]]) -> Set[int]:
+    """정렬된 posting 목록들의 교집합 — 짧은 목록 기준으로 긴 목록은 이분 탐색"""
+    postings = sorted(postings, key=len)
+    result = set(postings[0])
+    for other in postings[1:]:
+        if not result:
+            break
+        if len(result) * 16 < len(other):
+            n = len(other)
+            result = {
+                d for d in result if (i := bisect_left(other, d)) < n and other[i] == d
+            }
+        else:
+            result.intersection_update(other)
+    return result
+
+
+class NgramIndex:
+    """필드별 bigram 역색인 (순수 파이썬, 프로세스 로컬)
+
+    - posting은 내부 문서 번호의 array('I') — 문서는 항상 뒤에 추가되므로 정렬이 유지된다
+    - 수정/삭제는 기존 문서 번호를 무효화(tombstone)하고 새 번호로 다시 추가.
+      dead_ratio가 커지면 호출자가 전체 재색인으로 압축한다
+    - 검색: 질의의 모든 단어가 (요청 필드 중 어느 하나에) 포함된 문서.
+      점수 = Σ 단어 × 일치 필드 (필드 가중치 × idf), 동점이면 최근 색인된 문서 우선
+    """
+
+    def __init__(self, weights: Mapping[str, float]):
+        self.weights = dict(weights)
+        self._postings: Dict[str, Dict[str, array]] = {f: {} for f in self.weights}
+        # 1글자 질의용: 글자 → 그 글자를 포함하는 term
+        self._char_terms: Dict[str, Dict[str, Set[str]]] = {f: {} for f in self.weights}
+        self._keys = array("q")  # 내부 번호 → 외부 키 (삭제 시 -1)
+        self._fingerprints = array("q")
+        self._docs: Dict[int, int] = {}  # 외부 키 → 내부 번호
+        self._dead: Set[int] = set()  # 무효화된 내부 번호
+        self._lock = threading.Lock()
+        self.version = 0
+
+    def __len__(self) -> int:
+        return len(self._docs)
+
+    @property
+    def dead_ratio(self) -> float:
+        total = len(self._keys)
+        return (total - len(self._docs)) / total if total else 0.0
+
+    def add(self, key: int, texts: Mapping[str, Optional[str]]) -> bool:
+        """문서 추가/교체 (내용이 같으면 무시)
+
+        :return: 색인이 바뀌었으면 True
+        """
+        fingerprint = hash(tuple(texts.get(f) for f in self.weights))
+        with self._lock:
+            doc = self._docs.get(key)
+            if doc is not None:
+                if self._fingerprints[doc] == fingerprint:
+                    return False
+                self._keys[doc] = -1
+                self._dead.add(doc)
+            doc = len(self._keys)
+            self._keys.append(key)
+            self._fingerprints.append(fingerprint)
+            self._docs[key] = doc
+            self.version += 1
+            for field in self.weights:
+                postings = self._postings[field]
+                terms = {t for w in normalize_words(texts.get(field)) for t in word_terms(w)}
+                for term in terms:
+                    posting = postings.get(term)
+                    if posting is None:
+                        posting = postings[term] = array("I")
+                        for ch in set(term):
+                            self._char_terms[field].setdefault(ch, set()).add(term)
+                    posting.append(doc)
+            return True
+
+    def remove(self, key: int) -> None:
+        with self._lock:
+            doc = self._docs.pop(key, None)
+            if doc is not None:
+                self._keys[doc] = -1
+                self._dead.add(doc)
+                self.version += 1
+
+    def _word_docs(self, field: str, word: str) -> Set[int]:
+        postings = self._postings[field]
+        if len(word) < NGRAM_SIZE:
+            # 1글자: 그 글자를 포함하는 모든 term의 합집합
+            docs: Set[int] = set()
+            for term in self._char_terms[field].get(word, ()):
+                docs.update(postings[term])
+            return docs
+        lists = []
+        for term in set(word_terms(word)):
+            posting = postings.get(term)
+            if posting is None:
+                return set()
+            lists.append(posting)
+        return _intersect(lists)
+
+    def search(
+        self, query: str, fields: Iterable[str], *, limit: int
+    ) -> List[Tuple[int, float]]:
+        """관련도 상위 limit개 (외부 키, 점수)"""
+        words = list(dict.fromkeys(normalize_words(query)))
+        fields = [f for f in fields if f in self.weights]
+        if not words or not fields:
+            return []
+        total = max(len(self._keys), 1)
+        parts: List[Tuple[Set[int], float]] = []
+        matched: Optional[Set[int]] = None
+        for word in words:
+            word_docs: Set[int] = set()
+            for field in fields:
+                docs = self._word_docs(field, word)
+                if docs:
+                    idf = math.log(1 + total / len(docs))
+                    parts.append((docs, self.weights[field] * idf))
+                    word_docs |= docs
+            matched = word_docs if matched is None else matched & word_docs
+            if not matched:
+                return []
+        # 문서별 합산 대신 (단어, 필드) 일치 조합별로 집합을 나눠 같은 점수 그룹을 만든다
+        groups: List[Tuple[float, Set[int]]] = [(0.0, matched - self._dead)]
+        for docs, weight in parts:
+            split: List[Tuple[float, Set[int]]] = []
+            for score, group in groups:
+                inside = group & docs
+                if inside:
+                    split.append((score + weight, inside))
+                if len(inside) < len(group):
+                    split.append((score, group - inside))
+            groups = split
+        groups.sort(key=lambda g: g[0], reverse=True)
+        keys = self._keys
+        hits: List[Tuple[int, float]] = []
+        for score, group in groups:
+            need = limit - len(hits)
+            if need <= 0:
+                break
+            ranked = heapq.nlargest(need, group) if len(group) > need else sorted(group, reverse=True)
+            score = round(score, 4)
+            hits.extend((keys[d], score) for d in ranked)
+        return hits
+
+    def stats(self) -> dict:
+        return {
+            "documents": len(self._docs),
+            "dead_ratio": round(self.dead_ratio, 3),
+            "terms": sum(len(p) for p in self._postings.values()),
+            "postings": sum(len(a) for p in self._postings.values() for a in p.values()),
+        }
@@ -1,10 +1,16 @@
+from contextlib import asynccontextmanager
+
 from fastapi import FastAPI
 from fastapi.middleware.cors import CORSMiddleware
 
 from app.core.config import settings
 from app.api.v1.router import api_router
 from app.api.admin.v1.router import admin_api_router
-from app.db.session import Base, engine
+from app.db.query_stats import QueryStatsMiddleware
+from app.db.session import Base, SessionLocal, engine
+from app.batch.scheduler import auction_scheduler
+from app.domains.auctions.hot_state import hot_auctions
+from app.domains.products.search import product_search
 from app.core.errors import (
     business_error_handler,
     internal_error_handler,
@@ -19,15 +25,41 @@ from app.schemas.auctions import (
     Bid,
     AuctionOffer,
     AuctionDeposit,
+    AuctionStats,
 )  # noqa: F401
 
-# Create tables on startup (MVP convenience; migrate later with Alembic)
-Base.metadata.create_all(bind=engine)
+# Create missing tables on startup (MVP convenience). 기존 테이블의 컬럼/색인은 Alembic 리비전으로 관리
+if settings.DB_CREATE_ALL:
+    Base.metadata.create_all(bind=engine)
+
+
+
+@asynccontextmanager
+async def lifespan(_app: FastAPI):
+    # 핫 경매 상태: DB 기준 적재 후 주기적으로 재적재 (HOT_AUCTION_BACKEND=off면 no-op)
+    hot_auctions.start(SessionLocal, settings.HOT_AUCTION_REFRESH_SECONDS)
+    # 검색 색인: SEARCH_BACKEND=memory일 때만 적재/증분 반영
+    product_search.start(SessionLocal, settings.SEARCH_REFRESH_SECONDS)
+    # 경매 시작/정산 스케줄러: 별도 프로세스(python -m app.batch) 대신 앱에서 돌릴 때만
+    if settings.SCHEDULER_ENABLED:
+        auction_scheduler.start()
+    yield
+    auction_scheduler.stop()
+    product_search.stop()
+    hot_auctions.stop()
+
 
-app = FastAPI(title=settings.PROJECT_NAME, version=settings.VERSION)
+app = FastAPI(title=settings.PROJECT_NAME, version=settings.VERSION, lifespan=lifespan)
 app.add_exception_handler(BusinessError, business_error_handler)
 app.add_exception_handler(Exception, internal_error_handler)
 
+# 요청별 SQL 문 수/DB 시간 → Server-Timing 헤더 + 로그 (임계값 초과 시 WARNING)
+if settings.QUERY_STATS_ENABLED:
+    app.add_middleware(
+        QueryStatsMiddleware,
+        warn_count=settings.QUERY_STATS_WARN_COUNT,
+        slow_ms=settings.QUERY_STATS_SLOW_MS,
+    )
 app.add_middleware(
     CORSMiddleware,
     allow_origins=settings.CORS_ORIGINS,
@@ -1,14 +1,22 @@
-from typing import List, Optional, Tuple
+from typing import Dict, List, Optional, Tuple
 from sqlalchemy.orm import Session
-from sqlalchemy import select, func, desc, and_, or_, exists
+from sqlalchemy import select, func, desc, and_, exists, case
 from app.core.timezone import utc_to_kst
 from app.schemas.auctions import Auction, Bid
-from app.schemas.products import Product, ProductImage
+from app.schemas.products import Product
 from app.schemas.stores import PopupStore
 from app.schemas.orders import Order, OrderItem, Shipment
 from app.schemas.payments import Payment
 from app.domains.auctions.admin_dto import AdminAuctionListItem, AdminAuctionDetail
 from app.domains.auctions.enums import PaymentStatusKo, ShipmentStatusKo
+from app.repositories.auction_stats import (
+    highest_bid_col,
+    bidder_count_col,
+    join_auction_stats,
+)
+from app.repositories.paging import fetch_page
+from app.repositories.product_images import rep_image_col
+from app.domains.products.search import SearchField, product_search
 
 
 class AuctionAdminReadRepository:
@@ -16,92 +24,105 @@ class AuctionAdminReadRepository:
         self.db = db
 
     def _rep_image_subq(self):
-        return (
-            select(ProductImage.image_url)
-            .where(ProductImage.product_id == Product.id)
-            .order_by(ProductImage.sort_order.asc())
-            .limit(1)
-            .correlate(Product)
-            .scalar_subquery()
-        )
-
-    def _highest_bid_subq(self):
-        return (
-            select(func.max(Bid.amount)).where(Bid.auction_id == Auction.id).correlate(Auction).scalar_subquery()
-        )
-
-    def _bidder_count_subq(self):
-        return (
-            select(func.count(func.distinct(Bid.user_id))).where(Bid.auction_id == Auction.id).correlate(Auction).scalar_subquery()
-        )
+        return rep_image_col()
 
     def _exists_bid_subq(self):
         return exists(select(Bid.id).where(Bid.auction_id == Auction.id)).correlate(Auction)
 
-    def _derive_payment_status(self):
-        # Map Payment.status -> ko
-        # CASE WHEN exists paid for product -> 확인, when exists refunded -> 취소, else 대기
-        paid_exists = (
-            select(func.count(Payment.id))
-            .where(
-                Payment.status == "PAID",
-                Payment.user_id == Order.user_id,
-                OrderItem.order_id == Order.id,
-                OrderItem.product_id == Product.id,
-            )
-            .correlate(Product, Order, OrderItem, Payment)
-            .scalar_subquery()
-        )
-        refunded_exists = (
-            select(func.count(Payment.id))
-            .where(
-                Payment.status == "REFUNDED",
-                Payment.user_id == Order.user_id,
-                OrderItem.order_id == Order.id,
-                OrderItem.product_id == Product.id,
-            )
-            .correlate(Product, Order, OrderItem, Payment)
-            .scalar_subquery()
-        )
-        return func.case(
-            (paid_exists > 0, PaymentStatusKo.CONFIRMED.value),
-            (refunded_exists > 0, PaymentStatusKo.CANCELED.value),
-            else_=PaymentStatusKo.PENDING.value,
-        )
+    # 상품별 주문/결제/배송 여부 — 목록/상세의 결제·배송 상태 판정과 필터에 함께 사용
+    # (결제는 해당 상품 주문자의 결제 기준)
+    @staticmethod
+    def _payment_exists(status: str):
+        return exists(
+            select(Payment.id)
+            .join(Order, Order.user_id == Payment.user_id)
+            .join(OrderItem, OrderItem.order_id == Order.id)
+            .where(OrderItem.product_id == Product.id, Payment.status == status)
+        ).correlate(Product)
+
+    @staticmethod
+    def _shipment_exists(reached):
+        return exists(
+            select(Shipment.id)
+            .join(OrderItem, OrderItem.order_id == Shipment.order_id)
+            .where(OrderItem.product_id == Product.id, reached.isnot(None))
+        ).correlate(Product)
+
+    @staticmethod
+    def _order_exists():
+        return exists(
+            select(OrderItem.id)
+            .join(Order, Order.id == OrderItem.order_id)
+            .where(OrderItem.product_id == Product.id)
+        ).correlate(Product)
+
+    def _payment_status_filter(self, value: str):
+        paid = self._payment_exists("PAID")
+        refunded = self._payment_exists("REFUNDED")
+        return {
+            PaymentStatusKo.CONFIRMED: paid,
+            PaymentStatusKo.CANCELED: and_(~paid, refunded),
+            PaymentStatusKo.PENDING: and_(~paid, ~refunded),
+        }[PaymentStatusKo(value)]
+
+    def _shipment_status_filter(self, value: str):
+        delivered = self._shipment_exists(Shipment.delivered_at)
+        shipped = self._shipment_exists(Shipment.shipped_at)
+        ordered = self._order_exists()
+        return {
+            ShipmentStatusKo.COMPLETED: delivered,
+            ShipmentStatusKo.INQUIRY: and_(~delivered, shipped),
+            ShipmentStatusKo.PROCESSING: and_(~delivered, ~shipped, ordered),
+            ShipmentStatusKo.WAITING: ~ordered,
+        }[ShipmentStatusKo(value)]
 
-    def _derive_shipment_status(self):
-        # shipment for the order item product
-        # if exists delivered -> 완료, else if shipped -> 조회, else if order exists -> 처리, else 대기
-        shipped_exists = (
-            select(func.count(Shipment.id))
-            .where(
-                Shipment.order_id == Order.id,
-                Shipment.shipped_at.isnot(None),
+    def _fulfillment_statuses(self, product_ids: List[int]) -> Dict[int, Tuple[str, str]]:
+        """상품별 (결제 상태, 배송 상태)를 한 번의 grouped 쿼리로 계산
+
+        주문이 없는 상품은 (대기, 대기)
+        """
+        statuses = {
+            pid: (PaymentStatusKo.PENDING.value, ShipmentStatusKo.WAITING.value)
+            for pid in product_ids
+        }
+        if not product_ids:
+            return statuses
+
+        def flag(cond):
+            return func.max(case((cond, 1), else_=0))
+
+        rows = self.db.execute(
+            select(
+                OrderItem.product_id,
+                flag(Payment.status == "PAID").label("paid"),
+                flag(Payment.status == "REFUNDED").label("refunded"),
+                flag(Shipment.delivered_at.isnot(None)).label("delivered"),
+                flag(Shipment.shipped_at.isnot(None)).label("shipped"),
             )
-            .correlate(Order, Shipment)
-            .scalar_subquery()
-        )
-        delivered_exists = (
-            select(func.count(Shipment.id))
-            .where(
-                Shipment.order_id == Order.id,
-                Shipment.delivered_at.isnot(None),
+            .join(Order, Order.id == OrderItem.order_id)
+            .outerjoin(Shipment, Shipment.order_id == Order.id)
+            .outerjoin(
+                Payment,
+                and_(Payment.user_id == Order.user_id, Payment.status.in_(("PAID", "REFUNDED"))),
             )
-            .correlate(Order, Shipment)
-            .scalar_subquery()
-        )
-        order_exists = (
-            select(func.count(Order.id))
-            .where(Order.id == OrderItem.order_id, OrderItem.product_id == Product.id)
-            .correlate(Order, OrderItem, Product)
-            .scalar_subquery()
-        )
-        return func.case(
-            (delivered_exists > 0, ShipmentStatusKo.COMPLETED.value),
-            (shipped_exists > 0, ShipmentStatusKo.INQUIRY.value),
-            (order_exists > 0, ShipmentStatusKo.PROCESSING.value),
-            else_=ShipmentStatusKo.WAITING.value,
-        )
+            .where(OrderItem.product_id.in_(product_ids))
+            .group_by(OrderItem.product_id)
+        ).all()
+        for r in rows:
+            if r.paid:
+                payment_ko = PaymentStatusKo.CONFIRMED.value
+            elif r.refunded:
+                payment_ko = PaymentStatusKo.CANCELED.value
+            else:
+                payment_ko = PaymentStatusKo.PENDING.value
+            if r.delivered:
+                shipment_ko = ShipmentStatusKo.COMPLETED.value
+            elif r.shipped:
+                shipment_ko = ShipmentStatusKo.INQUIRY.value
+            else:
+                shipment_ko = ShipmentStatusKo.PROCESSING.value
+            statuses[int(r.product_id)] = (payment_ko, shipment_ko)
+        return statuses
 
     def list_auctions(
         self,
@@ -121,9 +142,8 @@ class AuctionAdminReadRepository:
         ends_to: Optional[str],
         sort: str,
     ) -> Tuple[List[AdminAuctionListItem], int]:
-        rep = self._rep_image_subq()
-        highest = self._highest_bid_subq()
-        bidders = self._bidder_count_subq()
+        highest = highest_bid_col()
+        bidders = bidder_count_col()
         any_bid = self._exists_bid_subq()
 
         stmt = (
@@ -138,14 +158,15 @@ class AuctionAdminReadRepository:
                 Auction.status,
                 highest.label("current_highest_bid"),
                 bidders.label("bidder_count"),
+                any_bid.label("has_bid"),
             )
             .join(Product, Product.id == Auction.product_id)
         )
+        stmt = join_auction_stats(stmt)
 
         # filters
         if q:
-            like = f"%{q}%"
-            stmt = stmt.where(or_(Product.name.like(like)))
+            stmt = stmt.where(product_search.match(q, (SearchField.NAME,)).where)
         if product_id:
             stmt = stmt.where(Product.id == product_id)
         if store_name:
@@ -159,6 +180,10 @@ class AuctionAdminReadRepository:
                 stmt = stmt.where(and_(Auction.status == "ENDED", any_bid))
             elif result == "LOST":
                 stmt = stmt.where(and_(Auction.status == "ENDED", ~any_bid))
+        if payment_status and payment_status != "ALL":
+            stmt = stmt.where(self._payment_status_filter(payment_status))
+        if shipment_status and shipment_status != "ALL":
+            stmt = stmt.where(self._shipment_status_filter(shipment_status))
         if starts_from:
             stmt = stmt.where(Auction.starts_at >= starts_from)
         if starts_to:
@@ -179,77 +204,13 @@ class AuctionAdminReadRepository:
         else:
             stmt = stmt.order_by(Auction.starts_at.desc())
 
-        # 필터링된 total을 위해 기존 stmt를 이용해 count stmt 생성
-        count_stmt = stmt.with_only_columns(func.count(Auction.id))
-        items_rows = self.db.execute(stmt.limit(size).offset((page - 1) * size)).all()
-        total = int(self.db.execute(count_stmt).scalar_one())
+        # 행 + 필터링된 total을 한 번에 조회, 결제/배송 상태는 페이지 상품 단위로 일괄 계산
+        page_rows = fetch_page(self.db, stmt, limit=size, offset=(page - 1) * size)
+        statuses = self._fulfillment_statuses([int(r.product_id) for r in page_rows.rows])
 
-        # compute statuses per row lazily (simplify for now)
         result_items: List[AdminAuctionListItem] = []
-        for r in items_rows:
-            # derive statuses with simplified rules via separate queries if needed
-            # Payment: check any PAID payment for this product
-            paid = (
-                self.db.execute(
-                    select(func.count(Payment.id))
-                    .join(Order, Order.user_id == Payment.user_id)
-                    .join(OrderItem, OrderItem.order_id == Order.id)
-                    .where(OrderItem.product_id == r.product_id, Payment.status == "PAID")
-                ).scalar_one()
-                > 0
-            )
-            refunded = (
-                self.db.execute(
-                    select(func.count(Payment.id))
-                    .join(Order, Order.user_id == Payment.user_id)
-                    .join(OrderItem, OrderItem.order_id == Order.id)
-                    .where(OrderItem.product_id == r.product_id, Payment.status == "REFUNDED")
-                ).scalar_one()
-                > 0
-            )
-            if paid:
-                payment_ko = PaymentStatusKo.CONFIRMED.value
-            elif refunded:
-                payment_ko = PaymentStatusKo.CANCELED.value
-            else:
-                payment_ko = PaymentStatusKo.PENDING.value
-
-            # Shipment
-            delivered = (
-                self.db.execute(
-                    select(func.count(Shipment.id))
-                    .join(Order, Order.id == Shipment.order_id)
-                    .join(OrderItem, OrderItem.order_id == Order.id)
-                    .where(OrderItem.product_id == r.product_id, Shipment.delivered_at.isnot(None))
-                ).scalar_one()
-                > 0
-            )
-            shipped = (
-                self.db.execute(
-                    select(func.count(Shipment.id))
-                    .join(Order, Order.id == Shipment.order_id)
-                    .join(OrderItem, OrderItem.order_id == Order.id)
-                    .where(OrderItem.product_id == r.product_id, Shipment.shipped_at.isnot(None))
-                ).scalar_one()
-                > 0
-            )
-            order_exists = (
-                self.db.execute(
-                    select(func.count(Order.id))
-                    .join(OrderItem, OrderItem.order_id == Order.id)
-                    .where(OrderItem.product_id == r.product_id)
-                ).scalar_one()
-                > 0
-            )
-            if delivered:
-                shipment_ko = ShipmentStatusKo.COMPLETED.value
-            elif shipped:
-                shipment_ko = ShipmentStatusKo.INQUIRY.value
-            elif order_exists:
-                shipment_ko = ShipmentStatusKo.PROCESSING.value
-            else:
-                shipment_ko = ShipmentStatusKo.WAITING.value
-
+        for r in page_rows.rows:
+            payment_ko, shipment_ko = statuses[int(r.product_id)]
             result_items.append(
                 AdminAuctionListItem(
                     auction_id=int(r.auction_id),
@@ -262,16 +223,14 @@ class AuctionAdminReadRepository:
                     status=str(r.status),
                     payment_status=payment_ko,
                     shipment_status=shipment_ko,
-                    is_won=(str(r.status) == "ENDED" and (
-                        self.db.execute(select(func.count(Bid.id)).where(Bid.auction_id == r.auction_id)).scalar_one() > 0
-                    )),
+                    is_won=str(r.status) == "ENDED" and bool(r.has_bid),
                 )
             )
-        return result_items, total
+        return result_items, int(page_rows.total)
 
     def get_auction_detail(self, auction_id: int) -> Optional[AdminAuctionDetail]:
-        highest = self._highest_bid_subq()
-        bidders = self._bidder_count_subq()
+        highest = highest_bid_col()
+        bidders = bidder_count_col()
         rep = self._rep_image_subq()
         stmt = (
             select(
@@ -289,75 +248,18 @@ class AuctionAdminReadRepository:
                 Auction.status,
                 highest.label("current_highest_bid"),
                 bidders.label("bidder_count"),
+                self._exists_bid_subq().label("has_bid"),
             )
             .join(Product, Product.id == Auction.product_id)
             .join(PopupStore, PopupStore.id == Product.popup_store_id)
             .where(Auction.id == auction_id)
         )
+        stmt = join_auction_stats(stmt)
         r = self.db.execute(stmt).first()
         if not r:
             return None
 
-        # derive statuses same as above
-        paid = (
-            self.db.execute(
-                select(func.count(Payment.id))
-                .join(Order, Order.user_id == Payment.user_id)
-                .join(OrderItem, OrderItem.order_id == Order.id)
-                .where(OrderItem.product_id == r.product_id, Payment.status == "PAID")
-            ).scalar_one()
-            > 0
-        )
-        refunded = (
-            self.db.execute(
-                select(func.count(Payment.id))
-                .join(Order, Order.user_id == Payment.user_id)
-                .join(OrderItem, OrderItem.order_id == Order.id)
-                .where(OrderItem.product_id == r.product_id, Payment.status == "REFUNDED")
-            ).scalar_one()
-            > 0
-        )
-        if paid:
-            payment_ko = PaymentStatusKo.CONFIRMED.value
-        elif refunded:
-            payment_ko = PaymentStatusKo.CANCELED.value
-        else:
-            payment_ko = PaymentStatusKo.PENDING.value
-
-        delivered = (
-            self.db.execute(
-                select(func.count(Shipment.id))
-                .join(Order, Order.id == Shipment.order_id)
-                .join(OrderItem, OrderItem.order_id == Order.id)
-                .where(OrderItem.product_id == r.product_id, Shipment.delivered_at.isnot(None))
-            ).scalar_one()
-            > 0
-        )
-        shipped = (
-            self.db.execute(
-                select(func.count(Shipment.id))
-                .join(Order, Order.id == Shipment.order_id)
-                .join(OrderItem, OrderItem.order_id == Order.id)
-                .where(OrderItem.product_id == r.product_id, Shipment.shipped_at.isnot(None))
-            ).scalar_one()
-            > 0
-        )
-        order_exists = (
-            self.db.execute(
-                select(func.count(Order.id))
-                .join(OrderItem, OrderItem.order_id == Order.id)
-                .where(OrderItem.product_id == r.product_id)
-            ).scalar_one()
-            > 0
-        )
-        if delivered:
-            shipment_ko = ShipmentStatusKo.COMPLETED.value
-        elif shipped:
-            shipment_ko = ShipmentStatusKo.INQUIRY.value
-        elif order_exists:
-            shipment_ko = ShipmentStatusKo.PROCESSING.value
-        else:
-            shipment_ko = ShipmentStatusKo.WAITING.value
+        payment_ko, shipment_ko = self._fulfillment_statuses([int(r.product_id)])[int(r.product_id)]
 
         return AdminAuctionDetail(
             auction_id=int(r.auction_id),
@@ -376,9 +278,7 @@ class AuctionAdminReadRepository:
             bidder_count=int(r.bidder_count),
             payment_status=payment_ko,
             shipment_status=shipment_ko,
-            is_won=(str(r.status) == "ENDED" and (
-                self.db.execute(select(func.count(Bid.id)).where(Bid.auction_id == r.auction_id)).scalar_one() > 0
-            )),
+            is_won=str(r.status) == "ENDED" and bool(r.has_bid),
         )
 
 
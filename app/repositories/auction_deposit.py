@@ -1,5 +1,6 @@
+from typing import List
 from sqlalchemy.orm import Session
-from sqlalchemy import select
+from sqlalchemy import select, update
 from app.schemas.auctions import AuctionDeposit
 
 
@@ -31,6 +32,27 @@ class AuctionDepositRepository:
         stmt = select(AuctionDeposit).where(AuctionDeposit.auction_id == auction_id)
         return [row[0] for row in self.db.execute(stmt)]
 
+    def list_refundable_by_auctions(self, auction_ids: List[int]) -> List[AuctionDeposit]:
+        """여러 경매의 환불 가능 보증금 (결제 완료 + 미환불)"""
+        if not auction_ids:
+            return []
+        stmt = select(AuctionDeposit).where(
+            AuctionDeposit.auction_id.in_(auction_ids),
+            AuctionDeposit.status != "REFUNDED",
+            AuctionDeposit.payment_id.isnot(None),
+        )
+        return list(self.db.execute(stmt).scalars())
+
+    def mark_refunded_many(self, deposit_ids: List[int]) -> None:
+        if not deposit_ids:
+            return
+        self.db.execute(
+            update(AuctionDeposit)
+            .where(AuctionDeposit.id.in_(deposit_ids))
+            .values(status="REFUNDED")
+            .execution_options(synchronize_session=False)
+        )
+
     def mark_refunded(self, deposit_id: int):
         rec = self.db.get(AuctionDeposit, deposit_id)
         if rec:
@@ -1,8 +1,10 @@
-from typing import List, Tuple, Optional
+from datetime import datetime
+from typing import Dict, List, Tuple, Optional
 from sqlalchemy.orm import Session
-from sqlalchemy import select, func, desc, and_, distinct, or_
-from app.schemas.auctions import Auction, Bid
-from app.schemas.products import Product, ProductImage
+from sqlalchemy import select, func, desc, and_, distinct
+from app.schemas.auctions import Auction, AuctionStats, Bid
+from app.domains.auctions.enums import AuctionStatus
+from app.schemas.products import Product
 from app.schemas.stores import PopupStore
 from app.schemas.users import User
 from app.domains.auctions.mappers import row_to_auction_info, rows_to_bid_items
@@ -10,65 +12,150 @@ from app.domains.auctions.auction_info import AuctionInfo
 from app.domains.auctions.bid_item import BidItem
 from app.domains.products.mappers import rows_to_product_items
 from app.domains.products.product_list_item import ProductListItem
+from app.infrastructure.cache.app_cache import AUCTION_INFO, cached
+from app.repositories.paging import SortKey, fetch_page
+from app.repositories.product_images import rep_image_col
+from app.repositories.product_read import product_sort_keys
+from app.domains.products.search import PRODUCT_TEXT_FIELDS, product_search
+from app.repositories.auction_stats import (
+    highest_bid_col,
+    bidder_count_col,
+    join_auction_stats,
+)
+
+
+def _auction_info_select(*extra_columns):
+    return select(
+        Auction.id,
+        Auction.buy_now_price,
+        highest_bid_col().label("current_highest_bid"),
+        Auction.status,
+        Auction.starts_at,
+        Auction.ends_at,
+        Auction.start_price,
+        Auction.min_bid_price,
+        Auction.deposit_amount,
+        bidder_count_col().label("bidder_count"),
+        *extra_columns,
+    )
 
 
 class AuctionReadRepository:
     def __init__(self, db: Session):
         self.db = db
 
-    def highest_bid_amount_subq(self, auction_id_subq=None):
-        from sqlalchemy import select, func
-
-        q = select(func.max(Bid.amount))
-        if auction_id_subq is not None:
-            q = q.where(Bid.auction_id == auction_id_subq)
-        return q.scalar_subquery()
-
-    def bidder_count_subq(self, auction_id_subq=None):
-        from sqlalchemy import select, func
+    @cached(AUCTION_INFO, "auction_info")
+    def get_auction_info_by_product(self, product_id: int) -> AuctionInfo | None:
+        return self.load_auction_info_by_product(product_id)
 
-        q = select(func.count(func.distinct(Bid.user_id)))
-        if auction_id_subq is not None:
-            q = q.where(Bid.auction_id == auction_id_subq)
-        return q.scalar_subquery()
+    def load_auction_info_by_product(
+        self, product_id: int, *, for_update: bool = False
+    ) -> AuctionInfo | None:
+        """캐시를 거치지 않는 경매 정보 조회 (입찰 검증 등 정합성이 필요한 경로)
 
-    def get_auction_info_by_product(self, product_id: int) -> AuctionInfo | None:
-        highest = self.highest_bid_amount_subq(Auction.id)
-        bidders = self.bidder_count_subq(Auction.id)
-        stmt = select(
-            Auction.id,
-            Auction.buy_now_price,
-            highest.label("current_highest_bid"),
-            Auction.status,
-            Auction.starts_at,
-            Auction.ends_at,
-            Auction.start_price,
-            Auction.min_bid_price,
-            Auction.deposit_amount,
-            bidders.label("bidder_count"),
-        ).where(Auction.product_id == product_id)
+        for_update=True: 잠금 읽기로 스냅샷과 무관하게 최신 커밋된 최고가를 읽는다
+        """
+        stmt = join_auction_stats(_auction_info_select()).where(
+            Auction.product_id == product_id
+        )
+        if for_update:
+            stmt = stmt.with_for_update()
         row = self.db.execute(stmt).first()
         return row_to_auction_info(row) if row else None
 
+    def list_hot_auction_rows(
+        self, *, ends_after: datetime, ends_before: datetime, limit: int
+    ) -> List:
+        """종료가 임박한 RUNNING 경매의 경매 정보 행 (핫 상태 적재용, 종료 임박 순)
+
+        row_to_auction_info 컬럼 + product_id, ends_at_utc(시간대 변환 전 종료 시각), bid_count
+        """
+        stmt = join_auction_stats(
+            _auction_info_select(
+                Auction.product_id,
+                Auction.ends_at.label("ends_at_utc"),
+                func.coalesce(AuctionStats.bid_count, 0).label("bid_count"),
+            )
+        ).where(
+            Auction.status == AuctionStatus.RUNNING.value,
+            Auction.ends_at > ends_after,
+            Auction.ends_at <= ends_before,
+        )
+        return self.db.execute(
+            stmt.order_by(Auction.ends_at.asc(), Auction.id.asc()).limit(limit)
+        ).all()
+
+    def list_pending_transitions(
+        self, *, until: datetime, limit: int
+    ) -> List[Tuple[datetime, str, int]]:
+        """until까지 시작/종료 시각이 오는 경매 (스케줄러 힙 적재용, 이미 지난 시각 포함)
+
+        SCHEDULED는 starts_at, RUNNING은 ends_at 기준 — (status, 시각) 복합 색인 범위 조회 2회
+        :return: (시각, 현재 상태, 경매 ID) 시각 순
+        """
+        starting = self.db.execute(
+            select(Auction.starts_at, Auction.status, Auction.id)
+            .where(
+                Auction.status == AuctionStatus.SCHEDULED.value,
+                Auction.starts_at <= until,
+            )
+            .order_by(Auction.starts_at.asc())
+            .limit(limit)
+        ).all()
+        ending = self.db.execute(
+            select(Auction.ends_at, Auction.status, Auction.id)
+            .where(
+                Auction.status == AuctionStatus.RUNNING.value,
+                Auction.ends_at <= until,
+            )
+            .order_by(Auction.ends_at.asc())
+            .limit(limit)
+        ).all()
+        return sorted(tuple(row) for row in starting + ending)[:limit]
+
+    def list_bidder_ids_by_auctions(self, auction_ids: List[int]) -> Dict[int, List[int]]:
+        """경매별 입찰자 사용자 ID 목록 (한 번의 조회)"""
+        result: Dict[int, List[int]] = {auction_id: [] for auction_id in auction_ids}
+        if not auction_ids:
+            return result
+        rows = self.db.execute(
+            select(Bid.auction_id, Bid.user_id)
+            .where(Bid.auction_id.in_(auction_ids))
+            .distinct()
+        ).all()
+        for auction_id, user_id in rows:
+            result[int(auction_id)].append(int(user_id))
+        return result
+
     def list_bids_by_product(
-        self, product_id: int, limit: int = 3, offset: int = 0
-    ) -> Tuple[List[BidItem], int]:
+        self,
+        product_id: int,
+        limit: int = 3,
+        offset: int = 0,
+        *,
+        cursor: Optional[str] = None,
+    ) -> Tuple[List[BidItem], Optional[int], bool, Optional[str]]:
         stmt = (
             select(Bid.user_id, Bid.amount, Bid.created_at, User.nickname, User.profile_image_url)
             .join(User, User.id == Bid.user_id)
             .join(Auction, Auction.id == Bid.auction_id)
             .where(Auction.product_id == product_id)
-            .order_by(Bid.created_at.desc())
-            .limit(limit)
-            .offset(offset)
         )
-        rows = self.db.execute(stmt)
-        total = self.db.execute(
-            select(func.count(Bid.id))
-            .join(Auction, Auction.id == Bid.auction_id)
-            .where(Auction.product_id == product_id)
-        ).scalar_one()
-        return rows_to_bid_items(rows), int(total)
+        page_rows = fetch_page(
+            self.db,
+            stmt,
+            limit=limit,
+            offset=offset,
+            order_by=[SortKey(Bid.created_at, True), SortKey(Bid.id, True)],
+            cursor=cursor,
+            cursor_scope=f"bids:{product_id}",
+        )
+        return (
+            rows_to_bid_items(page_rows.rows),
+            page_rows.total,
+            page_rows.has_next,
+            page_rows.next_cursor,
+        )
 
     def similar_products_in_same_store(
         self,
@@ -83,27 +170,12 @@ class AuctionReadRepository:
         price_max: Optional[float] = None,
         sort: str = "latest",
         q: Optional[str] = None,
-    ) -> Tuple[List[ProductListItem], int]:
-        rep_img = (
-            select(ProductImage.image_url)
-            .where(ProductImage.product_id == Product.id)
-            .order_by(ProductImage.sort_order.asc())
-            .limit(1)
-            .correlate(Product)
-            .scalar_subquery()
-        )
-        highest_bid = (
-            select(func.max(Bid.amount))
-            .where(Bid.auction_id == Auction.id)
-            .correlate(Auction)
-            .scalar_subquery()
-        )
-        bidder_count = (
-            select(func.count(func.distinct(Bid.user_id)))
-            .where(Bid.auction_id == Auction.id)
-            .correlate(Auction)
-            .scalar_subquery()
-        )
+        with_total: bool = True,
+        cursor: Optional[str] = None,
+    ) -> Tuple[List[ProductListItem], Optional[int], bool, Optional[str]]:
+        rep_img = rep_image_col()
+        highest_bid = highest_bid_col()
+        bidder_count = bidder_count_col()
         stmt_store = select(Product.popup_store_id).where(Product.id == product_id)
         store_id = self.db.execute(stmt_store).scalar_one()
 
@@ -120,12 +192,7 @@ class AuctionReadRepository:
                 elif status == "ENDED":
                     stmt = stmt.where(Auction.status == "ENDED")
             # bidders
-            bc = (
-                select(func.count(func.distinct(Bid.user_id)))
-                .where(Bid.auction_id == Auction.id)
-                .correlate(Auction)
-                .scalar_subquery()
-            )
+            bc = bidder_count
             if bidders and bidders != "ALL":
                 if bidders == "LE_10":
                     stmt = stmt.where(bc <= 10)
@@ -156,14 +223,7 @@ class AuctionReadRepository:
                     stmt = stmt.where(price_expr < price_max)
             # keyword q
             if q:
-                like = f"%{q}%"
-                stmt = stmt.where(
-                    or_(
-                        Product.name.like(like),
-                        Product.summary.like(like),
-                        Product.description.like(like),
-                    )
-                )
+                stmt = stmt.where(product_search.match(q, PRODUCT_TEXT_FIELDS).where)
             return stmt
 
         stmt = (
@@ -181,28 +241,25 @@ class AuctionReadRepository:
             .join(PopupStore, PopupStore.id == Product.popup_store_id)
             .join(Auction, Auction.product_id == Product.id)
         )
-        stmt = apply_filters(stmt)
-        if sort == "recommended":
-            price_expr = func.coalesce(highest_bid, Auction.start_price)
-            stmt = stmt.order_by(desc(price_expr))
-        elif sort == "popular":
-            stmt = stmt.order_by(desc(bidder_count))
-        elif sort == "ending":
-            stmt = stmt.order_by(Auction.ends_at.asc())
-        else:
-            stmt = stmt.order_by(Product.created_at.desc())
-        stmt = stmt.limit(limit).offset(offset)
-
-        rows = self.db.execute(stmt)
-
-        count_stmt = (
-            select(func.count(Product.id))
-            .join(Auction, Auction.product_id == Product.id)
-            .where(Product.popup_store_id == store_id, Product.id != product_id)
+        stmt = apply_filters(join_auction_stats(stmt))
+        page_rows = fetch_page(
+            self.db,
+            stmt,
+            limit=limit,
+            offset=offset,
+            with_total=with_total,
+            order_by=product_sort_keys(
+                sort, highest_bid, bidder_count, q=q, search_fields=PRODUCT_TEXT_FIELDS
+            ),
+            cursor=cursor,
+            cursor_scope=f"similar:{product_id}:{sort}",
+        )
+        return (
+            rows_to_product_items(page_rows.rows),
+            page_rows.total,
+            page_rows.has_next,
+            page_rows.next_cursor,
         )
-        count_stmt = apply_filters(count_stmt)
-        total = self.db.execute(count_stmt).scalar_one()
-        return rows_to_product_items(rows), int(total)
 
     def get_bid_by_auction_and_user(self, auction_id: int, user_id: int) -> Bid | None:
         stmt = select(Bid).where(Bid.auction_id == auction_id, Bid.user_id == user_id)
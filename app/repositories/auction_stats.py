@@ -0,0 +1,102 @@
+from typing import Iterable, Optional
+from sqlalchemy.orm import Session
+from sqlalchemy import select, func, delete, insert
+from sqlalchemy.dialects.mysql import insert as mysql_insert
+from sqlalchemy.dialects.sqlite import insert as sqlite_insert
+from app.schemas.auctions import Auction, AuctionStats, Bid
+
+
+def highest_bid_col():
+    """auction_stats 기준 현재 최고 입찰가 (입찰이 없으면 NULL)"""
+    return AuctionStats.current_highest_bid
+
+
+def bidder_count_col():
+    """auction_stats 기준 입찰자 수 (집계 행이 없으면 0)"""
+    return func.coalesce(AuctionStats.bidder_count, 0)
+
+
+def join_auction_stats(stmt):
+    """Auction이 포함된 select에 auction_stats를 outer join"""
+    return stmt.outerjoin(AuctionStats, AuctionStats.auction_id == Auction.id)
+
+
+class AuctionStatsRepository:
+    def __init__(self, db: Session):
+        self.db = db
+
+    def apply_bid(
+        self, *, auction_id: int, amount: float, is_new_bidder: bool
+    ) -> AuctionStats:
+        """신규 입찰을 집계에 반영 (호출자 트랜잭션 안에서 실행)
+
+        첫 입찰이 동시에 들어와도 중복 키 에러가 나지 않도록 행 생성/누적을 upsert 한 문장으로 처리
+        """
+        dialect = self.db.get_bind().dialect.name
+        values = dict(
+            auction_id=auction_id,
+            current_highest_bid=amount,
+            bidder_count=1 if is_new_bidder else 0,
+            bid_count=1,
+            last_bid_at=func.now(),
+        )
+        if dialect == "mysql":
+            stmt = mysql_insert(AuctionStats).values(**values)
+            new, greatest = stmt.inserted, func.greatest
+        else:
+            stmt = sqlite_insert(AuctionStats).values(**values)
+            new, greatest = stmt.excluded, func.max
+        changes = dict(
+            current_highest_bid=greatest(
+                func.coalesce(AuctionStats.current_highest_bid, new.current_highest_bid),
+                new.current_highest_bid,
+            ),
+            bidder_count=AuctionStats.bidder_count + new.bidder_count,
+            bid_count=AuctionStats.bid_count + 1,
+            last_bid_at=new.last_bid_at,
+            # upsert의 UPDATE 절에는 onupdate가 적용되지 않음
+            updated_at=func.now(),
+        )
+        if dialect == "mysql":
+            stmt = stmt.on_duplicate_key_update(**changes)
+        else:
+            stmt = stmt.on_conflict_do_update(
+                index_elements=[AuctionStats.auction_id], set_=changes
+            )
+        self.db.execute(stmt)
+        return self.db.get(AuctionStats, auction_id, populate_existing=True)
+
+    def reconcile(self, auction_ids: Optional[Iterable[int]] = None) -> int:
+        """bid 테이블로부터 집계를 다시 계산 (백필/정합성 복구용)
+
+        :param auction_ids: 대상 경매 ID 목록. None이면 전체
+        :return: 재계산된 집계 행 수
+        """
+        ids = list(auction_ids) if auction_ids is not None else None
+        if ids is not None and not ids:
+            return 0
+        agg = select(
+            Bid.auction_id,
+            func.max(Bid.amount),
+            func.count(func.distinct(Bid.user_id)),
+            func.count(Bid.id),
+            func.max(Bid.created_at),
+        ).group_by(Bid.auction_id)
+        purge = delete(AuctionStats)
+        if ids is not None:
+            agg = agg.where(Bid.auction_id.in_(ids))
+            purge = purge.where(AuctionStats.auction_id.in_(ids))
+        self.db.execute(purge)
+        result = self.db.execute(
+            insert(AuctionStats).from_select(
+                [
+                    AuctionStats.auction_id,
+                    AuctionStats.current_highest_bid,
+                    AuctionStats.bidder_count,
+                    AuctionStats.bid_count,
+                    AuctionStats.last_bid_at,
+                ],
+                agg,
+            )
+        )
+        return int(result.rowcount or 0)
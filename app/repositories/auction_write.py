@@ -1,6 +1,25 @@
+from datetime import datetime
+from typing import Dict, List, NamedTuple, Optional
 from sqlalchemy.orm import Session
-from sqlalchemy import select, func
+from sqlalchemy import select, func, update
+from app.domains.auctions.enums import AuctionStatus
 from app.schemas.auctions import Auction, Bid
+from app.schemas.products import Product
+from app.repositories.auction_stats import AuctionStatsRepository
+from app.infrastructure.cache.app_cache import (
+    LISTING,
+    invalidate_after_commit,
+    invalidate_auction_info_after_commit,
+)
+
+
+class PlacedBid(NamedTuple):
+    """place_bid 결과 (flush 시점 값 — 재조회 없이 이벤트/응답 구성)"""
+
+    id: int
+    bid_order: int
+    amount: float
+    bidder_count: int
 
 
 class AuctionWriteRepository:
@@ -19,15 +38,145 @@ class AuctionWriteRepository:
             select(Auction).where(Auction.id == auction_id)
         ).scalar_one_or_none()
 
-    def place_bid(self, auction_id: int, user_id: int, amount: float) -> Bid:
-        last_order = self.db.execute(
-            select(func.max(Bid.bid_order)).where(Bid.auction_id == auction_id)
-        ).scalar_one()
+    def lock_auction(self, auction_id: int) -> Auction | None:
+        """경매 행 배타 잠금 (SELECT ... FOR UPDATE)
+
+        같은 경매의 입찰 검증~기록을 트랜잭션 종료까지 직렬화한다.
+        """
+        return self.db.execute(
+            select(Auction)
+            .where(Auction.id == auction_id)
+            .with_for_update()
+            .execution_options(populate_existing=True)
+        ).scalar_one_or_none()
+
+    def claim_due_for_settlement(self, *, now: datetime, limit: int) -> List:
+        """종료 시각이 지난 RUNNING 경매를 행 잠금으로 선점 (정산 청크)
+
+        SKIP LOCKED로 다른 정산 워커가 잡은 경매는 건너뛴다. 잠금은 호출자 트랜잭션 종료 시 해제.
+        :return: (id, product_id, product_name) 행, 종료 시각 순
+        """
+        stmt = (
+            select(Auction.id, Auction.product_id, Product.name.label("product_name"))
+            .join(Product, Product.id == Auction.product_id)
+            .where(
+                Auction.status == AuctionStatus.RUNNING.value,
+                Auction.ends_at <= now,
+            )
+            .order_by(Auction.ends_at.asc(), Auction.id.asc())
+            .limit(limit)
+            .with_for_update(of=Auction, skip_locked=True)
+        )
+        return self.db.execute(stmt).all()
+
+    def winning_bids(self, auction_ids: List[int]) -> Dict[int, object]:
+        """경매별 낙찰 입찰 (최고가, 동액이면 나중 입찰) — 한 번의 조회
+
+        :return: {auction_id: (auction_id, user_id, amount) 행}, 입찰 없는 경매는 제외
+        """
+        if not auction_ids:
+            return {}
+        ranked = (
+            select(
+                Bid.auction_id,
+                Bid.user_id,
+                Bid.amount,
+                func.row_number()
+                .over(
+                    partition_by=Bid.auction_id,
+                    order_by=(Bid.amount.desc(), Bid.created_at.desc()),
+                )
+                .label("rn"),
+            )
+            .where(Bid.auction_id.in_(auction_ids))
+            .subquery()
+        )
+        rows = self.db.execute(
+            select(ranked.c.auction_id, ranked.c.user_id, ranked.c.amount).where(
+                ranked.c.rn == 1
+            )
+        ).all()
+        return {int(row.auction_id): row for row in rows}
+
+    def claim_due_to_start(self, *, now: datetime, limit: int) -> List:
+        """시작 시각이 된 SCHEDULED 경매를 행 잠금으로 선점 (시작 청크)
+
+        SKIP LOCKED로 다른 워커가 잡은 경매는 건너뛴다. 잠금은 호출자 트랜잭션 종료 시 해제.
+        :return: (id, product_id, ends_at) 행, 시작 시각 순
+        """
+        stmt = (
+            select(Auction.id, Auction.product_id, Auction.ends_at)
+            .where(
+                Auction.status == AuctionStatus.SCHEDULED.value,
+                Auction.starts_at <= now,
+            )
+            .order_by(Auction.starts_at.asc(), Auction.id.asc())
+            .limit(limit)
+            .with_for_update(skip_locked=True)
+        )
+        return self.db.execute(stmt).all()
+
+    def transition_status(
+        self, auction_ids: List[int], *, from_status: AuctionStatus, to_status: AuctionStatus
+    ) -> int:
+        """from_status인 경매만 to_status로 일괄 전환 (이미 전환된 경매는 건너뜀)"""
+        if not auction_ids:
+            return 0
+        return self.db.execute(
+            update(Auction)
+            .where(
+                Auction.id.in_(auction_ids),
+                Auction.status == from_status.value,
+            )
+            .values(status=to_status.value)
+            .execution_options(synchronize_session=False)
+        ).rowcount
+
+    def get_last_bid(self, auction_id: int):
+        """가장 최근 입찰의 (bid_order, user_id) — 입찰 금액은 순번 기준 단조 증가하므로 최고가 입찰"""
+        return self.db.execute(
+            select(Bid.bid_order, Bid.user_id)
+            .where(Bid.auction_id == auction_id)
+            .order_by(Bid.bid_order.desc())
+            .limit(1)
+        ).first()
+
+    def place_bid(
+        self,
+        auction_id: int,
+        user_id: int,
+        amount: float,
+        *,
+        last_order: Optional[int] = None,
+        is_new_bidder: Optional[bool] = None,
+    ) -> PlacedBid:
+        """입찰 기록 (호출자가 lock_auction으로 경매 행을 잠근 트랜잭션 안에서 호출)
+
+        :param last_order: 호출자가 이미 조회한 마지막 입찰 순번 (없으면 여기서 조회)
+        :param is_new_bidder: 호출자가 이미 확인한 첫 입찰 여부 (없으면 여기서 조회)
+        """
+        if is_new_bidder is None:
+            is_new_bidder = not self.user_has_bid(auction_id, user_id)
+        if last_order is None:
+            last_order = self.db.execute(
+                select(func.max(Bid.bid_order)).where(Bid.auction_id == auction_id)
+            ).scalar_one()
         next_order = (last_order or 0) + 1
         bid = Bid(
             auction_id=auction_id, user_id=user_id, amount=amount, bid_order=next_order
         )
         self.db.add(bid)
-        self.db.commit()
-        self.db.refresh(bid)
-        return bid
+        # 집계(auction_stats)는 입찰과 같은 트랜잭션에서 갱신
+        stats = AuctionStatsRepository(self.db).apply_bid(
+            auction_id=auction_id, amount=amount, is_new_bidder=is_new_bidder
+        )
+        auction = self.db.get(Auction, auction_id)
+        invalidate_after_commit(self.db, LISTING)
+        invalidate_auction_info_after_commit(self.db, auction.product_id)
+        self.db.flush()
+        return PlacedBid(
+            id=bid.id,
+            bid_order=next_order,
+            amount=float(amount),
+            bidder_count=int(stats.bidder_count),
+        )
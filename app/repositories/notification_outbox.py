@@ -0,0 +1,123 @@
+from datetime import datetime, timedelta
+from typing import Any, Dict, List
+from sqlalchemy import insert, select, update, func
+from sqlalchemy.orm import Session
+from app.schemas.notifications import NotificationOutbox
+
+
+class NotificationOutboxRepository:
+    def __init__(self, db: Session):
+        self.db = db
+
+    def enqueue(self, *, channel: str, payload: Dict[str, Any]) -> NotificationOutbox:
+        """아웃박스 메시지 적재 (호출자 트랜잭션과 함께 커밋)"""
+        row = NotificationOutbox(
+            channel=channel,
+            payload=payload,
+            status="PENDING",
+            attempts=0,
+            available_at=datetime.utcnow(),
+        )
+        self.db.add(row)
+        self.db.flush()
+        return row
+
+    def enqueue_many(self, *, channel: str, payloads: List[Dict[str, Any]]) -> None:
+        """여러 메시지를 일괄 INSERT로 적재 (호출자 트랜잭션과 함께 커밋)"""
+        if not payloads:
+            return
+        now = datetime.utcnow()
+        self.db.execute(
+            insert(NotificationOutbox),
+            [
+                {
+                    "channel": channel,
+                    "payload": payload,
+                    "status": "PENDING",
+                    "attempts": 0,
+                    "available_at": now,
+                }
+                for payload in payloads
+            ],
+        )
+
+    def claim_batch(self, *, limit: int, lease_seconds: float) -> List[int]:
+        """전달 가능한 메시지를 IN_FLIGHT로 임대 선점하고 ID 반환
+
+        SKIP LOCKED로 다른 디스패처가 선점 중인 행은 건너뛰고, 선점 직후 커밋하면 행 잠금은 풀리지만
+        임대(available_at = 지금 + lease_seconds)가 끝날 때까지 다른 디스패처가 다시 잡지 않는다.
+        결과를 기록하지 못한 채 임대가 끝난 IN_FLIGHT(워커 중단/커밋 실패)는 다시 선점된다.
+        """
+        now = datetime.utcnow()
+        stmt = (
+            select(NotificationOutbox)
+            .where(
+                NotificationOutbox.status.in_(("PENDING", "IN_FLIGHT")),
+                NotificationOutbox.available_at <= now,
+            )
+            .order_by(NotificationOutbox.id.asc())
+            .limit(limit)
+            .with_for_update(skip_locked=True)
+        )
+        rows = list(self.db.execute(stmt).scalars())
+        lease_until = now + timedelta(seconds=lease_seconds)
+        for row in rows:
+            row.status = "IN_FLIGHT"
+            row.available_at = lease_until
+        self.db.flush()
+        return [int(row.id) for row in rows]
+
+    def get_in_flight(self, outbox_id: int) -> NotificationOutbox | None:
+        """임대 중인 메시지 (이미 결과가 기록됐거나 다른 디스패처가 다시 선점해 처리했으면 None)"""
+        row = self.db.get(NotificationOutbox, outbox_id)
+        return row if row is not None and row.status == "IN_FLIGHT" else None
+
+    def mark_sent(self, ids: List[int]) -> None:
+        if not ids:
+            return
+        self.db.execute(
+            update(NotificationOutbox)
+            .where(NotificationOutbox.id.in_(ids))
+            .values(status="SENT", sent_at=datetime.utcnow(), last_error=None)
+        )
+
+    def mark_retry(
+        self, row: NotificationOutbox, *, error: str, delay_seconds: float, max_attempts: int
+    ) -> None:
+        """실패 기록: 재시도 한도 내면 available_at을 뒤로 미루고, 초과 시 FAILED"""
+        row.attempts = (row.attempts or 0) + 1
+        row.last_error = error[:1024]
+        if row.attempts >= max_attempts:
+            row.status = "FAILED"
+        else:
+            row.status = "PENDING"
+            row.available_at = datetime.utcnow() + timedelta(seconds=delay_seconds)
+
+    def mark_partial(
+        self,
+        row: NotificationOutbox,
+        *,
+        error: str,
+        failed_user_ids: List[int] | None,
+        delay_seconds: float,
+        max_attempts: int,
+    ) -> None:
+        """일부 수신자만 전달된 메시지: 실패한 수신자로 payload를 좁혀 재시도
+
+        실패 수신자를 알 수 없으면 중복 발송을 막기 위해 재시도하지 않고 FAILED로 남긴다.
+        """
+        if not failed_user_ids:
+            row.attempts = (row.attempts or 0) + 1
+            row.last_error = error[:1024]
+            row.status = "FAILED"
+            return
+        row.payload = {**row.payload, "user_ids": failed_user_ids}
+        self.mark_retry(row, error=error, delay_seconds=delay_seconds, max_attempts=max_attempts)
+
+    def count_by_status(self) -> Dict[str, int]:
+        rows = self.db.execute(
+            select(NotificationOutbox.status, func.count(NotificationOutbox.id)).group_by(
+                NotificationOutbox.status
+            )
+        ).all()
+        return {str(status): int(count) for status, count in rows}
@@ -1,21 +1,32 @@
-from typing import List
+from typing import List, Optional, Tuple
 from sqlalchemy.orm import Session
-from sqlalchemy import select, desc, func
+from sqlalchemy import select, func
 from app.schemas.notifications import Notification
+from app.repositories.paging import SortKey, fetch_page
 
 
 class NotificationReadRepository:
     def __init__(self, db: Session):
         self.db = db
 
-    def list_by_user(self, *, user_id: int, limit: int = 50) -> List[Notification]:
-        stmt = (
-            select(Notification)
-            .where(Notification.user_id == user_id)
-            .order_by(desc(Notification.sent_at))
-            .limit(limit)
+    def list_by_user(
+        self, *, user_id: int, limit: int = 50, cursor: Optional[str] = None
+    ) -> Tuple[List[Notification], Optional[str]]:
+        """최신순 알림 목록과 다음 페이지 커서 (sent_at desc, id desc)"""
+        stmt = select(Notification).where(Notification.user_id == user_id)
+        page_rows = fetch_page(
+            self.db,
+            stmt,
+            limit=limit,
+            with_total=False,
+            order_by=[
+                SortKey(Notification.sent_at, True),
+                SortKey(Notification.id, True),
+            ],
+            cursor=cursor,
+            cursor_scope=f"notifications:{user_id}",
         )
-        return [row[0] for row in self.db.execute(stmt).all()]
+        return [row[0] for row in page_rows.rows], page_rows.next_cursor
 
     def count_unread_by_user(self, *, user_id: int) -> int:
         stmt = select(func.count(Notification.id)).where(
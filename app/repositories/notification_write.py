@@ -1,3 +1,5 @@
+from typing import Iterable, List
+from sqlalchemy import insert
 from sqlalchemy.orm import Session
 from app.schemas.notifications import Notification
 
@@ -9,10 +11,39 @@ class NotificationWriteRepository:
     def create(
         self, *, user_id: int | None, title: str, body: str, channel: str = "PUSH", product_id: int | None = None
     ) -> Notification:
+        """알림 1건 생성 (커밋은 호출자 트랜잭션에서)"""
         n = Notification(
             user_id=user_id, title=title, body=body, channel=channel, status="SENT", product_id=product_id
         )
         self.db.add(n)
-        self.db.commit()
-        self.db.refresh(n)
+        self.db.flush()
         return n
+
+    def create_many(
+        self,
+        *,
+        user_ids: Iterable[int],
+        title: str,
+        body: str,
+        channel: str = "PUSH",
+        product_id: int | None = None,
+    ) -> int:
+        """동일 내용의 알림을 여러 수신자에게 multi-row INSERT 한 번으로 생성
+
+        :return: 생성 건수
+        """
+        rows: List[dict] = [
+            {
+                "user_id": user_id,
+                "title": title,
+                "body": body,
+                "channel": channel,
+                "status": "SENT",
+                "product_id": product_id,
+            }
+            for user_id in user_ids
+        ]
+        if not rows:
+            return 0
+        self.db.execute(insert(Notification).values(rows))
+        return len(rows)
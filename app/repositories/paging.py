@@ -0,0 +1,91 @@
+from typing import Any, List, NamedTuple, Optional, Sequence
+from sqlalchemy import and_, func, or_, select
+from sqlalchemy.orm import Session
+
+from app.domains.common.paging import decode_cursor, encode_cursor
+
+
+class PageRows(NamedTuple):
+    rows: List[Any]
+    total: Optional[int]
+    has_next: bool
+    next_cursor: Optional[str] = None
+
+
+class SortKey(NamedTuple):
+    """keyset 정렬 키 (마지막 키는 유일해야 함 — 보통 id)"""
+
+    expr: Any
+    descending: bool = False
+
+
+def _after_cursor(keys: Sequence[SortKey], values: Sequence[Any]):
+    """(k0, k1, ...) 가 커서 위치 다음인 행 조건 — 키별로 방향이 달라도 동작하도록 전개형 사용"""
+    clauses = []
+    for i, key in enumerate(keys):
+        value = values[i]
+        cmp = key.expr < value if key.descending else key.expr > value
+        equals = [k.expr == v for k, v in zip(keys[:i], values[:i])]
+        clauses.append(and_(*equals, cmp))
+    return or_(*clauses)
+
+
+def fetch_page(
+    db: Session,
+    stmt,
+    *,
+    limit: int,
+    offset: int = 0,
+    with_total: bool = True,
+    order_by: Sequence[SortKey] = (),
+    cursor: Optional[str] = None,
+    cursor_scope: str = "",
+) -> PageRows:
+    """목록 select를 한 번의 왕복으로 페이지 조회
+
+    - with_total=True: COUNT(*) OVER()를 함께 select하여 rows와 total을 동시에 반환
+    - with_total=False: limit+1건을 조회해 has_next만 계산 (total=None)
+    - order_by 지정 시 다음 페이지용 next_cursor를 함께 반환하고,
+      cursor가 주어지면 offset 대신 keyset 조건(정렬 키 > 커서 값)으로 이어서 조회한다.
+      cursor 조회는 항상 total 없이 동작한다.
+    """
+    keys = list(order_by)
+    if keys:
+        stmt = stmt.order_by(
+            *(k.expr.desc() if k.descending else k.expr.asc() for k in keys)
+        ).add_columns(*(k.expr.label(f"_cursor_{i}") for i, k in enumerate(keys)))
+        if cursor:
+            values = decode_cursor(cursor, scope=cursor_scope, size=len(keys))
+            stmt = stmt.where(_after_cursor(keys, values))
+            offset = 0
+            with_total = False
+
+    if not with_total:
+        rows = db.execute(stmt.limit(limit + 1).offset(offset)).all()
+        rows, total, has_next = rows[:limit], None, len(rows) > limit
+    else:
+        rows = db.execute(
+            stmt.add_columns(func.count().over().label("total_count"))
+            .limit(limit)
+            .offset(offset)
+        ).all()
+        if rows:
+            total = int(rows[0].total_count)
+        elif offset:
+            # 범위를 벗어난 페이지: window 값이 없으므로 총 개수만 별도 조회
+            total = int(
+                db.execute(
+                    select(func.count()).select_from(stmt.order_by(None).subquery())
+                ).scalar_one()
+            )
+        else:
+            total = 0
+        has_next = offset + len(rows) < total
+
+    next_cursor = None
+    if keys and has_next and rows:
+        last = rows[-1]._mapping
+        next_cursor = encode_cursor(
+            cursor_scope, [last[f"_cursor_{i}"] for i in range(len(keys))]
+        )
+    return PageRows(rows, total, has_next, next_cursor)
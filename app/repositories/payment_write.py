@@ -1,5 +1,6 @@
+from typing import List
 from sqlalchemy.orm import Session
-from sqlalchemy import select
+from sqlalchemy import insert, select, update
 from app.schemas.payments import Payment, PaymentLog, PaymentRefund
 
 
@@ -33,6 +34,26 @@ class PaymentWriteRepository:
             p.status = status
             self.db.flush()
 
+    def update_payment_statuses(self, payment_ids: List[int], status: str) -> None:
+        if not payment_ids:
+            return
+        self.db.execute(
+            update(Payment)
+            .where(Payment.id.in_(payment_ids))
+            .values(status=status)
+            .execution_options(synchronize_session=False)
+        )
+
+    def create_payment_logs(self, rows: List[dict]) -> None:
+        """결제 로그 일괄 INSERT (rows: create_payment_log 인자 dict, executemany는 multi-row로 묶여 전송)"""
+        if rows:
+            self.db.execute(insert(PaymentLog), rows)
+
+    def create_refunds(self, rows: List[dict]) -> None:
+        """환불 레코드 일괄 INSERT (rows: payment_id, amount, reason)"""
+        if rows:
+            self.db.execute(insert(PaymentRefund), rows)
+
     def create_payment_log(
         self,
         *,
@@ -1,6 +1,5 @@
 from typing import List, Tuple, Optional
 from sqlalchemy.orm import Session
-from sqlalchemy import select, func, desc, and_, or_
 from sqlalchemy import select, func, desc, and_
 from app.domains.common.paging import Page
 from app.domains.products.admin_product import ProductAdminListItem, ProductAdminMeta
@@ -8,6 +7,8 @@ from app.domains.products.admin_store import StoreAdminMeta
 from app.schemas.auctions.auction_offer import AuctionOffer
 from app.schemas.orders.order import Order
 from app.schemas.products import Product, ProductImage
+from app.repositories.product_images import rep_image_col
+from app.domains.products.search import PRODUCT_TEXT_FIELDS, product_search
 from app.schemas.stores import PopupStore
 from app.schemas.auctions import Auction, Bid
 from app.domains.products.mappers import rows_to_product_items
@@ -140,14 +141,7 @@ class ProductAdminReadRepository:
         category: Optional[str] = None,  # ALL or concrete category string
         q: Optional[str] = None,  # keyword search
     ) -> Tuple[List[ProductAdminListItem], int]:
-        rep_img = (
-            select(ProductImage.image_url)
-            .where(ProductImage.product_id == Product.id)
-            .order_by(ProductImage.sort_order.asc())
-            .limit(1)
-            .correlate(Product)
-            .scalar_subquery()
-        )
+        rep_img = rep_image_col()
         stmt = select(func.count(Product.id)).join(
             Auction, Auction.product_id == Product.id, isouter=True
         )
@@ -162,14 +156,7 @@ class ProductAdminReadRepository:
         if category and category != "ALL":
             stmt = stmt.where(Product.category == category)
         if q:
-            like = f"%{q}%"
-            stmt = stmt.where(
-                or_(
-                    Product.name.like(like),
-                    Product.summary.like(like),
-                    Product.description.like(like),
-                )
-            )
+            stmt = stmt.where(product_search.match(q, PRODUCT_TEXT_FIELDS).where)
 
         total = self.db.execute(stmt).scalar_one()
         list_stmt = (
@@ -53,7 +53,6 @@ class ProductAdminWriteRepository:
         store.starts_at = starts_at
         store.ends_at = ends_at
         self.db.flush()
-        self.db.refresh(store)
         return store
 
     def sync_product_tags(self, *, tags: List[str], product_id: int):
@@ -76,45 +75,41 @@ class ProductAdminWriteRepository:
 
         # 2. 삭제할 태그 결정 (DB에 연결되어 있지만 새 리스트에 없는 태그)
         tags_to_remove = [tag for tag in current_tags if tag.name not in new_tag_names]
-        for tag in tags_to_remove:
+        if tags_to_remove:
             self.db.execute(
                 delete(ProductTag).where(
-                    ProductTag.product_id == product_id, ProductTag.tag_id == tag.id
+                    ProductTag.product_id == product_id,
+                    ProductTag.tag_id.in_([tag.id for tag in tags_to_remove]),
                 )
             )
 
-        # 3. 추가할 태그 결정 (리스트에 있지만 DB에 없는 태그)
+        # 3. 추가할 태그 결정 (리스트에 있지만 DB에 없는 태그) — 기존 태그는 한 번에 조회
         tags_to_add_names = new_tag_names - current_tag_names
-        tag_objects_to_add = []
-
+        if not tags_to_add_names:
+            return
+        existing = {
+            tag.name: tag
+            for tag in self.db.execute(
+                select(Tag).where(Tag.name.in_(tags_to_add_names))
+            ).scalars()
+        }
         for tag_name in tags_to_add_names:
-            tag_obj = self.db.execute(
-                select(Tag).where(Tag.name == tag_name)
-            ).scalar_one_or_none()
-
             # 태그가 DB에 없으면 생성
-            if not tag_obj:
-                tag_obj = Tag(name=tag_name)
-                self.db.add(tag_obj)
-                self.db.flush()
-
-            # ProductTag에 연결
-            self.db.add(ProductTag(product_id=product_id, tag_id=tag_obj.id))
-            tag_objects_to_add.append((tag_obj.id, tag_obj.name))
-
-        # 4. 최종 연결된 태그 반환
-        final_tags = self.db.execute(
-            select(Tag.id, Tag.name)
-            .join(ProductTag)
-            .where(ProductTag.product_id == product_id)
-        ).all()
-        print(final_tags)
+            if tag_name not in existing:
+                existing[tag_name] = Tag(name=tag_name)
+                self.db.add(existing[tag_name])
+        self.db.flush()
+
+        # 4. ProductTag에 연결
+        for tag_name in tags_to_add_names:
+            self.db.add(ProductTag(product_id=product_id, tag_id=existing[tag_name].id))
 
     def sync_product_images(self, *, product: Product, new_image_urls: list[str]):
         """
         product.images와 new_image_urls를 동기화
         - 새 URL이 있으면 추가
         - 기존에 없어진 URL은 삭제
+        - 대표 이미지(첫 URL)를 product.representative_image_url에 반영
         """
         # 현재 이미지 URL 집합
         existing_urls = {img.image_url: img for img in product.images}
@@ -123,10 +118,12 @@ class ProductAdminWriteRepository:
         new_urls = set(new_image_urls)
 
         # 삭제할 이미지 찾기
-        for url in set(existing_urls) - new_urls:
+        removed_urls = set(existing_urls) - new_urls
+        if removed_urls:
             self.db.execute(
                 delete(ProductImage).where(
-                    ProductImage.product_id == product.id, ProductImage.image_url == url
+                    ProductImage.product_id == product.id,
+                    ProductImage.image_url.in_(removed_urls),
                 )
             )
 
@@ -145,6 +142,8 @@ class ProductAdminWriteRepository:
                 existing_urls[url].sort_order = idx
                 existing_urls[url].image_type = "MAIN" if idx == 0 else "DETAIL"
 
+        product.representative_image_url = new_image_urls[0] if new_image_urls else None
+
     def create_product(
         self,
         *,
@@ -184,11 +183,10 @@ class ProductAdminWriteRepository:
             condition_note=specs.condition_note,
         )
 
+        # 새 상품의 images 컬렉션은 비어 있으므로 flush 전에 채워 상품/이미지를 한 번에 INSERT
+        self.sync_product_images(product=product, new_image_urls=images)
         self.db.add(product)
         self.db.flush()
-        self.db.refresh(product)
-
-        self.sync_product_images(product=product, new_image_urls=images)
         self.sync_product_tags(tags=tags, product_id=product.id)
         self.db.flush()
 
@@ -232,8 +230,6 @@ class ProductAdminWriteRepository:
         product.edition_info = specs.edition_info
         product.condition_note = specs.condition_note
 
-        self.db.flush()
-        self.db.refresh(product)
         self.sync_product_images(product=product, new_image_urls=images)
         self.sync_product_tags(tags=tags, product_id=product.id)
         self.db.flush()
@@ -0,0 +1,78 @@
+from typing import Dict, Iterable, Optional
+from sqlalchemy.orm import Session
+from sqlalchemy import select, func, update
+from app.core.config import settings
+from app.schemas.products import Product, ProductImage
+
+
+def _first_image_subq():
+    """sort_order가 가장 작은 product_image (Product에 상관)"""
+    return (
+        select(ProductImage.image_url)
+        .where(ProductImage.product_id == Product.id)
+        .order_by(ProductImage.sort_order.asc())
+        .limit(1)
+        .correlate(Product)
+        .scalar_subquery()
+    )
+
+
+def rep_image_col():
+    """Product가 포함된 select에서 쓰는 상품 대표 이미지 URL
+
+    PRODUCT_REP_IMAGE_FROM_COLUMN=true면 비정규화 컬럼(product.representative_image_url),
+    아니면 product_image 상관 서브쿼리
+    """
+    if settings.PRODUCT_REP_IMAGE_FROM_COLUMN:
+        return Product.representative_image_url
+    return _first_image_subq()
+
+
+def rep_images_by_product(db: Session, product_ids: Iterable[int]) -> Dict[int, str]:
+    """여러 상품의 대표 이미지를 한 번에 조회 (이미지가 없는 상품은 결과에 없음)"""
+    ids = list(dict.fromkeys(product_ids))
+    if not ids:
+        return {}
+    if settings.PRODUCT_REP_IMAGE_FROM_COLUMN:
+        stmt = select(Product.id, Product.representative_image_url).where(
+            Product.id.in_(ids), Product.representative_image_url.isnot(None)
+        )
+    else:
+        ranked = (
+            select(
+                ProductImage.product_id,
+                ProductImage.image_url,
+                func.row_number()
+                .over(
+                    partition_by=ProductImage.product_id,
+                    order_by=(ProductImage.sort_order.asc(), ProductImage.id.asc()),
+                )
+                .label("rn"),
+            )
+            .where(ProductImage.product_id.in_(ids))
+            .subquery()
+        )
+        stmt = select(ranked.c.product_id, ranked.c.image_url).where(ranked.c.rn == 1)
+    return {int(pid): url for pid, url in db.execute(stmt).all()}
+
+
+class ProductImageRepository:
+    def __init__(self, db: Session):
+        self.db = db
+
+    def refresh_representative_images(self, product_ids: Optional[Iterable[int]] = None) -> int:
+        """product_image 기준으로 product.representative_image_url 재계산 (백필/정합성 복구용)
+
+        :param product_ids: 대상 상품 ID 목록. None이면 전체
+        :return: 갱신된 상품 행 수
+        """
+        ids = list(product_ids) if product_ids is not None else None
+        if ids is not None and not ids:
+            return 0
+        # 백필은 상품 수정이 아니므로 updated_at(onupdate)은 그대로 둔다
+        stmt = update(Product).values(
+            representative_image_url=_first_image_subq(), updated_at=Product.updated_at
+        )
+        if ids is not None:
+            stmt = stmt.where(Product.id.in_(ids))
+        return self.db.execute(stmt.execution_options(synchronize_session=False)).rowcount
@@ -1,7 +1,6 @@
 from typing import List, Tuple, Optional
 from sqlalchemy.orm import Session
 from sqlalchemy import select, func, desc, and_, or_
-from sqlalchemy import select, func, desc, and_
 from app.domains.common.paging import Page
 from app.domains.products.admin_product import ProductAdminListItem, ProductAdminMeta
 from app.domains.products.admin_store import StoreAdminMeta
@@ -16,6 +15,50 @@ from app.domains.products.product_meta import ProductMeta, ProductSpecs
 from app.domains.products.product_list_item import ProductListItem
 from app.domains.products.store_with_products import StoreWithProducts
 from app.core.repository_mixins import TimezoneConversionMixin
+from app.infrastructure.cache.app_cache import PRODUCT_META, cached
+from app.repositories.paging import SortKey, fetch_page
+from app.repositories.product_images import rep_image_col
+from app.domains.products.search import FEED_SEARCH_FIELDS, product_search
+from app.repositories.auction_stats import (
+    highest_bid_col,
+    bidder_count_col,
+    join_auction_stats,
+)
+
+
+def product_sort_keys(
+    sort: str,
+    highest_bid,
+    bidder_count,
+    *,
+    ending_expr=None,
+    q: Optional[str] = None,
+    search_fields=FEED_SEARCH_FIELDS,
+) -> List[SortKey]:
+    """상품 목록 정렬 키 (keyset 커서용으로 Product.id를 마지막 tiebreaker로 포함)
+
+    - recommended: 현재가(없으면 시작가) desc
+    - popular: 입찰자수 desc
+    - ending: 종료 임박(ending_expr, 기본 Auction.ends_at) asc
+    - relevance: 검색 관련도 desc (q가 없거나 백엔드가 관련도를 지원하지 않으면 latest)
+    - 그 외(latest): 상품 등록일 desc
+    """
+    relevance = (
+        product_search.match(q, search_fields).relevance
+        if sort == "relevance" and q
+        else None
+    )
+    if relevance is not None:
+        key = SortKey(relevance, True)
+    elif sort == "recommended":
+        key = SortKey(func.coalesce(highest_bid, Auction.start_price), True)
+    elif sort == "popular":
+        key = SortKey(bidder_count, True)
+    elif sort == "ending":
+        key = SortKey(ending_expr if ending_expr is not None else Auction.ends_at)
+    else:
+        key = SortKey(Product.created_at, True)
+    return [key, SortKey(Product.id, key.descending)]
 
 
 class ProductReadRepository(TimezoneConversionMixin):
@@ -23,28 +66,36 @@ class ProductReadRepository(TimezoneConversionMixin):
         self.db = db
 
     def _base_product_select(self):
-        rep_img = (
-            select(ProductImage.image_url)
-            .where(ProductImage.product_id == Product.id)
-            .order_by(ProductImage.sort_order.asc())
-            .limit(1)
-            .correlate(Product)
-            .scalar_subquery()
-        )
-        highest_bid = (
-            select(func.max(Bid.amount))
-            .where(Bid.auction_id == Auction.id)
-            .correlate(Auction)
-            .scalar_subquery()
-        )
-        bidder_count = (
-            select(func.count(func.distinct(Bid.user_id)))
-            .where(Bid.auction_id == Auction.id)
-            .correlate(Auction)
-            .scalar_subquery()
-        )
+        rep_img = rep_image_col()
+        # 입찰 집계는 auction_stats(비정규화)에서 조회 — join_auction_stats 필요
+        highest_bid = highest_bid_col()
+        bidder_count = bidder_count_col()
         return rep_img, highest_bid, bidder_count
 
+    def _product_list_stmt(self, *where):
+        """목록 공통 select: 상품/스토어/경매/집계 join + 만료 경매 제외"""
+        rep_img, highest_bid, bidder_count = self._base_product_select()
+        stmt = (
+            select(
+                Product.id.label("product_id"),
+                PopupStore.name.label("popup_store_name"),
+                Product.name.label("product_name"),
+                Auction.status.label("auction_status"),
+                func.coalesce(highest_bid, Auction.start_price).label("current_highest_bid"),
+                Auction.buy_now_price.label("buy_now_price"),
+                rep_img.label("representative_image"),
+                Auction.starts_at.label("auction_starts_at"),
+                Auction.ends_at.label("auction_ends_at"),
+                bidder_count.label("bidder_count"),
+                Product.created_at.label("product_created_at"),
+            )
+            .join(PopupStore, PopupStore.id == Product.popup_store_id)
+            .join(Auction, Auction.product_id == Product.id)
+        )
+        stmt = join_auction_stats(stmt).where(*where)
+        stmt = stmt.where(Auction.ends_at > func.now())
+        return stmt, highest_bid, bidder_count
+
     def _apply_common_filters(
         self,
         stmt,
@@ -69,14 +120,8 @@ class ProductReadRepository(TimezoneConversionMixin):
             elif status == "SCHEDULED":
                 stmt = stmt.where(Auction.status == "SCHEDULED")
 
-        # Bidder count filter (requires bidder_count subquery present in select or available via correlate)
-        # We'll recompute bidder_count scalar_subquery for safety
-        bidder_count_subq = (
-            select(func.count(func.distinct(Bid.user_id)))
-            .where(Bid.auction_id == Auction.id)
-            .correlate(Auction)
-            .scalar_subquery()
-        )
+        # Bidder count filter (stmt must already outer join auction_stats)
+        bidder_count_subq = bidder_count_col()
         if bidders and bidders != "ALL":
             if bidders == "LE_10":
                 stmt = stmt.where(bidder_count_subq <= 10)
@@ -89,16 +134,7 @@ class ProductReadRepository(TimezoneConversionMixin):
 
         # Price filter using coalesce(current_highest_bid, Auction.start_price)
         price_expr = func.coalesce(
-            (
-                highest_bid_subq
-                if highest_bid_subq is not None
-                else (
-                    select(func.max(Bid.amount))
-                    .where(Bid.auction_id == Auction.id)
-                    .correlate(Auction)
-                    .scalar_subquery()
-                )
-            ),
+            highest_bid_subq if highest_bid_subq is not None else highest_bid_col(),
             Auction.start_price,
         )
 
@@ -126,58 +162,12 @@ class ProductReadRepository(TimezoneConversionMixin):
         if category and category != "ALL":
             stmt = stmt.where(Product.category == category)
 
-        # Keyword search (LIKE on product/store text fields)
+        # Keyword search (상품명/요약/설명/스토어명, SEARCH_BACKEND에 따라 LIKE/FULLTEXT/메모리 색인)
         if q:
-            like = f"%{q}%"
-            stmt = stmt.where(
-                or_(
-                    Product.name.like(like),
-                    Product.summary.like(like),
-                    Product.description.like(like),
-                    PopupStore.name.like(like),
-                )
-            )
+            stmt = stmt.where(product_search.match(q, FEED_SEARCH_FIELDS).where)
 
         return stmt
 
-    def _count_products_with_filters(
-        self,
-        *,
-        base_where,
-        status: Optional[str] = None,
-        bidders: Optional[str] = None,
-        price_bucket: Optional[str] = None,
-        price_min: Optional[float] = None,
-        price_max: Optional[float] = None,
-        category: Optional[str] = None,
-        q: Optional[str] = None,
-    ) -> int:
-        # Build count select mirroring filters
-        stmt = (
-            select(func.count(Product.id))
-            .join(PopupStore, PopupStore.id == Product.popup_store_id)
-            .join(Auction, Auction.product_id == Product.id)
-            .where(*base_where)
-        )
-        stmt = self._apply_common_filters(
-            stmt,
-            status=status,
-            bidders=bidders,
-            price_bucket=price_bucket,
-            price_min=price_min,
-            price_max=price_max,
-            highest_bid_subq=(
-                select(func.max(Bid.amount))
-                .where(Bid.auction_id == Auction.id)
-                .correlate(Auction)
-                .scalar_subquery()
-            ),
-            category=category,
-            q=q,
-        )
-        total = self.db.execute(stmt).scalar_one()
-        return int(total)
-
     def ending_soon_products(
         self,
         *,
@@ -191,30 +181,13 @@ class ProductReadRepository(TimezoneConversionMixin):
         sort: str = "ending",
         category: Optional[str] = None,
         q: Optional[str] = None,
-    ) -> Tuple[List[ProductListItem], int]:
-        rep_img, highest_bid, bidder_count = self._base_product_select()
-        stmt = (
-            select(
-                Product.id.label("product_id"),
-                PopupStore.name.label("popup_store_name"),
-                Product.name.label("product_name"),
-                Auction.status.label("auction_status"),
-                func.coalesce(highest_bid, Auction.start_price).label("current_highest_bid"),
-                Auction.buy_now_price.label("buy_now_price"),
-                rep_img.label("representative_image"),
-                Auction.starts_at.label("auction_starts_at"),
-                Auction.ends_at.label("auction_ends_at"),
-                bidder_count.label("bidder_count"),
-                Product.created_at.label("product_created_at"),
-            )
-            .join(PopupStore, PopupStore.id == Product.popup_store_id)
-            .join(Auction, Auction.product_id == Product.id)
-            .where(
-                Product.is_active == 1,
-                Product.is_sold == 0,
-            )
+        with_total: bool = True,
+        cursor: Optional[str] = None,
+    ) -> Tuple[List[ProductListItem], Optional[int], bool, Optional[str]]:
+        stmt, highest_bid, bidder_count = self._product_list_stmt(
+            Product.is_active == 1,
+            Product.is_sold == 0,
         )
-        stmt = stmt.where(Auction.ends_at > func.now())
         stmt = self._apply_common_filters(
             stmt,
             status=status,
@@ -226,30 +199,23 @@ class ProductReadRepository(TimezoneConversionMixin):
             category=category,
             q=q,
         )
-        # Sorting
-        if sort == "recommended":
-            price_expr = func.coalesce(highest_bid, Auction.start_price)
-            stmt = stmt.order_by(desc(price_expr))
-        elif sort == "popular":
-            # use bidder_count
-            stmt = stmt.order_by(desc(bidder_count))
-        elif sort == "latest":
-            stmt = stmt.order_by(Product.created_at.desc())
-        else:  # ending
-            stmt = stmt.order_by(Auction.ends_at.asc())
-        stmt = stmt.limit(limit).offset(offset)
-        rows = self.db.execute(stmt)
-        total = self._count_products_with_filters(
-            base_where=(Product.is_active == 1, Product.is_sold == 0),
-            status=status,
-            bidders=bidders,
-            price_bucket=price_bucket,
-            price_min=price_min,
-            price_max=price_max,
-            category=category,
-            q=q,
+        sort_keys = product_sort_keys(sort, highest_bid, bidder_count, q=q)
+        page_rows = fetch_page(
+            self.db,
+            stmt,
+            limit=limit,
+            offset=offset,
+            with_total=with_total,
+            order_by=sort_keys,
+            cursor=cursor,
+            cursor_scope=f"ending_soon:{sort}",
+        )
+        return (
+            rows_to_product_items(page_rows.rows),
+            page_rows.total,
+            page_rows.has_next,
+            page_rows.next_cursor,
         )
-        return rows_to_product_items(rows), total
 
     def recommended_products(
         self,
@@ -264,30 +230,13 @@ class ProductReadRepository(TimezoneConversionMixin):
         sort: str = "recommended",
         category: Optional[str] = None,
         q: Optional[str] = None,
-    ) -> Tuple[List[ProductListItem], int]:
-        rep_img, highest_bid, bid_count = self._base_product_select()
-        stmt = (
-            select(
-                Product.id.label("product_id"),
-                PopupStore.name.label("popup_store_name"),
-                Product.name.label("product_name"),
-                Auction.status.label("auction_status"),
-                func.coalesce(highest_bid, Auction.start_price).label("current_highest_bid"),
-                Auction.buy_now_price.label("buy_now_price"),
-                rep_img.label("representative_image"),
-                Auction.starts_at.label("auction_starts_at"),
-                Auction.ends_at.label("auction_ends_at"),
-                bid_count.label("bidder_count"),
-                Product.created_at.label("product_created_at"),
-            )
-            .join(PopupStore, PopupStore.id == Product.popup_store_id)
-            .join(Auction, Auction.product_id == Product.id)
-            .where(
-                Product.is_active == 1,
-                Product.is_sold == 0,
-            )
+        with_total: bool = True,
+        cursor: Optional[str] = None,
+    ) -> Tuple[List[ProductListItem], Optional[int], bool, Optional[str]]:
+        stmt, highest_bid, bid_count = self._product_list_stmt(
+            Product.is_active == 1,
+            Product.is_sold == 0,
         )
-        stmt = stmt.where(Auction.ends_at > func.now())
         stmt = self._apply_common_filters(
             stmt,
             status=status,
@@ -299,29 +248,23 @@ class ProductReadRepository(TimezoneConversionMixin):
             category=category,
             q=q,
         )
-        # Sorting
-        if sort == "recommended":
-            price_expr = func.coalesce(highest_bid, Auction.start_price)
-            stmt = stmt.order_by(desc(price_expr))
-        elif sort == "popular":
-            stmt = stmt.order_by(desc(bid_count))
-        elif sort == "ending":
-            stmt = stmt.order_by(Auction.ends_at.asc())
-        else:
-            stmt = stmt.order_by(Product.created_at.desc())
-        stmt = stmt.limit(limit).offset(offset)
-        rows = self.db.execute(stmt)
-        total = self._count_products_with_filters(
-            base_where=(Product.is_active == 1, Product.is_sold == 0),
-            status=status,
-            bidders=bidders,
-            price_bucket=price_bucket,
-            price_min=price_min,
-            price_max=price_max,
-            category=category,
-            q=q,
+        sort_keys = product_sort_keys(sort, highest_bid, bid_count, q=q)
+        page_rows = fetch_page(
+            self.db,
+            stmt,
+            limit=limit,
+            offset=offset,
+            with_total=with_total,
+            order_by=sort_keys,
+            cursor=cursor,
+            cursor_scope=f"recommended:{sort}",
+        )
+        return (
+            rows_to_product_items(page_rows.rows),
+            page_rows.total,
+            page_rows.has_next,
+            page_rows.next_cursor,
         )
-        return rows_to_product_items(rows), total
 
     def new_products(
         self,
@@ -336,30 +279,13 @@ class ProductReadRepository(TimezoneConversionMixin):
         sort: str = "latest",
         category: Optional[str] = None,
         q: Optional[str] = None,
-    ) -> Tuple[List[ProductListItem], int]:
-        rep_img, highest_bid, bidder_count = self._base_product_select()
-        stmt = (
-            select(
-                Product.id.label("product_id"),
-                PopupStore.name.label("popup_store_name"),
-                Product.name.label("product_name"),
-                Auction.status.label("auction_status"),
-                func.coalesce(highest_bid, Auction.start_price).label("current_highest_bid"),
-                Auction.buy_now_price.label("buy_now_price"),
-                rep_img.label("representative_image"),
-                Auction.starts_at.label("auction_starts_at"),
-                Auction.ends_at.label("auction_ends_at"),
-                bidder_count.label("bidder_count"),
-                Product.created_at.label("product_created_at"),
-            )
-            .join(PopupStore, PopupStore.id == Product.popup_store_id)
-            .join(Auction, Auction.product_id == Product.id)
-            .where(
-                Product.is_active == 1,
-                Product.is_sold == 0,
-            )
+        with_total: bool = True,
+        cursor: Optional[str] = None,
+    ) -> Tuple[List[ProductListItem], Optional[int], bool, Optional[str]]:
+        stmt, highest_bid, bidder_count = self._product_list_stmt(
+            Product.is_active == 1,
+            Product.is_sold == 0,
         )
-        stmt = stmt.where(Auction.ends_at > func.now())
         stmt = self._apply_common_filters(
             stmt,
             status=status,
@@ -371,28 +297,23 @@ class ProductReadRepository(TimezoneConversionMixin):
             category=category,
             q=q,
         )
-        if sort == "recommended":
-            price_expr = func.coalesce(highest_bid, Auction.start_price)
-            stmt = stmt.order_by(desc(price_expr))
-        elif sort == "popular":
-            stmt = stmt.order_by(desc(bidder_count))
-        elif sort == "ending":
-            stmt = stmt.order_by(Auction.ends_at.asc())
-        else:
-            stmt = stmt.order_by(Product.created_at.desc())
-        stmt = stmt.limit(limit).offset(offset)
-        rows = self.db.execute(stmt)
-        total = self._count_products_with_filters(
-            base_where=(Product.is_active == 1, Product.is_sold == 0),
-            status=status,
-            bidders=bidders,
-            price_bucket=price_bucket,
-            price_min=price_min,
-            price_max=price_max,
-            category=category,
-            q=q,
+        sort_keys = product_sort_keys(sort, highest_bid, bidder_count, q=q)
+        page_rows = fetch_page(
+            self.db,
+            stmt,
+            limit=limit,
+            offset=offset,
+            with_total=with_total,
+            order_by=sort_keys,
+            cursor=cursor,
+            cursor_scope=f"new:{sort}",
+        )
+        return (
+            rows_to_product_items(page_rows.rows),
+            page_rows.total,
+            page_rows.has_next,
+            page_rows.next_cursor,
         )
-        return rows_to_product_items(rows), total
 
     def recent_stores_with_products(
         self,
@@ -409,7 +330,6 @@ class ProductReadRepository(TimezoneConversionMixin):
         category: Optional[str] = None,
         q: Optional[str] = None,
     ) -> Tuple[List[tuple], int]:
-        rep_img, highest_bid, bidder_count = self._base_product_select()
         stores_stmt = (
             select(PopupStore)
             .order_by(PopupStore.id.desc())
@@ -420,30 +340,11 @@ class ProductReadRepository(TimezoneConversionMixin):
         total_stores = self.db.execute(select(func.count(PopupStore.id))).scalar_one()
         result: List[tuple] = []
         for store in stores:
-            stmt = (
-                select(
-                    Product.id.label("product_id"),
-                    PopupStore.name.label("popup_store_name"),
-                    Product.name.label("product_name"),
-                    Auction.status.label("auction_status"),
-                    func.coalesce(highest_bid, Auction.start_price).label("current_highest_bid"),
-                    Auction.buy_now_price.label("buy_now_price"),
-                    rep_img.label("representative_image"),
-                    Auction.starts_at.label("auction_starts_at"),
-                    Auction.ends_at.label("auction_ends_at"),
-                    bidder_count.label("bidder_count"),
-                    Product.created_at.label("product_created_at"),
-                )
-                .join(PopupStore, PopupStore.id == Product.popup_store_id)
-                .join(Auction, Auction.product_id == Product.id)
-                .where(
-                    Product.popup_store_id == store.id,
-                    Product.is_active == 1,
-                    Product.is_sold == 0,
-                )
+            stmt, highest_bid, bidder_count = self._product_list_stmt(
+                Product.popup_store_id == store.id,
+                Product.is_active == 1,
+                Product.is_sold == 0,
             )
-            # exclude expired auctions
-            stmt = stmt.where(Auction.ends_at > func.now())
             stmt = self._apply_common_filters(
                 stmt,
                 status=status,
@@ -455,15 +356,12 @@ class ProductReadRepository(TimezoneConversionMixin):
                 category=category,
                 q=q,
             )
-            if sort == "recommended":
-                price_expr = func.coalesce(highest_bid, Auction.start_price)
-                stmt = stmt.order_by(desc(price_expr))
-            elif sort == "popular":
-                stmt = stmt.order_by(desc(bidder_count))
-            elif sort == "ending":
-                stmt = stmt.order_by(Auction.ends_at.asc())
-            else:
-                stmt = stmt.order_by(Product.created_at.desc())
+            stmt = stmt.order_by(
+                *(
+                    k.expr.desc() if k.descending else k.expr.asc()
+                    for k in product_sort_keys(sort, highest_bid, bidder_count, q=q)
+                )
+            )
             stmt = stmt.limit(per_store_products)
             products_rows = self.db.execute(stmt)
             result.append(
@@ -530,32 +428,14 @@ class ProductReadRepository(TimezoneConversionMixin):
         price_max: Optional[float] = None,
         category: Optional[str] = None,
         q: Optional[str] = None,
-    ) -> Tuple[List[ProductListItem], int]:
-        rep_img, highest_bid, bid_count = self._base_product_select()
-        stmt = (
-            select(
-                Product.id.label("product_id"),
-                PopupStore.name.label("popup_store_name"),
-                Product.name.label("product_name"),
-                Auction.status.label("auction_status"),
-                func.coalesce(highest_bid, Auction.start_price).label("current_highest_bid"),
-                Auction.buy_now_price.label("buy_now_price"),
-                rep_img.label("representative_image"),
-                Auction.starts_at.label("auction_starts_at"),
-                Auction.ends_at.label("auction_ends_at"),
-                bid_count.label("bidder_count"),
-                Product.created_at.label("product_created_at"),
-            )
-            .join(PopupStore, PopupStore.id == Product.popup_store_id)
-            .join(Auction, Auction.product_id == Product.id)
-            .where(
-                Product.popup_store_id == store_id,
-                Product.is_active == 1,
-                Product.is_sold == 0,
-            )
+        with_total: bool = True,
+        cursor: Optional[str] = None,
+    ) -> Tuple[List[ProductListItem], Optional[int], bool, Optional[str]]:
+        stmt, highest_bid, bid_count = self._product_list_stmt(
+            Product.popup_store_id == store_id,
+            Product.is_active == 1,
+            Product.is_sold == 0,
         )
-        # exclude expired auctions
-        stmt = stmt.where(Auction.ends_at > func.now())
         stmt = self._apply_common_filters(
             stmt,
             status=status,
@@ -567,32 +447,23 @@ class ProductReadRepository(TimezoneConversionMixin):
             category=category,
             q=q,
         )
-        if sort == "recommended":
-            price_expr = func.coalesce(highest_bid, Auction.start_price)
-            stmt = stmt.order_by(desc(price_expr))
-        elif sort == "popular":
-            stmt = stmt.order_by(desc(bid_count))
-        elif sort == "ending":
-            stmt = stmt.order_by(Auction.ends_at.asc())
-        else:
-            stmt = stmt.order_by(Product.created_at.desc())
-        stmt = stmt.limit(size).offset((page - 1) * size)
-        rows = self.db.execute(stmt)
-        total = self._count_products_with_filters(
-            base_where=(
-                Product.popup_store_id == store_id,
-                Product.is_active == 1,
-                Product.is_sold == 0,
-            ),
-            status=status,
-            bidders=bidders,
-            price_bucket=price_bucket,
-            price_min=price_min,
-            price_max=price_max,
-            category=category,
-            q=q,
+        sort_keys = product_sort_keys(sort, highest_bid, bid_count, q=q)
+        page_rows = fetch_page(
+            self.db,
+            stmt,
+            limit=size,
+            offset=(page - 1) * size,
+            with_total=with_total,
+            order_by=sort_keys,
+            cursor=cursor,
+            cursor_scope=f"store:{store_id}:{sort}",
+        )
+        return (
+            rows_to_product_items(page_rows.rows),
+            page_rows.total,
+            page_rows.has_next,
+            page_rows.next_cursor,
         )
-        return rows_to_product_items(rows), int(total)
 
     def upcoming_products(
         self,
@@ -607,30 +478,13 @@ class ProductReadRepository(TimezoneConversionMixin):
         sort: str = "ending",
         category: Optional[str] = None,
         q: Optional[str] = None,
-    ) -> Tuple[List[ProductListItem], int]:
-        rep_img, highest_bid, bidder_count = self._base_product_select()
-        stmt = (
-            select(
-                Product.id.label("product_id"),
-                PopupStore.name.label("popup_store_name"),
-                Product.name.label("product_name"),
-                Auction.status.label("auction_status"),
-                func.coalesce(highest_bid, Auction.start_price).label("current_highest_bid"),
-                Auction.buy_now_price.label("buy_now_price"),
-                rep_img.label("representative_image"),
-                Auction.starts_at.label("auction_starts_at"),
-                Auction.ends_at.label("auction_ends_at"),
-                bidder_count.label("bidder_count"),
-                Product.created_at.label("product_created_at"),
-            )
-            .join(PopupStore, PopupStore.id == Product.popup_store_id)
-            .join(Auction, Auction.product_id == Product.id)
-            .where(
-                Product.is_active == 1,
-                Product.is_sold == 0,
-            )
+        with_total: bool = True,
+        cursor: Optional[str] = None,
+    ) -> Tuple[List[ProductListItem], Optional[int], bool, Optional[str]]:
+        stmt, highest_bid, bidder_count = self._product_list_stmt(
+            Product.is_active == 1,
+            Product.is_sold == 0,
         )
-        stmt = stmt.where(Auction.ends_at > func.now())
         stmt = self._apply_common_filters(
             stmt,
             status=status,
@@ -642,30 +496,28 @@ class ProductReadRepository(TimezoneConversionMixin):
             category=category,
             q=q,
         )
-        # Sorting: reuse keys; for "ending" interpret as starts_at asc (오픈 임박)
-        if sort == "recommended":
-            price_expr = func.coalesce(highest_bid, Auction.start_price)
-            stmt = stmt.order_by(desc(price_expr))
-        elif sort == "popular":
-            stmt = stmt.order_by(desc(bidder_count))
-        elif sort == "latest":
-            stmt = stmt.order_by(Product.created_at.desc())
-        else:  # ending -> opening soon
-            stmt = stmt.order_by(Auction.starts_at.asc())
-        stmt = stmt.limit(limit).offset(offset)
-        rows = self.db.execute(stmt)
-        total = self._count_products_with_filters(
-            base_where=(Product.is_active == 1, Product.is_sold == 0),
-            status=status,
-            bidders=bidders,
-            price_bucket=price_bucket,
-            price_min=price_min,
-            price_max=price_max,
-            category=category,
-            q=q,
+        # "ending"은 오픈 임박(starts_at asc)으로 해석
+        sort_keys = product_sort_keys(
+            sort, highest_bid, bidder_count, ending_expr=Auction.starts_at, q=q
+        )
+        page_rows = fetch_page(
+            self.db,
+            stmt,
+            limit=limit,
+            offset=offset,
+            with_total=with_total,
+            order_by=sort_keys,
+            cursor=cursor,
+            cursor_scope=f"upcoming:{sort}",
+        )
+        return (
+            rows_to_product_items(page_rows.rows),
+            page_rows.total,
+            page_rows.has_next,
+            page_rows.next_cursor,
         )
-        return rows_to_product_items(rows), total
 
+    @cached(PRODUCT_META, "product_meta")
     def product_meta(self, product_id: int) -> ProductMeta:
         prod = self.db.execute(
             select(Product).where(Product.id == product_id)
@@ -0,0 +1,58 @@
+from datetime import datetime
+from typing import Iterator, List, Optional
+from sqlalchemy import or_, select
+from sqlalchemy.orm import Session
+from app.schemas.products import Product
+from app.schemas.stores import PopupStore
+
+
+class ProductSearchRepository:
+    """검색 색인용 상품 문서(상품명/요약/설명/스토어명) 조회"""
+
+    def __init__(self, db: Session):
+        self.db = db
+
+    def _documents(self, *where):
+        return (
+            select(
+                Product.id,
+                Product.name,
+                Product.summary,
+                Product.description,
+                PopupStore.name.label("store_name"),
+                Product.updated_at,
+                PopupStore.updated_at.label("store_updated_at"),
+            )
+            .join(PopupStore, PopupStore.id == Product.popup_store_id)
+            .where(*where)
+        )
+
+    def iter_document_chunks(self, *, chunk_size: int = 5000) -> Iterator[List]:
+        """전체 상품 문서를 id keyset 청크로 조회"""
+        last_id = 0
+        while True:
+            rows = self.db.execute(
+                self._documents(Product.id > last_id).order_by(Product.id).limit(chunk_size)
+            ).all()
+            if not rows:
+                return
+            yield rows
+            last_id = int(rows[-1].id)
+
+    def documents_by_ids(self, product_ids: List[int]) -> List:
+        if not product_ids:
+            return []
+        return self.db.execute(self._documents(Product.id.in_(product_ids))).all()
+
+    def documents_by_store(self, store_id: int) -> List:
+        return self.db.execute(self._documents(Product.popup_store_id == store_id)).all()
+
+    def documents_updated_since(self, since: Optional[datetime]) -> List:
+        """상품 또는 소속 스토어(스토어명)가 since 이후 수정된 문서"""
+        if since is None:
+            return []
+        return self.db.execute(
+            self._documents(
+                or_(Product.updated_at >= since, PopupStore.updated_at >= since)
+            )
+        ).all()
@@ -1,13 +1,15 @@
-from typing import Tuple, List
+from typing import Tuple, List, Optional
 from sqlalchemy import func, select, desc
 from sqlalchemy.orm import Session
 
 from app.domains.stories.mappers import rows_to_story_items
+from app.infrastructure.cache.app_cache import STORY, cached
+from app.repositories.paging import fetch_page
+from app.repositories.product_images import rep_image_col
 from app.domains.stories.product_brief import ProductBrief
 from app.domains.stories.story_list_item import StoryListItem
 from app.domains.stories.story_meta import StoryMeta
 from app.schemas.products.product import Product
-from app.schemas.products.product_image import ProductImage
 from app.schemas.stories.story import Story
 from app.schemas.stories.story_image import StoryImage
 
@@ -17,15 +19,7 @@ class StoryReadRepository:
         self.db = db
 
     def _product_rep_img_select(self):
-        rep_img = (
-            select(ProductImage.image_url)
-            .where(ProductImage.product_id == Product.id)
-            .order_by(ProductImage.sort_order.asc())
-            .limit(1)
-            .correlate(Product)
-            .scalar_subquery()
-        )
-        return rep_img
+        return rep_image_col()
 
     def _story_rep_img_select(self):
         rep_img = (
@@ -38,13 +32,7 @@ class StoryReadRepository:
         )
         return rep_img
 
-    def _count_recent_stories(self) -> int:
-        stmt = select(func.count(Story.id)).join(
-            Product, Product.id == Story.product_id
-        )
-        total = self.db.execute(stmt).scalar_one()
-        return int(total)
-
+    @cached(STORY, "story_meta")
     def get_story_meta_with_product_brief(self, story_id: int) -> StoryMeta | None:
         story = self.db.execute(
             select(Story).where(Story.id == story_id)
@@ -83,11 +71,13 @@ class StoryReadRepository:
             images=story_images,
         )
 
+    @cached(STORY, "recent_stories")
     def recent_story_items_with_product_brief(
         self,
         limit: int = 9,
         offset: int = 0,
-    ) -> Tuple[List[StoryListItem], int]:
+        with_total: bool = True,
+    ) -> Tuple[List[StoryListItem], Optional[int], bool]:
         product_rep_img = self._product_rep_img_select()
         story_rep_img = self._story_rep_img_select()
         stmt = (
@@ -104,9 +94,8 @@ class StoryReadRepository:
             )
             .join(Product, Product.id == Story.product_id)
             .order_by(Story.created_at.desc())
-            .limit(limit)
-            .offset(offset)
         )
-        rows = self.db.execute(stmt)
-        total = self._count_recent_stories()
-        return rows_to_story_items(rows), int(total)
+        page_rows = fetch_page(
+            self.db, stmt, limit=limit, offset=offset, with_total=with_total
+        )
+        return rows_to_story_items(page_rows.rows), page_rows.total, page_rows.has_next
@@ -1,13 +1,17 @@
-from typing import List, Optional, Tuple
+from typing import Dict, List, Optional, Tuple
 from datetime import datetime
 from sqlalchemy.orm import Session
-from sqlalchemy import select, func, desc, and_, or_, exists
+from sqlalchemy import select, func, desc, and_, exists, case
 
 from app.schemas.auctions import Auction, Bid
-from app.schemas.products import Product, ProductImage
+from app.schemas.products import Product
 from app.schemas.stores import PopupStore
 from app.schemas.orders import Order, OrderItem, Shipment
 from app.schemas.payments import Payment
+from app.repositories.auction_stats import highest_bid_col, join_auction_stats
+from app.repositories.paging import fetch_page
+from app.repositories.product_images import rep_image_col
+from app.domains.products.search import SearchField, product_search
 from app.domains.auctions.user_dto import (
     UserAuctionDashboard,
     UserRelatedAuctionItem,
@@ -20,91 +24,120 @@ class UserAuctionReadRepository:
         self.db = db
 
     def _rep_image_subq(self):
-        return (
-            select(ProductImage.image_url)
-            .where(ProductImage.product_id == Product.id)
-            .order_by(ProductImage.sort_order.asc())
-            .limit(1)
-            .correlate(Product)
-            .scalar_subquery()
-        )
-
-    def _highest_bid_subq(self):
-        return (
-            select(func.max(Bid.amount))
-            .where(Bid.auction_id == Auction.id)
-            .correlate(Auction)
-            .scalar_subquery()
-        )
-
-    def _my_highest_bid_subq(self, user_id_subq=None):
-        q = select(func.max(Bid.amount))
-        if user_id_subq is not None:
-            q = q.where(Bid.user_id == user_id_subq)
-        return q
+        return rep_image_col()
 
     def dashboard_counts(self, *, user_id: int) -> UserAuctionDashboard:
+        """마이페이지 상단 집계 4종을 한 번의 왕복으로 조회 (각 집계는 스칼라 서브쿼리)"""
         # running bids: distinct auctions where user has at least one bid and auction is RUNNING
         running_count = (
-            self.db.execute(
-                select(func.count(func.distinct(Auction.id)))
-                .join(Bid, Bid.auction_id == Auction.id)
-                .where(Bid.user_id == user_id, Auction.status == "RUNNING")
-            ).scalar_one()
+            select(func.count(func.distinct(Auction.id)))
+            .join(Bid, Bid.auction_id == Auction.id)
+            .where(Bid.user_id == user_id, Auction.status == "RUNNING")
+            .scalar_subquery()
         )
 
         # pre-shipment: user won (has PAID payment or order exists) but no shipment shipped/delivered
         # Criteria: exists order item for user's product with Payment.PAID and Shipment.shipped_at is NULL
         preship_count = (
-            self.db.execute(
-                select(func.count(func.distinct(Product.id)))
-                .select_from(Product)
-                .join(Auction, Auction.product_id == Product.id)
-                .join(Bid, Bid.auction_id == Auction.id)
-                .join(OrderItem, OrderItem.product_id == Product.id, isouter=True)
-                .join(Order, Order.id == OrderItem.order_id, isouter=True)
-                .join(Shipment, Shipment.order_id == Order.id, isouter=True)
-                .join(Payment, Payment.user_id == Bid.user_id, isouter=True)
-                .where(
-                    Bid.user_id == user_id,
-                    Auction.status == "ENDED",
-                    Payment.status == "PAID",
-                    Shipment.shipped_at.is_(None),
-                )
-            ).scalar_one()
+            select(func.count(func.distinct(Product.id)))
+            .select_from(Product)
+            .join(Auction, Auction.product_id == Product.id)
+            .join(Bid, Bid.auction_id == Auction.id)
+            .join(OrderItem, OrderItem.product_id == Product.id, isouter=True)
+            .join(Order, Order.id == OrderItem.order_id, isouter=True)
+            .join(Shipment, Shipment.order_id == Order.id, isouter=True)
+            .join(Payment, Payment.user_id == Bid.user_id, isouter=True)
+            .where(
+                Bid.user_id == user_id,
+                Auction.status == "ENDED",
+                Payment.status == "PAID",
+                Shipment.shipped_at.is_(None),
+            )
+            .scalar_subquery()
         )
 
         # shipping: shipment.shipped_at not null and delivered_at is null
         shipping_count = (
-            self.db.execute(
-                select(func.count(func.distinct(Product.id)))
-                .select_from(Product)
-                .join(OrderItem, OrderItem.product_id == Product.id)
-                .join(Order, Order.id == OrderItem.order_id)
-                .join(Shipment, Shipment.order_id == Order.id)
-                .where(Order.user_id == user_id, Shipment.shipped_at.isnot(None), Shipment.delivered_at.is_(None))
-            ).scalar_one()
+            select(func.count(func.distinct(Product.id)))
+            .select_from(Product)
+            .join(OrderItem, OrderItem.product_id == Product.id)
+            .join(Order, Order.id == OrderItem.order_id)
+            .join(Shipment, Shipment.order_id == Order.id)
+            .where(Order.user_id == user_id, Shipment.shipped_at.isnot(None), Shipment.delivered_at.is_(None))
+            .scalar_subquery()
         )
 
         # delivered: shipment.delivered_at not null
         delivered_count = (
-            self.db.execute(
-                select(func.count(func.distinct(Product.id)))
-                .select_from(Product)
-                .join(OrderItem, OrderItem.product_id == Product.id)
-                .join(Order, Order.id == OrderItem.order_id)
-                .join(Shipment, Shipment.order_id == Order.id)
-                .where(Order.user_id == user_id, Shipment.delivered_at.isnot(None))
-            ).scalar_one()
+            select(func.count(func.distinct(Product.id)))
+            .select_from(Product)
+            .join(OrderItem, OrderItem.product_id == Product.id)
+            .join(Order, Order.id == OrderItem.order_id)
+            .join(Shipment, Shipment.order_id == Order.id)
+            .where(Order.user_id == user_id, Shipment.delivered_at.isnot(None))
+            .scalar_subquery()
         )
 
+        row = self.db.execute(
+            select(
+                running_count.label("running"),
+                preship_count.label("preship"),
+                shipping_count.label("shipping"),
+                delivered_count.label("delivered"),
+            )
+        ).one()
         return UserAuctionDashboard(
-            running_bid_count=int(running_count),
-            pre_shipment_count=int(preship_count),
-            shipping_count=int(shipping_count),
-            delivered_count=int(delivered_count),
+            running_bid_count=int(row.running or 0),
+            pre_shipment_count=int(row.preship or 0),
+            shipping_count=int(row.shipping or 0),
+            delivered_count=int(row.delivered or 0),
         )
 
+    def _order_states(
+        self, *, user_id: int, product_ids: List[int]
+    ) -> Dict[int, Tuple[bool, bool]]:
+        """상품별 내 주문의 배송 상태 (shipped, delivered) — 페이지 상품 전체를 한 번에 조회
+
+        내 주문이 없는 상품은 결과에 없음
+        """
+        if not product_ids:
+            return {}
+        rows = self.db.execute(
+            select(
+                OrderItem.product_id,
+                func.max(case((Shipment.shipped_at.isnot(None), 1), else_=0)).label("shipped"),
+                func.max(case((Shipment.delivered_at.isnot(None), 1), else_=0)).label("delivered"),
+            )
+            .join(Order, Order.id == OrderItem.order_id)
+            .outerjoin(Shipment, Shipment.order_id == Order.id)
+            .where(Order.user_id == user_id, OrderItem.product_id.in_(product_ids))
+            .group_by(OrderItem.product_id)
+        ).all()
+        return {int(r.product_id): (bool(r.shipped), bool(r.delivered)) for r in rows}
+
+    @staticmethod
+    def _item_status(
+        auction_status: str, order_state: Optional[Tuple[bool, bool]], has_paid_payment: bool
+    ) -> MyAuctionItemStatus:
+        # status mapping
+        # - Shipment: delivered_at -> 배송완료, shipped_at -> 배송중
+        # - RUNNING -> 경매 진행중
+        # - PAUSED -> 경매 일시중지
+        # - ENDED with my order and payment paid -> 낙찰 확정
+        # - ENDED -> 경매 종료
+        shipped, delivered = order_state or (False, False)
+        if delivered:
+            return MyAuctionItemStatus.DELIVERED
+        if shipped:
+            return MyAuctionItemStatus.SHIPPING
+        if auction_status == "RUNNING":
+            return MyAuctionItemStatus.RUNNING
+        if auction_status == "PAUSED":
+            return MyAuctionItemStatus.PAUSED
+        if auction_status == "ENDED" and order_state is not None and has_paid_payment:
+            return MyAuctionItemStatus.WON_CONFIRMED
+        return MyAuctionItemStatus.AUCTION_ENDED
+
     def list_user_related_items(
         self,
         *,
@@ -115,17 +148,33 @@ class UserAuctionReadRepository:
         period_to: Optional[datetime],
         keyword: Optional[str],
     ) -> Tuple[List[UserRelatedAuctionItem], int]:
+        """내가 입찰한 경매 목록 — 페이지 조회(행+총개수) 1회 + 주문/배송 상태 일괄 조회 1회"""
         rep = self._rep_image_subq()
-        highest = self._highest_bid_subq()
+        highest = highest_bid_col()
 
-        # last/my highest bid time per auction
-        my_last_bid_at_subq = (
-            select(func.max(Bid.created_at))
-            .where(Bid.auction_id == Auction.id, Bid.user_id == user_id)
-            .correlate(Auction)
-            .scalar_subquery()
+        # 경매별 내 입찰 집계 (최고 입찰가, 마지막 입찰 시각)
+        mine = (
+            select(
+                Bid.auction_id.label("auction_id"),
+                func.max(Bid.amount).label("my_highest"),
+                func.max(Bid.created_at).label("my_last_bid_at"),
+            )
+            .where(Bid.user_id == user_id)
+            .group_by(Bid.auction_id)
         )
+        # 기간 조건: 기간 안에 내 입찰이 하나라도 있는 경매
+        in_period = []
+        if period_from:
+            in_period.append(Bid.created_at >= period_from)
+        if period_to:
+            in_period.append(Bid.created_at <= period_to)
+        if in_period:
+            mine = mine.having(func.max(case((and_(*in_period), 1), else_=0)) == 1)
+        mine = mine.subquery("mine")
 
+        has_paid_payment = exists().where(
+            Payment.user_id == user_id, Payment.status == "PAID"
+        )
         stmt = (
             select(
                 Product.id.label("product_id"),
@@ -133,110 +182,36 @@ class UserAuctionReadRepository:
                 Product.name.label("product_name"),
                 rep.label("image_url"),
                 highest.label("current_highest_bid"),
-                my_last_bid_at_subq.label("my_last_bid_at"),
+                Auction.status.label("auction_status"),
+                mine.c.my_highest,
+                mine.c.my_last_bid_at,
+                has_paid_payment.label("has_paid_payment"),
             )
-            .join(Auction, Auction.product_id == Product.id)
+            .select_from(mine)
+            .join(Auction, Auction.id == mine.c.auction_id)
+            .join(Product, Product.id == Auction.product_id)
             .join(PopupStore, PopupStore.id == Product.popup_store_id)
-            .join(Bid, Bid.auction_id == Auction.id)
-            .where(Bid.user_id == user_id)
         )
-
-        if period_from:
-            stmt = stmt.where(Bid.created_at >= period_from)
-        if period_to:
-            stmt = stmt.where(Bid.created_at <= period_to)
+        stmt = join_auction_stats(stmt)
         if keyword:
-            like = f"%{keyword}%"
-            stmt = stmt.where(or_(Product.name.like(like), PopupStore.name.like(like)))
+            stmt = stmt.where(
+                product_search.match(keyword, (SearchField.NAME, SearchField.STORE)).where
+            )
 
         # sort: latest by my bid time desc
-        stmt = stmt.order_by(desc(my_last_bid_at_subq)).limit(size).offset((page - 1) * size)
-
-        rows = self.db.execute(stmt).all()
-
-        # count
-        count_stmt = (
-            select(func.count(func.distinct(Product.id)))
-            .join(Auction, Auction.product_id == Product.id)
-            .join(PopupStore, PopupStore.id == Product.popup_store_id)
-            .join(Bid, Bid.auction_id == Auction.id)
-            .where(Bid.user_id == user_id)
+        page_rows = fetch_page(
+            self.db,
+            stmt.order_by(desc(mine.c.my_last_bid_at), desc(Auction.id)),
+            limit=size,
+            offset=(page - 1) * size,
+        )
+        rows = page_rows.rows
+        order_states = self._order_states(
+            user_id=user_id, product_ids=[int(r.product_id) for r in rows]
         )
-        if period_from:
-            count_stmt = count_stmt.where(Bid.created_at >= period_from)
-        if period_to:
-            count_stmt = count_stmt.where(Bid.created_at <= period_to)
-        if keyword:
-            like = f"%{keyword}%"
-            count_stmt = count_stmt.where(or_(Product.name.like(like), PopupStore.name.like(like)))
-        total = int(self.db.execute(count_stmt).scalar_one())
 
-        # derive my highest bid per auction
         items: List[UserRelatedAuctionItem] = []
         for r in rows:
-            my_highest = (
-                self.db.execute(
-                    select(func.max(Bid.amount)).where(Bid.user_id == user_id, Bid.auction_id == r.auction_id)
-                ).scalar_one()
-            )
-
-            # status mapping
-            # - RUNNING -> 경매 진행중
-            # - ENDED with I am winner and payment paid -> 낙찰 확정
-            # - ENDED -> 경매 종료
-            # - PAUSED -> 경매 일시중지
-            # - Shipment: shipped_at -> 배송중, delivered_at -> 배송완료
-            auction_status = self.db.execute(
-                select(Auction.status).where(Auction.id == r.auction_id)
-            ).scalar_one()
-
-            # check my order and shipment
-            order_row = self.db.execute(
-                select(Order.id)
-                .join(OrderItem, OrderItem.order_id == Order.id)
-                .where(Order.user_id == user_id, OrderItem.product_id == r.product_id)
-            ).first()
-            shipment_status: Optional[str] = None
-            if order_row:
-                order_id = int(order_row[0])
-                shipped = self.db.execute(
-                    select(func.count(Shipment.id)).where(Shipment.order_id == order_id, Shipment.shipped_at.isnot(None))
-                ).scalar_one() > 0
-                delivered = self.db.execute(
-                    select(func.count(Shipment.id)).where(Shipment.order_id == order_id, Shipment.delivered_at.isnot(None))
-                ).scalar_one() > 0
-                if delivered:
-                    shipment_status = "DELIVERED"
-                elif shipped:
-                    shipment_status = "SHIPPING"
-
-            if shipment_status == "DELIVERED":
-                item_status = MyAuctionItemStatus.DELIVERED
-            elif shipment_status == "SHIPPING":
-                item_status = MyAuctionItemStatus.SHIPPING
-            elif auction_status == "RUNNING":
-                item_status = MyAuctionItemStatus.RUNNING
-            elif auction_status == "PAUSED":
-                item_status = MyAuctionItemStatus.PAUSED
-            elif auction_status == "ENDED":
-                # am I winner and paid?
-                paid = (
-                    self.db.execute(
-                        select(func.count(Payment.id))
-                        .join(Order, Order.user_id == Payment.user_id)
-                        .join(OrderItem, OrderItem.order_id == Order.id)
-                        .where(
-                            Order.user_id == user_id,
-                            OrderItem.product_id == r.product_id,
-                            Payment.status == "PAID",
-                        )
-                    ).scalar_one()
-                    > 0
-                )
-                item_status = MyAuctionItemStatus.WON_CONFIRMED if paid else MyAuctionItemStatus.AUCTION_ENDED
-            else:
-                item_status = MyAuctionItemStatus.AUCTION_ENDED
-
             items.append(
                 UserRelatedAuctionItem(
                     product_id=int(r.product_id),
@@ -244,12 +219,14 @@ class UserAuctionReadRepository:
                     image_url=str(r.image_url) if r.image_url else None,
                     product_name=str(r.product_name),
                     current_highest_bid=float(r.current_highest_bid) if r.current_highest_bid is not None else None,
-                    my_bid_amount=float(my_highest) if my_highest is not None else None,
-                    status=item_status,
+                    my_bid_amount=float(r.my_highest) if r.my_highest is not None else None,
+                    status=self._item_status(
+                        r.auction_status,
+                        order_states.get(int(r.product_id)),
+                        bool(r.has_paid_payment),
+                    ),
                     my_last_bid_at=r.my_last_bid_at.isoformat() if r.my_last_bid_at else "",
                 )
             )
 
-        return items, total
-
-
+        return items, int(page_rows.total)
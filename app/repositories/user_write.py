@@ -24,7 +24,6 @@ class UserWriteRepository:
         )
         self.db.add(user)
         self.db.flush()
-        self.db.refresh(user)
         return user
 
     def update_user(
@@ -40,7 +39,6 @@ class UserWriteRepository:
         user.profile_image_url = profile_image_url
         user.is_phone_verified = is_phone_verified
         self.db.flush()
-        self.db.refresh(user)
         return user
 
     def create_auth_provider(
@@ -82,7 +80,6 @@ class UserWriteRepository:
     def set_phone_verification_as_verified(
         self, verification: PhoneVerification, verified_at: datetime
     ) -> PhoneVerification:
-        verification.verified_at = verified_at.isoformat()
+        verification.verified_at = verified_at
         self.db.flush()
-        self.db.refresh(verification)
         return verification
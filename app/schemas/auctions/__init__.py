@@ -2,3 +2,4 @@ from .auction import Auction
 from .bid import Bid
 from .auction_offer import AuctionOffer
 from .auction_deposit import AuctionDeposit
+from .auction_stats import AuctionStats
@@ -1,4 +1,4 @@
-from sqlalchemy import Column, BigInteger, String, DateTime, DECIMAL, ForeignKey
+from sqlalchemy import Column, BigInteger, String, DateTime, DECIMAL, ForeignKey, Index
 from sqlalchemy.sql import func
 from sqlalchemy.orm import relationship
 from app.db.session import Base
@@ -6,6 +6,11 @@ from app.db.session import Base
 
 class Auction(Base):
     __tablename__ = "auction"
+    # 상태 전이 배치/피드: status + 시작/종료 시각 범위
+    __table_args__ = (
+        Index("idx_auction_status_ends", "status", "ends_at"),
+        Index("idx_auction_status_starts", "status", "starts_at"),
+    )
 
     id = Column(BigInteger, primary_key=True, autoincrement=True)
     product_id = Column(
@@ -0,0 +1,30 @@
+from sqlalchemy import (
+    Column,
+    BigInteger,
+    Integer,
+    DateTime,
+    DECIMAL,
+    ForeignKey,
+    Index,
+)
+from sqlalchemy.sql import func
+from app.db.session import Base
+
+
+class AuctionStats(Base):
+    """경매별 입찰 집계(비정규화). 입찰 시 같은 트랜잭션에서 갱신된다."""
+
+    __tablename__ = "auction_stats"
+    __table_args__ = (
+        Index("idx_as_highest_bid", "current_highest_bid"),
+        Index("idx_as_bidder_count", "bidder_count"),
+    )
+
+    auction_id = Column(BigInteger, ForeignKey("auction.id"), primary_key=True)
+    current_highest_bid = Column(DECIMAL(12, 2))
+    bidder_count = Column(Integer, nullable=False, default=0)
+    bid_count = Column(Integer, nullable=False, default=0)
+    last_bid_at = Column(DateTime)
+    updated_at = Column(
+        DateTime, nullable=False, server_default=func.now(), onupdate=func.now()
+    )
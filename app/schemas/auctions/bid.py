@@ -1,4 +1,13 @@
-from sqlalchemy import Column, BigInteger, Integer, DateTime, DECIMAL, ForeignKey
+from sqlalchemy import (
+    Column,
+    BigInteger,
+    Integer,
+    DateTime,
+    DECIMAL,
+    ForeignKey,
+    UniqueConstraint,
+    Index,
+)
 from sqlalchemy.sql import func
 from sqlalchemy.orm import relationship
 from app.db.session import Base
@@ -6,6 +15,14 @@ from app.db.session import Base
 
 class Bid(Base):
     __tablename__ = "bid"
+    # 경매 내 입찰 순번 중복 방지 (동시 입찰 불변식의 최후 방어선)
+    __table_args__ = (
+        UniqueConstraint("auction_id", "bid_order", name="uq_bid_auction_order"),
+        # 경매별 최고가/입찰 목록, 경매별 내 입찰, 내 입찰 내역(최근순)
+        Index("idx_bid_auction_amount", "auction_id", "amount"),
+        Index("idx_bid_auction_user", "auction_id", "user_id"),
+        Index("idx_bid_user_created", "user_id", "created_at"),
+    )
 
     id = Column(BigInteger, primary_key=True, autoincrement=True)
     auction_id = Column(BigInteger, ForeignKey("auction.id"), nullable=False)
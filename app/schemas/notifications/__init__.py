@@ -1 +1,2 @@
 from .notification import Notification
+from .notification_outbox import NotificationOutbox
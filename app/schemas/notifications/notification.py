@@ -1,10 +1,15 @@
-from sqlalchemy import Column, BigInteger, String, DateTime, JSON
+from sqlalchemy import Column, BigInteger, String, DateTime, JSON, Index
 from sqlalchemy.sql import func
 from app.db.session import Base
 
 
 class Notification(Base):
     __tablename__ = "notification"
+    # 내 알림 목록(최근순) / 상태별 개수
+    __table_args__ = (
+        Index("idx_notification_user_sent", "user_id", "sent_at"),
+        Index("idx_notification_user_status", "user_id", "status"),
+    )
 
     id = Column(BigInteger, primary_key=True, autoincrement=True)
     user_id = Column(BigInteger)
@@ -0,0 +1,20 @@
+from sqlalchemy import Column, BigInteger, Integer, String, DateTime, JSON, Index
+from sqlalchemy.sql import func
+from app.db.session import Base
+
+
+class NotificationOutbox(Base):
+    """알림 트랜잭셔널 아웃박스. 비즈니스 트랜잭션과 함께 기록되고 디스패처가 비동기 전달한다."""
+
+    __tablename__ = "notification_outbox"
+    __table_args__ = (Index("idx_no_status_available", "status", "available_at"),)
+
+    id = Column(BigInteger, primary_key=True, autoincrement=True)
+    channel = Column(String(20), nullable=False)  # INBOX | SMS | PUSH
+    payload = Column(JSON, nullable=False)
+    status = Column(String(20), nullable=False, default="PENDING")  # PENDING | IN_FLIGHT(전달 중, available_at까지 임대) | SENT | FAILED
+    attempts = Column(Integer, nullable=False, default=0)
+    available_at = Column(DateTime, nullable=False, server_default=func.now())
+    last_error = Column(String(1024))
+    created_at = Column(DateTime, nullable=False, server_default=func.now())
+    sent_at = Column(DateTime)
@@ -1,9 +1,11 @@
-from sqlalchemy import Column, BigInteger, Integer, DECIMAL, ForeignKey
+from sqlalchemy import Column, BigInteger, Integer, DECIMAL, ForeignKey, Index
 from app.db.session import Base
 
 
 class OrderItem(Base):
     __tablename__ = "order_item"
+    # 상품별 주문/배송 상태 조회 (내 경매, 관리자 경매 목록)
+    __table_args__ = (Index("idx_oi_product", "product_id"),)
 
     id = Column(BigInteger, primary_key=True, autoincrement=True)
     order_id = Column(BigInteger, ForeignKey("order.id"), nullable=False)
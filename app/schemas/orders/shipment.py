@@ -1,10 +1,11 @@
-from sqlalchemy import Column, BigInteger, String, DateTime
+from sqlalchemy import Column, BigInteger, String, DateTime, Index
 from sqlalchemy.sql import func
 from app.db.session import Base
 
 
 class Shipment(Base):
     __tablename__ = "shipment"
+    __table_args__ = (Index("idx_shipment_order", "order_id"),)
 
     id = Column(BigInteger, primary_key=True, autoincrement=True)
     order_id = Column(BigInteger, nullable=False)
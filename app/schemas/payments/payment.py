@@ -7,6 +7,7 @@ from sqlalchemy import (
     DECIMAL,
     ForeignKey,
     Enum as SAEnum,
+    Index,
 )
 from sqlalchemy.sql import func
 from app.db.session import Base
@@ -14,6 +15,8 @@ from app.db.session import Base
 
 class Payment(Base):
     __tablename__ = "payment"
+    # 주문별 결제 상태 EXISTS (관리자 경매 결제 상태)
+    __table_args__ = (Index("idx_payment_order_status", "order_id", "status"),)
 
     id = Column(BigInteger, primary_key=True, autoincrement=True)
     order_id = Column(BigInteger)
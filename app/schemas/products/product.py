@@ -6,6 +6,7 @@ from sqlalchemy import (
     DateTime,
     DECIMAL,
     ForeignKey,
+    Index,
 )
 from sqlalchemy.sql import func
 from sqlalchemy.orm import relationship
@@ -14,6 +15,20 @@ from app.db.session import Base
 
 class Product(Base):
     __tablename__ = "product"
+    # 키워드 검색(SEARCH_BACKEND=fulltext)용 ngram FULLTEXT — MATCH 컬럼 목록과 정확히 같아야 한다
+    __table_args__ = (
+        Index(
+            "ft_product_text",
+            "name",
+            "summary",
+            "description",
+            mysql_prefix="FULLTEXT",
+            mysql_with_parser="ngram",
+        ),
+        Index("ft_product_name", "name", mysql_prefix="FULLTEXT", mysql_with_parser="ngram"),
+        # 스토어별 판매중 상품 목록
+        Index("idx_product_store_active", "popup_store_id", "is_active", "is_sold"),
+    )
 
     id = Column(BigInteger, primary_key=True, autoincrement=True)
     popup_store_id = Column(BigInteger, ForeignKey("popup_store.id"), nullable=False)
@@ -36,6 +51,8 @@ class Product(Base):
     courier_name = Column(String(60), default="CJ대한통운")
     is_active = Column(Integer, nullable=False, default=1)
     is_sold = Column(Integer, nullable=False, default=0)
+    # 비정규화: sort_order가 가장 작은 product_image URL (sync_product_images가 유지)
+    representative_image_url = Column(String(1024))
     created_at = Column(DateTime, nullable=False, server_default=func.now())
     updated_at = Column(
         DateTime, nullable=False, server_default=func.now(), onupdate=func.now()
@@ -1,9 +1,11 @@
-from sqlalchemy import Column, BigInteger, Integer, String, ForeignKey
+from sqlalchemy import Column, BigInteger, Integer, String, ForeignKey, Index
 from app.db.session import Base
 
 
 class ProductImage(Base):
     __tablename__ = "product_image"
+    # 대표 이미지(sort_order 최소) 조회
+    __table_args__ = (Index("idx_pi_product_sort", "product_id", "sort_order"),)
 
     id = Column(BigInteger, primary_key=True, autoincrement=True)
     product_id = Column(BigInteger, ForeignKey("product.id"), nullable=False)
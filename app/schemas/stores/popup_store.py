@@ -1,10 +1,13 @@
-from sqlalchemy import Column, BigInteger, String, DateTime
+from sqlalchemy import Column, BigInteger, String, DateTime, Index
 from sqlalchemy.sql import func
 from app.db.session import Base
 
 
 class PopupStore(Base):
     __tablename__ = "popup_store"
+    __table_args__ = (
+        Index("ft_popup_store_name", "name", mysql_prefix="FULLTEXT", mysql_with_parser="ngram"),
+    )
 
     id = Column(BigInteger, primary_key=True, autoincrement=True)
     name = Column(String(120), nullable=False)
@@ -14,3 +17,7 @@ class PopupStore(Base):
     starts_at = Column(DateTime)
     ends_at = Column(DateTime)
     created_at = Column(DateTime, nullable=False, server_default=func.now())
+    # 스토어명은 상품 검색 문서에 포함 → 검색 색인 증분 반영(refresh) 기준
+    updated_at = Column(
+        DateTime, nullable=False, server_default=func.now(), onupdate=func.now()
+    )
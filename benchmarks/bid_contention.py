@@ -0,0 +1,247 @@
+"""단일 경매 동시 입찰 경합 벤치마크
+
+수천 명의 입찰자가 하나의 경매에 동시에 입찰하는 상황(플래시 경매)을 재현하고
+처리량, 재시도율, 불변식(입찰 순번 연속/유일, 금액 단조 증가, 집계 일치)을 검증한다.
+입찰자는 최신 최고가 기준 다음 스텝으로 입찰하고, 경합으로 금액이 밀리면(BID_NOT_ALLOWED)
+새 최고가로 다시 입찰한다.
+
+실행 (MySQL, 테스트용 DB 권장 — 입찰/경매 데이터가 생성됨):
+    DATABASE_URL=mysql+pymysql://... python -m benchmarks.bid_contention --create --bidders 2000 --concurrency 64
+    DATABASE_URL=mysql+pymysql://... python -m benchmarks.bid_contention --auction-id 4001
+"""
+
+import argparse
+import threading
+import time
+from collections import Counter
+from concurrent.futures import ThreadPoolExecutor
+from datetime import datetime, timedelta
+
+from sqlalchemy import func, select
+from sqlalchemy.orm import Session
+
+import app.main  # noqa: F401  (매퍼/테이블 등록)
+from app.core.errors import BusinessError
+from app.db.session import SessionLocal
+from app.domains.auctions.bid_rules import BidRules
+from app.domains.auctions.service import AuctionService
+from app.domains.common.tx import lock_retry_stats
+from app.domains.notifications.service import NotificationService
+from app.repositories.auction_deposit import AuctionDepositRepository
+from app.repositories.auction_read import AuctionReadRepository
+from app.repositories.auction_write import AuctionWriteRepository
+from app.repositories.order_write import OrderWriteRepository
+from app.repositories.payment_write import PaymentWriteRepository
+from app.schemas.auctions import Auction, AuctionStats, Bid
+from app.schemas.products import Product
+from app.schemas.stores import PopupStore
+
+
+def percentile(samples, pct: float) -> float:
+    ordered = sorted(samples)
+    if not ordered:
+        return 0.0
+    idx = min(len(ordered) - 1, max(0, int(round(pct / 100 * len(ordered))) - 1))
+    return ordered[idx]
+
+
+class Outcomes:
+    def __init__(self):
+        self._lock = threading.Lock()
+        self.counts: Counter = Counter()
+        self.latencies: list = []
+
+    def add(self, key: str, latency_ms: float | None = None) -> None:
+        with self._lock:
+            self.counts[key] += 1
+            if latency_ms is not None:
+                self.latencies.append(latency_ms)
+
+
+def _auction_service(db: Session) -> AuctionService:
+    return AuctionService(
+        db,
+        AuctionReadRepository(db),
+        AuctionWriteRepository(db),
+        OrderWriteRepository(db),
+        PaymentWriteRepository(db),
+        AuctionDepositRepository(db),
+        NotificationService(db),
+    )
+
+
+def create_auction() -> int:
+    """즉시구매가 없는 RUNNING 경매 생성 (스텝 상한 없이 경합 유지)"""
+    db = SessionLocal()
+    try:
+        store_id = db.execute(select(func.min(PopupStore.id))).scalar_one()
+        if store_id is None:
+            raise SystemExit("popup_store 데이터가 필요합니다")
+        now = datetime.utcnow()
+        product = Product(
+            popup_store_id=store_id,
+            category="가구/리빙",
+            name="bid-contention-benchmark",
+            price=10000,
+            stock=1,
+        )
+        db.add(product)
+        db.flush()
+        auction = Auction(
+            product_id=product.id,
+            start_price=10000,
+            min_bid_price=10000,
+            buy_now_price=None,
+            deposit_amount=0,
+            starts_at=now - timedelta(hours=1),
+            ends_at=now + timedelta(days=1),
+            status="RUNNING",
+        )
+        db.add(auction)
+        db.commit()
+        return int(auction.id)
+    finally:
+        db.close()
+
+
+def _bid_until_accepted(
+    auction_id: int, product_id: int, user_id: int, max_attempts: int, outcomes: Outcomes
+) -> None:
+    db = SessionLocal()
+    try:
+        service = _auction_service(db)
+        read = AuctionReadRepository(db)
+        for _ in range(max_attempts):
+            info = read.load_auction_info_by_product(product_id)
+            db.rollback()  # 읽기 스냅샷 종료 → 다음 조회는 최신 커밋 기준
+            current = (
+                float(info.current_highest_bid)
+                if info.current_highest_bid is not None
+                else float(info.min_bid_price)
+            )
+            buy_now = float(info.buy_now_price) if info.buy_now_price is not None else None
+            steps = BidRules.make_bid_steps(current, buy_now, count=1)
+            if not steps:
+                outcomes.add("exhausted")
+                return
+            started = time.perf_counter()
+            try:
+                service.place_bid(auction_id=auction_id, amount=steps[0], user_id=user_id)
+            except BusinessError as e:
+                code = getattr(e.code, "value", e.code)
+                outcomes.add(f"rejected:{code}")
+                if code == "BID_NOT_ALLOWED":
+                    # 다른 입찰에 밀려 금액이 낡음 → 최신 최고가로 재입찰
+                    continue
+                return
+            except Exception as e:
+                db.rollback()
+                outcomes.add(f"error:{type(e).__name__}")
+                return
+            outcomes.add("accepted", (time.perf_counter() - started) * 1000)
+            return
+        outcomes.add("gave_up")
+    finally:
+        db.close()
+
+
+def check_invariants(auction_id: int) -> list:
+    db = SessionLocal()
+    try:
+        rows = db.execute(
+            select(Bid.bid_order, Bid.amount, Bid.user_id)
+            .where(Bid.auction_id == auction_id)
+            .order_by(Bid.bid_order.asc(), Bid.id.asc())
+        ).all()
+        orders = [int(r[0]) for r in rows]
+        amounts = [float(r[1]) for r in rows]
+        problems = []
+        if orders != list(range(1, len(orders) + 1)):
+            problems.append("bid_order가 1부터 연속/유일하지 않음")
+        if any(b <= a for a, b in zip(amounts, amounts[1:])):
+            problems.append("입찰 금액이 순번 기준 단조 증가하지 않음")
+        stats = db.get(AuctionStats, auction_id)
+        if rows:
+            if stats is None:
+                problems.append("auction_stats 행 없음")
+            else:
+                if float(stats.current_highest_bid or 0) != max(amounts):
+                    problems.append("auction_stats.current_highest_bid != max(bid.amount)")
+                if int(stats.bid_count) != len(rows):
+                    problems.append("auction_stats.bid_count != count(bid)")
+                if int(stats.bidder_count) != len({r[2] for r in rows}):
+                    problems.append("auction_stats.bidder_count != count(distinct user)")
+        return problems
+    finally:
+        db.close()
+
+
+def run(auction_id: int, bidders: int, concurrency: int, user_id_base: int, max_attempts: int):
+    db = SessionLocal()
+    try:
+        product_id = db.execute(
+            select(Auction.product_id).where(Auction.id == auction_id)
+        ).scalar_one()
+    finally:
+        db.close()
+
+    outcomes = Outcomes()
+    retries_before = lock_retry_stats["retries"]
+    started = time.perf_counter()
+    with ThreadPoolExecutor(max_workers=concurrency) as pool:
+        for i in range(bidders):
+            pool.submit(
+                _bid_until_accepted,
+                auction_id,
+                product_id,
+                user_id_base + i,
+                max_attempts,
+                outcomes,
+            )
+    elapsed = time.perf_counter() - started
+
+    counts = outcomes.counts
+    accepted = counts["accepted"]
+    attempts = sum(v for k, v in counts.items() if k == "accepted" or k.startswith(("rejected", "error")))
+    stale = sum(v for k, v in counts.items() if k.startswith("rejected"))
+    lock_retries = lock_retry_stats["retries"] - retries_before
+    print(f"auction_id={auction_id} bidders={bidders} concurrency={concurrency} elapsed={elapsed:.2f}s")
+    print(f"accepted={accepted} throughput={accepted / elapsed:.1f} bids/s attempts={attempts}")
+    print(
+        f"client_retry_rate={stale / attempts if attempts else 0:.2%} "
+        f"lock_retries={lock_retries} outcomes={dict(counts)}"
+    )
+    lat = outcomes.latencies
+    print(
+        "accepted_latency_ms "
+        f"p50={percentile(lat, 50):.1f} p95={percentile(lat, 95):.1f} p99={percentile(lat, 99):.1f}"
+    )
+    problems = check_invariants(auction_id)
+    if problems:
+        print("INVARIANTS FAIL")
+        for p in problems:
+            print(f"  - {p}")
+        raise SystemExit(1)
+    print("INVARIANTS OK")
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--auction-id", type=int)
+    parser.add_argument("--create", action="store_true", help="벤치마크용 경매를 새로 생성")
+    parser.add_argument("--bidders", type=int, default=2000)
+    parser.add_argument("--concurrency", type=int, default=64)
+    parser.add_argument("--user-id-base", type=int, default=9_000_000)
+    parser.add_argument("--max-attempts", type=int, default=50, help="입찰자별 최대 재입찰 횟수")
+    args = parser.parse_args()
+    if args.create:
+        auction_id = create_auction()
+    elif args.auction_id:
+        auction_id = args.auction_id
+    else:
+        parser.error("--auction-id 또는 --create 필요")
+    run(auction_id, args.bidders, args.concurrency, args.user_id_base, args.max_attempts)
+
+
+if __name__ == "__main__":
+    main()
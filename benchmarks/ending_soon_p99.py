@@ -0,0 +1,83 @@
+"""/products/ending-soon 동시성 부하 벤치마크
+
+동일 워커(uvicorn --workers 1)에 N개의 동시 클라이언트를 붙여 p50/p95/p99 지연을 측정한다.
+before/after 비교 방법:
+    # before: 동기 세션 (DATABASE_ASYNC_URL 미설정)
+    uvicorn app.main:app --workers 1
+    python -m benchmarks.ending_soon_p99 --base-url http://localhost:8000
+
+    # after: async 드라이버
+    DATABASE_ASYNC_URL=mysql+aiomysql://... uvicorn app.main:app --workers 1
+    python -m benchmarks.ending_soon_p99 --base-url http://localhost:8000
+"""
+
+import argparse
+import asyncio
+import statistics
+import time
+
+import httpx
+
+
+def percentile(samples, pct: float) -> float:
+    ordered = sorted(samples)
+    if not ordered:
+        return 0.0
+    idx = min(len(ordered) - 1, max(0, int(round(pct / 100 * len(ordered))) - 1))
+    return ordered[idx]
+
+
+async def _client_loop(client, url, params, n_requests, latencies, errors):
+    for _ in range(n_requests):
+        started = time.perf_counter()
+        try:
+            resp = await client.get(url, params=params)
+            if resp.status_code != 200:
+                errors.append(resp.status_code)
+        except httpx.HTTPError as e:
+            errors.append(type(e).__name__)
+        latencies.append((time.perf_counter() - started) * 1000)
+
+
+async def run(base_url: str, concurrency: int, requests_per_client: int, path: str):
+    url = base_url.rstrip("/") + path
+    params = {"page": 1, "size": 20}
+    latencies: list = []
+    errors: list = []
+    limits = httpx.Limits(max_connections=concurrency, max_keepalive_connections=concurrency)
+    async with httpx.AsyncClient(limits=limits, timeout=60) as client:
+        # warm-up (커넥션 풀/쿼리 캐시 예열)
+        await client.get(url, params=params)
+        started = time.perf_counter()
+        await asyncio.gather(
+            *[
+                _client_loop(client, url, params, requests_per_client, latencies, errors)
+                for _ in range(concurrency)
+            ]
+        )
+        elapsed = time.perf_counter() - started
+
+    total = len(latencies)
+    print(f"url={url} concurrency={concurrency} requests={total} errors={len(errors)}")
+    print(f"throughput={total / elapsed:.1f} req/s elapsed={elapsed:.2f}s")
+    print(
+        "latency_ms "
+        f"p50={percentile(latencies, 50):.1f} "
+        f"p95={percentile(latencies, 95):.1f} "
+        f"p99={percentile(latencies, 99):.1f} "
+        f"mean={statistics.fmean(latencies) if latencies else 0:.1f}"
+    )
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--base-url", default="http://localhost:8000")
+    parser.add_argument("--path", default="/users/v1/products/ending-soon")
+    parser.add_argument("--concurrency", type=int, default=200)
+    parser.add_argument("--requests-per-client", type=int, default=20)
+    args = parser.parse_args()
+    asyncio.run(run(args.base_url, args.concurrency, args.requests_per_client, args.path))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,236 @@
+"""상품 키워드 검색 벤치마크 — 합성 카탈로그(기본 100만 상품)
+
+1) 프로세스 내 (기본): 메모리 bigram 역색인(NgramIndex) 적재 시간/메모리와 질의 p50/p99를
+   LIKE '%q%'와 같은 부분 문자열 전체 스캔과 비교
+    python -m benchmarks.search_index --products 1000000 --queries 200
+
+2) DB: 합성 상품을 MySQL에 적재(--seed-db)한 뒤 LIKE / FULLTEXT(ngram) 조건의 COUNT 지연 비교
+    python -m benchmarks.search_index --seed-db 1000000
+    python -m benchmarks.search_index --db --queries 50
+"""
+
+import argparse
+import random
+import resource
+import time
+
+from sqlalchemy import func, insert, select
+
+import app.main  # noqa: F401  (설정/매퍼 로딩)
+from app.db.session import SessionLocal
+from app.domains.products.search import FEED_SEARCH_FIELDS
+from app.infrastructure.search.backends import (
+    FullTextSearchBackend,
+    InMemorySearchBackend,
+    LikeSearchBackend,
+    SearchField,
+)
+from app.infrastructure.search.ngram_index import normalize_words
+from app.schemas.products import Product
+from app.schemas.stores import PopupStore
+
+ADJECTIVES = [
+    "원목", "빈티지", "모던", "북유럽", "수제", "미니", "대형", "접이식", "라탄", "세라믹",
+    "유리", "리넨", "가죽", "스테인리스", "우드", "클래식", "심플", "컬러", "무광", "한정판",
+]
+NOUNS = [
+    "의자", "테이블", "스툴", "램프", "조명", "화병", "머그컵", "접시", "쟁반", "선반",
+    "수납장", "거울", "시계", "러그", "쿠션", "캔들", "액자", "트레이", "바구니", "소파",
+    "책상", "서랍", "행거", "포스터", "키링", "텀블러", "볼", "커트러리", "매트", "오브제",
+]
+PHRASES = [
+    "편안한 착석감", "공방에서 직접 제작", "한정 수량", "선물용으로 좋은", "생활 방수",
+    "오래 써도 튼튼한", "작은 공간에 어울리는", "손으로 칠한", "재고 소진 시 종료", "친환경 소재",
+]
+STORES = [f"{a} {n} 팝업" for a in ADJECTIVES[:10] for n in ("하우스", "마켓", "스튜디오", "랩")]
+
+
+def percentile(samples, pct: float) -> float:
+    ordered = sorted(samples)
+    if not ordered:
+        return 0.0
+    idx = min(len(ordered) - 1, max(0, int(round(pct / 100 * len(ordered))) - 1))
+    return ordered[idx]
+
+
+def synthetic_products(n: int, seed: int = 42):
+    """(id, name, summary, description, store_name) 합성 상품"""
+    rng = random.Random(seed)
+    for pid in range(1, n + 1):
+        name = f"{rng.choice(ADJECTIVES)} {rng.choice(NOUNS)} {rng.randint(1, 999)}호"
+        summary = f"{rng.choice(PHRASES)} {rng.choice(ADJECTIVES)} {rng.choice(NOUNS)}"
+        description = " ".join(rng.sample(PHRASES, 3))
+        yield pid, name, summary, description, STORES[pid % len(STORES)]
+
+
+def synthetic_queries(n: int, seed: int = 7):
+    """단어 1개 / 2개 / 1글자 질의를 섞는다"""
+    rng = random.Random(seed)
+    queries = []
+    for i in range(n):
+        kind = i % 4
+        if kind == 0:
+            queries.append(rng.choice(NOUNS))
+        elif kind == 1:
+            queries.append(f"{rng.choice(ADJECTIVES)} {rng.choice(NOUNS)}")
+        elif kind == 2:
+            queries.append(rng.choice(ADJECTIVES))
+        else:
+            queries.append(rng.choice(NOUNS)[0])
+    return queries
+
+
+def _peak_rss_mib() -> float:
+    return resource.getrusage(resource.RUSAGE_SELF).ru_maxrss / 1024
+
+
+def _like_scan(docs, query: str, limit: int) -> int:
+    """LIKE '%q%' OR ... 시뮬레이션 — 질의 전체를 부분 문자열로 전 문서 스캔"""
+    q = query.lower()
+    hits = 0
+    for texts in docs:
+        if any(t and q in t for t in texts):
+            hits += 1
+    return min(hits, limit)
+
+
+def run_in_process(n_products: int, n_queries: int, scan_queries: int, max_results: int):
+    backend = InMemorySearchBackend(max_results=max_results)
+    index = backend.new_index()
+    fields = [f.value for f in FEED_SEARCH_FIELDS]
+
+    rss_before = _peak_rss_mib()
+    started = time.perf_counter()
+    for pid, name, summary, description, store in synthetic_products(n_products):
+        index.add(
+            pid,
+            {
+                SearchField.NAME.value: name,
+                SearchField.SUMMARY.value: summary,
+                SearchField.DESCRIPTION.value: description,
+                SearchField.STORE.value: store,
+            },
+        )
+    build_s = time.perf_counter() - started
+    stats = index.stats()
+    print(
+        f"products={n_products} build={build_s:.1f}s "
+        f"({n_products / build_s:,.0f} docs/s) peak_rss_delta≈{_peak_rss_mib() - rss_before:.0f}MiB"
+    )
+    print(f"terms={stats['terms']:,} postings={stats['postings']:,}")
+
+    queries = synthetic_queries(n_queries)
+    latencies = []
+    hit_counts = []
+    for q in queries:
+        t = time.perf_counter()
+        hits = index.search(q, fields, limit=max_results)
+        latencies.append((time.perf_counter() - t) * 1000)
+        hit_counts.append(len(hits))
+    print(
+        f"index  queries={len(queries)} p50={percentile(latencies, 50):.2f}ms "
+        f"p99={percentile(latencies, 99):.2f}ms max={max(latencies):.2f}ms "
+        f"avg_hits={sum(hit_counts) / len(hit_counts):.0f} (cap {max_results})"
+    )
+
+    if scan_queries <= 0:
+        return
+    # 스캔 비교용 문서는 LIKE처럼 원문(소문자)만 보관
+    docs = [
+        tuple(" ".join(normalize_words(t)) for t in (name, summary, description, store))
+        for _, name, summary, description, store in synthetic_products(n_products)
+    ]
+    scan = []
+    for q in queries[:scan_queries]:
+        t = time.perf_counter()
+        _like_scan(docs, q, max_results)
+        scan.append((time.perf_counter() - t) * 1000)
+    print(
+        f"scan   queries={len(scan)} p50={percentile(scan, 50):.2f}ms "
+        f"p99={percentile(scan, 99):.2f}ms max={max(scan):.2f}ms"
+    )
+
+
+def seed_db(n_products: int, chunk_size: int = 10000):
+    """합성 상품을 벤치마크 전용 스토어 아래에 적재"""
+    db = SessionLocal()
+    try:
+        store_ids = {}
+        for name in STORES:
+            store = PopupStore(name=name)
+            db.add(store)
+            db.flush()
+            store_ids[name] = store.id
+        db.commit()
+        chunk = []
+        started = time.perf_counter()
+        for pid, name, summary, description, store in synthetic_products(n_products):
+            chunk.append(
+                {
+                    "popup_store_id": store_ids[store],
+                    "category": "가구/리빙",
+                    "name": name,
+                    "summary": summary,
+                    "description": description,
+                    "price": 10000,
+                    "stock": 1,
+                }
+            )
+            if len(chunk) >= chunk_size:
+                db.execute(insert(Product), chunk)
+                db.commit()
+                chunk = []
+        if chunk:
+            db.execute(insert(Product), chunk)
+            db.commit()
+        print(f"seeded products={n_products} in {time.perf_counter() - started:.1f}s")
+    finally:
+        db.close()
+
+
+def run_db(n_queries: int, repeat: int):
+    backends = {"like": LikeSearchBackend(), "fulltext": FullTextSearchBackend()}
+    queries = synthetic_queries(n_queries)
+    db = SessionLocal()
+    try:
+        for name, backend in backends.items():
+            latencies = []
+            for q in queries:
+                stmt = (
+                    select(func.count())
+                    .select_from(Product)
+                    .join(PopupStore, PopupStore.id == Product.popup_store_id)
+                    .where(backend.match(q, FEED_SEARCH_FIELDS).where)
+                )
+                for _ in range(repeat):
+                    t = time.perf_counter()
+                    db.execute(stmt).scalar_one()
+                    latencies.append((time.perf_counter() - t) * 1000)
+            print(
+                f"{name:8s} queries={len(queries)}x{repeat} p50={percentile(latencies, 50):.1f}ms "
+                f"p99={percentile(latencies, 99):.1f}ms max={max(latencies):.1f}ms"
+            )
+    finally:
+        db.close()
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--products", type=int, default=1_000_000)
+    parser.add_argument("--queries", type=int, default=200)
+    parser.add_argument("--scan-queries", type=int, default=20, help="전체 스캔 비교 질의 수 (0이면 생략)")
+    parser.add_argument("--max-results", type=int, default=1000)
+    parser.add_argument("--seed-db", type=int, metavar="N", help="DB에 합성 상품 N개 적재")
+    parser.add_argument("--db", action="store_true", help="DB 모드: LIKE / FULLTEXT 비교")
+    parser.add_argument("--repeat", type=int, default=3)
+    args = parser.parse_args()
+    if args.seed_db:
+        seed_db(args.seed_db)
+    elif args.db:
+        run_db(args.queries, args.repeat)
+    else:
+        run_in_process(args.products, args.queries, args.scan_queries, args.max_results)
+
+
+if __name__ == "__main__":
+    main()
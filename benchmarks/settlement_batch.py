@@ -0,0 +1,222 @@
+"""경매 정산 배치 처리량 벤치마크
+
+종료 시각이 지난 RUNNING 경매 N개(기본 5만, 경매당 입찰자/보증금 결제 --bidders명)를 적재한 뒤
+AuctionSettlementBatch를 실행해 초당 정산 경매 수를 측정하고 결과를 검증한다.
+(경매당 RUNNING 잔여 0, 낙찰자 외 보증금만 정확히 1회 환불, 낙찰 알림 경매당 1건)
+--workers > 1이면 여러 배치를 동시에 실행해 SKIP LOCKED 선점으로 중복 정산이 없는지 확인한다
+(FOR UPDATE SKIP LOCKED를 지원하는 MySQL 8 필요). --chunk-size 1은 경매별 트랜잭션과 비교용.
+
+실행 (MySQL, 테스트용 DB 권장 — 만료된 다른 경매도 함께 정산됨):
+    DATABASE_URL=mysql+pymysql://... python -m benchmarks.settlement_batch --auctions 50000
+    DATABASE_URL=mysql+pymysql://... python -m benchmarks.settlement_batch --auctions 50000 --workers 4
+    DATABASE_URL=mysql+pymysql://... python -m benchmarks.settlement_batch --auctions 5000 --chunk-size 1
+"""
+
+import argparse
+import time
+import uuid
+from concurrent.futures import ThreadPoolExecutor
+from datetime import datetime, timedelta
+
+from sqlalchemy import func, insert, select
+
+import app.main  # noqa: F401  (매퍼/테이블 등록)
+from app.batch.auction_settlement import AuctionSettlementBatch
+from app.db.session import SessionLocal
+from app.schemas.auctions import Auction, AuctionDeposit, Bid
+from app.schemas.notifications import NotificationOutbox
+from app.schemas.payments import Payment, PaymentRefund
+from app.schemas.products import Product
+from app.schemas.stores import PopupStore
+
+USER_ID_BASE = 8_000_000
+
+
+def _chunks(rows, size):
+    for i in range(0, len(rows), size):
+        yield rows[i : i + size]
+
+
+def _bulk_insert(db, entity, rows, size: int = 5000) -> None:
+    for chunk in _chunks(rows, size):
+        db.execute(insert(entity), chunk)
+    db.commit()
+
+
+def seed(n_auctions: int, n_bidders: int) -> str:
+    """만료된 RUNNING 경매 + 입찰 + 보증금(결제 완료) 적재
+
+    :return: 이번 적재분 상품명 접두어 (검증용)
+    """
+    prefix = f"settlement-bench-{uuid.uuid4().hex[:8]}"
+    db = SessionLocal()
+    try:
+        store_id = db.execute(select(func.min(PopupStore.id))).scalar_one()
+        if store_id is None:
+            raise SystemExit("popup_store 데이터가 필요합니다")
+        now = datetime.utcnow()
+        started = time.perf_counter()
+        _bulk_insert(
+            db,
+            Product,
+            [
+                {
+                    "popup_store_id": store_id,
+                    "category": "가구/리빙",
+                    "name": f"{prefix}-{i}",
+                    "price": 10000,
+                    "stock": 1,
+                }
+                for i in range(n_auctions)
+            ],
+        )
+        product_ids = db.execute(
+            select(Product.id).where(Product.name.like(f"{prefix}-%")).order_by(Product.id)
+        ).scalars().all()
+        _bulk_insert(
+            db,
+            Auction,
+            [
+                {
+                    "product_id": pid,
+                    "start_price": 10000,
+                    "min_bid_price": 10000,
+                    "deposit_amount": 1000,
+                    "starts_at": now - timedelta(days=1),
+                    "ends_at": now - timedelta(seconds=i % 3600 + 1),
+                    "status": "RUNNING",
+                }
+                for i, pid in enumerate(product_ids)
+            ],
+        )
+        auction_ids = db.execute(
+            select(Auction.id).where(Auction.product_id.in_(product_ids)).order_by(Auction.id)
+        ).scalars().all()
+
+        bids, payments = [], []
+        for aid in auction_ids:
+            for k in range(n_bidders):
+                user_id = USER_ID_BASE + k
+                bids.append(
+                    {
+                        "auction_id": aid,
+                        "user_id": user_id,
+                        "bid_order": k + 1,
+                        "amount": 10000 + 1000 * k,
+                        "created_at": now - timedelta(hours=1) + timedelta(seconds=k),
+                    }
+                )
+                payments.append(
+                    {
+                        "user_id": user_id,
+                        "provider": "dummy",
+                        "external_tid": f"{prefix}-{aid}-{user_id}",
+                        "amount": 1000,
+                        "status": "PAID",
+                    }
+                )
+        _bulk_insert(db, Bid, bids)
+        _bulk_insert(db, Payment, payments)
+        paid = db.execute(
+            select(Payment.id, Payment.user_id, Payment.external_tid).where(
+                Payment.external_tid.like(f"{prefix}-%")
+            )
+        ).all()
+        _bulk_insert(
+            db,
+            AuctionDeposit,
+            [
+                {
+                    "auction_id": int(tid.rsplit("-", 2)[1]),
+                    "user_id": user_id,
+                    "payment_id": payment_id,
+                    "amount": 1000,
+                    "status": "PAID",
+                }
+                for payment_id, user_id, tid in paid
+            ],
+        )
+        print(
+            f"seeded auctions={len(auction_ids)} bids={len(bids)} deposits={len(paid)} "
+            f"in {time.perf_counter() - started:.1f}s"
+        )
+        return prefix
+    finally:
+        db.close()
+
+
+def verify(prefix: str, n_bidders: int) -> None:
+    db = SessionLocal()
+    try:
+        auctions = (
+            select(Auction.id)
+            .join(Product, Product.id == Auction.product_id)
+            .where(Product.name.like(f"{prefix}-%"))
+        )
+        running = db.execute(
+            select(func.count()).where(Auction.id.in_(auctions), Auction.status == "RUNNING")
+        ).scalar_one()
+        n_auctions = db.execute(select(func.count()).select_from(auctions.subquery())).scalar_one()
+        refunded = db.execute(
+            select(func.count()).where(
+                AuctionDeposit.auction_id.in_(auctions), AuctionDeposit.status == "REFUNDED"
+            )
+        ).scalar_one()
+        refund_rows, refunded_payments = db.execute(
+            select(func.count(), func.count(func.distinct(PaymentRefund.payment_id)))
+            .select_from(PaymentRefund)
+            .join(Payment, Payment.id == PaymentRefund.payment_id)
+            .where(Payment.external_tid.like(f"{prefix}-%"))
+        ).one()
+        notified = db.execute(
+            select(func.count()).where(
+                NotificationOutbox.payload["title"].as_string().like(f"{prefix}-%")
+            )
+        ).scalar_one()
+        expected = n_auctions * (n_bidders - 1)
+        print(
+            f"verify running={running} refunded_deposits={refunded}/{expected} "
+            f"refunds={refund_rows} (distinct payments {refunded_payments}) "
+            f"notifications={notified}/{n_auctions}"
+        )
+        ok = (
+            running == 0
+            and refunded == refund_rows == refunded_payments == expected
+            and notified == n_auctions
+        )
+        if not ok:
+            raise SystemExit("정산 결과 검증 실패")
+    finally:
+        db.close()
+
+
+def run(prefix: str, n_bidders: int, workers: int, chunk_size: int | None) -> None:
+    started = time.perf_counter()
+    with ThreadPoolExecutor(max_workers=workers) as pool:
+        counts = list(
+            pool.map(lambda _: AuctionSettlementBatch(chunk_size=chunk_size).run_once(), range(workers))
+        )
+    elapsed = time.perf_counter() - started
+    settled = sum(counts)
+    print(
+        f"settled={settled} workers={workers} per_worker={counts} elapsed={elapsed:.1f}s "
+        f"throughput={settled / elapsed:,.0f} auctions/s"
+    )
+    verify(prefix, n_bidders)
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--auctions", type=int, default=50_000)
+    parser.add_argument("--bidders", type=int, default=3, help="경매당 입찰자(보증금 결제) 수")
+    parser.add_argument("--workers", type=int, default=1, help="동시에 실행할 정산 배치 수")
+    parser.add_argument("--chunk-size", type=int, help="기본 SETTLEMENT_CHUNK_SIZE")
+    args = parser.parse_args()
+    if args.bidders < 1:
+        parser.error("--bidders는 1 이상")
+    prefix = seed(args.auctions, args.bidders)
+    run(prefix, args.bidders, args.workers, args.chunk_size)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,196 @@
+"""경매 실시간 이벤트(SSE) 팬아웃 벤치마크 — 한 워커에 유휴 구독자 수천 명
+
+1) 프로세스 내 (기본): 한 이벤트 루프에 N개의 SSE 스트림(sse_stream)을 띄우고, 요청 스레드처럼
+   별도 스레드에서 이벤트를 발행해 구독자당 메모리와 팬아웃 지연(발행 → 마지막 구독자 수신)을 측정
+    python -m benchmarks.sse_fanout --subscribers 5000 --events 50
+
+2) HTTP: 실행 중인 워커(uvicorn --workers 1)에 N개의 SSE 연결을 유지하고,
+   --bid-amount 지정 시 입찰 1건을 넣어 모든 연결이 BID 이벤트를 받기까지의 지연을 측정
+    uvicorn app.main:app --workers 1
+    python -m benchmarks.sse_fanout --base-url http://localhost:8000 --auction-id 4001 \\
+        --subscribers 2000 --bid-amount 72000 --bid-user-id 1003
+"""
+
+import argparse
+import asyncio
+import threading
+import time
+import tracemalloc
+
+import httpx
+
+import app.main  # noqa: F401  (설정/매퍼 로딩)
+from app.core.config import settings
+from app.domains.auctions.enums import AuctionEventType
+from app.domains.auctions.events import AuctionEvent
+from app.infrastructure.realtime.brokers import InProcessBroker
+from app.infrastructure.realtime.hub import EventHub, sse_stream
+
+
+def percentile(samples, pct: float) -> float:
+    ordered = sorted(samples)
+    if not ordered:
+        return 0.0
+    idx = min(len(ordered) - 1, max(0, int(round(pct / 100 * len(ordered))) - 1))
+    return ordered[idx]
+
+
+async def _never_disconnected() -> bool:
+    return False
+
+
+async def _consume(hub, channel, n_events, received, ready):
+    stream = sse_stream(hub, channel, is_disconnected=_never_disconnected)
+    await stream.__anext__()  # retry 프레임 = 구독 완료
+    ready()
+    for i in range(n_events):
+        await stream.__anext__()
+        received[i].append(time.perf_counter())
+    await stream.aclose()
+
+
+async def run_in_process(subscribers: int, n_events: int, interval_ms: float):
+    hub = EventHub(InProcessBroker(), queue_size=max(64, n_events))
+    channel = "auction:1"
+    received = [[] for _ in range(n_events)]
+    ready_count = 0
+    all_ready = asyncio.Event()
+
+    def ready():
+        nonlocal ready_count
+        ready_count += 1
+        if ready_count == subscribers:
+            all_ready.set()
+
+    tracemalloc.start()
+    base = tracemalloc.get_traced_memory()[0]
+    tasks = [
+        asyncio.create_task(_consume(hub, channel, n_events, received, ready))
+        for _ in range(subscribers)
+    ]
+    await all_ready.wait()
+    per_sub = (tracemalloc.get_traced_memory()[0] - base) / subscribers
+    tracemalloc.stop()
+
+    sent_at = []
+
+    def publisher():
+        for i in range(n_events):
+            frame = AuctionEvent(
+                type=AuctionEventType.BID, auction_id=1, product_id=1, amount=10000 + i * 1000
+            ).to_sse()
+            sent_at.append(time.perf_counter())
+            hub.publish(channel, frame)
+            time.sleep(interval_ms / 1000)
+
+    started = time.perf_counter()
+    cpu_started = time.process_time()
+    thread = threading.Thread(target=publisher)
+    thread.start()
+    await asyncio.gather(*tasks)
+    thread.join()
+    elapsed = time.perf_counter() - started
+    cpu = time.process_time() - cpu_started
+
+    fanout_ms = [(max(r) - sent_at[i]) * 1000 for i, r in enumerate(received)]
+    delivery_ms = [(t - sent_at[i]) * 1000 for i, r in enumerate(received) for t in r]
+    delivered = sum(len(r) for r in received)
+    print(f"subscribers={subscribers} events={n_events} delivered={delivered}/{subscribers * n_events}")
+    print(f"memory_per_subscriber={per_sub / 1024:.1f}KiB elapsed={elapsed:.2f}s cpu={cpu:.2f}s")
+    print(
+        f"fanout_ms(all subscribers) p50={percentile(fanout_ms, 50):.1f} "
+        f"p99={percentile(fanout_ms, 99):.1f} max={max(fanout_ms):.1f}"
+    )
+    print(
+        f"delivery_ms(per subscriber) p50={percentile(delivery_ms, 50):.1f} "
+        f"p99={percentile(delivery_ms, 99):.1f}"
+    )
+
+
+async def _http_subscriber(client, url, first_bid_at, stats):
+    try:
+        async with client.stream("GET", url) as resp:
+            if resp.status_code != 200:
+                stats["errors"] += 1
+                return
+            stats["connected"] += 1
+            async for line in resp.aiter_lines():
+                if line.startswith("event: BID"):
+                    stats["latencies"].append((time.perf_counter() - first_bid_at[0]) * 1000)
+                    return
+                if line.startswith(": ping"):
+                    stats["pings"] += 1
+    except httpx.HTTPError:
+        stats["errors"] += 1
+
+
+async def run_http(
+    base_url: str,
+    auction_id: int,
+    subscribers: int,
+    hold_seconds: float,
+    bid_amount: float | None,
+    bid_user_id: int,
+):
+    url = f"{base_url}{settings.API_V1_STR}/auction/{auction_id}/events"
+    stats = {"connected": 0, "errors": 0, "pings": 0, "latencies": []}
+    first_bid_at = [0.0]
+    limits = httpx.Limits(max_connections=subscribers + 10, max_keepalive_connections=0)
+    async with httpx.AsyncClient(limits=limits, timeout=httpx.Timeout(None, connect=30)) as client:
+        tasks = [
+            asyncio.create_task(_http_subscriber(client, url, first_bid_at, stats))
+            for _ in range(subscribers)
+        ]
+        deadline = time.perf_counter() + 60
+        while stats["connected"] + stats["errors"] < subscribers and time.perf_counter() < deadline:
+            await asyncio.sleep(0.2)
+        print(f"connected={stats['connected']} errors={stats['errors']} (holding {hold_seconds}s)")
+        await asyncio.sleep(hold_seconds)
+        if bid_amount is not None:
+            first_bid_at[0] = time.perf_counter()
+            resp = await client.post(
+                f"{base_url}{settings.API_V1_STR}/auction/bid",
+                params={"auction_id": auction_id, "amount": bid_amount},
+                headers={"Authorization": f"Bearer {bid_user_id}"},
+            )
+            print(f"bid status={resp.status_code} {resp.text[:120]}")
+            await asyncio.wait(tasks, timeout=30)
+        for t in tasks:
+            t.cancel()
+    lat = stats["latencies"]
+    print(f"pings={stats['pings']} bid_events_received={len(lat)}/{stats['connected']}")
+    if lat:
+        print(
+            f"bid→event ms p50={percentile(lat, 50):.1f} p99={percentile(lat, 99):.1f} "
+            f"max={max(lat):.1f}"
+        )
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--subscribers", type=int, default=5000)
+    parser.add_argument("--events", type=int, default=50, help="프로세스 내 모드: 발행 이벤트 수")
+    parser.add_argument("--interval-ms", type=float, default=20.0, help="프로세스 내 모드: 발행 간격")
+    parser.add_argument("--base-url", help="HTTP 모드: 실행 중인 서버 주소")
+    parser.add_argument("--auction-id", type=int, default=4001)
+    parser.add_argument("--hold-seconds", type=float, default=5.0)
+    parser.add_argument("--bid-amount", type=float)
+    parser.add_argument("--bid-user-id", type=int, default=1003)
+    args = parser.parse_args()
+    if args.base_url:
+        asyncio.run(
+            run_http(
+                args.base_url.rstrip("/"),
+                args.auction_id,
+                args.subscribers,
+                args.hold_seconds,
+                args.bid_amount,
+                args.bid_user_id,
+            )
+        )
+    else:
+        asyncio.run(run_in_process(args.subscribers, args.events, args.interval_ms))
+
+
+if __name__ == "__main__":
+    main()
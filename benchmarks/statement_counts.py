@@ -0,0 +1,207 @@
+"""쓰기 유스케이스별 SQL 문 수 벤치마크
+
+입찰/즉시구매/회원가입/관리자 상품 저장을 요청과 같은 구성(UoW 1개 + 엔드포인트 서비스 팩토리)으로
+실행하며 DB로 나간 문장 수(SELECT/INSERT/UPDATE/DELETE)와 커밋 수를 센다.
+쓰기 직후 refresh 같은 왕복이 다시 들어오면 BUDGETS를 넘어 종료 코드 1로 실패한다.
+(인증 의존성의 사용자 조회는 제외, 준비 데이터 적재는 집계하지 않음)
+
+실행 (MySQL, 테스트용 DB 권장 — 상품/경매/사용자 데이터가 생성됨):
+    DATABASE_URL=mysql+pymysql://... python -m benchmarks.statement_counts
+    DATABASE_URL=mysql+pymysql://... python -m benchmarks.statement_counts --no-check
+"""
+
+import argparse
+import sys
+import uuid
+from collections import Counter
+from datetime import datetime, timedelta
+from decimal import Decimal
+
+from sqlalchemy import event, func, select
+
+import app.main  # noqa: F401  (매퍼/테이블 등록)
+from app.api.v1.endpoints.admin_products import get_product_service
+from app.api.v1.endpoints.auction_actions import get_auction_service
+from app.api.v1.endpoints.auth import get_user_service
+from app.db.session import SessionLocal, engine
+from app.domains.products.admin_product import ProductCreateOrUpdate
+from app.domains.products.product_meta import ProductSpecs
+from app.infrastructure.db.uow import SqlAlchemyUnitOfWork
+from app.schemas.auctions import Auction
+from app.schemas.products import Product
+from app.schemas.stores import PopupStore
+from app.schemas.users import User
+
+# 유스케이스별 허용 문장 수 (커밋 제외). 줄이는 변경이면 함께 낮춘다
+BUDGETS = {
+    "bid": 14,
+    "buy-now": 12,
+    "signup": 3,
+    "admin-product-create": 14,
+    "admin-product-update": 16,
+}
+
+
+class StatementCounter:
+    """engine에서 실행되는 문장 수를 종류별로 센다 (with 블록 동안)"""
+
+    def __init__(self, bind=engine):
+        self.bind = bind
+        self.counts: Counter = Counter()
+
+    def _before_execute(self, conn, cursor, statement, parameters, context, executemany):
+        self.counts[statement.lstrip().split(None, 1)[0].upper()] += 1
+
+    def _commit(self, conn):
+        self.counts["COMMIT"] += 1
+
+    def __enter__(self) -> "StatementCounter":
+        event.listen(self.bind, "before_cursor_execute", self._before_execute)
+        event.listen(self.bind, "commit", self._commit)
+        return self
+
+    def __exit__(self, *exc):
+        event.remove(self.bind, "before_cursor_execute", self._before_execute)
+        event.remove(self.bind, "commit", self._commit)
+
+    @property
+    def statements(self) -> int:
+        return sum(n for kind, n in self.counts.items() if kind != "COMMIT")
+
+
+def seed(prefix: str) -> dict:
+    """유스케이스 준비 데이터: 입찰자/구매자, 진행 중 경매 2개(입찰용/즉시구매용)"""
+    db = SessionLocal()
+    try:
+        store_id = db.execute(select(func.min(PopupStore.id))).scalar_one()
+        if store_id is None:
+            raise SystemExit("popup_store 데이터가 필요합니다")
+        users = [User(email=f"{prefix}-{i}@bench.local", nickname=f"{prefix}-{i}") for i in range(2)]
+        db.add_all(users)
+        now = datetime.utcnow()
+        auctions = []
+        for kind in ("bid", "buy-now"):
+            product = Product(
+                popup_store_id=store_id, category="가구/리빙", name=f"{prefix}-{kind}", price=10000, stock=1
+            )
+            db.add(product)
+            db.flush()
+            auction = Auction(
+                product_id=product.id,
+                start_price=10000,
+                min_bid_price=10000,
+                buy_now_price=100000,
+                deposit_amount=1000,
+                starts_at=now - timedelta(hours=1),
+                ends_at=now + timedelta(hours=1),
+                status="RUNNING",
+            )
+            db.add(auction)
+            auctions.append(auction)
+        db.commit()
+        return {
+            "store_id": store_id,
+            "user_id": users[0].id,
+            "buyer_id": users[1].id,
+            "bid_auction_id": auctions[0].id,
+            "buy_now_auction_id": auctions[1].id,
+        }
+    finally:
+        db.close()
+
+
+def _product_data(prefix: str, store_id: int, **overrides) -> ProductCreateOrUpdate:
+    data = dict(
+        name=f"{prefix}-admin",
+        summary="요약",
+        description="설명",
+        price=Decimal("120000"),
+        stock=1,
+        images=[f"https://img.local/{prefix}/main.png", f"https://img.local/{prefix}/detail.png"],
+        category="가구/리빙",
+        tags=[f"{prefix}-a", f"{prefix}-b"],
+        specs=ProductSpecs(),
+        store_id=store_id,
+        shipping_base_fee=2500,
+    )
+    data.update(overrides)
+    return ProductCreateOrUpdate(**data)
+
+
+def run_use_cases(prefix: str, ctx: dict) -> dict:
+    """유스케이스마다 요청 하나와 같은 UoW 스코프로 실행하고 StatementCounter 결과 반환"""
+    results = {}
+
+    def measure(name, fn):
+        with StatementCounter() as counter:
+            with SqlAlchemyUnitOfWork() as uow:
+                value = fn(uow)
+        results[name] = counter
+        return value
+
+    measure(
+        "bid",
+        lambda uow: get_auction_service(uow).place_bid(
+            auction_id=ctx["bid_auction_id"], amount=11000, user_id=ctx["user_id"]
+        ),
+    )
+    measure(
+        "buy-now",
+        lambda uow: get_auction_service(uow).buy_now(
+            auction_id=ctx["buy_now_auction_id"], user_id=ctx["buyer_id"]
+        ),
+    )
+    measure(
+        "signup",
+        lambda uow: get_user_service(uow).signup_user_with_oauth(
+            email=f"{prefix}-signup@bench.local",
+            nickname=f"{prefix}-signup",
+            provider="kakao",
+            provider_user_id=prefix,
+            raw_profile_json={},
+        ),
+    )
+    created = measure(
+        "admin-product-create",
+        lambda uow: get_product_service(uow).create_product_admin(_product_data(prefix, ctx["store_id"])),
+    )
+    measure(
+        "admin-product-update",
+        lambda uow: get_product_service(uow).update_product_admin(
+            _product_data(
+                prefix,
+                ctx["store_id"],
+                id=created.id,
+                stock=2,
+                images=[f"https://img.local/{prefix}/detail.png"],
+                tags=[f"{prefix}-b", f"{prefix}-c"],
+            )
+        ),
+    )
+    return results
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--no-check", action="store_true", help="BUDGETS 초과여도 실패하지 않음")
+    args = parser.parse_args()
+
+    prefix = f"stmt-bench-{uuid.uuid4().hex[:8]}"
+    results = run_use_cases(prefix, seed(prefix))
+
+    over = []
+    print(f"{'use case':<22}{'total':>6}{'budget':>7}  {'commits':>7}  breakdown")
+    for name, counter in results.items():
+        counts = counter.counts
+        breakdown = ", ".join(f"{kind} {n}" for kind, n in sorted(counts.items()) if kind != "COMMIT")
+        print(f"{name:<22}{counter.statements:>6}{BUDGETS[name]:>7}  {counts['COMMIT']:>7}  {breakdown}")
+        # 요청당 커밋은 정확히 1회 (UoW)
+        if counter.statements > BUDGETS[name] or counts["COMMIT"] != 1:
+            over.append(name)
+    if over and not args.no_check:
+        print(f"budget exceeded: {', '.join(over)}")
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
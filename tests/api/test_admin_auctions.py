@@ -18,6 +18,23 @@ def test_admin_auctions_list(client: TestClient):
     assert "items" in body and isinstance(body["items"], list)
 
 
+def test_admin_auctions_list_filters_payment_and_shipment_status(client: TestClient):
+    params = {"page": 1, "size": 100, "payment_status": "확인", "shipment_status": "완료"}
+    r = client.get(f"{API}/auctions", params=params, headers=admin_headers())
+    assert r.status_code == 200
+    body = r.json()
+    # 시드: 상품 3003 주문(5001) 결제 완료 + 배송 완료
+    assert 4003 in {item["auction_id"] for item in body["items"]}
+    assert body["total"] == len(body["items"])
+    assert all(
+        (item["payment_status"], item["shipment_status"]) == ("확인", "완료") for item in body["items"]
+    )
+
+    r = client.get(f"{API}/auctions", params={"payment_status": "PAID"}, headers=admin_headers())
+    assert r.status_code == 400
+    assert r.json()["code"] == "INVALID_STATUS_FILTER"
+
+
 def test_admin_auction_detail(client: TestClient):
     # Use known seeded auction id from existing tests
     auction_id = 4001
@@ -38,3 +38,204 @@ def test_bid_and_buy_now(client: TestClient):
     )
     assert r4.status_code == 400
 
+
+
+def test_concurrent_bids_same_amount_accept_exactly_one():
+    from concurrent.futures import ThreadPoolExecutor
+    from sqlalchemy import select
+
+    from app.core.errors import BusinessError
+    from app.db.session import SessionLocal
+    from app.domains.auctions.bid_rules import BidRules
+    from app.domains.auctions.service import AuctionService
+    from app.domains.notifications.service import NotificationService
+    from app.repositories.auction_deposit import AuctionDepositRepository
+    from app.repositories.auction_read import AuctionReadRepository
+    from app.repositories.auction_write import AuctionWriteRepository
+    from app.repositories.order_write import OrderWriteRepository
+    from app.repositories.payment_write import PaymentWriteRepository
+    from app.schemas.auctions import Auction, Bid
+
+    auction_id = 4005
+    db = SessionLocal()
+    try:
+        product_id = db.execute(
+            select(Auction.product_id).where(Auction.id == auction_id)
+        ).scalar_one()
+        info = AuctionReadRepository(db).load_auction_info_by_product(product_id)
+        current = float(info.current_highest_bid or info.min_bid_price)
+        amount = BidRules.make_bid_steps(current, None, count=1)[0]
+    finally:
+        db.close()
+
+    def place(user_id: int) -> str:
+        s = SessionLocal()
+        try:
+            service = AuctionService(
+                s,
+                AuctionReadRepository(s),
+                AuctionWriteRepository(s),
+                OrderWriteRepository(s),
+                PaymentWriteRepository(s),
+                AuctionDepositRepository(s),
+                NotificationService(s),
+            )
+            service.place_bid(auction_id=auction_id, amount=amount, user_id=user_id)
+            return "OK"
+        except BusinessError as e:
+            return getattr(e.code, "value", e.code)
+        finally:
+            s.close()
+
+    with ThreadPoolExecutor(max_workers=8) as pool:
+        results = list(pool.map(place, range(8001, 8009)))
+
+    # 같은 금액의 동시 입찰은 하나만 성공, 나머지는 갱신된 최고가 기준으로 거절
+    assert results.count("OK") == 1
+    assert set(results) == {"OK", "BID_NOT_ALLOWED"}
+
+    db = SessionLocal()
+    try:
+        orders = db.execute(
+            select(Bid.bid_order).where(Bid.auction_id == auction_id).order_by(Bid.bid_order)
+        ).scalars().all()
+        assert orders == list(range(1, len(orders) + 1))
+    finally:
+        db.close()
+
+
+def test_bid_step_check_matches_step_list():
+    from app.domains.auctions.bid_rules import MAX_BID_STEPS, BidRules
+
+    # 구간 경계(1만/3만/5만/15만/100만) 부근과 즉시구매가 유무 조합
+    for current in (9_800, 10_000, 29_500, 49_000, 148_000, 12_345.5, 990_000):
+        for buy_now in (None, current * 1.5, current * 20):
+            steps = BidRules.make_bid_steps(current, buy_now, count=MAX_BID_STEPS)
+            for i, step in enumerate(steps, start=1):
+                assert BidRules.step_index(current, step, buy_now) == i
+                assert BidRules.is_valid_step(current, step, buy_now)
+            allowed = set(steps)
+            for step in steps:
+                for off in (step - 1, step + 1, step + 250):
+                    assert BidRules.is_valid_step(current, off, buy_now) == (off in allowed)
+            assert not BidRules.is_valid_step(current, current, buy_now)
+
+    # 100 스텝을 넘는 점프 입찰은 거절
+    far = BidRules.make_bid_steps(10_000, None, count=MAX_BID_STEPS + 1)[-1]
+    assert BidRules.step_index(10_000, far, None) == MAX_BID_STEPS + 1
+    assert not BidRules.is_valid_step(10_000, far, None)
+
+
+def test_product_auction_info_without_steps(client: TestClient):
+    r = client.get(f"{API}/catalog/products/3001/auction", params={"with_steps": False})
+    assert r.status_code == 200
+    assert r.json()["bid_steps"] == []
+
+
+def test_concurrent_buy_now_creates_exactly_one_order():
+    from concurrent.futures import ThreadPoolExecutor
+    from datetime import datetime, timedelta
+    from sqlalchemy import func, select
+
+    from app.api.v1.endpoints.auction_actions import get_auction_service
+    from app.core.errors import BusinessError
+    from app.db.session import SessionLocal
+    from app.infrastructure.db.uow import SqlAlchemyUnitOfWork
+    from app.schemas.auctions import Auction
+    from app.schemas.orders.order_item import OrderItem
+    from app.schemas.products import Product
+
+    db = SessionLocal()
+    try:
+        product = Product(popup_store_id=2001, category="가구/리빙", name="buy-now-race", price=10000, stock=1)
+        db.add(product)
+        db.flush()
+        now = datetime.utcnow()
+        auction = Auction(
+            product_id=product.id,
+            start_price=10000,
+            min_bid_price=10000,
+            buy_now_price=50000,
+            starts_at=now - timedelta(hours=1),
+            ends_at=now + timedelta(hours=1),
+            status="RUNNING",
+        )
+        db.add(auction)
+        db.commit()
+        auction_id, product_id = auction.id, product.id
+    finally:
+        db.close()
+
+    def buy(user_id: int) -> str:
+        try:
+            with SqlAlchemyUnitOfWork() as uow:
+                get_auction_service(uow).buy_now(auction_id=auction_id, user_id=user_id)
+            return "OK"
+        except BusinessError as e:
+            return getattr(e.code, "value", e.code)
+
+    with ThreadPoolExecutor(max_workers=8) as pool:
+        results = list(pool.map(buy, range(8101, 8109)))
+
+    # 경매 행 잠금 후 재검증 → 하나만 주문, 나머지는 종료된 경매로 거절
+    assert results.count("OK") == 1
+    assert set(results) == {"OK", "BUY_NOT_ALLOWED"}
+    db = SessionLocal()
+    try:
+        orders = db.execute(
+            select(func.count(OrderItem.id)).where(OrderItem.product_id == product_id)
+        ).scalar_one()
+        assert orders == 1
+    finally:
+        db.close()
+
+
+def test_concurrent_first_bid_stats_upsert():
+    from concurrent.futures import ThreadPoolExecutor
+    from datetime import datetime, timedelta
+
+    from app.db.session import SessionLocal
+    from app.repositories.auction_stats import AuctionStatsRepository
+    from app.schemas.auctions import Auction, AuctionStats
+    from app.schemas.products import Product
+
+    db = SessionLocal()
+    try:
+        product = Product(popup_store_id=2001, category="가구/리빙", name="first-bid-race", price=10000, stock=1)
+        db.add(product)
+        db.flush()
+        now = datetime.utcnow()
+        auction = Auction(
+            product_id=product.id,
+            start_price=10000,
+            min_bid_price=10000,
+            starts_at=now - timedelta(hours=1),
+            ends_at=now + timedelta(hours=1),
+            status="RUNNING",
+        )
+        db.add(auction)
+        db.commit()
+        auction_id = auction.id
+    finally:
+        db.close()
+
+    def apply(amount: int) -> None:
+        s = SessionLocal()
+        try:
+            AuctionStatsRepository(s).apply_bid(auction_id=auction_id, amount=amount, is_new_bidder=True)
+            s.commit()
+        finally:
+            s.close()
+
+    # 집계 행이 없는 경매에 동시에 반영해도 중복 키 에러 없이 모두 누적
+    amounts = [11000 + i * 1000 for i in range(8)]
+    with ThreadPoolExecutor(max_workers=8) as pool:
+        list(pool.map(apply, amounts))
+
+    db = SessionLocal()
+    try:
+        stats = db.get(AuctionStats, auction_id)
+        assert stats.bid_count == 8 and stats.bidder_count == 8
+        assert float(stats.current_highest_bid) == max(amounts)
+    finally:
+        db.close()
@@ -0,0 +1,73 @@
+import asyncio
+import threading
+
+import fakeredis
+
+from app.domains.auctions.enums import AuctionEventType
+from app.domains.auctions.events import AuctionEvent
+from app.infrastructure.realtime.brokers import InProcessBroker, RedisEventBroker
+from app.infrastructure.realtime.hub import HEARTBEAT, EventHub, sse_stream
+
+
+def _event(amount: float) -> bytes:
+    return AuctionEvent(
+        type=AuctionEventType.BID, auction_id=4001, product_id=3001, amount=amount, user_id=1002
+    ).to_sse()
+
+
+def test_hub_fans_out_thread_published_events_per_channel():
+    hub = EventHub(InProcessBroker(), queue_size=2)
+
+    async def scenario():
+        async with hub.subscribe("auction:4001") as a, hub.subscribe(
+            "auction:4001"
+        ) as b, hub.subscribe("auction:4002") as other:
+            assert hub.stats()["subscribers"] == 3
+            # 요청 처리 스레드(동기 코드)에서 발행하는 상황
+            frames = [_event(x) for x in (1.0, 2.0, 3.0)]
+            t = threading.Thread(
+                target=lambda: [hub.publish("auction:4001", f) for f in frames]
+            )
+            t.start()
+            t.join()
+            await asyncio.sleep(0.05)
+            # 큐 상한(2) 초과분은 오래된 것부터 버림
+            assert [await a.get(), await a.get()] == frames[1:]
+            assert a.dropped == 1
+            assert (await b.get()).startswith(b"event: BID\ndata: ")
+            assert other.queue.empty()
+        assert hub.stats()["subscribers"] == 0
+
+    asyncio.run(scenario())
+
+
+def test_redis_broker_delivers_to_local_subscribers():
+    broker = RedisEventBroker(fakeredis.FakeRedis(), prefix="t:events")
+    hub = EventHub(broker)
+
+    async def scenario():
+        async with hub.subscribe("auction:4001") as sub:
+            await asyncio.sleep(0.1)
+            frame = _event(75000.0)
+            hub.publish("auction:4001", frame)
+            assert await asyncio.wait_for(sub.get(), timeout=3) == frame
+
+    try:
+        asyncio.run(scenario())
+    finally:
+        broker.stop()
+
+
+def test_sse_stream_sends_heartbeat_when_idle():
+    hub = EventHub(InProcessBroker(), heartbeat_seconds=0.05)
+
+    async def connected() -> bool:
+        return False
+
+    async def scenario():
+        stream = sse_stream(hub, "auction:4001", is_disconnected=connected)
+        assert (await stream.__anext__()).startswith(b"retry:")
+        assert await asyncio.wait_for(stream.__anext__(), timeout=1) == HEARTBEAT
+        await stream.aclose()
+
+    asyncio.run(scenario())
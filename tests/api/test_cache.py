@@ -0,0 +1,88 @@
+import fakeredis
+import pytest
+from typing import List, Optional
+from pydantic import BaseModel
+
+from app.infrastructure.cache.app_cache import AppCache, DelayedInvalidator, cache_key
+from app.infrastructure.cache.backends import InMemoryCacheBackend, RedisCacheBackend
+from app.infrastructure.cache.serializers import MsgpackSerializer, OrjsonSerializer
+from pydantic import TypeAdapter
+
+
+class _Item(BaseModel):
+    id: int
+    name: str
+    price: Optional[float] = None
+
+
+def _backends():
+    yield InMemoryCacheBackend()
+    yield RedisCacheBackend(fakeredis.FakeRedis())
+
+
+@pytest.mark.parametrize("serializer", [OrjsonSerializer(), MsgpackSerializer()])
+def test_get_or_load_roundtrip_and_invalidate(serializer):
+    for backend in _backends():
+        cache = AppCache(backend, serializer, prefix="t", default_ttl_seconds=60)
+        adapter = TypeAdapter(List[_Item])
+        calls = []
+
+        def loader():
+            calls.append(1)
+            return [_Item(id=1, name="의자", price=1000.0)]
+
+        key = cache_key("items", page=1, q=" Chair ")
+        first = cache.get_or_load("listing", key, loader, adapter)
+        second = cache.get_or_load("listing", cache_key("items", q="chair", page=1), loader, adapter)
+        assert first == second
+        assert len(calls) == 1
+
+        cache.invalidate("listing")
+        cache.get_or_load("listing", key, loader, adapter)
+        assert len(calls) == 2
+        stats = cache.stats()["namespaces"]["listing"]
+        assert stats["hits"] == 1 and stats["misses"] == 2
+
+
+def test_invalidation_is_shared_across_workers():
+    server = fakeredis.FakeServer()
+    worker_a = AppCache(RedisCacheBackend(fakeredis.FakeRedis(server=server)), MsgpackSerializer(), prefix="t")
+    worker_b = AppCache(RedisCacheBackend(fakeredis.FakeRedis(server=server)), MsgpackSerializer(), prefix="t")
+    adapter = TypeAdapter(int)
+    key = cache_key("auction_info", product_id=1)
+
+    assert worker_a.get_or_load("auction_info", key, lambda: 1, adapter) == 1
+    assert worker_b.get_or_load("auction_info", key, lambda: 2, adapter) == 1
+
+    worker_a.invalidate("auction_info")
+    assert worker_b.get_or_load("auction_info", key, lambda: 3, adapter) == 3
+
+
+def test_refresh_skips_cached_value_and_overwrites_it():
+    cache = AppCache(InMemoryCacheBackend(), MsgpackSerializer(), prefix="t", default_ttl_seconds=60)
+    adapter = TypeAdapter(int)
+    key = cache_key("auction_info", product_id=1)
+
+    # replica 읽기가 채운 지연 값을 primary 고정 읽기는 무시하고 최신값으로 덮어씀
+    assert cache.get_or_load("auction_info", key, lambda: 1, adapter) == 1
+    assert cache.get_or_load("auction_info", key, lambda: 2, adapter, refresh=True) == 2
+    assert cache.get_or_load("auction_info", key, lambda: 3, adapter) == 2
+
+
+def test_delayed_invalidation_removes_value_refilled_after_commit():
+    cache = AppCache(InMemoryCacheBackend(), MsgpackSerializer(), prefix="t", default_ttl_seconds=60)
+    delayed = DelayedInvalidator(cache, delay_seconds=3600)
+    adapter = TypeAdapter(int)
+    key = cache_key("auction_info", product_id=1)
+
+    cache.invalidate_key("auction_info", key)
+    delayed.schedule("auction_info", key)
+    delayed.schedule("auction_info", key)  # 같은 대상은 마지막 예약 하나로 합침
+    delayed.schedule("listing")
+    assert delayed.pending() == 2
+    # 무효화 직후 지연된 replica가 변경 전 값을 다시 채움
+    cache.get_or_load("auction_info", key, lambda: 1, adapter)
+
+    assert delayed.run_due() == 0
+    assert delayed.run_due(now=float("inf")) == 2
+    assert cache.get_or_load("auction_info", key, lambda: 2, adapter) == 2
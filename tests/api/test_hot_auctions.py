@@ -0,0 +1,83 @@
+from datetime import datetime, timedelta
+
+import fakeredis
+import pytest
+
+from app.core.errors import BusinessError
+from app.domains.auctions.auction_info import AuctionInfo
+from app.domains.auctions.bid_rules import BidRules
+from app.domains.auctions.hot_state import HotAuctionStateManager
+from app.infrastructure.auctions.hot_state_store import (
+    HotAuctionSnapshot,
+    InMemoryHotAuctionStore,
+    RedisHotAuctionStore,
+)
+
+
+def _stores():
+    yield InMemoryHotAuctionStore()
+    yield RedisHotAuctionStore(fakeredis.FakeRedis(), prefix="t:hot")
+
+
+def _snapshot(*, highest=71000.0, bid_count=2, ends_in=timedelta(minutes=5)) -> HotAuctionSnapshot:
+    return HotAuctionSnapshot(
+        product_id=3001,
+        ends_at_utc=datetime.utcnow() + ends_in,
+        bid_count=bid_count,
+        info=AuctionInfo(
+            auction_id=4001,
+            buy_now_price=200000.0,
+            current_highest_bid=highest,
+            bid_steps=[],
+            starts_at="2025-08-19T19:00:00+09:00",
+            ends_at="2025-08-21T08:59:59+09:00",
+            start_price=50000.0,
+            min_bid_price=1000.0,
+            deposit_amount=10000.0,
+            bidder_count=2,
+            status="RUNNING",
+        ),
+    )
+
+
+def test_hot_state_reads_validates_and_writes_through():
+    for store in _stores():
+        hot = HotAuctionStateManager(store)
+        store.put(_snapshot(), [1001, 1002])
+
+        info = hot.auction_info(3001)
+        assert info.current_highest_bid == 71000.0
+        assert info.bid_steps == BidRules.make_bid_steps(71000.0, 200000.0)
+        assert hot.auction_info(3001, with_steps=False).bid_steps == []
+
+        # 스텝이 아닌 금액 / 이미 참여한 사용자는 DB 조회 없이 거절
+        with pytest.raises(BusinessError) as e:
+            hot.precheck_bid(auction_id=4001, amount=72500, user_id=1003)
+        assert e.value.code.value == "BID_NOT_ALLOWED"
+        with pytest.raises(BusinessError) as e:
+            hot.precheck_bid(auction_id=4001, amount=76000, user_id=1001)
+        assert e.value.code.value == "BID_ALREADY_EXISTS"
+        assert hot.precheck_bid(auction_id=4001, amount=76000, user_id=1003) is True
+        assert hot.precheck_bid(auction_id=9999, amount=76000, user_id=1003) is False
+
+        hot._apply_bid(4001, 1003, 76000.0)
+        info = hot.auction_info(3001)
+        assert (info.current_highest_bid, info.bidder_count) == (76000.0, 3)
+        assert info.bid_steps[0] == 81000.0
+
+        # 입찰 반영 전에 읽은 재적재 스냅샷은 최신 상태를 덮어쓰지 않음
+        store.put(_snapshot(bid_count=2), [1001, 1002])
+        assert hot.auction_info(3001).current_highest_bid == 76000.0
+
+        hot.evict(4001)
+        assert hot.auction_info(3001) is None
+        assert store.auction_ids() == set()
+
+
+def test_hot_state_drops_expired_auction():
+    for store in _stores():
+        hot = HotAuctionStateManager(store)
+        store.put(_snapshot(ends_in=timedelta(seconds=-1)), [])
+        assert hot.auction_info(3001) is None
+        assert hot.precheck_bid(auction_id=4001, amount=76000, user_id=1003) is False
+        assert store.get(4001) is None
@@ -0,0 +1,203 @@
+from sqlalchemy import select
+
+from app.batch.notification_dispatch import NotificationOutboxDispatcher
+from app.db.session import SessionLocal
+from app.domains.common.tx import transactional
+from app.domains.notifications.dto import NotifyManyRequest
+from app.domains.notifications.service import NotificationService
+from app.infrastructure.notifications.channels import InboxChannel, PushChannel, SmsChannel
+from app.schemas.notifications import Notification, NotificationOutbox
+
+
+class _FailingChannel:
+    def deliver(self, session, payload):
+        raise RuntimeError("channel down")
+
+
+class _FakeSms:
+    """첫 발송에서 fail_to 번호만 실패시키는 solapi 대역"""
+
+    def __init__(self, fail_to: str):
+        self.fail_to = fail_to
+        self.sent = []
+
+    def send(self, messages):
+        from types import SimpleNamespace
+
+        batch = [m.to for m in messages if m.text == "outbox-sms"]
+        failed = [SimpleNamespace(to=self.fail_to)] if self.fail_to in batch and not self.sent else []
+        if batch:
+            self.sent.append(sorted(batch))
+        return SimpleNamespace(
+            group_info=SimpleNamespace(count=SimpleNamespace(registered_failed=len(failed))),
+            failed_message_list=failed,
+        )
+
+
+def _publish(title: str, channels=("INBOX",)) -> None:
+    db = SessionLocal()
+    try:
+        with transactional(db):
+            NotificationService(db).publish(
+                NotifyManyRequest(user_ids=[1001, 1002, 1001], title=title, body=""),
+                channels=channels,
+            )
+    finally:
+        db.close()
+
+
+def _recipients(title: str) -> list:
+    """다른 세션(= 커밋된 데이터)에서 본 해당 제목 알림의 수신자"""
+    db = SessionLocal()
+    try:
+        return sorted(
+            db.execute(select(Notification.user_id).where(Notification.title == title))
+            .scalars()
+            .all()
+        )
+    finally:
+        db.close()
+
+
+def test_send_many_inserts_per_recipient_in_caller_transaction():
+    db = SessionLocal()
+    try:
+        NotificationService(db).send_many(
+            NotifyManyRequest(user_ids=[1001, 1002, 1001], title="send-many", body="")
+        )
+        # 호출자 트랜잭션 안에서는 수신자별 1건씩 보이지만 커밋하지 않는다
+        own = db.execute(
+            select(Notification.user_id).where(Notification.title == "send-many")
+        ).scalars().all()
+        assert sorted(own) == [1001, 1002]
+        assert db.in_transaction()
+        assert _recipients("send-many") == []
+
+        db.rollback()
+        assert _recipients("send-many") == []
+    finally:
+        db.close()
+
+
+def test_outbox_dispatch_delivers_to_inbox():
+    _publish("outbox-inbox")
+    dispatcher = NotificationOutboxDispatcher(channels={"INBOX": InboxChannel()})
+    assert dispatcher.run_once() >= 1
+
+    db = SessionLocal()
+    try:
+        user_ids = db.execute(
+            select(Notification.user_id).where(Notification.title == "outbox-inbox")
+        ).scalars().all()
+        assert sorted(user_ids) == [1001, 1002]
+        statuses = db.execute(
+            select(NotificationOutbox.status).where(NotificationOutbox.channel == "INBOX")
+        ).scalars().all()
+        assert set(statuses) == {"SENT"}
+    finally:
+        db.close()
+
+
+def test_outbox_dispatch_failure_is_rescheduled():
+    _publish("outbox-fail", channels=("PUSH",))
+    dispatcher = NotificationOutboxDispatcher(
+        channels={"PUSH": _FailingChannel()}, backoff_seconds=60
+    )
+    assert dispatcher.run_once() == 0
+    # 백오프 동안은 다시 선점되지 않음
+    assert dispatcher.run_once() == 0
+
+    db = SessionLocal()
+    try:
+        row = db.execute(
+            select(NotificationOutbox).where(NotificationOutbox.channel == "PUSH")
+        ).scalars().first()
+        assert row.status == "PENDING"
+        assert row.attempts == 1
+        assert "channel down" in row.last_error
+    finally:
+        db.close()
+
+
+def test_outbox_sms_partial_failure_retries_only_failed_recipients():
+    _publish("outbox-sms", channels=("SMS",))
+    sms = _FakeSms(fail_to="+821055512345")  # 1002
+    dispatcher = NotificationOutboxDispatcher(
+        channels={"SMS": SmsChannel(message_service=sms), "INBOX": InboxChannel(), "PUSH": PushChannel()},
+        backoff_seconds=0,
+    )
+    dispatcher.run_once()
+    dispatcher.run_once()
+
+    # 인라인 재시도 없이, 다음 사이클에는 실패한 수신자에게만 재발송
+    assert sms.sent == [["+821012345678", "+821055512345"], ["+821055512345"]]
+    db = SessionLocal()
+    try:
+        row = db.execute(
+            select(NotificationOutbox).where(
+                NotificationOutbox.channel == "SMS",
+                NotificationOutbox.payload["title"].as_string() == "outbox-sms",
+            )
+        ).scalars().one()
+        assert row.status == "SENT"
+        assert row.payload["user_ids"] == [1002]
+        assert row.attempts == 1
+    finally:
+        db.close()
+
+
+class _RecordingChannel:
+    def __init__(self):
+        self.titles = []
+
+    def deliver(self, session, payload):
+        self.titles.append(payload["title"])
+
+
+def test_outbox_lease_skips_in_flight_and_reclaims_expired():
+    from datetime import datetime, timedelta
+
+    from sqlalchemy import update
+
+    from app.repositories.notification_outbox import NotificationOutboxRepository
+
+    _publish("outbox-lease", channels=("PUSH",))
+    db = SessionLocal()
+    try:
+        # 다른 디스패처가 선점한 뒤 결과를 기록하지 못하고 멈춘 상황
+        with transactional(db):
+            claimed = NotificationOutboxRepository(db).claim_batch(limit=1000, lease_seconds=3600)
+        assert claimed
+    finally:
+        db.close()
+
+    push = _RecordingChannel()
+    dispatcher = NotificationOutboxDispatcher(channels={"PUSH": push, "INBOX": InboxChannel()})
+    dispatcher.run_once()
+    assert "outbox-lease" not in push.titles  # 임대 중에는 다시 선점하지 않음
+
+    db = SessionLocal()
+    try:
+        with transactional(db):
+            db.execute(
+                update(NotificationOutbox)
+                .where(NotificationOutbox.id.in_(claimed))
+                .values(available_at=datetime.utcnow() - timedelta(seconds=1))
+            )
+    finally:
+        db.close()
+    dispatcher.run_once()
+    dispatcher.run_once()
+    assert push.titles.count("outbox-lease") == 1  # 임대 만료 후 한 번만 재전달
+
+    db = SessionLocal()
+    try:
+        row = db.execute(
+            select(NotificationOutbox).where(
+                NotificationOutbox.channel == "PUSH",
+                NotificationOutbox.payload["title"].as_string() == "outbox-lease",
+            )
+        ).scalars().one()
+        assert row.status == "SENT" and row.sent_at is not None
+    finally:
+        db.close()
@@ -1,5 +1,8 @@
+import pytest
 from fastapi.testclient import TestClient
 from app.core.config import settings
+from app.db.session import SessionLocal
+from app.repositories.product_images import rep_images_by_product
 
 
 API = settings.API_V1_STR
@@ -29,6 +32,74 @@ def test_products_feeds_and_pagination(client: TestClient):
     assert len(body["items"]) <= 1
 
 
+def test_products_feed_without_total(client: TestClient):
+    with_total = client.get(f"{API}/products/ending-soon?size=1").json()
+    r = client.get(f"{API}/products/ending-soon?size=1&with_total=false")
+    assert r.status_code == 200
+    body = r.json()
+    assert_page_shape(body)
+    assert body["total"] is None
+    assert body["has_next"] == with_total["has_next"]
+    assert body["items"] == with_total["items"]
+    assert with_total["has_next"] == (with_total["total"] > 1)
+
+
+
+def test_products_feed_cursor_matches_offset_pages(client: TestClient):
+    offset_ids = []
+    page = 1
+    while True:
+        body = client.get(f"{API}/products/new?size=1&page={page}").json()
+        offset_ids += [it["product_id"] for it in body["items"]]
+        if not body["has_next"]:
+            break
+        page += 1
+
+    body = client.get(f"{API}/products/new?size=1").json()
+    cursor_ids = [it["product_id"] for it in body["items"]]
+    while body["next_cursor"]:
+        r = client.get(f"{API}/products/new?size=1&cursor={body['next_cursor']}")
+        assert r.status_code == 200
+        body = r.json()
+        assert body["total"] is None
+        cursor_ids += [it["product_id"] for it in body["items"]]
+    assert cursor_ids == offset_ids
+
+
+def test_products_feed_rejects_foreign_cursor(client: TestClient):
+    first = client.get(f"{API}/products/ending-soon?size=1").json()
+    if not first["next_cursor"]:
+        return
+    # 다른 정렬에서 발급된 커서는 거부
+    r = client.get(f"{API}/products/ending-soon?sort=latest&cursor={first['next_cursor']}")
+    assert r.status_code == 400
+    assert r.json()["code"] == "INVALID_CURSOR"
+
+
+def test_cursor_is_bound_to_feed_and_store():
+    from app.core.errors import BusinessError
+    from app.db.session import SessionLocal
+    from app.domains.common.paging import encode_cursor
+    from app.repositories.product_read import ProductReadRepository
+
+    db = SessionLocal()
+    try:
+        repo = ProductReadRepository(db)
+        # 같은 정렬이라도 다른 피드/다른 스토어에서 발급된 커서는 INVALID_CURSOR
+        foreign = [
+            encode_cursor("new:latest", ["2025-08-19T00:00:00", 3001]),
+            encode_cursor("store:2002:latest", ["2025-08-19T00:00:00", 3001]),
+        ]
+        for cursor in foreign:
+            try:
+                repo.products_by_store(store_id=2001, sort="latest", page=1, size=1, cursor=cursor)
+            except BusinessError as e:
+                assert getattr(e.code, "value", e.code) == "INVALID_CURSOR"
+            else:
+                raise AssertionError("foreign cursor accepted")
+    finally:
+        db.close()
+
 def test_recent_stores_with_products_and_store_list(client: TestClient):
     r = client.get(f"{API}/products/stores/recent?page=1&stores=2&size=2")
     assert r.status_code == 200
@@ -43,3 +114,17 @@ def test_recent_stores_with_products_and_store_list(client: TestClient):
     assert r2.status_code == 200
     assert_page_shape(r2.json())
 
+
+
+@pytest.mark.parametrize("from_column", [False, True])
+def test_rep_images_batched_lookup(monkeypatch, from_column):
+    # 시드에서 대표 이미지 컬럼을 product_image 기준으로 백필함
+    monkeypatch.setattr(settings, "PRODUCT_REP_IMAGE_FROM_COLUMN", from_column)
+    db = SessionLocal()
+    try:
+        images = rep_images_by_product(db, [3001, 3003, 3004, 3001])
+    finally:
+        db.close()
+    # 3003은 이미지 없음
+    assert set(images) == {3001, 3004}
+    assert images[3001].endswith("product-1-main.png")
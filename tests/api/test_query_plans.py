@@ -0,0 +1,137 @@
+import re
+from contextlib import contextmanager
+from datetime import datetime
+
+from fastapi.testclient import TestClient
+from sqlalchemy import event, select
+from sqlalchemy.engine import Engine
+
+from app.core.config import settings
+from app.core.security import create_access_token
+from app.db.session import engine
+from app.domains.auctions.enums import AuctionStatus
+from app.schemas.auctions import Auction
+
+
+API = settings.API_V1_STR
+ADMIN_API = settings.ADMIN_API_STR or "/admin/v1"
+
+# 항상 부모 키로 접근해야 하는 테이블 — 쓸 수 있는 색인 없이 전체 스캔하면 실패
+HOT_TABLES = {"bid", "notification", "product_image", "order_item", "payment", "shipment"}
+
+
+def _auth(user_id: int) -> dict:
+    return {"Authorization": f"Bearer {create_access_token(str(user_id))}"}
+
+
+def _admin() -> dict:
+    settings.ADMIN_TOKEN = settings.ADMIN_TOKEN or "test-admin-token"
+    return {"Authorization": f"Bearer {settings.ADMIN_TOKEN}"}
+
+
+@contextmanager
+def _capture_selects():
+    """모든 엔진(읽기 전용/async 포함)에서 실행된 SELECT와 파라미터 수집"""
+    captured = []
+
+    def before(conn, cursor, statement, parameters, context, executemany):
+        if not executemany and statement.lstrip().upper().startswith("SELECT"):
+            captured.append((statement, parameters))
+
+    event.listen(Engine, "before_cursor_execute", before)
+    try:
+        yield captured
+    finally:
+        event.remove(Engine, "before_cursor_execute", before)
+
+
+def _explain(statement, parameters):
+    # 실행 때와 같은 DBAPI 파라미터로 EXPLAIN
+    conn = engine.raw_connection()
+    try:
+        cur = conn.cursor()
+        cur.execute(f"EXPLAIN {statement}", parameters)
+        columns = [d[0] for d in cur.description]
+        return [dict(zip(columns, row)) for row in cur.fetchall()]
+    finally:
+        conn.close()
+
+
+def _plans(captured):
+    return [_explain(s, p) for s, p in captured if " FROM " in s.upper()]
+
+
+def _base_table(name):
+    # SQLAlchemy 별칭(bid_1)은 원 테이블로, 파생 테이블(<derived2>, anon_1)은 제외
+    if not name or name.startswith("<"):
+        return None
+    return re.sub(r"_\d+$", "", name)
+
+
+def _possible_keys(plans, table):
+    keys = set()
+    for plan in plans:
+        for row in plan:
+            if _base_table(row["table"]) == table and row["possible_keys"]:
+                keys.update(row["possible_keys"].split(","))
+    return keys
+
+
+def test_hot_path_queries_do_not_full_scan_child_tables(client: TestClient):
+    calls = [
+        ("GET", f"{API}/products/ending-soon", {"status": "ALL"}, None),
+        ("GET", f"{API}/products/new", {"status": "ALL"}, None),
+        ("GET", f"{API}/products/stores/recent", {}, None),
+        ("GET", f"{API}/catalog/stores/2001/products", {"status": "ALL"}, None),
+        ("GET", f"{API}/catalog/products/3001/meta", {}, None),
+        ("GET", f"{API}/catalog/products/3001/auction", {}, None),
+        ("GET", f"{API}/catalog/products/3001/bids", {}, None),
+        ("GET", f"{API}/catalog/products/3001/similar", {"status": "ALL"}, None),
+        ("GET", f"{API}/notifications", {}, _auth(1001)),
+        ("GET", f"{API}/notifications/count/unread", {}, _auth(1001)),
+        ("GET", f"{API}/users/me/auctions", {}, _auth(1002)),
+        ("GET", f"{API}/users/me/auctions/dashboard", {}, _auth(1002)),
+        ("GET", f"{ADMIN_API}/auctions", {"payment_status": "PAID"}, _admin()),
+        ("GET", f"{ADMIN_API}/auctions/4001", {}, _admin()),
+    ]
+    with _capture_selects() as captured:
+        for method, path, params, headers in calls:
+            r = client.request(method, path, params=params, headers=headers)
+            assert r.status_code == 200, (path, r.text)
+    assert captured
+
+    violations = []
+    for statement, parameters in captured:
+        if " FROM " not in statement.upper():
+            continue
+        for row in _explain(statement, parameters):
+            table = _base_table(row["table"])
+            if table in HOT_TABLES and row["type"] == "ALL" and not row["possible_keys"]:
+                violations.append((table, statement.split(" FROM ", 1)[1][:160]))
+    assert not violations, violations
+
+
+def test_hot_path_indexes_are_candidates(client: TestClient):
+    now = datetime(2025, 8, 20, 12, 0, 0)
+    # 경매 상태 전이 배치 조건
+    starting = select(Auction.id).where(
+        Auction.status == AuctionStatus.SCHEDULED.value, Auction.starts_at <= now
+    )
+    ending = select(Auction.id).where(
+        Auction.status == AuctionStatus.RUNNING.value, Auction.ends_at <= now
+    )
+    with _capture_selects() as captured, engine.connect() as conn:
+        conn.execute(starting).all()
+        conn.execute(ending).all()
+    starting_plan, ending_plan = _plans(captured)
+    assert "idx_auction_status_starts" in _possible_keys([starting_plan], "auction")
+    assert "idx_auction_status_ends" in _possible_keys([ending_plan], "auction")
+
+    with _capture_selects() as captured:
+        client.get(f"{API}/catalog/stores/2001/products", params={"status": "ALL"})
+        client.get(f"{API}/notifications", headers=_auth(1001))
+        client.get(f"{API}/users/me/auctions", headers=_auth(1002))
+    plans = _plans(captured)
+    assert "idx_product_store_active" in _possible_keys(plans, "product")
+    assert "idx_notification_user_sent" in _possible_keys(plans, "notification")
+    assert "idx_bid_user_created" in _possible_keys(plans, "bid")
@@ -0,0 +1,37 @@
+from fastapi.testclient import TestClient
+
+from app.core.config import settings
+from app.core.security import create_access_token
+
+
+API = settings.API_V1_STR
+ADMIN_API = settings.ADMIN_API_STR or "/admin/v1"
+
+
+def admin_headers() -> dict:
+    settings.ADMIN_TOKEN = settings.ADMIN_TOKEN or "test-admin-token"
+    return {"Authorization": f"Bearer {settings.ADMIN_TOKEN}"}
+
+
+def test_server_timing_header_reports_db_stats(client: TestClient, max_queries):
+    with max_queries(5) as requests:
+        r = client.get(f"{API}/users/me/auctions", headers={"Authorization": f"Bearer {create_access_token('1002')}"})
+    assert r.status_code == 200
+    timing = r.headers["server-timing"]
+    assert timing.startswith("db;dur=") and "db-slowest;dur=" in timing and "app;dur=" in timing
+    assert f'desc="{requests[0].count} queries"' in timing
+
+
+def test_list_endpoints_query_count_does_not_grow_with_rows(client: TestClient, max_queries):
+    # N+1이면 페이지 크기만큼 늘어남 — 페이지(행+총개수) + 일괄 조회 몇 번으로 고정
+    with max_queries(4):
+        r = client.get(f"{ADMIN_API}/auctions", params={"page": 1, "size": 100}, headers=admin_headers())
+    assert r.status_code == 200 and len(r.json()["items"]) >= 3
+
+    with max_queries(4):
+        r = client.get(
+            f"{API}/users/me/auctions",
+            params={"period": "custom", "startDate": "2025-08-01T00:00:00", "endDate": "2025-08-31T23:59:59"},
+            headers={"Authorization": f"Bearer {create_access_token('1002')}"},
+        )
+    assert r.status_code == 200 and r.json()["total"] >= 2
@@ -0,0 +1,105 @@
+from sqlalchemy import select
+
+from app.core import deps
+from app.db import routing
+from app.db.routing import RecentWriters, read_session_factory
+from app.db.session import ReadSessionLocal, SessionLocal
+
+
+class _Clock:
+    def __init__(self):
+        self.now = 0.0
+
+    def __call__(self) -> float:
+        return self.now
+
+
+def _place_bid(auction_id: int, user_id: int) -> None:
+    from app.domains.auctions.bid_rules import BidRules
+    from app.domains.auctions.service import AuctionService
+    from app.domains.notifications.service import NotificationService
+    from app.repositories.auction_deposit import AuctionDepositRepository
+    from app.repositories.auction_read import AuctionReadRepository
+    from app.repositories.auction_write import AuctionWriteRepository
+    from app.repositories.order_write import OrderWriteRepository
+    from app.repositories.payment_write import PaymentWriteRepository
+    from app.schemas.auctions import Auction
+
+    db = SessionLocal()
+    try:
+        product_id = db.execute(
+            select(Auction.product_id).where(Auction.id == auction_id)
+        ).scalar_one()
+        info = AuctionReadRepository(db).load_auction_info_by_product(product_id)
+        current = float(info.current_highest_bid or info.min_bid_price)
+    finally:
+        db.close()
+
+    s = SessionLocal()
+    try:
+        AuctionService(
+            s,
+            AuctionReadRepository(s),
+            AuctionWriteRepository(s),
+            OrderWriteRepository(s),
+            PaymentWriteRepository(s),
+            AuctionDepositRepository(s),
+            NotificationService(s),
+        ).place_bid(
+            auction_id=auction_id,
+            amount=BidRules.make_bid_steps(current, None, count=1)[0],
+            user_id=user_id,
+        )
+    finally:
+        s.close()
+
+
+def test_recent_writer_mark_expires_after_ttl():
+    clock = _Clock()
+    writers = RecentWriters(ttl_seconds=5, timer=clock)
+    writers.mark(1001)
+    assert writers.is_recent(1001) and not writers.is_recent(1002)
+
+    clock.now = 4.9
+    assert writers.is_recent(1001)
+    clock.now = 5.0
+    assert not writers.is_recent(1001)
+
+    # TTL 0 = read-your-writes 비활성
+    disabled = RecentWriters(ttl_seconds=0)
+    disabled.mark(1001)
+    assert not disabled.is_recent(1001)
+
+
+def test_bidder_reads_go_to_primary_until_ttl_expires(monkeypatch):
+    clock = _Clock()
+    writers = RecentWriters(ttl_seconds=30, timer=clock)
+    monkeypatch.setattr(routing, "recent_writers", writers)
+    monkeypatch.setattr("app.domains.auctions.service.recent_writers", writers)
+
+    _place_bid(4005, 8101)
+    assert read_session_factory(8101) is SessionLocal
+    assert read_session_factory(1001) is ReadSessionLocal
+    assert read_session_factory(None) is ReadSessionLocal
+
+    clock.now = 30.0
+    assert read_session_factory(8101) is ReadSessionLocal
+
+
+def test_get_read_db_routes_by_bearer_user(monkeypatch):
+    writers = RecentWriters(ttl_seconds=30)
+    writers.mark(8101)
+    monkeypatch.setattr(routing, "recent_writers", writers)
+    opened = []
+
+    def _factory(name, factory):
+        return lambda: opened.append(name) or factory()
+
+    monkeypatch.setattr(routing, "SessionLocal", _factory("primary", SessionLocal))
+    monkeypatch.setattr(routing, "ReadSessionLocal", _factory("replica", ReadSessionLocal))
+
+    for authorization in ("Bearer 8101", "Bearer 1001", None):
+        gen = deps.get_read_db(authorization)
+        next(gen)
+        gen.close()
+    assert opened == ["primary", "replica", "replica"]
@@ -0,0 +1,104 @@
+from datetime import datetime, timedelta
+
+from sqlalchemy import select
+
+from app.batch.auction_schedule import AuctionScheduleBatch
+from app.batch.scheduler import AuctionScheduler
+from app.db.session import SessionLocal, engine
+from app.infrastructure.db.advisory_lock import AdvisoryLock
+from app.schemas.auctions import Auction
+from app.schemas.products import Product
+
+# 시드 경매(2025-08-19~)보다 이른 기준 시각 — 배치가 테스트 경매만 처리하도록
+NOW = datetime(2025, 8, 1, 12, 0, 0)
+
+
+def _auction(db, name: str, *, status: str, starts_in: int, ends_in: int) -> int:
+    product = Product(popup_store_id=2001, category="가구/리빙", name=name, price=10000, stock=1)
+    db.add(product)
+    db.flush()
+    auction = Auction(
+        product_id=product.id,
+        start_price=10000,
+        min_bid_price=10000,
+        starts_at=NOW + timedelta(seconds=starts_in),
+        ends_at=NOW + timedelta(seconds=ends_in),
+        status=status,
+    )
+    db.add(auction)
+    db.commit()
+    return auction.id
+
+
+def _statuses(ids):
+    db = SessionLocal()
+    try:
+        return dict(db.execute(select(Auction.id, Auction.status).where(Auction.id.in_(ids))).all())
+    finally:
+        db.close()
+
+
+def test_scheduler_runs_transitions_at_due_time():
+    db = SessionLocal()
+    try:
+        start_due = _auction(db, "sched-start", status="SCHEDULED", starts_in=-1, ends_in=3600)
+        end_due = _auction(db, "sched-end", status="RUNNING", starts_in=-3600, ends_in=-1)
+        later = _auction(db, "sched-later", status="RUNNING", starts_in=-3600, ends_in=120)
+        beyond = _auction(db, "sched-beyond", status="SCHEDULED", starts_in=7200, ends_in=9000)
+    finally:
+        db.close()
+
+    scheduler = AuctionScheduler(lookahead_seconds=300)
+    scheduler.reload(NOW)
+    pending = {auction_id for _, _, auction_id in scheduler._heap}
+    assert pending == {start_due, end_due, later}
+    # 힙 최상단 = 가장 이른 예정 시각
+    assert scheduler._heap[0][0] == min(due for due, _, _ in scheduler._heap)
+
+    assert scheduler.run_due(NOW) == 2
+    statuses = _statuses([start_due, end_due, later])
+    assert statuses == {start_due: "RUNNING", end_due: "ENDED", later: "RUNNING"}
+    assert [auction_id for _, _, auction_id in scheduler._heap] == [later]
+
+    stats = scheduler.stats()
+    assert stats["started"] == 1 and stats["settled"] == 1 and stats["pending"] == 1
+    assert stats["lag_max_ms"] >= stats["lag_p50_ms"] >= 0
+
+
+def test_schedule_batch_transitions_due_auctions_in_bulk():
+    db = SessionLocal()
+    try:
+        opening = [
+            _auction(db, f"sched-open-{i}", status="SCHEDULED", starts_in=-1, ends_in=3600)
+            for i in range(3)
+        ]
+        missed = _auction(db, "sched-missed", status="SCHEDULED", starts_in=-7200, ends_in=-3600)
+        future = _auction(db, "sched-future", status="SCHEDULED", starts_in=3600, ends_in=7200)
+    finally:
+        db.close()
+
+    # 청크 경계를 넘겨도 모두 처리, 재실행은 no-op
+    assert AuctionScheduleBatch(chunk_size=2).run_once(NOW) == 3
+    assert AuctionScheduleBatch().run_once(NOW) == 0
+
+    statuses = _statuses(opening + [missed, future])
+    assert {statuses[i] for i in opening} == {"RUNNING"}
+    # 시작 전에 종료 시각이 지난 경매는 유찰 종료
+    assert statuses[missed] == "ENDED"
+    assert statuses[future] == "SCHEDULED"
+
+
+def test_advisory_lock_elects_single_leader():
+    first = AdvisoryLock(engine, "test:auction-scheduler")
+    second = AdvisoryLock(engine, "test:auction-scheduler")
+    try:
+        assert first.acquire() and first.check()
+        assert not second.acquire()
+        assert not AuctionScheduler(lock=second).leader
+
+        first.release()
+        assert not first.held
+        assert second.acquire() and second.check()
+    finally:
+        first.release()
+        second.release()
@@ -0,0 +1,149 @@
+from fastapi.testclient import TestClient
+from sqlalchemy.dialects import mysql
+
+from app.core.config import settings
+from app.db.session import SessionLocal
+from app.domains.products.search import FEED_SEARCH_FIELDS, product_search
+from app.infrastructure.cache.app_cache import LISTING, app_cache
+from app.infrastructure.search.backends import (
+    FullTextSearchBackend,
+    InMemorySearchBackend,
+    LikeSearchBackend,
+    SearchField,
+)
+
+
+API = settings.API_V1_STR
+FIELDS = [f.value for f in FEED_SEARCH_FIELDS]
+
+
+def _doc(name, summary=None, description=None, store=None):
+    return {"name": name, "summary": summary, "description": description, "store": store}
+
+
+def test_ngram_index_ranks_by_field_weight_and_requires_all_words():
+    index = InMemorySearchBackend.new_index()
+    index.add(1, _doc("원목 의자", "편안한 착석감"))
+    index.add(2, _doc("쿠션", "원목 의자용 쿠션"))
+    index.add(3, _doc("원목 테이블"))
+    index.add(4, _doc("Lamp", description="원목 받침", store="의자 공방"))
+
+    # 상품명 일치 > 요약 일치, 모든 단어가 있어야 결과에 포함
+    hits = [k for k, _ in index.search("원목 의자", FIELDS, limit=10)]
+    assert hits[0] == 1 and set(hits) == {1, 2, 4}
+    assert [k for k, _ in index.search("의자", ["name"], limit=10)] == [1]
+    assert index.search("소파", FIELDS, limit=10) == []
+    # 1글자 질의, 대소문자 무시
+    assert {k for k, _ in index.search("의", FIELDS, limit=10)} == {1, 2, 4}
+    assert [k for k, _ in index.search("LAMP", FIELDS, limit=10)] == [4]
+    assert len(index.search("원목", FIELDS, limit=2)) == 2
+
+
+def test_ngram_index_update_and_remove():
+    index = InMemorySearchBackend.new_index()
+    index.add(1, _doc("원목 의자"))
+    assert index.add(1, _doc("원목 의자")) is False  # 내용이 같으면 무시
+    assert index.add(1, _doc("라탄 스툴")) is True
+    index.add(2, _doc("원목 스툴"))
+
+    assert index.search("의자", FIELDS, limit=10) == []
+    assert [k for k, _ in index.search("스툴", FIELDS, limit=10)] == [2, 1]
+    index.remove(2)
+    assert [k for k, _ in index.search("스툴", FIELDS, limit=10)] == [1]
+    assert len(index) == 1
+    assert index.dead_ratio == 2 / 3
+
+
+def test_fulltext_backend_uses_matching_index_columns():
+    backend = FullTextSearchBackend()
+    assert backend.boolean_query("원목  의자!") == '+"원목" +"의자"'
+    assert backend.boolean_query("의 자") is None
+
+    sql = str(
+        backend.match("원목", FEED_SEARCH_FIELDS).where.compile(dialect=mysql.dialect())
+    )
+    assert "MATCH (product.name, product.summary, product.description) AGAINST" in sql
+    assert "MATCH (popup_store.name) AGAINST" in sql
+    assert "IN BOOLEAN MODE" in sql
+    assert backend.match("원목", (SearchField.NAME,)).relevance is not None
+    # 색인이 없는 컬럼 조합/짧은 단어는 LIKE 폴백
+    for q, fields in [("원목", (SearchField.SUMMARY,)), ("의", FEED_SEARCH_FIELDS)]:
+        match = backend.match(q, fields)
+        assert match.relevance is None
+        assert "LIKE" in str(match.where.compile(dialect=mysql.dialect()))
+
+
+def test_memory_search_backend_matches_like_results(client: TestClient, monkeypatch):
+    backend = InMemorySearchBackend(max_results=100)
+    monkeypatch.setattr(product_search, "backend", backend)
+    db = SessionLocal()
+    try:
+        assert product_search.rebuild(db) > 0
+    finally:
+        db.close()
+
+    def feed(q, **params):
+        app_cache.invalidate(LISTING)
+        r = client.get(f"{API}/products/new", params={"status": "ALL", "q": q, **params})
+        assert r.status_code == 200
+        return [item["id"] for item in r.json()["items"]]
+
+    for q in ["lamp", "램프", "빈티지"]:
+        found = feed(q)
+        monkeypatch.setattr(product_search, "backend", LikeSearchBackend())
+        expected = feed(q)
+        monkeypatch.setattr(product_search, "backend", backend)
+        assert found and sorted(found) == sorted(expected)
+
+    # 관련도 정렬: 상품명에 lamp가 있는 상품(Canvas Lamp, NoBuyNow Lamp)이 상위
+    ranked = feed("lamp", sort="relevance")
+    assert set(ranked[:2]) == {3002, 3006}
+    assert feed("없는검색어") == []
+
+
+def test_memory_search_refresh_picks_up_store_rename(monkeypatch):
+    from sqlalchemy import select
+
+    from app.schemas.products import Product
+    from app.schemas.stores import PopupStore
+
+    backend = InMemorySearchBackend(max_results=100)
+    monkeypatch.setattr(product_search, "backend", backend)
+    db = SessionLocal()
+    try:
+        product_search.rebuild(db)
+        store = db.get(PopupStore, 2001)
+        original = store.name
+        product_ids = set(
+            db.execute(select(Product.id).where(Product.popup_store_id == 2001)).scalars()
+        )
+        # 다른 워커에서 스토어명만 바뀐 경우 (재색인 훅 없이 refresh로만 반영)
+        store.name = "리네임테스트공방"
+        db.commit()
+        try:
+            assert product_search.refresh(db) >= len(product_ids)
+            hits = {k for k, _ in backend.index.search("리네임테스트공방", FIELDS, limit=100)}
+            assert hits == product_ids
+        finally:
+            store = db.get(PopupStore, 2001)
+            store.name = original
+            db.commit()
+    finally:
+        db.close()
+
+
+def test_upcoming_feed_sorts_by_relevance_when_q_given(client: TestClient, monkeypatch):
+    import app.repositories.product_read as product_read
+
+    seen = []
+    original = product_read.product_sort_keys
+
+    def spy(sort, *args, **kwargs):
+        seen.append((sort, kwargs.get("q")))
+        return original(sort, *args, **kwargs)
+
+    monkeypatch.setattr(product_read, "product_sort_keys", spy)
+    app_cache.invalidate(LISTING)
+    r = client.get(f"{API}/products/upcoming", params={"q": "lamp", "sort": "relevance"})
+    assert r.status_code == 200
+    assert ("relevance", "lamp") in seen
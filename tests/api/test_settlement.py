@@ -0,0 +1,96 @@
+from datetime import datetime, timedelta
+
+from sqlalchemy import select
+
+from app.batch.auction_settlement import AuctionSettlementBatch
+from app.db.session import SessionLocal
+from app.schemas.auctions import Auction, AuctionDeposit, Bid
+from app.schemas.notifications import NotificationOutbox
+from app.schemas.payments import Payment, PaymentRefund
+from app.schemas.products import Product
+
+# 시드 경매(2025-08-19~)보다 이른 기준 시각 — 배치가 테스트 경매만 처리하도록
+NOW = datetime(2025, 8, 1, 12, 0, 0)
+
+
+def _expired_auction(db, name: str, bidders=()) -> int:
+    """종료 시각이 지난 RUNNING 경매 + 입찰/보증금(결제 완료) 생성"""
+    product = Product(popup_store_id=2001, category="가구/리빙", name=name, price=10000, stock=1)
+    db.add(product)
+    db.flush()
+    auction = Auction(
+        product_id=product.id,
+        start_price=10000,
+        min_bid_price=10000,
+        deposit_amount=1000,
+        starts_at=NOW - timedelta(days=1),
+        ends_at=NOW - timedelta(minutes=1),
+        status="RUNNING",
+    )
+    db.add(auction)
+    db.flush()
+    for order, (user_id, amount) in enumerate(bidders, start=1):
+        db.add(Bid(auction_id=auction.id, user_id=user_id, bid_order=order, amount=amount))
+        payment = Payment(user_id=user_id, provider="dummy", amount=1000, status="PAID")
+        db.add(payment)
+        db.flush()
+        db.add(
+            AuctionDeposit(
+                auction_id=auction.id,
+                user_id=user_id,
+                payment_id=payment.id,
+                amount=1000,
+                status="PAID",
+            )
+        )
+    db.commit()
+    return auction.id
+
+
+def test_settlement_batch_settles_in_chunks_and_is_idempotent():
+    db = SessionLocal()
+    try:
+        won = _expired_auction(db, "settle-won", bidders=[(1001, 11000), (1002, 12000)])
+        empty = _expired_auction(db, "settle-empty")
+    finally:
+        db.close()
+
+    batch = AuctionSettlementBatch(chunk_size=1)
+    assert batch.run_once(NOW) == 2
+    # 이미 정산된 경매는 다시 처리하지 않음
+    assert batch.run_once(NOW) == 0
+
+    db = SessionLocal()
+    try:
+        statuses = dict(
+            db.execute(
+                select(Auction.id, Auction.status).where(Auction.id.in_([won, empty]))
+            ).all()
+        )
+        assert statuses == {won: "ENDED", empty: "ENDED"}
+
+        deposits = dict(
+            db.execute(
+                select(AuctionDeposit.user_id, AuctionDeposit.status).where(
+                    AuctionDeposit.auction_id == won
+                )
+            ).all()
+        )
+        # 낙찰자(최고가 1002) 보증금은 유지, 나머지만 1회 환불
+        assert deposits == {1001: "REFUNDED", 1002: "PAID"}
+        refunded = db.execute(
+            select(Payment.user_id, Payment.status)
+            .join(PaymentRefund, PaymentRefund.payment_id == Payment.id)
+            .join(AuctionDeposit, AuctionDeposit.payment_id == Payment.id)
+            .where(AuctionDeposit.auction_id == won)
+        ).all()
+        assert [tuple(r) for r in refunded] == [(1001, "REFUNDED")]
+
+        payloads = db.execute(
+            select(NotificationOutbox.payload).where(NotificationOutbox.channel == "INBOX")
+        ).scalars().all()
+        titles = [p["title"] for p in payloads]
+        assert titles.count("settle-won") == 1 and "settle-empty" not in titles
+        assert next(p for p in payloads if p["title"] == "settle-won")["user_ids"] == [1002]
+    finally:
+        db.close()
@@ -15,3 +15,29 @@ def test_health_and_db(client: TestClient):
     meta = r2.json()
     assert "version" in meta and "database" in meta and "tables" in meta
 
+
+
+def test_health_pool(client: TestClient):
+    client.get(f"{API}/db/metadata")
+    r = client.get(f"{API}/health/pool")
+    assert r.status_code == 200
+    body = r.json()
+    sync = body["sync"]
+    assert sync["checkouts"] >= 1
+    assert sync["checked_out"] >= 0
+    assert sync["timeouts"] >= 0
+    assert "wait_max_ms" in sync
+    # replica 미설정이면 read/async_read는 비어 있고, 설정 시 엔진별 통계가 따로 나온다
+    assert "read" in body and "async_read" in body
+    if body["read"] is not None:
+        assert body["read"]["timeouts"] >= 0
+
+
+def test_health_cache_counts_listing_hits(client: TestClient):
+    client.get(f"{API}/products/ending-soon", params={"page": 1, "size": 4})
+    client.get(f"{API}/products/ending-soon", params={"page": 1, "size": 4})
+    body = client.get(f"{API}/health/cache").json()
+    listing = body["namespaces"]["listing"]
+    assert listing["hits"] + listing["misses"] >= 2
+    if listing["ttl_seconds"] > 0:
+        assert listing["hits"] >= 1
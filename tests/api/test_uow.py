@@ -0,0 +1,116 @@
+import pytest
+from sqlalchemy import select
+
+from app.core.config import settings
+from app.core.deps import get_uow
+from app.db.session import SessionLocal
+from app.domains.common.tx import transactional
+from app.infrastructure.db.uow import SqlAlchemyUnitOfWork
+from app.main import app
+from app.schemas.products import Product
+
+
+def _product(name: str) -> Product:
+    return Product(popup_store_id=2001, category="가구/리빙", name=name, price=10000, stock=1)
+
+
+def _exists(name: str) -> bool:
+    db = SessionLocal()
+    try:
+        return db.scalar(select(Product.id).where(Product.name == name)) is not None
+    finally:
+        db.close()
+
+
+def test_uow_creates_repositories_lazily_per_scope():
+    uow = SqlAlchemyUnitOfWork()
+    with uow:
+        assert "payments" not in uow.__dict__
+        repo = uow.payments
+        assert uow.payments is repo and repo.db is uow.session
+    with uow:
+        # 새 스코프 = 새 세션에 바인딩된 새 리포지토리
+        assert uow.payments is not repo and uow.payments.db is uow.session
+
+
+def test_transactional_blocks_commit_once_at_uow_exit():
+    with SqlAlchemyUnitOfWork() as uow:
+        with transactional(uow.session):
+            uow.session.add(_product("uow-first"))
+        with transactional(uow.session):
+            uow.session.add(_product("uow-second"))
+        # 블록은 flush만 — UoW 종료 전에는 다른 세션에서 보이지 않음
+        assert not _exists("uow-first")
+    assert _exists("uow-first") and _exists("uow-second")
+
+
+def test_uow_rolls_back_every_block_on_error():
+    with pytest.raises(RuntimeError):
+        with SqlAlchemyUnitOfWork() as uow:
+            with transactional(uow.session):
+                uow.session.add(_product("uow-rolled-back"))
+            raise RuntimeError("boom")
+    assert not _exists("uow-rolled-back")
+
+
+def test_read_endpoint_verifies_user_without_opening_a_uow(client):
+    def _no_uow():
+        raise AssertionError("read endpoint opened a write UoW")
+        yield
+
+    app.dependency_overrides[get_uow] = _no_uow
+    try:
+        ok = client.get(
+            f"{settings.API_V1_STR}/notifications", headers={"Authorization": "Bearer 1001"}
+        )
+        missing = client.get(
+            f"{settings.API_V1_STR}/notifications", headers={"Authorization": "Bearer 999999"}
+        )
+    finally:
+        app.dependency_overrides.pop(get_uow, None)
+    assert ok.status_code == 200
+    assert missing.status_code == 401
+
+
+def test_async_uow_runs_cached_calls_off_the_event_loop_when_cache_blocks(monkeypatch):
+    import threading
+
+    import anyio
+
+    from app.infrastructure.cache.app_cache import app_cache
+    from app.infrastructure.cache.backends import InMemoryCacheBackend
+    from app.infrastructure.db.uow import AsyncSqlAlchemyUnitOfWork
+
+    class _FakeAsyncSession:
+        # run_sync는 AsyncSession처럼 이벤트 루프 스레드에서 실행
+        async def run_sync(self, fn):
+            return fn("async")
+
+        async def commit(self):
+            pass
+
+        async def close(self):
+            pass
+
+    class _BlockingBackend(InMemoryCacheBackend):
+        blocking = True
+
+    async def scenario():
+        loop_thread = threading.get_ident()
+        uow = AsyncSqlAlchemyUnitOfWork(
+            session_factory=_FakeAsyncSession, sync_session_factory=SessionLocal
+        )
+        async with uow:
+            plain = await uow.run(lambda db: (db, threading.get_ident()))
+            cached = await uow.run_cached(lambda db: (db, threading.get_ident()))
+        return loop_thread, plain, cached
+
+    monkeypatch.setattr(app_cache, "backend", InMemoryCacheBackend())
+    loop_thread, plain, cached = anyio.run(scenario)
+    assert plain == ("async", loop_thread) and cached == ("async", loop_thread)
+
+    monkeypatch.setattr(app_cache, "backend", _BlockingBackend())
+    loop_thread, plain, cached = anyio.run(scenario)
+    assert plain == ("async", loop_thread)
+    # 블로킹 캐시(redis)를 거치는 호출은 스레드풀의 동기 세션에서
+    assert cached[0] != "async" and cached[1] != loop_thread
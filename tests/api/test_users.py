@@ -1,6 +1,8 @@
+from sqlalchemy import event
 from fastapi.testclient import TestClient
 from app.core.config import settings
 from app.core.security import create_access_token
+from app.db.session import engine
 
 
 API = settings.API_V1_STR
@@ -39,3 +41,24 @@ def test_me_and_update_and_phone_flow(client: TestClient):
     )
     assert r4.status_code in (200, 400)
 
+
+
+def test_my_related_auctions_query_count_is_constant(client: TestClient):
+    statements = []
+
+    def count(conn, cursor, statement, *args):
+        if statement.lstrip().upper().startswith("SELECT"):
+            statements.append(statement)
+
+    params = {"period": "custom", "startDate": "2025-08-01T00:00:00", "endDate": "2025-08-31T23:59:59"}
+    event.listen(engine, "before_cursor_execute", count)
+    try:
+        r = client.get(f"{API}/users/me/auctions", params=params, headers=auth_header_for(1002))
+    finally:
+        event.remove(engine, "before_cursor_execute", count)
+    assert r.status_code == 200
+    body = r.json()
+    assert body["total"] >= 2
+    assert {3001, 3005} <= {item["product_id"] for item in body["items"]}
+    # 페이지 조회(행+총개수) 1회 + 주문/배송 상태 일괄 조회 1회 (행 수와 무관)
+    assert len(statements) == 2
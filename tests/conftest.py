@@ -2,9 +2,13 @@ import os
 import pathlib
 import pymysql
 import pytest
+from contextlib import contextmanager
+from alembic import command
+from alembic.config import Config
 from fastapi.testclient import TestClient
 from app.main import app
 from app.core.config import settings
+from app.db import query_stats
 
 
 def _run_seed_once():
@@ -58,8 +62,15 @@ def _run_seed_once():
         conn.close()
 
 
+def _migrate():
+    # create_all로 만든 기존 테스트 DB에도 리비전의 색인/컬럼을 반영
+    ini = pathlib.Path(__file__).resolve().parents[1] / "alembic.ini"
+    command.upgrade(Config(str(ini)), "head")
+
+
 @pytest.fixture(scope="session", autouse=True)
 def seed_db():
+    _migrate()
     _run_seed_once()
     yield
 
@@ -67,3 +78,23 @@ def seed_db():
 @pytest.fixture(scope="session")
 def client():
     return TestClient(app)
+
+
+@pytest.fixture
+def max_queries():
+    """with max_queries(n): 블록 안의 요청마다 실행한 SQL 문 수가 n 이하인지 검사
+
+    요청별 집계는 QueryStatsMiddleware 기준 (응답 후 UoW 커밋 포함)
+    """
+
+    @contextmanager
+    def _max_queries(limit: int):
+        with query_stats.capture() as requests:
+            yield requests
+        assert requests, "no request was made inside max_queries()"
+        for stats in requests:
+            assert stats.count <= limit, (
+                f"{stats.count} queries > {limit} (slowest: {stats.as_dict()['slowest_sql']})"
+            )
+
+    return _max_queries
@@ -7,10 +7,12 @@ SET FOREIGN_KEY_CHECKS = 0;
 DELETE FROM payment_refund;
 DELETE FROM payment_log;
 DELETE FROM shipment;
+DELETE FROM notification_outbox;
 DELETE FROM notification;
 DELETE FROM order_item;
 DELETE FROM `order`;
 DELETE FROM auction_deposit;
+DELETE FROM auction_stats;
 DELETE FROM bid;
 DELETE FROM auction;
 DELETE FROM product_image;
@@ -58,6 +60,72 @@ PREPARE stmt FROM @add_col_sql;
 EXECUTE stmt;
 DEALLOCATE PREPARE stmt;
 
+-- Add representative_image_url column if missing (비정규화 대표 이미지)
+SET @add_col_sql = (
+  SELECT IF(
+    EXISTS(
+      SELECT 1 FROM INFORMATION_SCHEMA.COLUMNS
+      WHERE TABLE_SCHEMA = DATABASE()
+        AND TABLE_NAME = 'product'
+        AND COLUMN_NAME = 'representative_image_url'
+    ),
+    'SELECT 1',
+    'ALTER TABLE product ADD COLUMN representative_image_url VARCHAR(1024) NULL'
+  )
+);
+PREPARE stmt FROM @add_col_sql;
+EXECUTE stmt;
+DEALLOCATE PREPARE stmt;
+
+-- Add ngram FULLTEXT indexes if missing (SEARCH_BACKEND=fulltext)
+SET @add_idx_sql = (
+  SELECT IF(
+    EXISTS(
+      SELECT 1 FROM INFORMATION_SCHEMA.STATISTICS
+      WHERE TABLE_SCHEMA = DATABASE()
+        AND TABLE_NAME = 'product'
+        AND INDEX_NAME = 'ft_product_text'
+    ),
+    'SELECT 1',
+    'ALTER TABLE product ADD FULLTEXT INDEX ft_product_text (name, summary, description) WITH PARSER ngram'
+  )
+);
+PREPARE stmt FROM @add_idx_sql;
+EXECUTE stmt;
+DEALLOCATE PREPARE stmt;
+
+SET @add_idx_sql = (
+  SELECT IF(
+    EXISTS(
+      SELECT 1 FROM INFORMATION_SCHEMA.STATISTICS
+      WHERE TABLE_SCHEMA = DATABASE()
+        AND TABLE_NAME = 'product'
+        AND INDEX_NAME = 'ft_product_name'
+    ),
+    'SELECT 1',
+    'ALTER TABLE product ADD FULLTEXT INDEX ft_product_name (name) WITH PARSER ngram'
+  )
+);
+PREPARE stmt FROM @add_idx_sql;
+EXECUTE stmt;
+DEALLOCATE PREPARE stmt;
+
+SET @add_idx_sql = (
+  SELECT IF(
+    EXISTS(
+      SELECT 1 FROM INFORMATION_SCHEMA.STATISTICS
+      WHERE TABLE_SCHEMA = DATABASE()
+        AND TABLE_NAME = 'popup_store'
+        AND INDEX_NAME = 'ft_popup_store_name'
+    ),
+    'SELECT 1',
+    'ALTER TABLE popup_store ADD FULLTEXT INDEX ft_popup_store_name (name) WITH PARSER ngram'
+  )
+);
+PREPARE stmt FROM @add_idx_sql;
+EXECUTE stmt;
+DEALLOCATE PREPARE stmt;
+
 -- ---------
 -- Users
 -- ---------
@@ -115,6 +183,15 @@ INSERT INTO product_image (id, product_id, image_type, image_url, sort_order) VA
   (41006, 3005, 'MAIN',   'https://nafalmvp-products.s3.ap-northeast-2.amazonaws.com/main/product-1-main.png', 0),
   (41007, 3006, 'MAIN',   'https://nafalmvp-products.s3.ap-northeast-2.amazonaws.com/main/product-1-main.png', 0);
 
+-- Backfill representative image (first image by sort_order)
+UPDATE product p
+SET p.representative_image_url = (
+  SELECT pi.image_url FROM product_image pi
+  WHERE pi.product_id = p.id
+  ORDER BY pi.sort_order ASC
+  LIMIT 1
+);
+
 -- Product tags (simple mapping)
 INSERT INTO product_tag (product_id, tag_id) VALUES
   (3001, 2),
@@ -139,6 +216,12 @@ INSERT INTO bid (id, auction_id, user_id, bid_order, amount, created_at) VALUES
   (50003, 4004, 1003, 1, 35000.00, '2025-08-19 20:00:00'),
   (50004, 4005, 1002, 1, 36000.00, '2025-08-19 20:10:00');
 
+-- Auction stats (bid 집계 비정규화 테이블)
+INSERT INTO auction_stats (auction_id, current_highest_bid, bidder_count, bid_count, last_bid_at)
+SELECT auction_id, MAX(amount), COUNT(DISTINCT user_id), COUNT(*), MAX(created_at)
+FROM bid
+GROUP BY auction_id;
+
 -- ---------
 -- Orders and Payments (pre-seeded PAID order to test refunds, etc.)
 -- ---------